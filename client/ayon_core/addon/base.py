@@ -3,12 +3,15 @@
 import copy
 import os
 import sys
+import json
 import time
+import hashlib
 import inspect
 import logging
 import threading
 import collections
 from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -18,7 +21,9 @@ from semver import VersionInfo
 from ayon_core import AYON_CORE_ROOT
 from ayon_core.lib import (
     Logger,
+    env_value_to_bool,
     is_dev_mode_enabled,
+    get_launcher_local_dir,
     get_launcher_storage_dir,
     is_headless_mode_enabled,
 )
@@ -121,10 +126,18 @@ class ProcessContext:
             print(f"Unknown keys in ProcessContext: {unknown_keys}")
 
 
+# Environment variable enabling concurrent import of addons
+PARALLEL_IMPORT_ENV_KEY = "AYON_ADDONS_PARALLEL_IMPORT"
+# Maximum number of threads used for concurrent import of addons
+PARALLEL_IMPORT_MAX_WORKERS = 8
+
+
 class _LoadCache:
     addons_lock = threading.Lock()
     addons_loaded = False
     addon_modules = []
+    # Import time of addon modules by module name
+    import_time_by_module_name = {}
 
 
 def load_addons(force=False):
@@ -169,11 +182,92 @@ def _get_ayon_bundle_data():
     )
 
 
+def _get_addons_info_cache_path():
+    return get_launcher_local_dir("addons_info_cache.json")
+
+
+def _get_bundle_revision(bundle_info):
+    """Revision of bundle data used to validate cached addons information.
+
+    Any change of bundle on server (e.g. changed addon version or dev
+        path) changes the revision.
+
+    Args:
+        bundle_info (dict[str, Any]): Bundle data from server.
+
+    Returns:
+        str: Bundle data checksum.
+
+    """
+    bundle_data = json.dumps(
+        {
+            "server_url": os.getenv("AYON_SERVER_URL"),
+            "bundle": bundle_info,
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(bundle_data.encode("utf-8")).hexdigest()
+
+
+def _get_cached_addons_information(bundle_info):
+    """Get cached addons information for bundle.
+
+    Args:
+        bundle_info (dict[str, Any]): Bundle data from server.
+
+    Returns:
+        Union[list[dict[str, Any]], None]: Cached addons information or None
+            if cache is not available or is outdated.
+
+    """
+    cache_path = _get_addons_info_cache_path()
+    try:
+        with open(cache_path, "r") as stream:
+            cache_data = json.load(stream)
+    except Exception:
+        return None
+
+    bundle_cache = cache_data.get(bundle_info["name"])
+    if (
+        not bundle_cache
+        or bundle_cache.get("revision") != _get_bundle_revision(bundle_info)
+    ):
+        return None
+    return bundle_cache.get("addons_info")
+
+
+def _store_cached_addons_information(bundle_info, addons_info):
+    cache_path = _get_addons_info_cache_path()
+    cache_data = {}
+    try:
+        with open(cache_path, "r") as stream:
+            cache_data = json.load(stream)
+    except Exception:
+        pass
+
+    cache_data[bundle_info["name"]] = {
+        "revision": _get_bundle_revision(bundle_info),
+        "addons_info": addons_info,
+    }
+    tmp_path = f"{cache_path}.{uuid4().hex}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as stream:
+            json.dump(cache_data, stream)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def _get_ayon_addons_information(bundle_info):
     """Receive information about addons to use from server.
 
+    Information is cached locally per bundle. Cache is used only if bundle
+        data on server did not change since the cache was stored.
+
     Todos:
-        Actually ask server for the information.
         Allow project name as optional argument to be able to query information
             about used addons for specific project.
 
@@ -181,6 +275,10 @@ def _get_ayon_addons_information(bundle_info):
         List[Dict[str, Any]]: List of addon information to use.
     """
 
+    cached_output = _get_cached_addons_information(bundle_info)
+    if cached_output is not None:
+        return cached_output
+
     output = []
     bundle_addons = bundle_info["addons"]
     addons = ayon_api.get_addons_info()["addons"]
@@ -196,6 +294,8 @@ def _get_ayon_addons_information(bundle_info):
             version["name"] = name
             version["version"] = addon_version
             output.append(version)
+
+    _store_cached_addons_information(bundle_info, output)
     return output
 
 
@@ -238,6 +338,61 @@ def _handle_moved_addons(addon_name, milestone_version, log):
     return addon_dir
 
 
+def _import_addon_modules(addon_dir, log):
+    """Import python modules with AYON addon from addon directory.
+
+    Addon directory must be already in 'sys.path'.
+
+    Args:
+        addon_dir (str): Addon client directory.
+        log (logging.Logger): Logger object.
+
+    Returns:
+        list[ModuleType]: Imported modules containing AYON addon.
+
+    """
+    addon_modules = []
+    for name in os.listdir(addon_dir):
+        # Ignore of files is implemented to be able to run code from code
+        #   where usually is more files than just the addon
+        # Ignore start and setup scripts
+        if name in ("setup.py", "start.py", "__pycache__"):
+            continue
+
+        path = os.path.join(addon_dir, name)
+        basename, ext = os.path.splitext(name)
+        # Ignore folders/files with dot in name
+        #   - dot names cannot be imported in Python
+        if "." in basename:
+            continue
+        is_dir = os.path.isdir(path)
+        is_py_file = ext.lower() == ".py"
+        if not is_py_file and not is_dir:
+            continue
+
+        start_time = time.perf_counter()
+        try:
+            mod = __import__(basename, fromlist=("",))
+            for attr_name in dir(mod):
+                attr = getattr(mod, attr_name)
+                if (
+                    inspect.isclass(attr)
+                    and issubclass(attr, AYONAddon)
+                ):
+                    addon_modules.append(mod)
+                    break
+
+        except BaseException:
+            log.warning(
+                "Failed to import \"{}\"".format(basename),
+                exc_info=True
+            )
+        _LoadCache.import_time_by_module_name[basename] = (
+            time.perf_counter() - start_time
+        )
+    return addon_modules
+
+
 def _load_ayon_addons(log):
     """Load AYON addons based on information from server.
 
@@ -271,6 +426,7 @@ def _load_ayon_addons(log):
             addons_dir
         ))
 
+    addon_dirs = []
     for addon_info in addons_info:
         addon_name = addon_info["name"]
         addon_version = addon_info["version"]
@@ -314,43 +470,36 @@ def _load_ayon_addons(log):
         if not addon_dir:
             continue
 
-        sys.path.insert(0, addon_dir)
-        addon_modules = []
-        for name in os.listdir(addon_dir):
-            # Ignore of files is implemented to be able to run code from code
-            #   where usually is more files than just the addon
-            # Ignore start and setup scripts
-            if name in ("setup.py", "start.py", "__pycache__"):
-                continue
+        addon_dirs.append((addon_name, addon_version, addon_dir))
 
-            path = os.path.join(addon_dir, name)
-            basename, ext = os.path.splitext(name)
-            # Ignore folders/files with dot in name
-            #   - dot names cannot be imported in Python
-            if "." in basename:
-                continue
-            is_dir = os.path.isdir(path)
-            is_py_file = ext.lower() == ".py"
-            if not is_py_file and not is_dir:
-                continue
+    if not addon_dirs:
+        return all_addon_modules
 
-            try:
-                mod = __import__(basename, fromlist=("",))
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        inspect.isclass(attr)
-                        and issubclass(attr, AYONAddon)
-                    ):
-                        addon_modules.append(mod)
-                        break
-
-            except BaseException:
-                log.warning(
-                    "Failed to import \"{}\"".format(basename),
-                    exc_info=True
-                )
+    if env_value_to_bool(PARALLEL_IMPORT_ENV_KEY, default=False):
+        # Add all directories to sys.path first so addons can import
+        #   each other, then import addons concurrently
+        for _, _, addon_dir in addon_dirs:
+            sys.path.insert(0, addon_dir)
+
+        max_workers = min(PARALLEL_IMPORT_MAX_WORKERS, len(addon_dirs))
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="AddonsImport"
+        ) as executor:
+            futures = [
+                executor.submit(_import_addon_modules, addon_dir, log)
+                for _, _, addon_dir in addon_dirs
+            ]
+            modules_by_addon = [future.result() for future in futures]
+
+    else:
+        modules_by_addon = []
+        for _, _, addon_dir in addon_dirs:
+            sys.path.insert(0, addon_dir)
+            modules_by_addon.append(_import_addon_modules(addon_dir, log))
 
+    for addon_item, addon_modules in zip(addon_dirs, modules_by_addon):
+        addon_name, addon_version, addon_dir = addon_item
         if not addon_modules:
             log.warning("Addon {} {} has no content to import".format(
                 addon_name, addon_version
@@ -785,6 +934,16 @@ class AddonsManager:
 
                 addon_classes.append(modules_item)
 
+        # Report import time of addon modules
+        import_report = {}
+        for addon_cls in addon_classes:
+            module_name = addon_cls.__module__.split(".")[0]
+            import_time = _LoadCache.import_time_by_module_name.get(
+                module_name
+            )
+            if import_time is not None:
+                import_report[addon_cls.__name__] = import_time
+
         for addon_cls in addon_classes:
             name = addon_cls.__name__
             try:
@@ -812,6 +971,11 @@ class AddonsManager:
             )
 
         if self._report is not None:
+            if import_report:
+                import_report[self._report_total_key] = sum(
+                    import_report.values()
+                )
+                self._report["Import"] = import_report
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
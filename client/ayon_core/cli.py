@@ -2,7 +2,12 @@
 """Package for handling AYON command line arguments."""
 import os
 import sys
+import json
+import time
+import uuid
 import code
+import hashlib
+import platform
 import traceback
 from pathlib import Path
 import warnings
@@ -16,6 +21,9 @@ from ayon_core.settings import get_general_environments
 from ayon_core.lib import (
     initialize_ayon_connection,
     is_running_from_build,
+    is_staging_enabled,
+    is_dev_mode_enabled,
+    env_value_to_bool,
     Logger,
 )
 
@@ -136,6 +144,36 @@ def publish(ctx, path, targets):
     main_cli_publish(path, targets, ctx.obj["addons_manager"])
 
 
+@main_cli.command()
+@click.pass_context
+@click.option(
+    "--idle-timeout",
+    help="Stop worker after given number of seconds without a job",
+    type=float,
+    default=None,
+)
+@click.option(
+    "--max-jobs",
+    help="Stop worker after given number of jobs",
+    type=int,
+    default=None,
+)
+def publish_worker(ctx, idle_timeout, max_jobs):
+    """Start persistent worker processing headless publish jobs.
+
+    Publish jobs are submitted to the worker by 'publish' command if
+    'AYON_PUBLISH_WORKER' environment variable is enabled.
+    """
+    from ayon_core.pipeline.publish import PublishWorker
+
+    worker = PublishWorker(
+        addons_manager=ctx.obj["addons_manager"],
+        idle_timeout=idle_timeout,
+        max_jobs=max_jobs,
+    )
+    worker.run()
+
+
 @main_cli.command(context_settings={"ignore_unknown_options": True})
 def publish_report_viewer():
     from ayon_core.tools.publisher.publish_report_viewer import main
@@ -268,6 +306,291 @@ def _set_addons_environments(addons_manager):
         os.environ.update(env)
 
 
+@click.command(
+    context_settings={
+        "ignore_unknown_options": True,
+        "allow_extra_args": True,
+    }
+)
+@click.argument("output_json_path")
+@click.option("--project", default=None)
+@click.option("--asset", default=None)
+@click.option("--folder", default=None)
+@click.option("--task", default=None)
+@click.option("--app", default=None)
+@click.option("--envgroup", default=None)
+def _extractenvironments_args(**kwargs):
+    """Arguments of 'extractenvironments' used by environments cache."""
+    pass
+
+
+class _ExtractEnvironmentsCache:
+    """Cache of environments extracted by 'extractenvironments' command.
+
+    Farm jobs call 'extractenvironments' at the start of every task, which
+    loads addons, fetches settings and resolves environments even if all
+    tasks of the job use the same context. When 'AYON_EXTRACT_ENV_CACHE'
+    is enabled, the extracted environments are stored to a file named by
+    hash of the context, server, user, bundle, settings variant and
+    settings snapshot revision. Following tasks write the output file
+    without loading AYON.
+
+    Only variables that were added, changed or removed by the extraction
+    are cached, together with their input values. On restore they are
+    applied to environment of the current process, and the cache is used
+    only if input values of those variables match. That way environment
+    of one worker is never copied to another one.
+
+    Cache directory can be set with 'AYON_EXTRACT_ENV_CACHE_DIR', e.g.
+    to a shared storage so all workers of a job can reuse it. Files older
+    than 'AYON_EXTRACT_ENV_CACHE_TTL' seconds are ignored and removed.
+    Names of additional environment variables that affect the extracted
+    environments can be added to the key with
+    'AYON_EXTRACT_ENV_CACHE_KEY_VARS' separated by comma.
+    """
+    enabled_env_key = "AYON_EXTRACT_ENV_CACHE"
+    dir_env_key = "AYON_EXTRACT_ENV_CACHE_DIR"
+    ttl_env_key = "AYON_EXTRACT_ENV_CACHE_TTL"
+    key_vars_env_key = "AYON_EXTRACT_ENV_CACHE_KEY_VARS"
+    default_ttl = 12 * 60 * 60
+    command_name = "extractenvironments"
+
+    def __init__(self, output_json_path, context_data):
+        self._output_json_path = output_json_path
+        self._context_data = context_data
+        self._cache_path = None
+        # Environment before AYON did change it
+        self._input_env = dict(os.environ)
+
+    @classmethod
+    def from_args(cls, args):
+        """Create cache for command line arguments.
+
+        Args:
+            args (list[str]): Command line arguments.
+
+        Returns:
+            Union[_ExtractEnvironmentsCache, None]: Cache or None if
+                arguments are not for 'extractenvironments' or cache
+                is disabled.
+
+        """
+        if not env_value_to_bool(cls.enabled_env_key, default=False):
+            return None
+
+        if cls.command_name not in args:
+            return None
+        idx = args.index(cls.command_name)
+        # Command of core or of applications addon
+        if (
+            "addon" in args[:idx]
+            and args[idx - 2:idx] != ["addon", "applications"]
+        ):
+            return None
+
+        ctx = _extractenvironments_args.make_context(
+            cls.command_name, list(args[idx + 1:]), resilient_parsing=True
+        )
+        params = dict(ctx.params)
+        output_json_path = params.pop("output_json_path")
+        if not output_json_path:
+            return None
+        if params.get("folder") is None:
+            params["folder"] = params.get("asset")
+        params.pop("asset")
+        return cls(output_json_path, params)
+
+    def _get_ttl(self):
+        try:
+            return int(os.getenv(self.ttl_env_key, self.default_ttl))
+        except ValueError:
+            return self.default_ttl
+
+    def _get_root(self):
+        root = os.getenv(self.dir_env_key)
+        if not root:
+            from ayon_core.lib import get_launcher_local_dir
+
+            root = get_launcher_local_dir("extracted_environments")
+        return root
+
+    def _get_cache_path(self):
+        if self._cache_path is not None:
+            return self._cache_path
+
+        variant = "production"
+        if is_dev_mode_enabled():
+            variant = "dev"
+        elif is_staging_enabled():
+            variant = "staging"
+
+        key_vars = [
+            key.strip()
+            for key in os.getenv(self.key_vars_env_key, "").split(",")
+            if key.strip()
+        ]
+        key_data = json.dumps({
+            "context": self._context_data,
+            "server_url": os.getenv("AYON_SERVER_URL"),
+            "username": os.getenv("AYON_USERNAME"),
+            "api_key": os.getenv("AYON_API_KEY"),
+            "bundle": os.getenv("AYON_BUNDLE_NAME"),
+            "variant": variant,
+            "settings_revision": os.getenv(
+                "AYON_SETTINGS_SNAPSHOT_REVISION"
+            ),
+            "platform": platform.system().lower(),
+            "env": {key: os.getenv(key) for key in sorted(key_vars)},
+        }, sort_keys=True)
+        filename = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+        self._cache_path = os.path.join(
+            self._get_root(), f"{filename}.json"
+        )
+        return self._cache_path
+
+    def restore(self):
+        """Copy cached environments to output path.
+
+        Returns:
+            bool: Environments were restored from cache.
+
+        """
+        cache_path = self._get_cache_path()
+        try:
+            mtime = os.path.getmtime(cache_path)
+        except OSError:
+            return False
+
+        if mtime < time.time() - self._get_ttl():
+            return False
+
+        try:
+            with open(cache_path, "r") as stream:
+                cache_data = json.load(stream)
+            input_values = cache_data["input"]
+            changes = cache_data["changes"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        # Extracted values may be based on input values of the variables
+        for key, value in input_values.items():
+            if self._input_env.get(key) != value:
+                return False
+
+        env = dict(self._input_env)
+        for key, value in changes.items():
+            if value is None:
+                env.pop(key, None)
+            else:
+                env[key] = value
+
+        output_dir = os.path.dirname(os.path.abspath(self._output_json_path))
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            with open(self._output_json_path, "w") as stream:
+                json.dump(env, stream, indent=4)
+        except OSError:
+            return False
+        print(f">>> Environments restored from cache '{cache_path}'")
+        return True
+
+    def store(self):
+        """Store extracted environments to cache."""
+        try:
+            with open(self._output_json_path, "r") as stream:
+                env = json.load(stream)
+        except (OSError, ValueError):
+            return
+
+        # Store only changes made by extraction, with input values of
+        #   changed variables, value 'None' marks removed variable
+        changes = {}
+        input_values = {}
+        for key in set(env) | set(self._input_env):
+            value = env.get(key)
+            input_value = self._input_env.get(key)
+            if value != input_value:
+                changes[key] = value
+                input_values[key] = input_value
+
+        cache_path = self._get_cache_path()
+        # Write to temp file first so other processes never read
+        #   partially written file
+        tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(
+                    {"input": input_values, "changes": changes}, stream
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._remove_outdated()
+
+    def _remove_outdated(self):
+        outdate_time = time.time() - self._get_ttl()
+        with os.scandir(self._get_root()) as scan:
+            for entry in scan:
+                try:
+                    if entry.stat().st_mtime < outdate_time:
+                        os.remove(entry.path)
+                except OSError:
+                    continue
+
+
+@click.command(
+    context_settings={
+        "ignore_unknown_options": True,
+        "allow_extra_args": True,
+    }
+)
+@click.argument("path")
+@click.option("-t", "--targets", default=None, multiple=True)
+def _publish_args(**kwargs):
+    """Arguments of 'publish' used to submit job to publish worker."""
+    pass
+
+
+def _publish_with_worker(args):
+    """Submit publish job to running publish worker.
+
+    Args:
+        args (list[str]): Command line arguments.
+
+    Returns:
+        Union[bool, None]: Publishing finished without errors or None if
+            publish worker was not used.
+
+    """
+    if (
+        not env_value_to_bool("AYON_PUBLISH_WORKER", default=False)
+        or "publish" not in args
+    ):
+        return None
+
+    idx = args.index("publish")
+    # Only global options can be before the command
+    if not all(arg.startswith("-") for arg in args[:idx]):
+        return None
+
+    from ayon_core.pipeline.publish import submit_to_publish_worker
+
+    ctx = _publish_args.make_context(
+        "publish", list(args[idx + 1:]), resilient_parsing=True
+    )
+    path = ctx.params["path"]
+    if not path:
+        return None
+    print(">>> Submitting publish job to publish worker ...")
+    result = submit_to_publish_worker(path, ctx.params["targets"])
+    if result is None:
+        print(">>> Publish worker is not available.")
+    return result
+
+
 def _add_addons(addons_manager):
     """Modules/Addons can add their cli commands dynamically."""
     log = Logger.get_logger("CLI-AddAddons")
@@ -284,6 +607,16 @@ def _add_addons(addons_manager):
 
 
 def main(*args, **kwargs):
+    # Skip loading of AYON if environments were already extracted
+    env_cache = _ExtractEnvironmentsCache.from_args(sys.argv[1:])
+    if env_cache is not None and env_cache.restore():
+        sys.exit(0)
+
+    # Skip loading of AYON if publish worker processed the job
+    publish_result = _publish_with_worker(sys.argv[1:])
+    if publish_result is not None:
+        sys.exit(0 if publish_result else 1)
+
     initialize_ayon_connection()
     python_path = os.getenv("PYTHONPATH", "")
     split_paths = python_path.split(os.pathsep)
@@ -314,6 +647,10 @@ def main(*args, **kwargs):
             prog_name="ayon",
             obj={"addons_manager": addons_manager},
         )
+    except SystemExit as exc:
+        if env_cache is not None and not exc.code:
+            env_cache.store()
+        raise
     except Exception:  # noqa
         exc_info = sys.exc_info()
         print("!!! AYON crashed:")
@@ -16,6 +16,13 @@ from .ayon_connection import initialize_ayon_connection
 from .cache import (
     CacheItem,
     NestedCacheItem,
+    get_caches_usage,
+)
+from .frozen import (
+    FrozenDict,
+    FrozenList,
+    freeze,
+    unfreeze,
 )
 from .events import (
     emit_event,
@@ -59,6 +66,12 @@ from .execute import (
     get_linux_launcher_args,
     execute,
     run_subprocess,
+    run_subprocess_streaming,
+    SubprocessResult,
+    SubprocessCancelledError,
+    SubprocessProgressParser,
+    FFmpegProgressParser,
+    OIIOToolProgressParser,
     run_detached_process,
     run_ayon_launcher_process,
     path_to_subprocess_arg,
@@ -149,6 +162,12 @@ __all__ = [
 
     "CacheItem",
     "NestedCacheItem",
+    "get_caches_usage",
+
+    "FrozenDict",
+    "FrozenList",
+    "freeze",
+    "unfreeze",
 
     "emit_event",
     "register_event_callback",
@@ -157,6 +176,12 @@ __all__ = [
     "get_linux_launcher_args",
     "execute",
     "run_subprocess",
+    "run_subprocess_streaming",
+    "SubprocessResult",
+    "SubprocessCancelledError",
+    "SubprocessProgressParser",
+    "FFmpegProgressParser",
+    "OIIOToolProgressParser",
     "run_detached_process",
     "run_ayon_launcher_process",
     "path_to_subprocess_arg",
@@ -1,4 +1,9 @@
+import sys
 import time
+import itertools
+import types
+import weakref
+import threading
 import collections
 
 InitInfo = collections.namedtuple(
@@ -6,11 +11,204 @@ InitInfo = collections.namedtuple(
     ["default_factory", "lifetime"]
 )
 
+# Root nested cache items used for usage report
+_nested_caches = weakref.WeakSet()
+# Maximum number of objects walked when data size is estimated
+_SIZE_ESTIMATE_LIMIT = 100000
+_SIZE_LEAF_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+_SIZE_SKIP_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+)
+
 
 def _default_factory_func():
     return None
 
 
+def _get_data_size(data):
+    """Estimate memory size of data in bytes.
+
+    Size of containers, their items and attributes of objects is summed.
+    Classes, modules and functions are not counted. Each object is counted
+    only once.
+
+    Args:
+        data (Any): Data to estimate size of.
+
+    Returns:
+        int: Estimated size in bytes.
+
+    """
+    size = 0
+    seen_ids = set()
+    queue = collections.deque([data])
+    while queue and len(seen_ids) < _SIZE_ESTIMATE_LIMIT:
+        item = queue.popleft()
+        item_id = id(item)
+        if item_id in seen_ids or isinstance(item, _SIZE_SKIP_TYPES):
+            continue
+        seen_ids.add(item_id)
+        size += sys.getsizeof(item, 0)
+        if isinstance(item, _SIZE_LEAF_TYPES):
+            continue
+
+        if isinstance(item, dict):
+            queue.extend(item.keys())
+            queue.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            queue.extend(item)
+        elif hasattr(item, "__dict__"):
+            queue.append(item.__dict__)
+    return size
+
+
+class _CacheTracker:
+    """Usage tracking of cache items in root 'NestedCacheItem'.
+
+    Tracker is shared by root nested cache item and all its children. It
+    keeps order in which cache items were used, their sizes, and statistics
+    of hits and misses.
+
+    Args:
+        root (NestedCacheItem): Root nested cache item.
+        name (Union[str, None]): Name of cache used in usage report.
+        max_entries (Union[int, None]): Maximum number of cache items.
+        max_bytes (Union[int, None]): Maximum estimated size of cached data.
+
+    """
+    # Number of least recently used items checked for expiration on access
+    expire_check_count = 10
+
+    def __init__(self, root, name, max_entries, max_bytes):
+        self._root_ref = weakref.ref(root)
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._items_by_path = collections.OrderedDict()
+        self._size_by_path = {}
+        self._size = 0
+
+    def item_checked(self, is_valid):
+        if is_valid:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def item_used(self, path, cache):
+        """Cache item was accessed from its parent.
+
+        Expired cache items that were not used for the longest time are
+        removed from the cache.
+        """
+        with self._lock:
+            self._items_by_path[path] = cache
+            self._items_by_path.move_to_end(path)
+            # Items without data are skipped, they might be just created
+            #   and waiting for data
+            expired_paths = [
+                oldest_path
+                for oldest_path, oldest_cache in itertools.islice(
+                    self._items_by_path.items(), self.expire_check_count
+                )
+                if oldest_path != path and oldest_cache.is_outdated
+            ]
+            for expired_path in expired_paths:
+                self._evict(expired_path)
+            self._enforce_limits(path)
+
+    def item_updated(self, path, cache):
+        with self._lock:
+            if self._items_by_path.get(path) is not cache:
+                # Item was removed from cache meanwhile
+                return
+            self._items_by_path.move_to_end(path)
+            if self.max_bytes is not None:
+                size = _get_data_size(cache.get_data())
+                self._size += size - self._size_by_path.get(path, 0)
+                self._size_by_path[path] = size
+            self._enforce_limits(path)
+
+    def forget(self, path_prefix):
+        """Stop tracking cache items removed from cache.
+
+        Args:
+            path_prefix (tuple[Any, ...]): Path of removed cache item or
+                path of nested cache item.
+
+        """
+        prefix_len = len(path_prefix)
+        with self._lock:
+            for path in tuple(self._items_by_path):
+                if path[:prefix_len] == path_prefix:
+                    self._items_by_path.pop(path)
+                    self._size -= self._size_by_path.pop(path, 0)
+
+    def get_usage(self):
+        """Usage information of the cache.
+
+        Returns:
+            dict[str, Any]: Usage information.
+
+        """
+        with self._lock:
+            items = list(self._items_by_path.items())
+            size_by_path = dict(self._size_by_path)
+
+        size = 0
+        for path, cache in items:
+            path_size = size_by_path.get(path)
+            if path_size is None:
+                path_size = _get_data_size(cache.get_data())
+            size += path_size
+        return {
+            "name": self.name,
+            "entries": len(items),
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _enforce_limits(self, current_path):
+        while len(self._items_by_path) > 1:
+            over_limit = (
+                (
+                    self.max_entries is not None
+                    and len(self._items_by_path) > self.max_entries
+                )
+                or (
+                    self.max_bytes is not None
+                    and self._size > self.max_bytes
+                )
+            )
+            if not over_limit:
+                break
+            oldest_path = next(iter(self._items_by_path))
+            # Currently used item is newest, which means that it is
+            #   the only item in the cache
+            if oldest_path == current_path:
+                break
+            self._evict(oldest_path)
+
+    def _evict(self, path):
+        self._items_by_path.pop(path)
+        self._size -= self._size_by_path.pop(path, 0)
+        self.evictions += 1
+        root = self._root_ref()
+        if root is not None:
+            root._remove_path(path)
+
+
 class CacheItem:
     """Simple cache item with lifetime and default factory for default value.
 
@@ -22,9 +220,15 @@ class CacheItem:
             value used on init and on reset.
         lifetime (Optional[int]): Lifetime of the cache data in seconds.
             Default lifetime is 120 seconds.
+        _tracker (Optional[_CacheTracker]): Private argument. Usage tracker
+            of root nested cache item.
+        _path (Optional[tuple[Any, ...]]): Private argument. Path of
+            the item in root nested cache item.
 
     """
-    def __init__(self, default_factory=None, lifetime=None):
+    def __init__(
+        self, default_factory=None, lifetime=None, _tracker=None, _path=None
+    ):
         if lifetime is None:
             lifetime = 120
         self._lifetime = lifetime
@@ -33,6 +237,8 @@ class CacheItem:
             default_factory = _default_factory_func
         self._default_factory = default_factory
         self._data = default_factory()
+        self._tracker = _tracker
+        self._path = _path
 
     @property
     def is_valid(self):
@@ -41,11 +247,36 @@ class CacheItem:
         Return:
             bool: True if cache is valid, False otherwise.
 
+        """
+        is_valid = not self.is_expired
+        if self._tracker is not None:
+            self._tracker.item_checked(is_valid)
+        return is_valid
+
+    @property
+    def is_expired(self):
+        """Cache data are not valid.
+
+        Same as 'is_valid' but is not counted to hit/miss statistics.
+
+        Return:
+            bool: True if cache is not valid, False otherwise.
+
         """
         if self._last_update is None:
-            return False
+            return True
 
-        return (time.time() - self._last_update) < self._lifetime
+        return (time.time() - self._last_update) >= self._lifetime
+
+    @property
+    def is_outdated(self):
+        """Cache had data but they are not valid anymore.
+
+        Return:
+            bool: True if cache data expired, False otherwise.
+
+        """
+        return self._last_update is not None and self.is_expired
 
     def set_lifetime(self, lifetime):
         """Change lifetime of cache item.
@@ -66,6 +297,8 @@ class CacheItem:
 
         self._last_update = None
         self._data = self._default_factory()
+        if self._tracker is not None:
+            self._tracker.item_updated(self._path, self)
 
     def get_data(self):
         """Receive cached data.
@@ -85,6 +318,8 @@ class CacheItem:
         """
         self._data = data
         self._last_update = time.time()
+        if self._tracker is not None:
+            self._tracker.item_updated(self._path, self)
 
 
 class NestedCacheItem:
@@ -105,26 +340,59 @@ class NestedCacheItem:
         >>> cache["a"]["b"].is_valid
         False
 
+    Cache items are removed when cache has more than 'max_entries' items,
+    or when estimated size of cached data is bigger than 'max_bytes'.
+    Items that were not used for the longest time are removed first.
+    Expired items that were not used for the longest time are also removed
+    when any item is accessed.
+
+    Usage of all nested cache items in process can be received with
+    'get_caches_usage'.
+
     Args:
         levels (int): Number of nested levels where read cache is stored.
         default_factory (Optional[callable]): Function that returns default
             value used on init and on reset.
         lifetime (Optional[int]): Lifetime of the cache data in seconds.
             Default value is based on default value of 'CacheItem'.
+        max_entries (Optional[int]): Maximum number of cache items.
+        max_bytes (Optional[int]): Maximum estimated size of cached data
+            in bytes. Size of data is estimated on each update.
+        name (Optional[str]): Name of cache used in usage report.
         _init_info (Optional[InitInfo]): Private argument. Init info for
             nested cache where created from parent item.
+        _tracker (Optional[_CacheTracker]): Private argument. Usage tracker
+            of root nested cache item.
+        _path (Optional[tuple[Any, ...]]): Private argument. Path of nested
+            cache in root nested cache item.
 
     """
     def __init__(
-        self, levels=1, default_factory=None, lifetime=None, _init_info=None
+        self,
+        levels=1,
+        default_factory=None,
+        lifetime=None,
+        max_entries=None,
+        max_bytes=None,
+        name=None,
+        _init_info=None,
+        _tracker=None,
+        _path=None,
     ):
         if levels < 1:
             raise ValueError("Nested levels must be greater than 0")
         self._data_by_key = {}
         if _init_info is None:
             _init_info = InitInfo(default_factory, lifetime)
+        if _tracker is None:
+            _tracker = _CacheTracker(self, name, max_entries, max_bytes)
+            _nested_caches.add(self)
+        if _path is None:
+            _path = ()
         self._init_info = _init_info
         self._levels = levels
+        self._tracker = _tracker
+        self._path = _path
 
     def __getitem__(self, key):
         """Get cached data.
@@ -137,18 +405,26 @@ class NestedCacheItem:
 
         """
         cache = self._data_by_key.get(key)
+        path = self._path + (key, )
         if cache is None:
             if self._levels > 1:
                 cache = NestedCacheItem(
                     levels=self._levels - 1,
-                    _init_info=self._init_info
+                    _init_info=self._init_info,
+                    _tracker=self._tracker,
+                    _path=path,
                 )
             else:
                 cache = CacheItem(
                     self._init_info.default_factory,
-                    self._init_info.lifetime
+                    self._init_info.lifetime,
+                    _tracker=self._tracker,
+                    _path=path,
                 )
             self._data_by_key[key] = cache
+
+        if self._levels == 1:
+            self._tracker.item_used(path, cache)
         return cache
 
     def __setitem__(self, key, value):
@@ -187,6 +463,19 @@ class NestedCacheItem:
         """
         return len(self._data_by_key)
 
+    def get_usage(self):
+        """Usage information of the cache.
+
+        Information is related to root nested cache item.
+
+        Returns:
+            dict[str, Any]: Usage information with name of cache, number of
+                entries, estimated size in bytes, number of hits, misses and
+                evictions, and limits.
+
+        """
+        return self._tracker.get_usage()
+
     def clear_key(self, key):
         """Clear cached item by key.
 
@@ -194,7 +483,8 @@ class NestedCacheItem:
             key (str): Key of the cache item.
 
         """
-        self._data_by_key.pop(key, None)
+        if self._data_by_key.pop(key, None) is not None:
+            self._tracker.forget(self._path + (key, ))
 
     def clear_invalid(self):
         """Clear all invalid cache items.
@@ -212,9 +502,10 @@ class NestedCacheItem:
                     changed[key] = output
                 if not cache.cached_count():
                     self._data_by_key.pop(key)
-            elif not cache.is_valid:
+            elif cache.is_expired:
                 changed[key] = cache.get_data()
                 self._data_by_key.pop(key)
+                self._tracker.forget(self._path + (key, ))
         return changed
 
     def reset(self):
@@ -225,6 +516,7 @@ class NestedCacheItem:
 
         """
         self._data_by_key = {}
+        self._tracker.forget(self._path)
 
     def set_lifetime(self, lifetime):
         """Change lifetime of all children cache items.
@@ -248,3 +540,38 @@ class NestedCacheItem:
         raise AttributeError((
             "{} does not support 'is_valid'. Lower nested level by '{}'"
         ).format(self.__class__.__name__, self._levels))
+
+    def _remove_path(self, path):
+        """Remove cache item by path and empty nested items on the path.
+
+        Args:
+            path (tuple[Any, ...]): Path of cache item.
+
+        """
+        parents = []
+        cache = self
+        for key in path[:-1]:
+            child = cache._data_by_key.get(key)
+            if child is None:
+                return
+            parents.append((cache, key, child))
+            cache = child
+        cache._data_by_key.pop(path[-1], None)
+        for parent, key, child in reversed(parents):
+            if child.cached_count():
+                break
+            parent._data_by_key.pop(key, None)
+
+
+def get_caches_usage():
+    """Usage information of all nested cache items in process.
+
+    Returns:
+        list[dict[str, Any]]: Usage information of each root
+            'NestedCacheItem', see 'NestedCacheItem.get_usage'.
+
+    """
+    return [
+        cache.get_usage()
+        for cache in list(_nested_caches)
+    ]
@@ -1,11 +1,17 @@
 import os
+import re
 import sys
 import subprocess
 import platform
 import json
+import time
+import queue
 import tempfile
+import threading
+import collections
 
 from .log import Logger
+from .profiling import add_subprocess_usage
 from .vendor_bin_utils import find_executable
 
 # MSDN process creation flag (Windows only)
@@ -69,28 +75,16 @@ def execute(args, silent=False, cwd=None, env=None, shell=None):
     return popen.returncode
 
 
-def run_subprocess(*args, **kwargs):
-    """Convenience method for getting output errors for subprocess.
-
-    Output logged when process finish.
-
-    Entered arguments and keyword arguments are passed to subprocess Popen.
-
-    On windows are 'creationflags' filled with flags that should cause ignore
-    creation of new window.
+def _prepare_subprocess_kwargs(args, kwargs):
+    """Prepare arguments for 'subprocess.Popen'.
 
     Args:
-        *args: Variable length argument list passed to Popen.
-        **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
-            pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+        args (tuple): Positional arguments for Popen.
+        kwargs (dict[str, Any]): Keyword arguments for Popen, modified
+            in place.
 
     Returns:
-        str: Full output of subprocess concatenated stdout and stderr.
-
-    Raises:
-        RuntimeError: Exception is raised if process finished with nonzero
-            return code.
+        tuple: Positional arguments for Popen.
 
     """
     # Modify creation flags on windows to hide console window if in UI mode
@@ -126,7 +120,35 @@ def run_subprocess(*args, **kwargs):
     # not passed.
     env = kwargs.get("env") or os.environ
     # Make sure environment contains only strings
-    filtered_env = {str(k): str(v) for k, v in env.items()}
+    kwargs["env"] = {str(k): str(v) for k, v in env.items()}
+    return args
+
+
+def run_subprocess(*args, **kwargs):
+    """Convenience method for getting output errors for subprocess.
+
+    Output logged when process finish.
+
+    Entered arguments and keyword arguments are passed to subprocess Popen.
+
+    On windows are 'creationflags' filled with flags that should cause ignore
+    creation of new window.
+
+    Args:
+        *args: Variable length argument list passed to Popen.
+        **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
+            pass `logging.Logger` object under "logger" to use custom logger
+            for output.
+
+    Returns:
+        str: Full output of subprocess concatenated stdout and stderr.
+
+    Raises:
+        RuntimeError: Exception is raised if process finished with nonzero
+            return code.
+
+    """
+    args = _prepare_subprocess_kwargs(args, kwargs)
 
     # Use lib's logger if was not passed with kwargs.
     logger = kwargs.pop("logger", None)
@@ -137,12 +159,14 @@ def run_subprocess(*args, **kwargs):
     kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
     kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
     kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
-    kwargs["env"] = filtered_env
 
+    start_time = time.perf_counter()
     proc = subprocess.Popen(*args, **kwargs)
 
     full_output = ""
     _stdout, _stderr = proc.communicate()
+    # Report process to active resource profiles
+    add_subprocess_usage(time.perf_counter() - start_time)
     if _stdout:
         _stdout = _stdout.decode("utf-8", errors="backslashreplace")
         full_output += _stdout
@@ -169,6 +193,344 @@ def run_subprocess(*args, **kwargs):
     return full_output
 
 
+class SubprocessProgressParser:
+    """Parse output lines of a process to progress.
+
+    Subclasses implement 'parse_line' which returns progress in range
+        0.0-1.0 for lines with progress information, 'None' for other lines.
+        Lines with progress information are not logged.
+    """
+    def parse_line(self, line):
+        """Parse progress from output line.
+
+        Args:
+            line (str): Output line without line ending.
+
+        Returns:
+            Union[float, None]: Progress or 'None' if line is not
+                progress information.
+
+        """
+        return None
+
+
+class FFmpegProgressParser(SubprocessProgressParser):
+    """Progress of ffmpeg running with '-progress pipe:1' argument.
+
+    Progress is calculated from processed frames when frame count is known,
+        otherwise from processed time if duration is known.
+
+    Args:
+        frame_count (Optional[int]): Number of output frames.
+        duration (Optional[float]): Output duration in seconds.
+
+    """
+    _line_regex = re.compile(r"^(?P<key>[a-z_0-9]+)=(?P<value>\S*)$")
+
+    def __init__(self, frame_count=None, duration=None):
+        self._frame_count = frame_count
+        self._duration = duration
+        self._progress = 0.0
+
+    def parse_line(self, line):
+        match = self._line_regex.match(line.strip())
+        if not match:
+            return None
+
+        key = match.group("key")
+        value = match.group("value")
+        try:
+            if key == "progress":
+                if value == "end":
+                    self._progress = 1.0
+
+            elif key == "frame" and self._frame_count:
+                self._progress = int(value) / self._frame_count
+
+            elif (
+                # 'out_time_ms' is in microseconds too
+                key in ("out_time_us", "out_time_ms")
+                and self._duration
+                and not self._frame_count
+            ):
+                self._progress = (int(value) / 1000000) / self._duration
+        except ValueError:
+            # Values may be 'N/A' at the beginning
+            pass
+
+        self._progress = min(max(self._progress, 0.0), 1.0)
+        return self._progress
+
+
+class OIIOToolProgressParser(SubprocessProgressParser):
+    """Progress of oiiotool processing frame sequence.
+
+    Progress is calculated by counting lines of written outputs which are
+        printed by oiiotool with '-v' argument.
+
+    Args:
+        frame_count (int): Number of output frames.
+        pattern (Optional[str]): Regex matching line of written output.
+
+    """
+    default_pattern = r"^\s*(?:Writing|Output)\b"
+
+    def __init__(self, frame_count, pattern=None):
+        if pattern is None:
+            pattern = self.default_pattern
+        self._frame_count = max(1, frame_count)
+        self._regex = re.compile(pattern)
+        self._processed = 0
+
+    def parse_line(self, line):
+        if not self._regex.search(line):
+            return None
+        self._processed += 1
+        return min(self._processed / self._frame_count, 1.0)
+
+
+class SubprocessCancelledError(RuntimeError):
+    """Process was killed because it was cancelled."""
+    pass
+
+
+class SubprocessResult:
+    """Result of process started with 'run_subprocess_streaming'.
+
+    Args:
+        returncode (int): Return code of process.
+        output (str): Last lines of concatenated stdout and stderr.
+        duration (float): Wall time of process in seconds.
+        cpu_time (Union[float, None]): User and system CPU time of process
+            and its children in seconds. Not available on Windows.
+        max_rss (Union[int, None]): Peak resident memory of process in bytes.
+            Not available on Windows.
+
+    """
+    def __init__(self, returncode, output, duration, cpu_time, max_rss):
+        self.returncode = returncode
+        self.output = output
+        self.duration = duration
+        self.cpu_time = cpu_time
+        self.max_rss = max_rss
+
+
+def _read_stream_lines(stream, stream_name, lines_queue, max_line_length):
+    """Read lines from process stream and put them to queue.
+
+    Carriage returns are handled as line endings too, tools often use them
+        to update status line in terminal.
+    """
+    try:
+        while True:
+            line = stream.readline(max_line_length)
+            if not line:
+                break
+            line = line.decode("utf-8", errors="backslashreplace")
+            for subline in line.replace("\r\n", "\n").split("\r"):
+                subline = subline.rstrip("\n")
+                if subline:
+                    lines_queue.put((stream_name, subline))
+    finally:
+        stream.close()
+        lines_queue.put((stream_name, None))
+
+
+def _stop_process(proc, wait_timeout=5):
+    proc.terminate()
+    try:
+        proc.wait(wait_timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _wait_for_process(proc):
+    """Wait for process and get its resources usage if possible.
+
+    Returns:
+        tuple[Union[float, None], Union[int, None]]: CPU time in seconds
+            and peak resident memory in bytes.
+
+    """
+    if not hasattr(os, "wait4") or proc.returncode is not None:
+        proc.wait()
+        return None, None
+
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        # Process was already reaped
+        proc.wait()
+        return None, None
+
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    max_rss = rusage.ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform != "darwin":
+        max_rss *= 1024
+    return rusage.ru_utime + rusage.ru_stime, max_rss
+
+
+def run_subprocess_streaming(
+    *args,
+    logger=None,
+    progress_parser=None,
+    progress_callback=None,
+    progress_log_step=0.1,
+    timeout=None,
+    cancel_event=None,
+    max_output_lines=1000,
+    max_line_length=65536,
+    **kwargs
+):
+    """Run process and process its output while it is running.
+
+    Alternative to 'run_subprocess' for long running processes. Output lines
+        are logged as soon as they are available and only last lines are
+        kept in memory. Progress of the process can be parsed from output
+        lines and reported using callback and logger.
+
+    Example:
+        >>> result = run_subprocess_streaming(
+        ...     ["ffmpeg", "-progress", "pipe:1", "-nostats", ...],
+        ...     progress_parser=FFmpegProgressParser(frame_count=100),
+        ...     timeout=3600,
+        ... )
+        >>> result.cpu_time
+
+    Args:
+        *args: Variable length argument list passed to Popen.
+        logger (Optional[logging.Logger]): Logger used for output.
+        progress_parser (Optional[SubprocessProgressParser]): Parser of
+            progress from output lines.
+        progress_callback (Optional[Callable[[float], None]]): Called when
+            progress changes, with progress in range 0.0-1.0.
+        progress_log_step (Optional[float]): Log progress each time it
+            grows by this step. Progress is not logged if 'None'.
+        timeout (Optional[float]): Kill process if it does not finish in
+            given number of seconds.
+        cancel_event (Optional[threading.Event]): Kill process when the
+            event is set.
+        max_output_lines (Optional[int]): Number of last output lines
+            kept in memory for result and error message.
+        max_line_length (Optional[int]): Longer lines are split.
+        **kwargs: Arbitrary keyword arguments passed to Popen.
+
+    Returns:
+        SubprocessResult: Result of process.
+
+    Raises:
+        RuntimeError: Process finished with nonzero return code.
+        subprocess.TimeoutExpired: Process did not finish in time.
+        SubprocessCancelledError: Process was cancelled.
+
+    """
+    args = _prepare_subprocess_kwargs(args, kwargs)
+    if logger is None:
+        logger = Logger.get_logger("run_subprocess")
+
+    kwargs["stdout"] = subprocess.PIPE
+    kwargs["stderr"] = subprocess.PIPE
+    kwargs["stdin"] = kwargs.get("stdin", subprocess.DEVNULL)
+
+    output_lines = collections.deque(maxlen=max_output_lines)
+    lines_queue = queue.Queue()
+    start_time = time.perf_counter()
+    proc = subprocess.Popen(*args, **kwargs)
+
+    threads = []
+    for stream, stream_name in (
+        (proc.stdout, "stdout"),
+        (proc.stderr, "stderr"),
+    ):
+        thread = threading.Thread(
+            target=_read_stream_lines,
+            args=(stream, stream_name, lines_queue, max_line_length),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    deadline = None
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+
+    progress = None
+    logged_step = 0
+    interrupted = None
+    open_streams = len(threads)
+    while open_streams:
+        if cancel_event is not None and cancel_event.is_set():
+            interrupted = "cancelled"
+        elif deadline is not None and time.monotonic() > deadline:
+            interrupted = "timeout"
+
+        if interrupted:
+            _stop_process(proc)
+            break
+
+        try:
+            stream_name, line = lines_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        if line is None:
+            open_streams -= 1
+            continue
+
+        if progress_parser is not None:
+            new_progress = progress_parser.parse_line(line)
+            if new_progress is not None:
+                if new_progress != progress:
+                    progress = new_progress
+                    if progress_callback is not None:
+                        progress_callback(progress)
+                    if progress_log_step:
+                        # Avoid float precision issues of steps
+                        step = int(round(progress / progress_log_step, 6))
+                        if step > logged_step:
+                            logged_step = step
+                            logger.info(
+                                "Progress: {:.0%}".format(progress)
+                            )
+                continue
+
+        output_lines.append(line)
+        if stream_name == "stdout":
+            logger.debug(line)
+        else:
+            logger.info(line)
+
+    for thread in threads:
+        # Child processes of killed process may still hold the streams
+        thread.join(5 if interrupted else None)
+
+    cpu_time, max_rss = _wait_for_process(proc)
+    duration = time.perf_counter() - start_time
+    # Report process to active resource profiles
+    add_subprocess_usage(duration, cpu_time, max_rss)
+
+    output = "\n".join(output_lines)
+    if interrupted == "timeout":
+        raise subprocess.TimeoutExpired(args, timeout, output=output)
+
+    if interrupted == "cancelled":
+        raise SubprocessCancelledError(
+            "Process was cancelled: \"{}\"".format(args)
+        )
+
+    if proc.returncode != 0:
+        exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
+        if output:
+            exc_msg += "\n\nOutput:\n{}".format(output)
+        raise RuntimeError(exc_msg)
+
+    return SubprocessResult(
+        proc.returncode, output, duration, cpu_time, max_rss
+    )
+
+
 def clean_envs_for_ayon_process(env=None):
     """Modify environments that may affect ayon-launcher process.
 
@@ -0,0 +1,311 @@
+"""Removal of files and directories using a pool of worker threads.
+
+Removing thousands of files one by one on network storage can take a lot of
+time because each removal is a round trip to the storage. The service below
+removes files concurrently and can postpone the removal until the caller
+decides that it is safe to remove them.
+"""
+import os
+import time
+import shutil
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+
+class FileCleanupService:
+    """Remove files and directories in background threads.
+
+    Paths can be added at any time. If service is not deferred the removal
+    starts right away, otherwise it starts on 'start' call. Deferred removal
+    can be cancelled using 'cancel' in which case nothing is removed.
+
+    Example:
+        >>> service = FileCleanupService(deferred=True)
+        >>> service.add_file("/tmp/render.0001.exr")
+        >>> service.add_dir("/tmp/staging")
+        >>> service.start()
+        >>> service.wait()
+
+    Args:
+        max_workers (Optional[int]): Maximum number of worker threads.
+        deferred (Optional[bool]): Removal does not start until 'start'
+            is called.
+        log (Optional[logging.Logger]): Logger used for reports.
+
+    """
+    default_max_workers = 8
+
+    def __init__(self, max_workers=None, deferred=False, log=None):
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+
+        self.log = log
+        self._max_workers = max(1, max_workers)
+        self._deferred = deferred
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+        self._queued_files = []
+        self._queued_dirs = []
+        self._empty_dirs = set()
+        self._known_paths = set()
+        self._started = not deferred
+        self._cancelled = False
+
+        self._removed_files = 0
+        self._removed_bytes = 0
+        self._removed_dirs = 0
+        self._failed = []
+        self._start_time = None
+
+    @property
+    def deferred(self):
+        return self._deferred
+
+    @property
+    def started(self):
+        return self._started
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def get_failed(self):
+        """Paths that failed to be removed.
+
+        Returns:
+            list[tuple[str, Exception]]: Path with exception.
+
+        """
+        with self._lock:
+            return list(self._failed)
+
+    def add_file(self, path, remove_empty_parent=False):
+        """Add file to remove.
+
+        Args:
+            path (str): Path to file.
+            remove_empty_parent (Optional[bool]): Try to remove parent
+                directory if it is empty once all files are removed.
+
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            if self._cancelled or path in self._known_paths:
+                return
+            self._known_paths.add(path)
+            if remove_empty_parent:
+                self._empty_dirs.add(os.path.dirname(path))
+            if not self._started:
+                self._queued_files.append(path)
+                return
+        self._submit(self._remove_file, path)
+
+    def add_files(self, paths, remove_empty_parent=False):
+        for path in paths:
+            self.add_file(path, remove_empty_parent)
+
+    def add_dir(self, path):
+        """Add directory to remove with all its content.
+
+        Files in directory are collected using 'os.scandir' and removed
+        by worker threads, the directory tree is removed when they're done.
+
+        Args:
+            path (str): Path to directory.
+
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            if self._cancelled or path in self._known_paths:
+                return
+            self._known_paths.add(path)
+            if not self._started:
+                self._queued_dirs.append(path)
+                return
+        self._submit(self._remove_dir, path)
+
+    def add_empty_dir(self, path):
+        """Remove directory at the end of cleanup only if it is empty.
+
+        Args:
+            path (str): Path to directory.
+
+        """
+        with self._lock:
+            self._empty_dirs.add(os.path.normpath(path))
+
+    def start(self):
+        """Start removal of queued paths."""
+        with self._lock:
+            if self._started or self._cancelled:
+                return
+            self._started = True
+            queued_files = self._queued_files
+            queued_dirs = self._queued_dirs
+            self._queued_files = []
+            self._queued_dirs = []
+
+        for path in queued_files:
+            self._submit(self._remove_file, path)
+        for path in queued_dirs:
+            self._submit(self._remove_dir, path)
+
+    def cancel(self):
+        """Cancel removal of all paths that were not removed yet."""
+        with self._lock:
+            self._cancelled = True
+            self._queued_files = []
+            self._queued_dirs = []
+            self._empty_dirs = set()
+            futures = list(self._futures)
+
+        for future in futures:
+            future.cancel()
+
+    def wait(self):
+        """Wait for all removals to finish and log report.
+
+        Returns:
+            bool: All paths were removed without errors.
+
+        """
+        while True:
+            with self._lock:
+                futures = [
+                    future
+                    for future in self._futures
+                    if not future.done()
+                ]
+            if not futures:
+                break
+            for future in futures:
+                try:
+                    future.result()
+                except CancelledError:
+                    pass
+
+        if not self._cancelled:
+            self._remove_empty_dirs()
+
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._futures = []
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        self._log_report()
+        return not self._failed
+
+    def _submit(self, func, path):
+        with self._lock:
+            if self._cancelled:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="FileCleanup"
+                )
+                self._start_time = time.perf_counter()
+            self._futures.append(self._executor.submit(func, path))
+
+    def _add_failed(self, path, exc):
+        with self._lock:
+            self._failed.append((path, exc))
+
+    def _remove_file(self, path):
+        if self._cancelled:
+            return
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            self._add_failed(path, exc)
+            return
+
+        with self._lock:
+            self._removed_files += 1
+            self._removed_bytes += size
+
+    def _remove_dir(self, path):
+        if self._cancelled or not os.path.isdir(path):
+            return
+
+        # Remove files in worker threads and remove the tree afterwards
+        subdirs = []
+        try:
+            with os.scandir(path) as scan:
+                for entry in scan:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    with self._lock:
+                        self._known_paths.add(entry.path)
+                    self._submit(self._remove_file, entry.path)
+        except Exception as exc:
+            self._add_failed(path, exc)
+            return
+
+        for subdir in subdirs:
+            self._remove_dir(subdir)
+
+        with self._lock:
+            self._empty_dirs.add(path)
+
+    def _remove_empty_dirs(self):
+        with self._lock:
+            dirpaths = self._empty_dirs
+            self._empty_dirs = set()
+
+        # Remove the deepest directories first
+        for dirpath in sorted(dirpaths, key=len, reverse=True):
+            if not os.path.isdir(dirpath):
+                continue
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                # Directory is not empty or file is still in use
+                continue
+            self._removed_dirs += 1
+
+        # Remove leftovers of directory trees that were fully cleaned
+        for dirpath in sorted(dirpaths, key=len):
+            if dirpath in self._known_paths and os.path.isdir(dirpath):
+                try:
+                    shutil.rmtree(dirpath)
+                except Exception as exc:
+                    self._add_failed(dirpath, exc)
+
+    def _log_report(self):
+        if self._start_time is None:
+            return
+
+        duration = time.perf_counter() - self._start_time
+        size_mb = self._removed_bytes / (1024 * 1024)
+        speed = self._removed_files / duration if duration else 0.0
+        self.log.debug(
+            "Removed {} files ({:.2f} MB) and {} directories in {:.2f}s"
+            " ({:.1f} files/s)".format(
+                self._removed_files,
+                size_mb,
+                self._removed_dirs,
+                duration,
+                speed
+            )
+        )
+        if self._failed:
+            self.log.warning(
+                "Failed to remove paths:\n{}".format("\n".join(
+                    "{}: {}".format(path, exc)
+                    for path, exc in sorted(
+                        self._failed, key=lambda i: i[0]
+                    )
+                ))
+            )
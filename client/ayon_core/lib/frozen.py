@@ -0,0 +1,164 @@
+"""Read-only views of nested data structures.
+
+Caches often return deep copies of large nested dictionaries so callers
+can't modify cached data. Read-only views avoid the copy on each access,
+nested values are wrapped lazily only when accessed. Callers that need
+to modify the data must ask for mutable copy explicitly.
+
+Example:
+    >>> settings = freeze({"core": {"tools": ["a", "b"]}})
+    >>> settings["core"]["tools"][0]
+    'a'
+    >>> settings["core"]["tools"] = []
+    Traceback (most recent call last):
+    ...
+    TypeError: 'FrozenDict' object does not support item assignment
+    >>> data = settings.mutable_copy()
+    >>> data["core"]["tools"] = []
+"""
+import copy
+import collections.abc
+
+
+def freeze(value):
+    """Wrap value in read-only view if it is a dictionary or a list.
+
+    Args:
+        value (Any): Value to wrap.
+
+    Returns:
+        Any: 'FrozenDict', 'FrozenList' or the value itself.
+
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+def unfreeze(value):
+    """Mutable deep copy of a value which may be a read-only view.
+
+    Args:
+        value (Any): Value to copy.
+
+    Returns:
+        Any: Mutable deep copy of the value.
+
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value.mutable_copy()
+    return copy.deepcopy(value)
+
+
+class FrozenDict(collections.abc.Mapping):
+    """Read-only view of a dictionary.
+
+    The wrapped dictionary is not copied, so it must not be changed by
+    the owner while the view is used. Nested dictionaries and lists are
+    returned as read-only views too.
+
+    Args:
+        data (dict[str, Any]): Wrapped dictionary.
+
+    """
+    __slots__ = ("_data", )
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return freeze(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenDict):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Deep copy of read-only view is a mutable copy
+        return copy.deepcopy(self._data, memo)
+
+    def mutable_copy(self):
+        """Mutable deep copy of the data.
+
+        Returns:
+            dict[str, Any]: Copy of the data.
+
+        """
+        return copy.deepcopy(self._data)
+
+
+class FrozenList(collections.abc.Sequence):
+    """Read-only view of a list.
+
+    Args:
+        data (list[Any]): Wrapped list.
+
+    """
+    __slots__ = ("_data", )
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return freeze(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenList):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._data, memo)
+
+    def mutable_copy(self):
+        """Mutable deep copy of the data.
+
+        Returns:
+            list[Any]: Copy of the data.
+
+        """
+        return copy.deepcopy(self._data)
@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and resource usage measurement."""
 import os
+import sys
+import time
 import cProfile
+import functools
+import threading
+import contextlib
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +38,194 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+class _ActiveProfiles(threading.local):
+    def __init__(self):
+        self.stack = []
+
+
+_active_profiles = _ActiveProfiles()
+_requests_hook_lock = threading.Lock()
+_requests_hook_installed = False
+
+
+def _get_self_max_rss():
+    """Peak resident memory of current process in bytes."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform != "darwin":
+        max_rss *= 1024
+    return max_rss
+
+
+def _get_children_cpu_time():
+    """CPU time of finished child processes in seconds."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _get_io_counters():
+    """Bytes read and written by current process.
+
+    Only available on Linux.
+
+    Returns:
+        tuple[Union[int, None], Union[int, None]]: Bytes read and written.
+
+    """
+    try:
+        with open("/proc/self/io", "r") as stream:
+            content = stream.read()
+    except OSError:
+        return None, None
+
+    values = {}
+    for line in content.splitlines():
+        key, _, value = line.partition(":")
+        values[key.strip()] = value.strip()
+    try:
+        return int(values["rchar"]), int(values["wchar"])
+    except (KeyError, ValueError):
+        return None, None
+
+
+def _diff(end, start):
+    if end is None or start is None:
+        return None
+    return end - start
+
+
+def _install_requests_hook():
+    """Count HTTP requests made by 'requests' sessions.
+
+    Server API connection uses 'requests' so this counts server API calls
+        made while a profile is active in the thread.
+    """
+    global _requests_hook_installed
+    with _requests_hook_lock:
+        if _requests_hook_installed:
+            return
+        _requests_hook_installed = True
+        try:
+            import requests
+        except ImportError:
+            return
+
+        orig_request = requests.Session.request
+
+        @functools.wraps(orig_request)
+        def request(*args, **kwargs):
+            if not _active_profiles.stack:
+                return orig_request(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return orig_request(*args, **kwargs)
+            finally:
+                add_server_request_usage(time.perf_counter() - start)
+
+        requests.Session.request = request
+
+
+def add_subprocess_usage(duration, cpu_time=None, max_rss=None):
+    """Add child process usage to profiles active in current thread.
+
+    Args:
+        duration (float): Wall time of the process in seconds.
+        cpu_time (Optional[float]): CPU time of the process in seconds.
+        max_rss (Optional[int]): Peak resident memory of the process
+            in bytes.
+
+    """
+    for profile in _active_profiles.stack:
+        profile["subprocess_count"] += 1
+        profile["subprocess_time"] += duration
+        if cpu_time is not None:
+            profile["subprocess_cpu_time"] += cpu_time
+        if max_rss is not None:
+            profile["subprocess_max_rss"] = max(
+                profile["subprocess_max_rss"], max_rss
+            )
+
+
+def add_server_request_usage(duration):
+    """Add server request to profiles active in current thread.
+
+    Args:
+        duration (float): Duration of the request in seconds.
+
+    """
+    for profile in _active_profiles.stack:
+        profile["api_calls"] += 1
+        profile["api_time"] += duration
+
+
+@contextlib.contextmanager
+def profile_resources(process_counters=True):
+    """Measure resources used by code in the block.
+
+    Wall and CPU time, child processes and server requests are measured
+        for current thread. Peak memory, I/O and CPU time of finished
+        child processes are values of whole process, so they include
+        work of other threads. They should be disabled with
+        'process_counters' when multiple threads do work at the same time.
+        Values which can't be measured on current platform, or are
+        disabled, are 'None'.
+
+    Args:
+        process_counters (Optional[bool]): Measure process-wide values.
+
+    Example:
+        >>> with profile_resources() as profile:
+        ...     do_something()
+        >>> profile["wall_time"]
+
+    Yields:
+        dict[str, Any]: Profile data filled when the block ends.
+
+    """
+    _install_requests_hook()
+
+    profile = {
+        "wall_time": 0.0,
+        "cpu_time": 0.0,
+        "children_cpu_time": None,
+        "peak_rss_delta": None,
+        "bytes_read": None,
+        "bytes_written": None,
+        "subprocess_count": 0,
+        "subprocess_time": 0.0,
+        "subprocess_cpu_time": 0.0,
+        "subprocess_max_rss": 0,
+        "api_calls": 0,
+        "api_time": 0.0,
+    }
+    start_max_rss = start_children_cpu = None
+    start_read = start_written = None
+    if process_counters:
+        start_max_rss = _get_self_max_rss()
+        start_children_cpu = _get_children_cpu_time()
+        start_read, start_written = _get_io_counters()
+    start_cpu = time.thread_time()
+    start = time.perf_counter()
+    _active_profiles.stack.append(profile)
+    try:
+        yield profile
+    finally:
+        _active_profiles.stack.remove(profile)
+        profile["wall_time"] = time.perf_counter() - start
+        profile["cpu_time"] = time.thread_time() - start_cpu
+        if process_counters:
+            end_read, end_written = _get_io_counters()
+            profile["bytes_read"] = _diff(end_read, start_read)
+            profile["bytes_written"] = _diff(end_written, start_written)
+            profile["children_cpu_time"] = _diff(
+                _get_children_cpu_time(), start_children_cpu
+            )
+            profile["peak_rss_delta"] = _diff(
+                _get_self_max_rss(), start_max_rss
+            )
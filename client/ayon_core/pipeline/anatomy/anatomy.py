@@ -12,8 +12,10 @@ from ayon_core.lib import (
     StringTemplate,
     CacheItem,
     NestedCacheItem,
+    freeze,
 )
 from ayon_core.addon import AddonsManager
+from ayon_core.pipeline.entities_cache import get_entities_cache
 
 from .exceptions import RootCombinationError, ProjectNotSet
 from .roots import AnatomyRoots
@@ -403,7 +405,6 @@ class BaseAnatomy(object):
 
 
 class Anatomy(BaseAnatomy):
-    _project_cache = NestedCacheItem(lifetime=10)
     _sitesync_addon_cache = CacheItem(lifetime=60)
     _default_site_id_cache = NestedCacheItem(lifetime=60)
     _root_overrides_cache = NestedCacheItem(2, lifetime=60)
@@ -421,7 +422,11 @@ class Anatomy(BaseAnatomy):
             ))
 
         if not project_entity:
-            project_entity = self.get_project_entity_from_cache(project_name)
+            # Anatomy data are copied from the entity on prepare so
+            #   read-only view is enough
+            project_entity = self.get_project_entity_from_cache(
+                project_name, frozen=True
+            )
         root_overrides = self._get_site_root_overrides(
             project_name, site_name
         )
@@ -429,11 +434,26 @@ class Anatomy(BaseAnatomy):
         super(Anatomy, self).__init__(project_entity, root_overrides)
 
     @classmethod
-    def get_project_entity_from_cache(cls, project_name):
-        project_cache = cls._project_cache[project_name]
-        if not project_cache.is_valid:
-            project_cache.update_data(ayon_api.get_project(project_name))
-        return copy.deepcopy(project_cache.get_data())
+    def get_project_entity_from_cache(cls, project_name, frozen=False):
+        """Project entity from cache.
+
+        Project entity is received from process-wide entities cache.
+
+        Args:
+            project_name (str): Project name.
+            frozen (Optional[bool]): Return read-only view of cached entity
+                instead of deep copy. The view is not 'dict' instance and
+                is not json serializable, use 'mutable_copy' to get
+                a mutable copy.
+
+        Returns:
+            Union[dict[str, Any], FrozenDict]: Project entity.
+
+        """
+        project_entity = get_entities_cache().get_project(project_name)
+        if frozen:
+            return freeze(project_entity)
+        return copy.deepcopy(project_entity)
 
     @classmethod
     def get_sitesync_addon(cls):
@@ -7,7 +7,9 @@ class TrackChangesItem:
     """Helper object to track changes in data.
 
     Has access to full old and new data and will create deep copy of them,
-    so it is not needed to create copy before passed in.
+    so it is not needed to create copy before passed in. Copies can be
+    skipped with 'copy_values' if passed values are never modified in place,
+    e.g. when they are snapshots of stored data.
 
     Can work as a dictionary if old or new value is a dictionary. In
     that case received object is another object of 'TrackChangesItem'.
@@ -71,17 +73,21 @@ class TrackChangesItem:
     Args:
         old_value (Any): Old value.
         new_value (Any): New value.
+        copy_values (Optional[bool]): Create deep copy of passed values.
     """
 
-    def __init__(self, old_value, new_value):
+    def __init__(self, old_value, new_value, copy_values=True):
         self._changed = old_value != new_value
         # Resolve if value is '_EMPTY_VALUE' after comparison of the values
         if old_value is _EMPTY_VALUE:
             old_value = None
         if new_value is _EMPTY_VALUE:
             new_value = None
-        self._old_value = copy.deepcopy(old_value)
-        self._new_value = copy.deepcopy(new_value)
+        if copy_values:
+            old_value = copy.deepcopy(old_value)
+            new_value = copy.deepcopy(new_value)
+        self._old_value = old_value
+        self._new_value = new_value
 
         self._old_is_dict = isinstance(old_value, dict)
         self._new_is_dict = isinstance(new_value, dict)
@@ -170,15 +176,14 @@ class TrackChangesItem:
         if not self.is_dict:
             return output
 
-        old_value = self.old_value
-        new_value = self.new_value
+        # Copy only changed values
         for key in self.changed_keys:
             _old = None
             _new = None
             if self._old_is_dict:
-                _old = old_value.get(key)
+                _old = copy.deepcopy(self._old_value.get(key))
             if self._new_is_dict:
-                _new = new_value.get(key)
+                _new = copy.deepcopy(self._new_value.get(key))
             output[key] = (_old, _new)
         return output
 
@@ -276,12 +281,14 @@ class TrackChangesItem:
 
         old_keys = self.old_keys
         new_keys = self.new_keys
-        new_value = self.new_value
-        old_value = self.old_value
+        # Values of this item are already copied (if should be), so
+        #   sub-items share them
+        new_value = self._new_value
+        old_value = self._old_value
         if self._old_is_dict and self._new_is_dict:
             for key in self.available_keys:
                 item = TrackChangesItem(
-                    old_value.get(key), new_value.get(key)
+                    old_value.get(key), new_value.get(key), copy_values=False
                 )
                 sub_items[key] = item
                 if item.changed or key not in old_keys or key not in new_keys:
@@ -295,7 +302,7 @@ class TrackChangesItem:
                 # NOTE Use '_EMPTY_VALUE' because old value could be 'None'
                 #   which would result in "unchanged" item
                 sub_items[key] = TrackChangesItem(
-                    old_value.get(key), _EMPTY_VALUE
+                    old_value.get(key), _EMPTY_VALUE, copy_values=False
                 )
 
         elif self._new_is_dict:
@@ -306,7 +313,7 @@ class TrackChangesItem:
                 # NOTE Use '_EMPTY_VALUE' because new value could be 'None'
                 #   which would result in "unchanged" item
                 sub_items[key] = TrackChangesItem(
-                    _EMPTY_VALUE, new_value.get(key)
+                    _EMPTY_VALUE, new_value.get(key), copy_values=False
                 )
 
         self._sub_items = sub_items
@@ -1,17 +1,19 @@
 import os
 import sys
 import copy
+import time
 import logging
+import threading
 import traceback
 import collections
 import inspect
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import typing
 from typing import Optional, Iterable, Dict
 
 import pyblish.logic
 import pyblish.api
-import ayon_api
 
 from ayon_core.settings import get_project_settings
 from ayon_core.lib import is_func_signature_supported
@@ -19,6 +21,8 @@ from ayon_core.lib.attribute_definitions import get_default_values
 from ayon_core.host import IPublishHost, IWorkfileHost
 from ayon_core.pipeline import Anatomy
 from ayon_core.pipeline.plugin_discover import DiscoverResult
+from ayon_core.pipeline.hierarchy_index import get_project_hierarchy_index
+from ayon_core.pipeline.entities_cache import get_entities_cache
 
 from .exceptions import (
     CreatorError,
@@ -185,10 +189,8 @@ class CreateContext:
 
         # Shared data across creators during collection phase
         self._collection_shared_data = None
-
-        # Context validation cache
-        self._folder_id_by_folder_path = {}
-        self._task_names_by_folder_path = {}
+        # Instances added by creators collecting in worker threads
+        self._collect_thread_data = threading.local()
 
         self.thumbnail_paths_by_instance_id = {}
 
@@ -349,7 +351,7 @@ class CreateContext:
         project_entity = None
         project_name = self.get_current_project_name()
         if project_name:
-            project_entity = ayon_api.get_project(project_name)
+            project_entity = get_entities_cache().get_project(project_name)
         self._current_project_entity = project_entity
         return copy.deepcopy(self._current_project_entity)
 
@@ -366,7 +368,7 @@ class CreateContext:
         folder_path = self.get_current_folder_path()
         if folder_path:
             project_name = self.get_current_project_name()
-            folder_entity = ayon_api.get_folder_by_path(
+            folder_entity = get_entities_cache().get_folder_by_path(
                 project_name, folder_path
             )
         self._current_folder_entity = folder_entity
@@ -387,7 +389,7 @@ class CreateContext:
             folder_entity = self.get_current_folder_entity()
             if folder_entity:
                 project_name = self.get_current_project_name()
-                task_entity = ayon_api.get_task_by_name(
+                task_entity = get_entities_cache().get_task_by_name(
                     project_name,
                     folder_id=folder_entity["id"],
                     task_name=task_name
@@ -500,8 +502,6 @@ class CreateContext:
 
         # Give ability to store shared data for collection phase
         self._collection_shared_data = {}
-        self._folder_id_by_folder_path = {}
-        self._task_names_by_folder_path = {}
 
     def reset_finalization(self):
         """Cleanup of attributes after reset."""
@@ -737,6 +737,15 @@ class CreateContext:
 
         TODO: Rename method to more suit.
         """
+        # Instances added from worker threads during collection are added
+        #   in main thread when all creators finished
+        collected_instances = getattr(
+            self._collect_thread_data, "instances", None
+        )
+        if collected_instances is not None:
+            collected_instances.append(instance)
+            return
+
         # Add instance to instances list
         if instance.id in self._instances_by_id:
             self.log.warning((
@@ -820,19 +829,22 @@ class CreateContext:
         project_name = self.project_name
         if folder_entity is None:
             folder_path = self.get_current_folder_path()
-            folder_entity = ayon_api.get_folder_by_path(
+            folder_entity = get_entities_cache().get_folder_by_path(
                 project_name, folder_path
             )
             if folder_entity is None:
                 raise CreatorError(
                     "Folder '{}' was not found".format(folder_path)
                 )
+            folder_entity = copy.deepcopy(folder_entity)
 
         if task_entity is None:
             current_task_name = self.get_current_task_name()
             if current_task_name:
-                task_entity = ayon_api.get_task_by_name(
-                    project_name, folder_entity["id"], current_task_name
+                task_entity = copy.deepcopy(
+                    get_entities_cache().get_task_by_name(
+                        project_name, folder_entity["id"], current_task_name
+                    )
                 )
 
         if pre_create_data is None:
@@ -1004,45 +1016,134 @@ class CreateContext:
             self.get_instances_context_info(instances_to_validate)
 
     def reset_instances(self):
-        """Reload instances"""
-        self._instances_by_id = collections.OrderedDict()
+        """Reload instances.
 
-        # Collect instances
-        error_message = "Collection of instances for creator {} failed. {}"
-        failed_info = []
-        for creator in self.sorted_creators:
-            label = creator.label
-            identifier = creator.identifier
-            failed = False
-            add_traceback = False
-            exc_info = None
-            try:
-                creator.collect_instances()
+        Creators with 'collect_thread_safe' enabled collect instances in
+        worker threads while other creators collect in main thread.
+        Instances are added to context in order of creators.
+        """
+        self._instances_by_id = collections.OrderedDict()
 
-            except CreatorError:
-                failed = True
-                exc_info = sys.exc_info()
-                self.log.warning(error_message.format(identifier, exc_info[1]))
+        sorted_creators = self.sorted_creators
+        thread_safe_creators = [
+            creator
+            for creator in sorted_creators
+            if creator.collect_thread_safe
+        ]
+        if len(thread_safe_creators) < 2:
+            thread_safe_creators = []
 
-            except:  # noqa: E722
-                failed = True
-                add_traceback = True
-                exc_info = sys.exc_info()
-                self.log.warning(
-                    error_message.format(identifier, ""),
-                    exc_info=True
+        failed_info = []
+        process_times = {}
+        if self.creator_discover_result is not None:
+            process_times = self.creator_discover_result.process_times
+            process_times.clear()
+
+        collected_by_identifier = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(thread_safe_creators), 8)),
+            thread_name_prefix="CreatorCollect"
+        ) as executor:
+            futures_by_identifier = {
+                creator.identifier: executor.submit(
+                    self._collect_creator_instances, creator, True
+                )
+                for creator in thread_safe_creators
+            }
+            for creator in sorted_creators:
+                if creator.identifier in futures_by_identifier:
+                    continue
+                collected_by_identifier[creator.identifier] = (
+                    self._collect_creator_instances(creator)
                 )
 
-            if failed:
-                failed_info.append(
-                    prepare_failed_creator_operation_info(
-                        identifier, label, exc_info, add_traceback
+            for identifier, future in futures_by_identifier.items():
+                collected_by_identifier[identifier] = future.result()
+
+        for creator in sorted_creators:
+            identifier = creator.identifier
+            instances, process_time, fail_info = (
+                collected_by_identifier[identifier]
+            )
+            process_times[identifier] = process_time
+            if fail_info is not None:
+                failed_info.append(fail_info)
+            for instance in instances:
+                self.creator_adds_instance(instance)
+
+        # Keep order of instances same as if creators were collected
+        #   one after another
+        if thread_safe_creators:
+            creator_order = {
+                creator.identifier: idx
+                for idx, creator in enumerate(sorted_creators)
+            }
+            self._instances_by_id = collections.OrderedDict(
+                sorted(
+                    self._instances_by_id.items(),
+                    key=lambda item: creator_order.get(
+                        item[1].creator_identifier, len(creator_order)
                     )
                 )
+            )
 
         if failed_info:
             raise CreatorsCollectionFailed(failed_info)
 
+    def _collect_creator_instances(self, creator, in_thread=False):
+        """Collect instances of a creator.
+
+        Args:
+            creator (BaseCreator): Creator plugin.
+            in_thread (Optional[bool]): Collection runs in worker thread.
+                Added instances are returned instead of added to context.
+
+        Returns:
+            tuple[list[CreatedInstance], float, Union[dict, None]]: Instances
+                collected in worker thread, process time and information
+                about failure.
+
+        """
+        error_message = "Collection of instances for creator {} failed. {}"
+        label = creator.label
+        identifier = creator.identifier
+        failed = False
+        add_traceback = False
+        exc_info = None
+        instances = []
+        if in_thread:
+            self._collect_thread_data.instances = instances
+
+        start = time.perf_counter()
+        try:
+            creator.collect_instances()
+
+        except CreatorError:
+            failed = True
+            exc_info = sys.exc_info()
+            self.log.warning(error_message.format(identifier, exc_info[1]))
+
+        except:  # noqa: E722
+            failed = True
+            add_traceback = True
+            exc_info = sys.exc_info()
+            self.log.warning(
+                error_message.format(identifier, ""),
+                exc_info=True
+            )
+
+        finally:
+            if in_thread:
+                self._collect_thread_data.instances = None
+
+        process_time = time.perf_counter() - start
+        fail_info = None
+        if failed:
+            fail_info = prepare_failed_creator_operation_info(
+                identifier, label, exc_info, add_traceback
+            )
+        return instances, process_time, fail_info
+
     def find_convertor_items(self):
         """Go through convertor plugins to look for items to convert.
 
@@ -1121,10 +1222,9 @@ class CreateContext:
         if not info_by_instance_id:
             return info_by_instance_id
 
-        project_name = self.project_name
+        hierarchy_index = get_project_hierarchy_index(self.project_name)
 
         to_validate = []
-        task_names_by_folder_path = collections.defaultdict(set)
         for instance in instances:
             context_info = info_by_instance_id[instance.id]
             if instance.has_promised_context:
@@ -1132,97 +1232,40 @@ class CreateContext:
                 context_info.task_is_valid = True
                 continue
             # TODO allow context promise
-            folder_path = context_info.folder_path
-            if not folder_path:
-                continue
-
-            if folder_path in self._folder_id_by_folder_path:
-                folder_id = self._folder_id_by_folder_path[folder_path]
-                if folder_id is None:
-                    continue
-                context_info.folder_is_valid = True
-
-            task_name = context_info.task_name
-            if task_name is not None:
-                tasks_cache = self._task_names_by_folder_path.get(folder_path)
-                if tasks_cache is not None:
-                    context_info.task_is_valid = task_name in tasks_cache
-                    continue
-
-            to_validate.append(instance)
-            task_names_by_folder_path[folder_path].add(task_name)
+            if context_info.folder_path:
+                to_validate.append(instance)
 
         if not to_validate:
             return info_by_instance_id
 
         # Backwards compatibility for cases where folder name is set instead
         #   of folder path
-        folder_names = set()
         folder_paths = set()
-        for folder_path in task_names_by_folder_path.keys():
-            if folder_path is None:
-                pass
-            elif "/" in folder_path:
-                folder_paths.add(folder_path)
-            else:
-                folder_names.add(folder_path)
-
-        folder_paths_by_id = {}
-        if folder_paths:
-            for folder_entity in ayon_api.get_folders(
-                project_name,
-                folder_paths=folder_paths,
-                fields={"id", "path"}
-            ):
-                folder_id = folder_entity["id"]
-                folder_path = folder_entity["path"]
-                folder_paths_by_id[folder_id] = folder_path
-                self._folder_id_by_folder_path[folder_path] = folder_id
-
-        folder_entities_by_name = collections.defaultdict(list)
-        if folder_names:
-            for folder_entity in ayon_api.get_folders(
-                project_name,
-                folder_names=folder_names,
-                fields={"id", "name", "path"}
-            ):
-                folder_id = folder_entity["id"]
-                folder_name = folder_entity["name"]
-                folder_path = folder_entity["path"]
-                folder_paths_by_id[folder_id] = folder_path
-                folder_entities_by_name[folder_name].append(folder_entity)
-                self._folder_id_by_folder_path[folder_path] = folder_id
-
-        tasks_entities = ayon_api.get_tasks(
-            project_name,
-            folder_ids=folder_paths_by_id.keys(),
-            fields={"name", "folderId"}
-        )
-
-        task_names_by_folder_path = collections.defaultdict(set)
-        for task_entity in tasks_entities:
-            folder_id = task_entity["folderId"]
-            folder_path = folder_paths_by_id[folder_id]
-            task_names_by_folder_path[folder_path].add(task_entity["name"])
-        self._task_names_by_folder_path.update(task_names_by_folder_path)
-
         for instance in to_validate:
             folder_path = instance["folderPath"]
-            task_name = instance.get("task")
-            if folder_path and "/" not in folder_path:
-                folder_entities = folder_entities_by_name.get(folder_path)
-                if len(folder_entities) == 1:
-                    folder_path = folder_entities[0]["path"]
+            if "/" not in folder_path:
+                folder_paths_by_name = (
+                    hierarchy_index.get_folder_paths_by_name(folder_path)
+                )
+                if len(folder_paths_by_name) == 1:
+                    folder_path = next(iter(folder_paths_by_name))
                     instance["folderPath"] = folder_path
+                    info_by_instance_id[instance.id].folder_path = folder_path
+            folder_paths.add(folder_path)
 
-            if folder_path not in task_names_by_folder_path:
-                continue
+        # Query folders unknown to the index at once
+        folder_ids_by_path = hierarchy_index.get_folder_ids(folder_paths)
+        for instance in to_validate:
             context_info = info_by_instance_id[instance.id]
+            folder_path = context_info.folder_path
+            if folder_ids_by_path.get(folder_path) is None:
+                continue
             context_info.folder_is_valid = True
 
+            task_name = context_info.task_name
             if (
                 not task_name
-                or task_name in task_names_by_folder_path[folder_path]
+                or hierarchy_index.task_exists(folder_path, task_name)
             ):
                 context_info.task_is_valid = True
         return info_by_instance_id
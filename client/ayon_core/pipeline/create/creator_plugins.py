@@ -186,6 +186,12 @@ class BaseCreator(ABC):
     # QUESTION make this required?
     host_name: Optional[str] = None
 
+    # Collection of instances can run in a worker thread, together with
+    #   other thread safe creators
+    # - 'collect_instances' must not use host API, only e.g. read files
+    #   or query server
+    collect_thread_safe: bool = False
+
     # Settings auto-apply helpers
     # Root key in project settings (mandatory for auto-apply to work)
     settings_category: Optional[str] = None
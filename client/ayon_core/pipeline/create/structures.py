@@ -16,6 +16,51 @@ from ayon_core.pipeline import (
 from .exceptions import ImmutableKeyError
 from .changes import TrackChangesItem
 
+# Values of these types can't be modified in place so they can be shared
+#   between current data and snapshot of stored data
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _snapshot_data(data, orig_data=None, dirty_keys=None):
+    """Create snapshot of data which is never modified in place.
+
+    Immutable values are shared with passed data. Mutable values that are
+    equal to values in previous snapshot reuse them, so unchanged parts
+    of data are not copied again.
+
+    Args:
+        data (Dict[str, Any]): Current data.
+        orig_data (Optional[Dict[str, Any]]): Previous snapshot.
+        dirty_keys (Optional[Set[str]]): Keys that were set since previous
+            snapshot, their values are copied without comparison. Mutable
+            values of other keys are still compared, because they could
+            be changed in place.
+
+    Returns:
+        Dict[str, Any]: Snapshot of data.
+
+    """
+    if orig_data is None:
+        orig_data = {}
+    if dirty_keys is None:
+        dirty_keys = set()
+
+    output = {}
+    for key, value in data.items():
+        if isinstance(value, _IMMUTABLE_TYPES):
+            output[key] = value
+            continue
+
+        # Values can be modified in place so they have to be compared
+        #   even if key is not dirty
+        if key not in dirty_keys and key in orig_data:
+            orig_value = orig_data[key]
+            if orig_value == value:
+                output[key] = orig_value
+                continue
+        output[key] = copy.deepcopy(value)
+    return output
+
 
 class ConvertorItem:
     """Item representing convertor plugin.
@@ -86,8 +131,10 @@ class AttributeValues:
 
     def __init__(self, attr_defs, values, origin_data=None):
         if origin_data is None:
-            origin_data = copy.deepcopy(values)
+            origin_data = _snapshot_data(values)
+        # Snapshot of stored values which is never modified in place
         self._origin_data = origin_data
+        self._dirty_keys = set()
 
         attr_defs_by_key = {
             attr_def.key: attr_def
@@ -146,9 +193,11 @@ class AttributeValues:
                 continue
             self._data[_key] = _value
             changes[_key] = _value
+        self._dirty_keys |= set(changes)
 
     def pop(self, key, default=None):
         value = self._data.pop(key, default)
+        self._dirty_keys.add(key)
         # Remove attribute definition if is 'UnknownDef'
         # - gives option to get rid of unknown values
         attr_def = self._attr_defs_by_key.get(key)
@@ -158,10 +207,14 @@ class AttributeValues:
         return value
 
     def reset_values(self):
+        self._dirty_keys |= set(self._data)
         self._data = {}
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        self._origin_data = _snapshot_data(
+            self._data, self._origin_data, self._dirty_keys
+        )
+        self._dirty_keys = set()
 
     @property
     def attr_defs(self):
@@ -251,7 +304,8 @@ class PublishAttributes:
 
     def __init__(self, parent, origin_data, attr_plugins=None):
         self.parent = parent
-        self._origin_data = copy.deepcopy(origin_data)
+        # Snapshot of stored values which is never modified in place
+        self._origin_data = _snapshot_data(origin_data)
 
         attr_plugins = attr_plugins or []
         self.attr_plugins = attr_plugins
@@ -310,7 +364,9 @@ class PublishAttributes:
             yield name
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        self._origin_data = _snapshot_data(
+            self.data_to_store(), self._origin_data
+        )
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -348,7 +404,7 @@ class PublishAttributes:
             self._plugin_names_order.append(key)
 
             value = data.get(key) or {}
-            orig_value = copy.deepcopy(origin_data.get(key) or {})
+            orig_value = origin_data.get(key) or {}
             self._data[key] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
@@ -384,7 +440,7 @@ class PublishAttributes:
         for plugin_name, attr_defs_data in attr_defs.items():
             attr_defs = deserialize_attr_defs(attr_defs_data)
             value = data.get(plugin_name) or {}
-            orig_value = copy.deepcopy(origin_data.get(plugin_name) or {})
+            orig_value = origin_data.get(plugin_name) or {}
             self._data[plugin_name] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
@@ -489,7 +545,10 @@ class CreatedInstance:
         orig_publish_attributes = data.pop("publish_attributes", None) or {}
 
         # Store original value of passed data
-        self._orig_data = copy.deepcopy(data)
+        # - snapshot is never modified in place, it is replaced on store
+        self._orig_data = _snapshot_data(data)
+        # Keys that were set or removed since last store
+        self._dirty_keys = set()
 
         # Pop 'productType' and 'productName' to prevent unexpected changes
         data.pop("productType", None)
@@ -568,6 +627,7 @@ class CreatedInstance:
         # Validate immutable keys
         if key not in self.__immutable_keys:
             self._data[key] = value
+            self._dirty_keys.add(key)
 
         elif value != self._data.get(key):
             # Raise exception if key is immutable and value has changed
@@ -582,6 +642,7 @@ class CreatedInstance:
             raise ImmutableKeyError(key)
 
         self._data.pop(key, *args, **kwargs)
+        self._dirty_keys.add(key)
 
     def keys(self):
         return self._data.keys()
@@ -617,9 +678,13 @@ class CreatedInstance:
 
     @property
     def origin_data(self):
-        output = copy.deepcopy(self._orig_data)
-        output["creator_attributes"] = self.creator_attributes.origin_data
-        output["publish_attributes"] = self.publish_attributes.origin_data
+        return copy.deepcopy(self._get_origin_snapshot())
+
+    def _get_origin_snapshot(self):
+        """Origin data without copying snapshots."""
+        output = dict(self._orig_data)
+        output["creator_attributes"] = self.creator_attributes._origin_data
+        output["publish_attributes"] = self.publish_attributes._origin_data
         return output
 
     @property
@@ -674,9 +739,25 @@ class CreatedInstance:
         return self._transient_data
 
     def changes(self):
-        """Calculate and return changes."""
+        """Calculate and return changes.
+
+        Values are not copied, origin data are snapshots that are never
+        modified and current data are not changed while changes
+        are processed.
+
+        Note:
+            All keys are compared, not only keys that were set or removed.
+            Mutable values can be changed in place without the instance
+            knowing about it (e.g. 'instance["key"]["sub"] = value'). Values
+            shared with snapshot are compared by identity, so only mutable
+            values are compared deeply.
+        """
 
-        return TrackChangesItem(self.origin_data, self.data_to_store())
+        return TrackChangesItem(
+            self._get_origin_snapshot(),
+            self.data_to_store(),
+            copy_values=False
+        )
 
     def mark_as_stored(self):
         """Should be called when instance data are stored.
@@ -684,15 +765,16 @@ class CreatedInstance:
         Origin data are replaced by current data so changes are cleared.
         """
 
-        orig_keys = set(self._orig_data.keys())
-        for key, value in self._data.items():
-            orig_keys.discard(key)
-            if key in ("creator_attributes", "publish_attributes"):
-                continue
-            self._orig_data[key] = copy.deepcopy(value)
-
-        for key in orig_keys:
-            self._orig_data.pop(key)
+        self._orig_data = _snapshot_data(
+            {
+                key: value
+                for key, value in self._data.items()
+                if key not in ("creator_attributes", "publish_attributes")
+            },
+            self._orig_data,
+            self._dirty_keys
+        )
+        self._dirty_keys = set()
 
         self.creator_attributes.mark_as_stored()
         self.publish_attributes.mark_as_stored()
@@ -761,8 +843,7 @@ class CreatedInstance:
                 instance of for which the instance belong.
         """
 
-        instance_data = copy.deepcopy(instance_data)
-
+        # Data are copied in '__init__'
         product_type = instance_data.get("productType")
         if product_type is None:
             product_type = instance_data.get("family")
@@ -827,7 +908,8 @@ class CreatedInstance:
                 recreating. Should contain 'data' and 'orig_data'.
         """
 
-        instance_data = copy.deepcopy(serialized_data["data"])
+        # Data are copied in '__init__'
+        instance_data = serialized_data["data"]
         creator_identifier = instance_data["creator_identifier"]
 
         product_type = instance_data["productType"]
@@ -0,0 +1,525 @@
+"""Process-wide cache of project entities.
+
+Tools, create context and anatomy query the same project, folder, task or
+product entities over and over, each of them with own time based cache.
+The cache is shared by all of them, so an entity is queried only once
+in the process.
+
+Cached entities are invalidated by changes on server. Server events of
+a project are checked by 'ProjectEventsPoller' when the project is
+accessed, and changed entities are dropped. The poller is shared with
+other caches of project entities, so events are queried only once. Each
+entity type has also own lifetime in case events are not available, and
+number of cached entities is limited, least recently used entities are
+dropped first.
+
+Entities are queried with default fields. Cached entities are shared,
+they must not be modified.
+"""
+import time
+import datetime
+import logging
+import threading
+import collections
+
+import ayon_api
+
+log = logging.getLogger(__name__)
+
+
+class ProjectEventsPoller:
+    """Poll entity events of projects on server.
+
+    Caches of project entities register callback and call 'check' when
+    a project is accessed. Events of the project are queried at most once
+    per 'check_interval' seconds and new events are passed to all
+    callbacks.
+
+    Callback is called with project name and list of events with 'id',
+    'topic' and 'summary', or with 'None' if events could not be received
+    and all cached data of the project should be dropped.
+    """
+    entity_types = (
+        "project",
+        "folder",
+        "task",
+        "product",
+        "version",
+        "representation",
+    )
+    # Events are not checked more often (in seconds)
+    check_interval = 5
+    # Events are queried with time overlap to cover time difference of
+    #   server and client (in seconds)
+    time_margin = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state_by_project = {}
+        self._callbacks = []
+
+    def register_callback(self, callback):
+        """Register callback called with new events of a project.
+
+        Args:
+            callback (Callable[[str, Union[list[dict], None]], None]):
+                Callback.
+
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def check(self, project_name):
+        """Check new events of a project.
+
+        Args:
+            project_name (str): Project name.
+
+        """
+        current_time = time.time()
+        with self._lock:
+            state = self._state_by_project.get(project_name)
+            if state is None:
+                # Nothing can be cached before first check
+                self._state_by_project[project_name] = {
+                    "last_check": current_time,
+                    "processed_ids": set(),
+                }
+                return
+
+            if current_time - state["last_check"] < self.check_interval:
+                return
+            last_check = state["last_check"]
+            # Other threads don't check events meanwhile
+            state["last_check"] = current_time
+            callbacks = list(self._callbacks)
+
+        newer_than = datetime.datetime.fromtimestamp(
+            last_check - self.time_margin,
+            tz=datetime.timezone.utc
+        ).isoformat()
+        events = []
+        event_ids = set()
+        try:
+            for event in ayon_api.get_events(
+                topics={
+                    f"entity.{entity_type}.*"
+                    for entity_type in self.entity_types
+                },
+                project_names={project_name},
+                newer_than=newer_than,
+                fields={"id", "topic", "summary"},
+            ):
+                event_ids.add(event["id"])
+                if event["id"] not in state["processed_ids"]:
+                    events.append(event)
+
+        except Exception:
+            log.debug(
+                f"Failed to receive events of project '{project_name}'.",
+                exc_info=True
+            )
+            events = None
+
+        else:
+            state["processed_ids"] = event_ids
+            if not events:
+                return
+
+        for callback in callbacks:
+            try:
+                callback(project_name, events)
+            except Exception:
+                log.warning(
+                    "Failed to process project events.", exc_info=True
+                )
+
+
+_project_events_poller = None
+_project_events_poller_lock = threading.Lock()
+
+
+def get_project_events_poller():
+    """Project events poller shared in the process.
+
+    Returns:
+        ProjectEventsPoller: Shared project events poller.
+
+    """
+    global _project_events_poller
+    with _project_events_poller_lock:
+        if _project_events_poller is None:
+            _project_events_poller = ProjectEventsPoller()
+    return _project_events_poller
+
+
+class EntitiesCache:
+    """Cache of project entities shared in the process.
+
+    Use 'get_entities_cache' to get shared cache.
+    """
+    entity_types = (
+        "project",
+        "folder",
+        "task",
+        "product",
+        "version",
+        "representation",
+    )
+    # Lifetime of cached entities by entity type (in seconds)
+    lifetimes = {
+        "project": 300,
+        "folder": 300,
+        "task": 300,
+        "product": 300,
+        "version": 120,
+        "representation": 120,
+    }
+    # Maximum number of cached entities of each entity type
+    max_entities = 10000
+    # Entity types which are invalidated when entity of a type is removed,
+    #   renamed or moved
+    children_types = {
+        "project": (),
+        "folder": ("task", "product", "version", "representation"),
+        "task": (),
+        "product": ("version", "representation"),
+        "version": ("representation",),
+        "representation": (),
+    }
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entities_by_type = {
+            entity_type: collections.OrderedDict()
+            for entity_type in self.entity_types
+        }
+        self._folder_ids_by_path = {}
+        self._task_ids_by_name = {}
+        self._events_poller = get_project_events_poller()
+        self._events_poller.register_callback(self._on_project_events)
+
+    def reset(self):
+        """Drop all cached entities."""
+        with self._lock:
+            for entities in self._entities_by_type.values():
+                entities.clear()
+            self._folder_ids_by_path.clear()
+            self._task_ids_by_name.clear()
+
+    def invalidate(self, project_name, entity_types=None):
+        """Drop cached entities of a project.
+
+        Args:
+            project_name (str): Project name.
+            entity_types (Optional[Iterable[str]]): Entity types to drop.
+                All entity types are dropped if not passed.
+
+        """
+        if entity_types is None:
+            entity_types = self.entity_types
+
+        with self._lock:
+            for entity_type in entity_types:
+                entities = self._entities_by_type[entity_type]
+                for key in [
+                    key for key in entities if key[0] == project_name
+                ]:
+                    entities.pop(key)
+
+                if entity_type == "folder":
+                    lookup = self._folder_ids_by_path
+                elif entity_type == "task":
+                    lookup = self._task_ids_by_name
+                else:
+                    continue
+                for key in [key for key in lookup if key[0] == project_name]:
+                    lookup.pop(key)
+
+    def add_entities(self, project_name, entity_type, entities):
+        """Add entities queried outside of the cache.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entities (Iterable[dict[str, Any]]): Entities with default
+                fields.
+
+        """
+        self._check_events(project_name)
+        with self._lock:
+            for entity in entities:
+                self._add_entity(project_name, entity_type, entity)
+
+    def get_project(self, project_name):
+        """Project entity.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            Union[dict[str, Any], None]: Project entity or None if project
+                was not found.
+
+        """
+        if not project_name:
+            return None
+        self._check_events(project_name)
+        entity = self._get_cached_entity(
+            project_name, "project", project_name
+        )
+        if entity is None:
+            entity = ayon_api.get_project(project_name)
+            if entity is not None:
+                self.add_entities(project_name, "project", [entity])
+        return entity
+
+    def get_entities(self, project_name, entity_type, entity_ids):
+        """Entities by ids.
+
+        Entities that are not cached are queried using single query.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type other than 'project'.
+            entity_ids (Iterable[str]): Entity ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Entities by id. Entities that were
+                not found are not in output.
+
+        """
+        output = {}
+        if not project_name:
+            return output
+
+        self._check_events(project_name)
+        missing_ids = set()
+        for entity_id in set(entity_ids):
+            entity = self._get_cached_entity(
+                project_name, entity_type, entity_id
+            )
+            if entity is None:
+                missing_ids.add(entity_id)
+            else:
+                output[entity_id] = entity
+
+        missing_ids.discard(None)
+        if missing_ids:
+            entities = list(self._query_entities(
+                project_name, entity_type, missing_ids
+            ))
+            self.add_entities(project_name, entity_type, entities)
+            for entity in entities:
+                output[entity["id"]] = entity
+        return output
+
+    def get_entity(self, project_name, entity_type, entity_id):
+        """Entity by id.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type other than 'project'.
+            entity_id (str): Entity id.
+
+        Returns:
+            Union[dict[str, Any], None]: Entity or None if was not found.
+
+        """
+        return self.get_entities(
+            project_name, entity_type, [entity_id]
+        ).get(entity_id)
+
+    def get_folder_by_path(self, project_name, folder_path):
+        """Folder entity by path.
+
+        Args:
+            project_name (str): Project name.
+            folder_path (str): Folder path.
+
+        Returns:
+            Union[dict[str, Any], None]: Folder entity or None if was
+                not found.
+
+        """
+        if not project_name or not folder_path:
+            return None
+
+        self._check_events(project_name)
+        with self._lock:
+            folder_id = self._folder_ids_by_path.get(
+                (project_name, folder_path)
+            )
+        if folder_id is not None:
+            entity = self._get_cached_entity(
+                project_name, "folder", folder_id
+            )
+            if entity is not None:
+                return entity
+
+        entity = ayon_api.get_folder_by_path(project_name, folder_path)
+        if entity is not None:
+            self.add_entities(project_name, "folder", [entity])
+        return entity
+
+    def get_task_by_name(self, project_name, folder_id, task_name):
+        """Task entity by folder id and task name.
+
+        Args:
+            project_name (str): Project name.
+            folder_id (str): Folder id.
+            task_name (str): Task name.
+
+        Returns:
+            Union[dict[str, Any], None]: Task entity or None if was
+                not found.
+
+        """
+        if not project_name or not folder_id or not task_name:
+            return None
+
+        self._check_events(project_name)
+        with self._lock:
+            task_id = self._task_ids_by_name.get(
+                (project_name, folder_id, task_name)
+            )
+        if task_id is not None:
+            entity = self._get_cached_entity(project_name, "task", task_id)
+            if entity is not None:
+                return entity
+
+        entity = ayon_api.get_task_by_name(
+            project_name, folder_id=folder_id, task_name=task_name
+        )
+        if entity is not None:
+            self.add_entities(project_name, "task", [entity])
+        return entity
+
+    def _get_cached_entity(self, project_name, entity_type, entity_id):
+        key = (project_name, entity_id)
+        with self._lock:
+            entities = self._entities_by_type[entity_type]
+            item = entities.get(key)
+            if item is None:
+                return None
+            cached_time, entity = item
+            if time.time() - cached_time > self.lifetimes[entity_type]:
+                entities.pop(key)
+                return None
+            entities.move_to_end(key)
+            return entity
+
+    def _add_entity(self, project_name, entity_type, entity):
+        if entity_type == "project":
+            entity_id = entity["name"]
+        else:
+            entity_id = entity["id"]
+        entities = self._entities_by_type[entity_type]
+        key = (project_name, entity_id)
+        entities[key] = (time.time(), entity)
+        entities.move_to_end(key)
+        while len(entities) > self.max_entities:
+            entities.popitem(last=False)
+
+        # NOTE Lookups are not cleaned up with dropped entities, they
+        #   only point to entity id which is validated on access
+        if entity_type == "folder" and entity.get("path"):
+            self._folder_ids_by_path[(project_name, entity["path"])] = (
+                entity_id
+            )
+        elif entity_type == "task" and entity.get("folderId"):
+            self._task_ids_by_name[
+                (project_name, entity["folderId"], entity["name"])
+            ] = entity_id
+
+    def _query_entities(self, project_name, entity_type, entity_ids):
+        if entity_type == "folder":
+            return ayon_api.get_folders(project_name, folder_ids=entity_ids)
+        if entity_type == "task":
+            return ayon_api.get_tasks(project_name, task_ids=entity_ids)
+        if entity_type == "product":
+            return ayon_api.get_products(
+                project_name, product_ids=entity_ids
+            )
+        if entity_type == "version":
+            return ayon_api.get_versions(
+                project_name, version_ids=entity_ids
+            )
+        if entity_type == "representation":
+            return ayon_api.get_representations(
+                project_name, representation_ids=entity_ids
+            )
+        raise ValueError(f"Unknown entity type '{entity_type}'")
+
+    def _check_events(self, project_name):
+        """Drop entities of a project that were changed on server."""
+        self._events_poller.check(project_name)
+
+    @staticmethod
+    def _affects_children(action):
+        return (
+            action == "deleted"
+            or "parent" in action
+            or action == "name_changed"
+        )
+
+    def _on_project_events(self, project_name, events):
+        if events is None:
+            log.debug(
+                f"Entities cache of project '{project_name}' is invalidated."
+            )
+            self.invalidate(project_name)
+            return
+
+        entity_types = set()
+        entity_ids_by_type = collections.defaultdict(set)
+        for event in events:
+            parts = event["topic"].split(".")
+            if len(parts) < 3 or parts[1] not in self.children_types:
+                continue
+            entity_type, action = parts[1], parts[2]
+            # Created entities were not cached
+            if action == "created":
+                continue
+
+            # Renamed or moved entity changes also children, e.g. path
+            #   of child folders
+            if self._affects_children(action):
+                entity_types.add(entity_type)
+                entity_types.update(self.children_types[entity_type])
+                continue
+
+            entity_id = (event.get("summary") or {}).get("entityId")
+            if entity_type == "project" or not entity_id:
+                entity_types.add(entity_type)
+            else:
+                entity_ids_by_type[entity_type].add(entity_id)
+
+        if entity_types:
+            self.invalidate(project_name, entity_types)
+
+        with self._lock:
+            for entity_type, entity_ids in entity_ids_by_type.items():
+                if entity_type in entity_types:
+                    continue
+                entities = self._entities_by_type[entity_type]
+                for entity_id in entity_ids:
+                    entities.pop((project_name, entity_id), None)
+
+
+_entities_cache = None
+_entities_cache_lock = threading.Lock()
+
+
+def get_entities_cache():
+    """Entities cache shared in the process.
+
+    Returns:
+        EntitiesCache: Shared entities cache.
+
+    """
+    global _entities_cache
+    with _entities_cache_lock:
+        if _entities_cache is None:
+            _entities_cache = EntitiesCache()
+    return _entities_cache
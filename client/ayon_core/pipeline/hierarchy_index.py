@@ -0,0 +1,351 @@
+"""Index of project folders and their task names.
+
+Validation of instance context, publishing and tools need to know if folder
+path exists, what is its id and which tasks it has. The index loads whole
+project hierarchy using a single query and is shared by all users in the
+process, so it is not loaded again e.g. on each reset of create context.
+
+Folder paths or task names which are not in the index are queried
+incrementally, e.g. when folder was created after the index was loaded.
+Result of the query is cached, so missing folder or task is not queried
+again until the index is refreshed.
+
+Server events of the project are checked using shared 'ProjectEventsPoller'
+on access. Created folders or tasks clear information about missing items,
+removed, renamed or moved folders or tasks invalidate the index.
+"""
+import time
+import threading
+import collections
+
+import ayon_api
+
+from ayon_core.lib import CacheItem
+from ayon_core.pipeline.entities_cache import get_project_events_poller
+
+
+class ProjectHierarchyIndex:
+    """Index of folders and task names of a project.
+
+    Use 'get_project_hierarchy_index' to get shared index of a project.
+
+    Args:
+        project_name (str): Project name.
+
+    """
+    lifetime = 300
+    # Lifetime of information that folder or task is missing
+    missing_lifetime = 30
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        self._lock = threading.RLock()
+        self._cache = CacheItem(lifetime=self.lifetime)
+        self._hierarchy_items = []
+        self._folder_id_by_path = {}
+        self._folder_path_by_id = {}
+        self._folder_paths_by_name = collections.defaultdict(set)
+        self._task_names_by_folder_id = collections.defaultdict(set)
+        self._missing_folder_paths = {}
+        self._missing_task_names = {}
+        self._events_poller = get_project_events_poller()
+        self._events_poller.register_callback(self._on_project_events)
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def is_valid(self):
+        return self._cache.is_valid
+
+    def refresh(self):
+        """Load whole project hierarchy from server."""
+        with self._lock:
+            self._load()
+
+    def set_invalid(self):
+        """Index will be loaded again on next access."""
+        self._cache.set_invalid()
+
+    def get_hierarchy_items(self):
+        """Folder items as returned by 'ayon_api.get_folders_hierarchy'.
+
+        Returns:
+            list[dict[str, Any]]: Hierarchy items of top level folders,
+                with children under 'children' key.
+
+        """
+        self._ensure_loaded()
+        return self._hierarchy_items
+
+    def get_folder_id(self, folder_path):
+        """Folder id by folder path.
+
+        Args:
+            folder_path (str): Folder path.
+
+        Returns:
+            Union[str, None]: Folder id or None if folder does not exist.
+
+        """
+        return self.get_folder_ids([folder_path])[folder_path]
+
+    def get_folder_ids(self, folder_paths):
+        """Folder ids by folder paths.
+
+        Folder paths that are not in the index are queried in single query.
+
+        Args:
+            folder_paths (Iterable[str]): Folder paths.
+
+        Returns:
+            dict[str, Union[str, None]]: Folder ids by folder paths.
+
+        """
+        folder_paths = {path for path in folder_paths if path}
+        self._ensure_loaded()
+        with self._lock:
+            missing_paths = {
+                path
+                for path in folder_paths
+                if (
+                    path not in self._folder_id_by_path
+                    and not self._is_marked_missing(
+                        self._missing_folder_paths, path
+                    )
+                )
+            }
+            if missing_paths:
+                self._fetch_folders(missing_paths)
+
+            return {
+                path: self._folder_id_by_path.get(path)
+                for path in folder_paths
+            }
+
+    def get_folder_path(self, folder_id):
+        """Folder path by id.
+
+        Args:
+            folder_id (str): Folder id.
+
+        Returns:
+            Union[str, None]: Folder path or None if folder is not known.
+
+        """
+        self._ensure_loaded()
+        return self._folder_path_by_id.get(folder_id)
+
+    def get_folder_paths_by_name(self, folder_name):
+        """Paths of folders with passed name.
+
+        Args:
+            folder_name (str): Folder name.
+
+        Returns:
+            set[str]: Folder paths.
+
+        """
+        self._ensure_loaded()
+        return set(self._folder_paths_by_name.get(folder_name, set()))
+
+    def get_task_names(self, folder_path):
+        """Task names of a folder.
+
+        Args:
+            folder_path (str): Folder path.
+
+        Returns:
+            Union[set[str], None]: Task names or None if folder
+                does not exist.
+
+        """
+        folder_id = self.get_folder_id(folder_path)
+        if folder_id is None:
+            return None
+        return set(self._task_names_by_folder_id[folder_id])
+
+    def task_exists(self, folder_path, task_name):
+        """Folder has task with passed name.
+
+        Task names of the folder are queried again if task is not found,
+        so tasks created after the index was loaded are found too.
+
+        Args:
+            folder_path (str): Folder path.
+            task_name (str): Task name.
+
+        Returns:
+            bool: Task exists.
+
+        """
+        folder_id = self.get_folder_id(folder_path)
+        if folder_id is None:
+            return False
+
+        with self._lock:
+            if task_name in self._task_names_by_folder_id[folder_id]:
+                return True
+            key = (folder_id, task_name)
+            if self._is_marked_missing(self._missing_task_names, key):
+                return False
+            self._fetch_tasks({folder_id})
+            if task_name in self._task_names_by_folder_id[folder_id]:
+                return True
+            self._missing_task_names[key] = time.time()
+            return False
+
+    def _is_marked_missing(self, missing, key):
+        missing_time = missing.get(key)
+        if missing_time is None:
+            return False
+        return time.time() - missing_time < self.missing_lifetime
+
+    def _ensure_loaded(self):
+        self._events_poller.check(self._project_name)
+        if self._cache.is_valid:
+            return
+        with self._lock:
+            if not self._cache.is_valid:
+                self._load()
+
+    @staticmethod
+    def _changes_structure(action):
+        return (
+            action in ("deleted", "name_changed")
+            or "parent" in action
+            or "folder" in action
+        )
+
+    def _on_project_events(self, project_name, events):
+        if project_name != self._project_name:
+            return
+
+        if events is None:
+            self.set_invalid()
+            return
+
+        created = False
+        invalidate = False
+        for event in events:
+            parts = event["topic"].split(".")
+            if len(parts) < 3 or parts[1] not in ("folder", "task"):
+                continue
+            action = parts[2]
+            if action == "created":
+                created = True
+            elif self._changes_structure(action):
+                invalidate = True
+                break
+
+        with self._lock:
+            if invalidate:
+                self.set_invalid()
+            elif created:
+                self._missing_folder_paths = {}
+                self._missing_task_names = {}
+
+    def _add_folder(self, folder_id, folder_path, folder_name):
+        self._folder_id_by_path[folder_path] = folder_id
+        self._folder_path_by_id[folder_id] = folder_path
+        self._folder_paths_by_name[folder_name].add(folder_path)
+        self._missing_folder_paths.pop(folder_path, None)
+
+    def _load(self):
+        hierarchy = ayon_api.get_folders_hierarchy(self._project_name)
+        hierarchy_items = hierarchy["hierarchy"]
+
+        self._folder_id_by_path = {}
+        self._folder_path_by_id = {}
+        self._folder_paths_by_name = collections.defaultdict(set)
+        self._task_names_by_folder_id = collections.defaultdict(set)
+        self._missing_folder_paths = {}
+        self._missing_task_names = {}
+
+        has_task_names = True
+        hierarchy_queue = collections.deque(hierarchy_items)
+        while hierarchy_queue:
+            item = hierarchy_queue.popleft()
+            name = item["name"]
+            path_parts = list(item["parents"])
+            path_parts.append(name)
+            folder_id = item["id"]
+            self._add_folder(folder_id, "/" + "/".join(path_parts), name)
+
+            task_names = item.get("taskNames")
+            if task_names is None:
+                has_task_names = False
+            else:
+                self._task_names_by_folder_id[folder_id] = set(task_names)
+            hierarchy_queue.extend(item["children"] or [])
+
+        # Older servers do not return task names in hierarchy
+        if not has_task_names:
+            for task_entity in ayon_api.get_tasks(
+                self._project_name, fields={"name", "folderId"}
+            ):
+                self._task_names_by_folder_id[task_entity["folderId"]].add(
+                    task_entity["name"]
+                )
+
+        self._hierarchy_items = hierarchy_items
+        self._cache.update_data(True)
+
+    def _fetch_folders(self, folder_paths):
+        found_ids = set()
+        for folder_entity in ayon_api.get_folders(
+            self._project_name,
+            folder_paths=folder_paths,
+            fields={"id", "name", "path"}
+        ):
+            folder_id = folder_entity["id"]
+            found_ids.add(folder_id)
+            self._add_folder(
+                folder_id, folder_entity["path"], folder_entity["name"]
+            )
+
+        now = time.time()
+        for folder_path in folder_paths:
+            if folder_path not in self._folder_id_by_path:
+                self._missing_folder_paths[folder_path] = now
+
+        if found_ids:
+            self._fetch_tasks(found_ids)
+
+    def _fetch_tasks(self, folder_ids):
+        task_names_by_folder_id = collections.defaultdict(set)
+        for task_entity in ayon_api.get_tasks(
+            self._project_name,
+            folder_ids=folder_ids,
+            fields={"name", "folderId"}
+        ):
+            task_names_by_folder_id[task_entity["folderId"]].add(
+                task_entity["name"]
+            )
+        for folder_id in folder_ids:
+            self._task_names_by_folder_id[folder_id] = (
+                task_names_by_folder_id[folder_id]
+            )
+
+
+_indexes_lock = threading.Lock()
+_indexes_by_project_name = {}
+
+
+def get_project_hierarchy_index(project_name):
+    """Shared hierarchy index of a project.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        ProjectHierarchyIndex: Hierarchy index of the project.
+
+    """
+    with _indexes_lock:
+        index = _indexes_by_project_name.get(project_name)
+        if index is None:
+            index = ProjectHierarchyIndex(project_name)
+            _indexes_by_project_name[project_name] = index
+    return index
@@ -28,12 +28,14 @@ from .utils import (
     get_representation_path_from_context,
     get_representation_path,
     get_representation_path_with_anatomy,
+    get_representation_paths,
 
     is_compatible_loader,
 
     loaders_from_repre_context,
     loaders_from_representation,
     filter_repre_contexts_by_loader,
+    LoaderCompatibilityIndex,
 
     any_outdated_containers,
     get_outdated_containers,
@@ -83,12 +85,14 @@ __all__ = (
     "get_representation_path_from_context",
     "get_representation_path",
     "get_representation_path_with_anatomy",
+    "get_representation_paths",
 
     "is_compatible_loader",
 
     "loaders_from_repre_context",
     "loaders_from_representation",
     "filter_repre_contexts_by_loader",
+    "LoaderCompatibilityIndex",
 
     "any_outdated_containers",
     "get_outdated_containers",
@@ -1,6 +1,8 @@
 import os
+import time
 import uuid
 import platform
+import threading
 import logging
 import inspect
 import collections
@@ -13,10 +15,12 @@ from ayon_core.host import ILoadHost
 from ayon_core.lib import (
     StringTemplate,
     TemplateUnsolved,
+    NestedCacheItem,
 )
 from ayon_core.pipeline import (
     Anatomy,
 )
+from ayon_core.pipeline.entities_cache import get_project_events_poller
 
 log = logging.getLogger(__name__)
 
@@ -25,6 +29,17 @@ ContainersFilterResult = collections.namedtuple(
     ["latest", "outdated", "not_found", "invalid"]
 )
 
+# Directory listings used to check existence of representation files
+#   in 'get_representation_paths'
+_DIR_LISTING_LIFETIME = 10
+_DIR_LISTING_MAX_COUNT = 1000
+_dir_listing_cache = NestedCacheItem(
+    levels=1,
+    lifetime=_DIR_LISTING_LIFETIME,
+    max_entries=_DIR_LISTING_MAX_COUNT,
+    name="load.dir_listing",
+)
+
 
 class HeroVersionType(object):
     def __init__(self, version):
@@ -777,6 +792,162 @@ def get_representation_path(representation, root=None):
     )
 
 
+def _get_dir_filenames(dir_path):
+    """Cached filenames in directory.
+
+    Filenames are lowered on windows.
+
+    Args:
+        dir_path (str): Normalized path to directory.
+
+    Returns:
+        Union[set[str], None]: Filenames or None if directory does
+            not exist.
+
+    """
+    cache = _dir_listing_cache[dir_path]
+    if not cache.is_valid:
+        try:
+            filenames = os.listdir(dir_path)
+        except OSError:
+            filenames = None
+
+        if filenames is not None:
+            if platform.system().lower() == "windows":
+                filenames = [filename.lower() for filename in filenames]
+            filenames = set(filenames)
+        cache.update_data(filenames)
+    return cache.get_data()
+
+
+def _cached_path_exists(path):
+    """Check if path exists using cached listing of its directory.
+
+    Args:
+        path (str): Path to file or directory.
+
+    Returns:
+        bool: Path exists.
+
+    """
+    dir_path, filename = os.path.split(os.path.normpath(path))
+    if not dir_path or not filename:
+        return os.path.exists(path)
+
+    filenames = _get_dir_filenames(dir_path)
+    if filenames is None:
+        return False
+    if platform.system().lower() == "windows":
+        filename = filename.lower()
+    return filename in filenames
+
+
+def _repre_path_from_template(repre_entity, root, templates):
+    template = repre_entity["attrib"].get("template")
+    context = repre_entity.get("context")
+    if not template or context is None:
+        return None
+
+    template_obj = templates.get(template)
+    if template_obj is None:
+        template_obj = StringTemplate(template)
+        templates[template] = template_obj
+
+    data = dict(context)
+    _fix_representation_context_compatibility(data)
+    data["root"] = root
+    try:
+        path = template_obj.format_strict(data)
+    except (TemplateUnsolved, KeyError):
+        return None
+
+    # Force replacing backslashes with forward slashed if not on windows
+    if platform.system().lower() != "windows":
+        path = path.replace("\\", "/")
+
+    if not path:
+        return path
+
+    normalized_path = os.path.normpath(path)
+    if _cached_path_exists(normalized_path):
+        return normalized_path
+    return path
+
+
+def _repre_path_from_data(repre_entity):
+    path = repre_entity["attrib"].get("path")
+    if not path:
+        return None
+
+    # Force replacing backslashes with forward slashed if not on windows
+    if platform.system().lower() != "windows":
+        path = path.replace("\\", "/")
+
+    if _cached_path_exists(path):
+        return os.path.normpath(path)
+
+    dir_path, file_name = os.path.split(os.path.normpath(path))
+    filenames = _get_dir_filenames(dir_path)
+    if filenames is None:
+        return None
+
+    base_name, ext = os.path.splitext(file_name)
+    file_name_items = None
+    if "#" in base_name:
+        file_name_items = [part for part in base_name.split("#") if part]
+    elif "%" in base_name:
+        file_name_items = base_name.split("%")
+
+    if not file_name_items:
+        return None
+
+    filename_start = file_name_items[0]
+    if platform.system().lower() == "windows":
+        filename_start = filename_start.lower()
+        ext = ext.lower()
+
+    for filename in filenames:
+        if filename.startswith(filename_start) and filename.endswith(ext):
+            return os.path.normpath(path)
+    return None
+
+
+def get_representation_paths(repre_entities, anatomy=None):
+    """Get paths of multiple representations.
+
+    Paths are resolved the same way as in 'get_representation_path', but
+    representation templates are parsed only once and existence of files
+    is checked using cached directory listings, so each directory is listed
+    only once for all representations (cache is kept for few seconds).
+
+    Args:
+        repre_entities (Iterable[dict[str, Any]]): Representation entities.
+        anatomy (Optional[Anatomy]): Project anatomy used to fill roots.
+            Registered root is used if not passed.
+
+    Returns:
+        dict[str, Union[str, None]]: Paths by representation id. Path is
+            None if could not be resolved.
+
+    """
+    if anatomy is not None:
+        root = anatomy.roots
+    else:
+        from ayon_core.pipeline import registered_root
+
+        root = registered_root()
+
+    templates = {}
+    output = {}
+    for repre_entity in repre_entities:
+        path = (
+            _repre_path_from_template(repre_entity, root, templates)
+            or _repre_path_from_data(repre_entity)
+        )
+        output[repre_entity["id"]] = path
+    return output
+
+
 def get_representation_path_by_names(
         project_name: str,
         folder_path: str,
@@ -903,6 +1074,151 @@ def filter_repre_contexts_by_loader(repre_contexts, loader):
     ]
 
 
+class LoaderCompatibilityIndex:
+    """Index of loaders by attributes used to check compatibility.
+
+    Loaders using default 'is_compatible_loader' implementation are indexed
+    by representation names, product types and extensions, so compatibility
+    is resolved once per unique combination of these values instead of
+    calling 'is_compatible_loader' for each loader and each context.
+    Loaders with custom implementation are checked per context.
+
+    Index should be created again when loaders are discovered again.
+
+    Args:
+        loaders (Iterable[LoaderPlugin]): Loader plugins.
+
+    """
+    def __init__(self, loaders):
+        from .plugins import LoaderPlugin
+
+        # Compare descriptors without binding them, overrides can be class
+        #   or static methods
+        default_methods = {
+            attr_name: inspect.getattr_static(LoaderPlugin, attr_name)
+            for attr_name in ("is_compatible_loader", "has_valid_extension")
+        }
+
+        self._loaders = list(loaders)
+        self._custom_loaders = []
+        self._loaders_by_repre_name = collections.defaultdict(list)
+        self._attributes_by_loader = {}
+        self._loaders_by_key = {}
+        for loader in self._loaders:
+            if any(
+                inspect.getattr_static(loader, attr_name) is not method
+                for attr_name, method in default_methods.items()
+            ):
+                self._custom_loaders.append(loader)
+                continue
+
+            repre_names = loader.get_representations()
+            product_types = loader.product_types
+            extensions = loader.extensions
+            # Loader is not compatible with anything
+            if not repre_names or not product_types or not extensions:
+                continue
+
+            self._attributes_by_loader[loader] = (
+                None if "*" in product_types else set(product_types),
+                None if "*" in extensions else {
+                    ext.lower() for ext in extensions
+                },
+            )
+            if "*" in repre_names:
+                repre_names = {"*"}
+            for repre_name in set(repre_names):
+                self._loaders_by_repre_name[repre_name].append(loader)
+
+    def get_compatible_loaders(self, repre_context):
+        """Loaders compatible with representation context.
+
+        Args:
+            repre_context (dict[str, Any]): Representation context.
+
+        Returns:
+            list[LoaderPlugin]: Compatible loaders in order as were passed
+                to the index.
+
+        """
+        repre_entity = repre_context.get("representation")
+        if not repre_entity:
+            return []
+
+        key = (
+            repre_entity["name"],
+            repre_context["product"]["productType"],
+            self._get_repre_extension(repre_entity),
+        )
+        loaders = self._loaders_by_key.get(key)
+        if loaders is None:
+            loaders = self._get_loaders_by_key(*key)
+            self._loaders_by_key[key] = loaders
+
+        if not self._custom_loaders:
+            return list(loaders)
+
+        loaders = set(loaders)
+        for loader in self._custom_loaders:
+            if loader.is_compatible_loader(repre_context):
+                loaders.add(loader)
+        return [loader for loader in self._loaders if loader in loaders]
+
+    def filter_repre_contexts(self, repre_contexts):
+        """Representation contexts by compatible loaders.
+
+        Args:
+            repre_contexts (Iterable[dict[str, Any]]): Representation
+                contexts.
+
+        Returns:
+            dict[LoaderPlugin, list[dict[str, Any]]]: Compatible
+                representation contexts by loader. Loaders are in order as
+                were passed to the index.
+
+        """
+        contexts_by_loader = collections.defaultdict(list)
+        for repre_context in repre_contexts:
+            for loader in self.get_compatible_loaders(repre_context):
+                contexts_by_loader[loader].append(repre_context)
+        return {
+            loader: contexts_by_loader[loader]
+            for loader in self._loaders
+            if loader in contexts_by_loader
+        }
+
+    def _get_loaders_by_key(self, repre_name, product_type, ext):
+        candidates = set(self._loaders_by_repre_name.get(repre_name, []))
+        candidates.update(self._loaders_by_repre_name.get("*", []))
+        output = []
+        for loader in self._loaders:
+            if loader not in candidates:
+                continue
+            product_types, extensions = self._attributes_by_loader[loader]
+            if (
+                product_types is not None
+                and product_type not in product_types
+            ):
+                continue
+            if extensions is not None and ext not in extensions:
+                continue
+            output.append(loader)
+        return output
+
+    @staticmethod
+    def _get_repre_extension(repre_entity):
+        # Same logic as 'LoaderPlugin.has_valid_extension'
+        repre_context = repre_entity.get("context") or {}
+        ext = repre_context.get("ext")
+        if not ext:
+            path = repre_entity.get("attrib", {}).get("path")
+            if path:
+                ext = os.path.splitext(path)[-1].lstrip(".")
+        if not ext:
+            return None
+        return ext.lower()
+
+
 def loaders_from_representation(loaders, representation):
     """Return all compatible loaders for a representation."""
     from ayon_core.pipeline import get_current_project_name
@@ -957,6 +1273,185 @@ def _is_valid_representation_id(repre_id: Any) -> bool:
     return True
 
 
+class _ContainersStateCache:
+    """Cache of entities used to filter containers of a project.
+
+    Relations of representations to versions and versions to products do
+    not change, so they are queried only once for each representation.
+    Last versions of products are queried again only when a version was
+    created or deleted in the project, which is checked using server
+    events received from shared 'ProjectEventsPoller'. Deleted
+    representations or versions reset whole cache.
+
+    Everything is queried again after 'full_refresh_interval' or when
+    events could not be received.
+
+    Args:
+        project_name (str): Project name.
+
+    """
+    full_refresh_interval = 600
+    last_version_topics = {
+        "entity.version.created",
+        "entity.version.deleted",
+        "entity.version.active_changed",
+    }
+    removed_topics = {
+        "entity.representation.deleted",
+        "entity.version.deleted",
+        "entity.product.deleted",
+    }
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        # Events callback can be triggered from 'get_info'
+        self._lock = threading.RLock()
+        self._last_full_refresh = None
+        self._reset()
+        self._events_poller = get_project_events_poller()
+        self._events_poller.register_callback(self._on_project_events)
+
+    def _reset(self):
+        # None is stored for missing entities
+        self._version_id_by_repre_id = {}
+        self._version_by_id = {}
+        self._last_version_id_by_product_id = {}
+
+    def get_info(self, repre_ids):
+        """Information needed to filter containers.
+
+        Args:
+            repre_ids (set[str]): Representation ids.
+
+        Returns:
+            tuple[
+                dict[str, Union[str, None]],
+                dict[str, Union[dict[str, Any], None]],
+                dict[str, Union[str, None]]
+            ]: Version id by representation id, version by version id
+                (with 'productId' and 'version') and last version id by
+                product id.
+
+        """
+        with self._lock:
+            self._update_state()
+
+            missing_repre_ids = repre_ids - set(self._version_id_by_repre_id)
+            if missing_repre_ids:
+                for repre_id in missing_repre_ids:
+                    self._version_id_by_repre_id[repre_id] = None
+                for repre_entity in ayon_api.get_representations(
+                    self._project_name,
+                    representation_ids=missing_repre_ids,
+                    fields={"id", "versionId"}
+                ):
+                    self._version_id_by_repre_id[repre_entity["id"]] = (
+                        repre_entity["versionId"]
+                    )
+
+            version_id_by_repre_id = {
+                repre_id: self._version_id_by_repre_id[repre_id]
+                for repre_id in repre_ids
+            }
+            version_ids = set(version_id_by_repre_id.values())
+            version_ids.discard(None)
+
+            # Query version entities to get it's product ids
+            # - also query hero version to be able identify if
+            #   representation belongs to existing version
+            missing_version_ids = version_ids - set(self._version_by_id)
+            if missing_version_ids:
+                for version_id in missing_version_ids:
+                    self._version_by_id[version_id] = None
+                for version_entity in ayon_api.get_versions(
+                    self._project_name,
+                    version_ids=missing_version_ids,
+                    hero=True,
+                    fields={"id", "productId", "version"}
+                ):
+                    self._version_by_id[version_entity["id"]] = (
+                        version_entity
+                    )
+
+            version_by_id = {
+                version_id: self._version_by_id[version_id]
+                for version_id in version_ids
+            }
+            # There's no need to query products for hero versions
+            #   - they are considered as latest?
+            product_ids = {
+                version_entity["productId"]
+                for version_entity in version_by_id.values()
+                if version_entity is not None
+                and version_entity["version"] >= 0
+            }
+            missing_product_ids = (
+                product_ids - set(self._last_version_id_by_product_id)
+            )
+            if missing_product_ids:
+                last_versions = ayon_api.get_last_versions(
+                    self._project_name,
+                    missing_product_ids,
+                    fields={"id"}
+                )
+                for product_id in missing_product_ids:
+                    last_version = last_versions.get(product_id)
+                    self._last_version_id_by_product_id[product_id] = (
+                        last_version["id"] if last_version else None
+                    )
+
+            last_version_id_by_product_id = {
+                product_id: self._last_version_id_by_product_id[product_id]
+                for product_id in product_ids
+            }
+        return version_id_by_repre_id, version_by_id, (
+            last_version_id_by_product_id
+        )
+
+    def _update_state(self):
+        current_time = time.time()
+        if (
+            self._last_full_refresh is None
+            or current_time - self._last_full_refresh
+            > self.full_refresh_interval
+        ):
+            self._reset()
+            self._last_full_refresh = current_time
+        # Events are checked also on first fill, so poller receives
+        #   events since the entities were queried
+        self._events_poller.check(self._project_name)
+
+    def _on_project_events(self, project_name, events):
+        if project_name != self._project_name:
+            return
+
+        with self._lock:
+            if events is None:
+                log.debug("Containers cache is reset.")
+                self._reset()
+                self._last_full_refresh = time.time()
+                return
+
+            topics = {event["topic"] for event in events}
+            if topics & self.removed_topics:
+                self._reset()
+            elif topics & self.last_version_topics:
+                self._last_version_id_by_product_id = {}
+
+
+_containers_state_caches = {}
+_containers_state_caches_lock = threading.Lock()
+
+
+def _get_containers_state_cache(project_name):
+    with _containers_state_caches_lock:
+        cache = _containers_state_caches.get(project_name)
+        if cache is None:
+            cache = _ContainersStateCache(project_name)
+            _containers_state_caches[project_name] = cache
+    return cache
+
+
 def filter_containers(containers, project_name):
     """Filter containers and split them into 4 categories.
 
@@ -965,6 +1460,10 @@ def filter_containers(containers, project_name):
     'invalid' are invalid containers (invalid content) and 'not_found' has
     some missing entity in database.
 
+    Entities needed to filter containers are cached for the session and
+    only last versions of products are queried again when a version was
+    created in the project.
+
     Args:
         containers (Iterable[dict]): List of containers referenced into scene.
         project_name (str): Name of project in which context shoud look for
@@ -988,7 +1487,6 @@ def filter_containers(containers, project_name):
         not_found_containers,
         invalid_containers
     )
-    # Query representation docs to get it's version ids
     repre_ids = {
         container["representation"]
         for container in containers
@@ -999,58 +1497,23 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_entities = ayon_api.get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields={"id", "versionId"}
-    )
-    # Store representations by stringified representation id
-    repre_entities_by_id = {}
-    repre_entities_by_version_id = collections.defaultdict(list)
-    for repre_entity in repre_entities:
-        repre_id = repre_entity["id"]
-        version_id = repre_entity["versionId"]
-        repre_entities_by_id[repre_id] = repre_entity
-        repre_entities_by_version_id[version_id].append(repre_entity)
-
-    # Query version docs to get it's product ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_entities = ayon_api.get_versions(
-        project_name,
-        version_ids=repre_entities_by_version_id.keys(),
-        hero=True,
-        fields={"id", "productId", "version"}
-    )
-    verisons_by_id = {}
-    versions_by_product_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_entity in version_entities:
-        version_id = version_entity["id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_entity
-        # There's no need to query products for hero versions
-        #   - they are considered as latest?
-        if version_entity["version"] < 0:
-            hero_version_ids.add(version_id)
-            continue
-        product_id = version_entity["productId"]
-        versions_by_product_id[product_id].append(version_entity)
+    (
+        version_id_by_repre_id,
+        verisons_by_id,
+        last_version_id_by_product_id,
+    ) = _get_containers_state_cache(project_name).get_info(repre_ids)
 
-    last_versions = ayon_api.get_last_versions(
-        project_name,
-        versions_by_product_id.keys(),
-        fields={"id"}
-    )
     # Figure out which versions are outdated
     outdated_version_ids = set()
-    for product_id, last_version_entity in last_versions.items():
-        for version_entity in versions_by_product_id[product_id]:
-            version_id = version_entity["id"]
-            if version_id in hero_version_ids:
-                continue
-            if version_id != last_version_entity["id"]:
-                outdated_version_ids.add(version_id)
+    for version_id, version_entity in verisons_by_id.items():
+        # Hero versions are considered as latest
+        if version_entity is None or version_entity["version"] < 0:
+            continue
+        last_version_id = last_version_id_by_product_id.get(
+            version_entity["productId"]
+        )
+        if last_version_id is not None and version_id != last_version_id:
+            outdated_version_ids.add(version_id)
 
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
@@ -1061,8 +1524,8 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_entity = repre_entities_by_id.get(repre_id)
-        if not repre_entity:
+        version_id = version_id_by_repre_id.get(repre_id)
+        if not version_id:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
@@ -1070,11 +1533,10 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_entity["versionId"]
         if version_id in outdated_version_ids:
             outdated_containers.append(container)
 
-        elif version_id not in verisons_by_id:
+        elif verisons_by_id.get(version_id) is None:
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
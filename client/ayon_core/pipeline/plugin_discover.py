@@ -25,6 +25,9 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Process times of plugins by their identifier, filled by plugins
+        #   users e.g. time of collection of creators
+        self.process_times = {}
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -61,6 +64,20 @@ class DiscoverResult:
                 for cls in self.ignored_plugins:
                     lines.append("- {}".format(cls.__name__))
 
+            # Process times of plugins
+            if self.process_times or full_report:
+                lines.append("*** Process times of {} plugins".format(len(
+                    self.process_times
+                )))
+                for identifier, process_time in sorted(
+                    self.process_times.items(),
+                    key=lambda item: item[1],
+                    reverse=True
+                ):
+                    lines.append("- {}: {:.3f}s".format(
+                        identifier, process_time
+                    ))
+
         # Abstract classes
         if self.abstract_plugins or full_report:
             lines.append("*** Discovered {} abstract plugins".format(len(
@@ -47,6 +47,29 @@ from .lib import (
     main_cli_publish,
 )
 
+from .parallel import (
+    is_parallel_publish_enabled,
+    is_plugin_parallel_safe,
+    process_plugin_instances_parallel,
+    publish_iter_parallel,
+)
+
+from .report_file import (
+    PUBLISH_REPORT_PATH_ENV_KEY,
+    is_publish_report_file,
+    extract_result_log_items,
+    read_publish_report_file,
+    PublishReportFileWriter,
+    PublishReportLogsReader,
+    PublishReportFileMaker,
+)
+
+from .worker import (
+    PublishWorker,
+    get_publish_worker_dir,
+    submit_to_publish_worker,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -98,6 +121,23 @@ __all__ = (
 
     "main_cli_publish",
 
+    "is_parallel_publish_enabled",
+    "is_plugin_parallel_safe",
+    "process_plugin_instances_parallel",
+    "publish_iter_parallel",
+
+    "PUBLISH_REPORT_PATH_ENV_KEY",
+    "is_publish_report_file",
+    "extract_result_log_items",
+    "read_publish_report_file",
+    "PublishReportFileWriter",
+    "PublishReportLogsReader",
+    "PublishReportFileMaker",
+
+    "PublishWorker",
+    "get_publish_worker_dir",
+    "submit_to_publish_worker",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -15,6 +15,7 @@ from ayon_core.lib import (
     Logger,
     import_filepath,
     filter_profiles,
+    env_value_to_bool,
 )
 from ayon_core.settings import get_project_settings
 from ayon_core.addon import AddonsManager
@@ -23,6 +24,14 @@ from ayon_core.pipeline import (
     Anatomy
 )
 from ayon_core.pipeline.plugin_discover import DiscoverResult
+from .parallel import (
+    is_parallel_publish_enabled,
+    publish_iter_parallel,
+)
+from .report_file import (
+    PUBLISH_REPORT_PATH_ENV_KEY,
+    PublishReportFileMaker,
+)
 from .constants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
@@ -982,34 +991,8 @@ def get_instance_expected_output_path(
     return os.path.normpath(template_filled)
 
 
-def main_cli_publish(
-    path: str,
-    targets: Optional[List[str]] = None,
-    addons_manager: Optional[AddonsManager] = None,
-):
-    """Start headless publishing.
-
-    Publish use json from passed path argument.
-
-    Args:
-        path (str): Path to JSON.
-        targets (Optional[List[str]]): List of pyblish targets.
-        addons_manager (Optional[AddonsManager]): Addons manager instance.
-
-    Raises:
-        RuntimeError: When there is no path to process or when executed with
-            list of JSON paths.
-
-    """
-    from ayon_core.pipeline import (
-        install_ayon_plugins,
-        get_global_context,
-    )
-
-    # Register target and host
-    if not isinstance(path, str):
-        raise RuntimeError("Path to JSON must be a string.")
-
+def _prepare_cli_publish_environment():
+    """Prepare environment variables and connection for headless publish."""
     # Fix older jobs
     for src_key, dst_key in (
         ("AVALON_PROJECT", "AYON_PROJECT_NAME"),
@@ -1024,25 +1007,35 @@ def main_cli_publish(
         # Remove old keys, so we're sure they're not used
         os.environ.pop(src_key, None)
 
-    log = Logger.get_logger("CLI-publish")
-
     # Make public ayon api behave as other user
     # - this works only if public ayon api is using service user
     username = os.environ.get("AYON_USERNAME")
     if username:
-        # NOTE: ayon-python-api does not have public api function to find
-        #   out if is used service user. So we need to have try > except
-        #   block.
-        con = ayon_api.get_server_api_connection()
-        try:
-            con.set_default_service_username(username)
-        except ValueError:
-            pass
+        _set_default_service_username(username)
 
-    install_ayon_plugins()
 
-    if addons_manager is None:
-        addons_manager = AddonsManager()
+def _set_default_service_username(username):
+    """Set user used by service user connection.
+
+    Args:
+        username (Union[str, None]): Username or None to reset.
+
+    """
+    # NOTE: ayon-python-api does not have public api function to find
+    #   out if is used service user. So we need to have try > except
+    #   block.
+    con = ayon_api.get_server_api_connection()
+    try:
+        con.set_default_service_username(username)
+    except ValueError:
+        pass
+
+
+def _register_cli_publish_plugins(addons_manager: AddonsManager):
+    """Register publish plugins of AYON and addons."""
+    from ayon_core.pipeline import install_ayon_plugins
+
+    install_ayon_plugins()
 
     # TODO validate if this has to happen
     # - it should happen during 'install_ayon_plugins'
@@ -1050,6 +1043,13 @@ def main_cli_publish(
     for plugin_path in publish_paths:
         pyblish.api.register_plugin_path(plugin_path)
 
+    pyblish.api.register_host("shell")
+
+
+def _apply_farm_publish_environment(addons_manager: AddonsManager):
+    """Update environment variables with farm publish environment."""
+    from ayon_core.pipeline import get_global_context
+
     applications_addon = addons_manager.get_enabled_addon("applications")
     if applications_addon is not None:
         context = get_global_context()
@@ -1060,8 +1060,8 @@ def main_cli_publish(
         )
         os.environ.update(env)
 
-    pyblish.api.register_host("shell")
 
+def _register_cli_publish_targets(targets: Optional[List[str]]):
     if targets:
         for target in targets:
             print(f"setting target: {target}")
@@ -1069,6 +1069,96 @@ def main_cli_publish(
     else:
         pyblish.api.register_target("farm")
 
+
+def _run_cli_publish(plugins: List[pyblish.api.Plugin], log) -> bool:
+    """Process publish plugins and stop on first error.
+
+    Publish report is written to JSON Lines file when path is set in
+    'AYON_PUBLISH_REPORT_PATH' environment variable. Resources used by
+    each plugin are stored to the report when 'AYON_PUBLISH_PROFILE'
+    is enabled.
+
+    Returns:
+        bool: Publishing finished without errors.
+
+    """
+    # Error exit as soon as any error occurs.
+    error_format = ("Failed {plugin.__name__}: "
+                    "{error} -- {error.traceback}")
+
+    context = pyblish.api.Context()
+    profile = env_value_to_bool("AYON_PUBLISH_PROFILE", default=False)
+    if is_parallel_publish_enabled():
+        log.info("Parallel publishing of instances is enabled.")
+        publish_iter = publish_iter_parallel(
+            context, plugins=plugins, profile=profile
+        )
+    elif profile:
+        # Pyblish iterator does not allow to measure each plugin, single
+        #   worker processes instances one by one
+        publish_iter = publish_iter_parallel(
+            context, plugins=plugins, max_workers=1, profile=profile
+        )
+    else:
+        publish_iter = pyblish.util.publish_iter(context, plugins=plugins)
+
+    report_maker = None
+    report_path = os.getenv(PUBLISH_REPORT_PATH_ENV_KEY)
+    if report_path:
+        report_maker = PublishReportFileMaker(report_path)
+
+    success = True
+    try:
+        for result in publish_iter:
+            if report_maker is not None:
+                report_maker.add_result(result)
+            if result["error"]:
+                log.error(error_format.format(**result))
+                success = False
+                break
+    finally:
+        if report_maker is not None:
+            report_maker.finish(context)
+            log.info(
+                "Publish report stored to '{}'".format(report_maker.filepath)
+            )
+    return success
+
+
+def main_cli_publish(
+    path: str,
+    targets: Optional[List[str]] = None,
+    addons_manager: Optional[AddonsManager] = None,
+):
+    """Start headless publishing.
+
+    Publish use json from passed path argument.
+
+    Args:
+        path (str): Path to JSON.
+        targets (Optional[List[str]]): List of pyblish targets.
+        addons_manager (Optional[AddonsManager]): Addons manager instance.
+
+    Raises:
+        RuntimeError: When there is no path to process or when executed with
+            list of JSON paths.
+
+    """
+    # Register target and host
+    if not isinstance(path, str):
+        raise RuntimeError("Path to JSON must be a string.")
+
+    _prepare_cli_publish_environment()
+
+    log = Logger.get_logger("CLI-publish")
+
+    if addons_manager is None:
+        addons_manager = AddonsManager()
+
+    _register_cli_publish_plugins(addons_manager)
+    _apply_farm_publish_environment(addons_manager)
+    _register_cli_publish_targets(targets)
+
     os.environ["AYON_PUBLISH_DATA"] = path
     os.environ["HEADLESS_PUBLISH"] = 'true'  # to use in app lib
 
@@ -1079,14 +1169,8 @@ def main_cli_publish(
     for plugin in plugins:
         print(plugin)
 
-    # Error exit as soon as any error occurs.
-    error_format = ("Failed {plugin.__name__}: "
-                    "{error} -- {error.traceback}")
-
-    for result in pyblish.util.publish_iter():
-        if result["error"]:
-            log.error(error_format.format(**result))
-            # uninstall()
-            sys.exit(1)
+    if not _run_cli_publish(plugins, log):
+        # uninstall()
+        sys.exit(1)
 
     log.info("Publish finished.")
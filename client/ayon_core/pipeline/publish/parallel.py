@@ -0,0 +1,309 @@
+"""Concurrent processing of publish instance plugins.
+
+Instance plugins can mark themselves as safe to be processed on multiple
+instances at the same time using 'parallel_safe' class attribute. Such
+plugins are processed on all their instances in a thread pool when parallel
+publishing is enabled by 'AYON_PUBLISH_PARALLEL' environment variable.
+
+Context plugins and instance plugins which are not parallel safe are
+processed as usual, so they act as barriers. Results are always returned
+in the same order as they would be returned by sequential processing.
+"""
+import os
+import logging
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+import pyblish.api
+import pyblish.lib
+import pyblish.logic
+import pyblish.plugin
+
+from ayon_core.lib import env_value_to_bool
+from ayon_core.lib.profiling import profile_resources
+
+PARALLEL_PUBLISH_ENV_KEY = "AYON_PUBLISH_PARALLEL"
+PARALLEL_PUBLISH_WORKERS_ENV_KEY = "AYON_PUBLISH_MAX_WORKERS"
+
+
+def is_parallel_publish_enabled():
+    """Parallel processing of instance plugins is enabled.
+
+    Returns:
+        bool: Parallel publishing is enabled.
+
+    """
+    return env_value_to_bool(PARALLEL_PUBLISH_ENV_KEY, default=False)
+
+
+def get_parallel_publish_max_workers():
+    """Maximum number of threads used to process instances.
+
+    Returns:
+        int: Maximum number of worker threads.
+
+    """
+    value = os.getenv(PARALLEL_PUBLISH_WORKERS_ENV_KEY)
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            pass
+    return os.cpu_count() or 1
+
+
+def is_plugin_parallel_safe(plugin):
+    """Plugin can be processed on multiple instances at the same time.
+
+    Args:
+        plugin (pyblish.api.Plugin): Publish plugin.
+
+    Returns:
+        bool: Plugin is instance plugin with 'parallel_safe' enabled.
+
+    """
+    return bool(
+        plugin.__instanceEnabled__
+        and getattr(plugin, "parallel_safe", False)
+    )
+
+
+class ThreadRecordsHandler(logging.Handler):
+    """Logging handler collecting records per thread.
+
+    Records emitted while processing a plugin on an instance in a worker
+    thread are not mixed with records of other instances.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self._records_by_thread = collections.defaultdict(list)
+
+    def emit(self, record):
+        try:
+            record.msg = record.getMessage()
+        except Exception:
+            record.msg = str(record.msg)
+        record.args = ()
+        with self._lock:
+            self._records_by_thread[record.thread].append(record)
+
+    def pop_records(self):
+        """Pop records emitted in current thread.
+
+        Returns:
+            list[logging.LogRecord]: Log records.
+
+        """
+        with self._lock:
+            return self._records_by_thread.pop(threading.get_ident(), [])
+
+    def clear_records(self):
+        with self._lock:
+            self._records_by_thread.clear()
+
+
+def _remove_pyblish_error_record(result, records):
+    """Remove error record logged by pyblish after plugin failed.
+
+    Pyblish logs formatted traceback when plugin fails, the record is
+    not part of records in result of sequential processing.
+    """
+    if result["error"] is None or not records:
+        return
+    last_record = records[-1]
+    if (
+        last_record.name == "pyblish.plugin"
+        and last_record.levelno == logging.ERROR
+    ):
+        records.pop(-1)
+
+
+def _process_plugin(
+    plugin, context, instance, profile, process_counters=True
+):
+    if not profile:
+        return pyblish.plugin.process(plugin, context, instance)
+
+    with profile_resources(process_counters) as profile_data:
+        result = pyblish.plugin.process(plugin, context, instance)
+    result["profile"] = profile_data
+    return result
+
+
+def process_plugin_instances_parallel(
+    plugin,
+    context,
+    instances,
+    max_workers=None,
+    records_handler=None,
+    profile=False,
+):
+    """Process plugin on instances in a thread pool.
+
+    Args:
+        plugin (pyblish.api.Plugin): Instance plugin.
+        context (pyblish.api.Context): Publish context.
+        instances (list[pyblish.api.Instance]): Instances to process.
+        max_workers (Optional[int]): Maximum number of worker threads.
+        records_handler (Optional[ThreadRecordsHandler]): Handler collecting
+            log records per thread. Records are stored to result under
+            'records' key when passed. Handler must be added to root
+            logger, otherwise records in results contain log records of
+            all instances processed at the same time.
+        profile (Optional[bool]): Measure resources used by each instance
+            and store them to result under 'profile' key. Process-wide
+            values are not measured when more than one worker is used,
+            because they would contain work of other instances.
+
+    Returns:
+        list[dict[str, Any]]: Results in the order of passed instances.
+
+    """
+    if max_workers is None:
+        max_workers = get_parallel_publish_max_workers()
+    max_workers = max(1, min(max_workers, len(instances)))
+    process_counters = max_workers == 1
+
+    def _process(instance):
+        if records_handler is not None:
+            # Make sure there are no leftovers from previous task
+            records_handler.pop_records()
+        result = _process_plugin(
+            plugin, context, instance, profile, process_counters
+        )
+        if records_handler is not None:
+            records = records_handler.pop_records()
+            _remove_pyblish_error_record(result, records)
+            result["records"] = records
+        return result
+
+    # 'pyblish.plugin.process' changes level of root logger and restores it
+    #   when finished, that is not thread safe so the level is set here
+    root_logger = logging.getLogger()
+    old_level = root_logger.level
+    root_logger.setLevel(logging.DEBUG)
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="PublishWorker"
+        ) as executor:
+            return list(executor.map(_process, instances))
+    finally:
+        root_logger.setLevel(old_level)
+
+
+def publish_iter_parallel(
+    context=None, plugins=None, targets=None, max_workers=None, profile=False
+):
+    """Publish iterator processing parallel safe plugins concurrently.
+
+    Alternative to 'pyblish.util.publish_iter'. Collectors are processed
+    first, then the rest of plugins. Processing stops when registered
+    pyblish test fails, same as in pyblish.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context.
+        plugins (Optional[list[pyblish.api.Plugin]]): Plugins to process,
+            discovered plugins are used if not passed.
+        targets (Optional[list[str]]): Targets of publishing.
+        max_workers (Optional[int]): Maximum number of worker threads.
+        profile (Optional[bool]): Measure resources used by each plugin
+            on each instance and store them to result under 'profile' key.
+
+    Yields:
+        dict[str, Any]: Result of plugin processed on instance or context.
+
+    """
+    if context is None:
+        context = pyblish.api.Context()
+    if plugins is None:
+        plugins = pyblish.api.discover()
+
+    plugins = [plugin for plugin in plugins if plugin.active]
+    collectors = [
+        plugin
+        for plugin in plugins
+        if pyblish.lib.inrange(
+            number=plugin.order, base=pyblish.api.CollectorOrder
+        )
+    ]
+    plugins = [plugin for plugin in plugins if plugin not in collectors]
+
+    for plugin_group in (collectors, plugins):
+        state = {
+            "nextOrder": None,
+            "ordersWithError": set()
+        }
+        for result in _iter_process_plugins(
+            plugin_group, context, state, targets, max_workers, profile
+        ):
+            yield result
+
+    pyblish.api.emit("published", context=context)
+
+
+def _process_parallel_with_records(
+    plugin, context, instances, max_workers, profile
+):
+    # Records collected by pyblish contain records of all threads, so
+    #   records of each instance are collected per thread
+    records_handler = ThreadRecordsHandler()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(records_handler)
+    try:
+        return process_plugin_instances_parallel(
+            plugin,
+            context,
+            instances,
+            max_workers,
+            records_handler=records_handler,
+            profile=profile,
+        )
+    finally:
+        root_logger.removeHandler(records_handler)
+        records_handler.clear_records()
+
+
+def _iter_process_plugins(
+    plugins, context, state, targets, max_workers, profile
+):
+    # Logic is based on 'pyblish.logic.Iterator'
+    test = pyblish.logic.registered_test()
+    if not targets:
+        targets = ["default"] + pyblish.api.registered_targets()
+
+    log = logging.getLogger("pyblish.logic")
+    for plugin in pyblish.logic.plugins_by_targets(plugins, targets):
+        state["nextOrder"] = plugin.order
+        message = test(**state)
+        if message:
+            log.error("Stopped due to {}".format(message))
+            return
+
+        if not plugin.__instanceEnabled__:
+            results = [_process_plugin(plugin, context, None, profile)]
+
+        else:
+            instances = [
+                instance
+                for instance in pyblish.logic.instances_by_plugin(
+                    context, plugin
+                )
+                if instance.data.get("publish") is not False
+            ]
+            if len(instances) > 1 and is_plugin_parallel_safe(plugin):
+                results = _process_parallel_with_records(
+                    plugin, context, instances, max_workers, profile
+                )
+            else:
+                results = [
+                    _process_plugin(plugin, context, instance, profile)
+                    for instance in instances
+                ]
+
+        for result in results:
+            if result["error"]:
+                state["ordersWithError"].add(plugin.order)
+            yield result
@@ -94,6 +94,11 @@ class PublishXmlValidationError(PublishValidationError):
 
 
 class AYONPyblishPluginMixin:
+    # Instance plugin can be processed on multiple instances at the same
+    #   time (in threads) when parallel publishing is enabled. Plugin must
+    #   not modify shared data (context data, other instances) to be safe.
+    parallel_safe = False
+
     # TODO
     # executable_in_thread = False
     #
@@ -0,0 +1,505 @@
+"""Publish report stored to JSON Lines file.
+
+Log items of publish report can be huge, e.g. farm publishing with
+hundreds of thousands of log records. Report file stores log items
+incrementally during publishing, each processed plugin on an instance
+writes one line with its log items. Last line of the file contains report
+data where log items of each plugin result are replaced with index to
+the line with logs ('logs_index').
+
+Report can be opened without loading log items, which are read lazily
+only when needed. If publishing was killed before report data were
+written, minimal report is created from the lines with log items.
+
+```
+{"type": "logs", "plugin_id": "...", "instance_id": "...", "logs": [...]}
+{"type": "logs", "plugin_id": "...", "instance_id": null, "logs": [...]}
+...
+{"type": "report", "report": {...}}
+```
+"""
+import os
+import json
+import uuid
+import inspect
+import datetime
+import traceback
+
+PUBLISH_REPORT_PATH_ENV_KEY = "AYON_PUBLISH_REPORT_PATH"
+PUBLISH_REPORT_FILE_EXT = ".jsonl"
+PUBLISH_REPORT_FILE_VERSION = "1.3.0"
+
+
+def is_publish_report_file(filepath):
+    """File is publish report stored in JSON Lines format.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        bool: File is JSON Lines publish report.
+
+    """
+    return os.path.splitext(filepath)[-1].lower() == PUBLISH_REPORT_FILE_EXT
+
+
+def extract_result_log_items(result):
+    """Convert log records and error of plugin result to log items.
+
+    Args:
+        result (dict[str, Any]): Result of processed plugin.
+
+    Returns:
+        list[dict[str, Any]]: Log items which can be stored to json.
+
+    """
+    output = []
+    records = result.get("records") or []
+    for record in records:
+        record_exc_info = record.exc_info
+        if record_exc_info is not None:
+            record_exc_info = "".join(
+                traceback.format_exception(*record_exc_info)
+            )
+
+        try:
+            msg = record.getMessage()
+        except Exception:
+            msg = str(record.msg)
+
+        output.append({
+            "type": "record",
+            "msg": msg,
+            "name": record.name,
+            "lineno": record.lineno,
+            "levelno": record.levelno,
+            "levelname": record.levelname,
+            "threadName": record.threadName,
+            "filename": record.filename,
+            "pathname": record.pathname,
+            "msecs": record.msecs,
+            "exc_info": record_exc_info
+        })
+
+    exception = result.get("error")
+    if exception:
+        fname, line_no, func, exc = exception.traceback
+
+        # Conversion of exception into string may crash
+        try:
+            msg = str(exception)
+        except BaseException:
+            msg = (
+                "Publisher Controller: ERROR"
+                " - Failed to get exception message"
+            )
+
+        # Action result does not have 'is_validation_error'
+        is_validation_error = result.get("is_validation_error", False)
+        output.append({
+            "type": "error",
+            "is_validation_error": is_validation_error,
+            "msg": msg,
+            "filename": str(fname),
+            "lineno": str(line_no),
+            "func": str(func),
+            "traceback": exception.formatted_traceback
+        })
+
+    return output
+
+
+class PublishReportFileWriter:
+    """Write publish report to JSON Lines file.
+
+    Log items are written immediately when added so they are not kept
+    in memory.
+
+    Args:
+        filepath (str): Path to output file.
+
+    """
+    def __init__(self, filepath):
+        dirpath = os.path.dirname(filepath)
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+        self._filepath = filepath
+        self._stream = open(filepath, "wb")
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write_line(self, data):
+        offset = self._stream.tell()
+        self._stream.write(json.dumps(data).encode("utf-8") + b"\n")
+        return offset
+
+    def add_logs(self, plugin_id, instance_id, log_items):
+        """Write log items of processed plugin.
+
+        Args:
+            plugin_id (str): Plugin id.
+            instance_id (Union[str, None]): Instance id.
+            log_items (list[dict[str, Any]]): Log items.
+
+        Returns:
+            dict[str, Any]: Index of written logs which is stored to report
+                data under 'logs_index' key.
+
+        """
+        errored = any(
+            log_item["type"] == "error"
+            for log_item in log_items
+        )
+        offset = None
+        if log_items:
+            offset = self._write_line({
+                "type": "logs",
+                "plugin_id": plugin_id,
+                "instance_id": instance_id,
+                "logs": log_items,
+            })
+        return {
+            "offset": offset,
+            "count": len(log_items),
+            "errored": errored,
+        }
+
+    def write_report(self, report_data):
+        """Write report data as last line and close the file.
+
+        Args:
+            report_data (dict[str, Any]): Report data with 'logs_index' in
+                instances data.
+
+        """
+        self._write_line({"type": "report", "report": report_data})
+        self.close()
+
+    def close(self):
+        if not self._stream.closed:
+            self._stream.close()
+
+
+class PublishReportLogsReader:
+    """Read log items from JSON Lines report file on demand.
+
+    Args:
+        filepath (str): Path to report file.
+
+    """
+    def __init__(self, filepath):
+        self._filepath = filepath
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def read_logs(self, offset):
+        """Read log items stored at offset.
+
+        Args:
+            offset (Union[int, None]): Offset of line with log items.
+
+        Returns:
+            list[dict[str, Any]]: Log items.
+
+        """
+        if offset is None:
+            return []
+        with open(self._filepath, "rb") as stream:
+            stream.seek(offset)
+            line = stream.readline()
+        return json.loads(line)["logs"]
+
+
+def _read_last_line(filepath):
+    block_size = 64 * 1024
+    with open(filepath, "rb") as stream:
+        stream.seek(0, os.SEEK_END)
+        position = stream.tell()
+        content = b""
+        # Find start of last non-empty line
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            stream.seek(position)
+            content = stream.read(read_size) + content
+            line_start = content.rstrip(b"\n").rfind(b"\n")
+            if line_start != -1:
+                content = content[line_start + 1:]
+                break
+    return content
+
+
+def _create_report_from_logs(filepath):
+    """Create minimal report data from lines with log items.
+
+    Used when publishing was killed before report data were written. Only
+    ids of plugins and instances are known, and last line might be
+    written only partially.
+
+    Args:
+        filepath (str): Path to report file.
+
+    Returns:
+        Union[dict[str, Any], None]: Report data or None if file does not
+            contain any log items.
+
+    """
+    plugin_data_by_id = {}
+    instances_data_by_id = {}
+    with open(filepath, "rb") as stream:
+        while True:
+            offset = stream.tell()
+            line = stream.readline()
+            if not line:
+                break
+            try:
+                data = json.loads(line)
+            except ValueError:
+                continue
+
+            if not isinstance(data, dict) or data.get("type") != "logs":
+                continue
+
+            plugin_id = data["plugin_id"]
+            instance_id = data["instance_id"]
+            log_items = data["logs"]
+            errored = any(
+                log_item["type"] == "error"
+                for log_item in log_items
+            )
+            plugin_data = plugin_data_by_id.get(plugin_id)
+            if plugin_data is None:
+                plugin_data = {
+                    "id": plugin_id,
+                    "name": plugin_id,
+                    "label": None,
+                    "order": len(plugin_data_by_id),
+                    "instances_data": [],
+                    "actions_data": [],
+                    "skipped": False,
+                    "passed": True,
+                }
+                plugin_data_by_id[plugin_id] = plugin_data
+
+            if errored:
+                plugin_data["passed"] = False
+
+            plugin_data["instances_data"].append({
+                "id": instance_id,
+                "logs": [],
+                "logs_index": {
+                    "offset": offset,
+                    "count": len(log_items),
+                    "errored": errored,
+                },
+                "process_time": 0.0,
+            })
+            if instance_id is not None:
+                instances_data_by_id.setdefault(instance_id, {
+                    "name": instance_id,
+                    "label": instance_id,
+                    "family": None,
+                    "families": [],
+                    "exists": True,
+                })
+
+    if not plugin_data_by_id:
+        return None
+
+    created_at = datetime.datetime.fromtimestamp(
+        os.path.getmtime(filepath)
+    ).astimezone()
+    return {
+        "plugins_data": list(plugin_data_by_id.values()),
+        "instances": instances_data_by_id,
+        "context": {"label": None},
+        "crashed_file_paths": {},
+        "id": uuid.uuid4().hex,
+        "created_at": created_at.isoformat(),
+        "report_version": PUBLISH_REPORT_FILE_VERSION,
+        "label": "{} (incomplete)".format(
+            os.path.splitext(os.path.basename(filepath))[0]
+        ),
+    }
+
+
+def read_publish_report_file(filepath):
+    """Read report data from JSON Lines report file.
+
+    Only last line of the file is read, log items are not loaded. When last
+    line does not contain report, e.g. publishing was killed, minimal
+    report is created from lines with log items.
+
+    Args:
+        filepath (str): Path to report file.
+
+    Returns:
+        dict[str, Any]: Report data.
+
+    Raises:
+        ValueError: When file does not contain report nor log items.
+
+    """
+    try:
+        data = json.loads(_read_last_line(filepath))
+    except ValueError:
+        data = None
+
+    if isinstance(data, dict) and data.get("type") == "report":
+        return data["report"]
+
+    report_data = _create_report_from_logs(filepath)
+    if report_data is None:
+        raise ValueError(
+            "File '{}' does not contain publish report.".format(filepath)
+        )
+    return report_data
+
+
+class PublishReportFileMaker:
+    """Create JSON Lines publish report from results of publishing.
+
+    Used for publishing without UI, e.g. on farm. Log items are written
+    to the file as results are added, only light-weight report data are
+    kept in memory.
+
+    Args:
+        filepath (str): Path to output file.
+
+    """
+    def __init__(self, filepath):
+        self._writer = PublishReportFileWriter(filepath)
+        self._plugin_data_by_id = {}
+        self._instances_data_by_id = {}
+
+    @property
+    def filepath(self):
+        return self._writer.filepath
+
+    def add_result(self, result):
+        """Add result of processed plugin.
+
+        Args:
+            result (dict[str, Any]): Result of processed plugin.
+
+        """
+        plugin = result["plugin"]
+        plugin_data = self._plugin_data_by_id.get(plugin.id)
+        if plugin_data is None:
+            plugin_data = self._create_plugin_data(plugin)
+            self._plugin_data_by_id[plugin.id] = plugin_data
+
+        instance = result["instance"]
+        instance_id = None
+        if instance is not None:
+            instance_id = instance.id
+            self._instances_data_by_id[instance_id] = (
+                self._create_instance_data(instance)
+            )
+
+        if result["error"]:
+            plugin_data["passed"] = False
+
+        logs_index = self._writer.add_logs(
+            plugin.id, instance_id, extract_result_log_items(result)
+        )
+        instance_data = {
+            "id": instance_id,
+            "logs": [],
+            "logs_index": logs_index,
+            "process_time": result["duration"],
+        }
+        profile = result.get("profile")
+        if profile is not None:
+            instance_data["profile"] = profile
+        plugin_data["instances_data"].append(instance_data)
+
+    def finish(self, context=None, label=None):
+        """Write report data and close the file.
+
+        Args:
+            context (Optional[pyblish.api.Context]): Publish context.
+            label (Optional[str]): Label of report.
+
+        """
+        context_label = None
+        if context is not None:
+            context_label = context.data.get("label")
+            existing_ids = set()
+            for instance in context:
+                existing_ids.add(instance.id)
+                self._instances_data_by_id[instance.id] = (
+                    self._create_instance_data(instance)
+                )
+            # Instances removed from context during publishing
+            for instance_id, instance_data in (
+                self._instances_data_by_id.items()
+            ):
+                if instance_id not in existing_ids:
+                    instance_data["exists"] = False
+
+        report_data = {
+            "plugins_data": list(self._plugin_data_by_id.values()),
+            "instances": self._instances_data_by_id,
+            "context": {"label": context_label},
+            "crashed_file_paths": {},
+            "id": uuid.uuid4().hex,
+            "created_at": (
+                datetime.datetime.now().astimezone().isoformat()
+            ),
+            "report_version": PUBLISH_REPORT_FILE_VERSION,
+        }
+        if label:
+            report_data["label"] = label
+        self._writer.write_report(report_data)
+
+    def _create_plugin_data(self, plugin):
+        docstring = getattr(plugin, "__doc__", None)
+        if docstring:
+            docstring = inspect.cleandoc(docstring)
+        try:
+            filepath = inspect.getfile(plugin)
+        except TypeError:
+            filepath = None
+        plugin_type = "instance" if plugin.__instanceEnabled__ else "context"
+        return {
+            "id": plugin.id,
+            "name": plugin.__name__,
+            "label": getattr(plugin, "label", None),
+            "order": plugin.order,
+            "filepath": filepath,
+            "docstring": docstring,
+            "plugin_type": plugin_type,
+            "families": list(plugin.families),
+            "targets": list(plugin.targets),
+            "instances_data": [],
+            "actions_data": [],
+            "skipped": False,
+            "passed": True,
+        }
+
+    def _create_instance_data(self, instance):
+        return {
+            "name": instance.data.get("name"),
+            "label": (
+                instance.data.get("label")
+                or instance.data.get("name")
+                or str(instance)
+            ),
+            "product_type": instance.data.get("productType"),
+            "family": instance.data.get("family"),
+            "families": instance.data.get("families") or [],
+            "exists": True,
+            "creator_identifier": instance.data.get("creator_identifier"),
+            "instance_id": instance.data.get("instance_id"),
+        }
@@ -0,0 +1,439 @@
+"""Persistent worker for headless publishing on farm nodes.
+
+Each headless publish job loads addons, registers plugin paths and
+discovers publish plugins before the publishing itself starts, which can
+take longer than the publishing of small jobs. Publish worker is launched
+once per farm node, keeps the bootstrapped state in memory and processes
+publish jobs submitted to a queue directory on local disk.
+
+Job is a json file with path to publish data, pyblish targets and
+environment variables of the submitting process. Credentials are not
+written to the job, worker publishes using its own connection. Worker
+claims the job by renaming it, writes output of publishing to a log file
+and result to a result file. Submitting process prints the log and exits
+with return code based on the result.
+
+Submitting process falls back to regular (cold) publishing if worker is
+not running, does not claim the job in time or rejects it because the job
+is for different server or bundle.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import logging
+import threading
+import contextlib
+
+import pyblish.api
+
+from ayon_core.lib import Logger, get_launcher_local_dir
+from ayon_core.addon import AddonsManager
+
+from .lib import (
+    _prepare_cli_publish_environment,
+    _set_default_service_username,
+    _register_cli_publish_plugins,
+    _apply_farm_publish_environment,
+    _register_cli_publish_targets,
+    _run_cli_publish,
+)
+
+PUBLISH_WORKER_DIR_ENV_KEY = "AYON_PUBLISH_WORKER_DIR"
+
+log = Logger.get_logger(__name__)
+
+# Environment variables which must match between worker and job
+_WORKER_IDENTITY_KEYS = (
+    "AYON_SERVER_URL",
+    "AYON_BUNDLE_NAME",
+    "AYON_USE_STAGING",
+    "AYON_USE_DEV",
+)
+# Environment variables which are not written to job file, worker uses
+#   own values
+_CREDENTIALS_KEYS = (
+    "AYON_API_KEY",
+)
+
+
+def get_publish_worker_dir():
+    """Directory used as queue of publish worker.
+
+    Returns:
+        str: Path to queue directory.
+
+    """
+    queue_dir = os.getenv(PUBLISH_WORKER_DIR_ENV_KEY)
+    if not queue_dir:
+        queue_dir = get_launcher_local_dir("publish_worker")
+    return queue_dir
+
+
+def _get_worker_identity(env):
+    return {key: env.get(key) for key in _WORKER_IDENTITY_KEYS}
+
+
+def _write_json_atomic(filepath, data):
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as stream:
+        json.dump(data, stream)
+    os.replace(tmp_path, filepath)
+
+
+class _JobOutputStream:
+    """Stream writing to original stream and to output of current job."""
+    def __init__(self, stream):
+        self._stream = stream
+        self.job_stream = None
+
+    def write(self, data):
+        job_stream = self.job_stream
+        if job_stream is not None:
+            job_stream.write(data)
+        return self._stream.write(data)
+
+    def flush(self):
+        job_stream = self.job_stream
+        if job_stream is not None:
+            job_stream.flush()
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _install_job_output_streams():
+    """Replace stdout and stderr with streams that can capture job output.
+
+    Stream handlers of existing loggers are pointed to the new streams too,
+        because they keep reference to the original stream.
+
+    Returns:
+        tuple[_JobOutputStream, _JobOutputStream]: Stdout and stderr.
+
+    """
+    stdout = _JobOutputStream(sys.stdout)
+    stderr = _JobOutputStream(sys.stderr)
+    streams_mapping = {
+        id(sys.stdout): stdout,
+        id(sys.stderr): stderr,
+    }
+    loggers = [logging.getLogger()]
+    loggers.extend(
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    )
+    for logger in loggers:
+        for handler in logger.handlers:
+            if not isinstance(handler, logging.StreamHandler):
+                continue
+            stream = streams_mapping.get(id(handler.stream))
+            if stream is not None:
+                handler.setStream(stream)
+
+    sys.stdout = stdout
+    sys.stderr = stderr
+    return stdout, stderr
+
+
+class PublishWorker:
+    """Process publish jobs from queue directory with warm state.
+
+    Addons, registered plugin paths and discovered plugins are kept
+    between jobs. Discovered plugins are cached per project because
+    project settings are applied to plugins during discovery.
+
+    Args:
+        queue_dir (Optional[str]): Queue directory.
+        addons_manager (Optional[AddonsManager]): Addons manager instance.
+        idle_timeout (Optional[float]): Stop worker if there was no job
+            for given number of seconds.
+        max_jobs (Optional[int]): Stop worker after given number of jobs.
+
+    """
+    heartbeat_interval = 5
+    poll_interval = 0.2
+    plugins_cache_timeout = 600
+
+    def __init__(
+        self,
+        queue_dir=None,
+        addons_manager=None,
+        idle_timeout=None,
+        max_jobs=None,
+    ):
+        if queue_dir is None:
+            queue_dir = get_publish_worker_dir()
+        self._queue_dir = queue_dir
+        self._jobs_dir = os.path.join(queue_dir, "jobs")
+        self._addons_manager = addons_manager
+        self._idle_timeout = idle_timeout
+        self._max_jobs = max_jobs
+        self._plugins_cache = {}
+        self._output_streams = None
+        self._stop_event = threading.Event()
+        self._log = Logger.get_logger(self.__class__.__name__)
+
+    def run(self):
+        """Process jobs until worker is stopped."""
+        os.makedirs(self._jobs_dir, exist_ok=True)
+        self._output_streams = _install_job_output_streams()
+        self._bootstrap()
+        self._log.info(
+            "Publish worker is waiting for jobs in '%s'", self._jobs_dir
+        )
+
+        heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, daemon=True
+        )
+        heartbeat_thread.start()
+
+        processed_jobs = 0
+        last_job_time = time.time()
+        try:
+            while True:
+                job_id = self._claim_next_job()
+                if job_id is None:
+                    if (
+                        self._idle_timeout is not None
+                        and time.time() - last_job_time > self._idle_timeout
+                    ):
+                        self._log.info("Publish worker is idle, stopping.")
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                self._process_job(job_id)
+                processed_jobs += 1
+                last_job_time = time.time()
+                if (
+                    self._max_jobs is not None
+                    and processed_jobs >= self._max_jobs
+                ):
+                    self._log.info("Maximum number of jobs processed.")
+                    break
+        finally:
+            self._stop_event.set()
+            heartbeat_thread.join()
+            self._remove_heartbeat()
+
+    def _bootstrap(self):
+        _prepare_cli_publish_environment()
+        if self._addons_manager is None:
+            self._addons_manager = AddonsManager()
+        _register_cli_publish_plugins(self._addons_manager)
+
+    def _get_heartbeat_path(self):
+        return os.path.join(self._queue_dir, "worker.json")
+
+    def _heartbeat_loop(self):
+        # Heartbeat is updated during jobs too so clients waiting
+        #   for result know that worker is still alive
+        data = {
+            "pid": os.getpid(),
+            "identity": _get_worker_identity(os.environ),
+        }
+        while not self._stop_event.is_set():
+            try:
+                _write_json_atomic(self._get_heartbeat_path(), data)
+            except OSError:
+                self._log.debug("Failed to write heartbeat.", exc_info=True)
+            self._stop_event.wait(self.heartbeat_interval)
+
+    def _remove_heartbeat(self):
+        with contextlib.suppress(OSError):
+            os.remove(self._get_heartbeat_path())
+
+    def _claim_next_job(self):
+        job_filenames = []
+        with os.scandir(self._jobs_dir) as scan:
+            for entry in scan:
+                if entry.name.endswith(".job.json"):
+                    job_filenames.append((entry.stat().st_mtime, entry.name))
+
+        for _, filename in sorted(job_filenames):
+            job_id = filename[:-len(".job.json")]
+            src_path = os.path.join(self._jobs_dir, filename)
+            try:
+                os.rename(src_path, self._get_job_path(job_id, "running"))
+            except OSError:
+                # Job was claimed by other worker or withdrawn by client
+                continue
+            return job_id
+        return None
+
+    def _get_job_path(self, job_id, suffix):
+        return os.path.join(self._jobs_dir, f"{job_id}.{suffix}.json")
+
+    def _get_plugins(self, project_name):
+        cache_item = self._plugins_cache.get(project_name)
+        if (
+            cache_item is not None
+            and time.time() - cache_item[0] < self.plugins_cache_timeout
+        ):
+            return cache_item[1]
+        plugins = pyblish.api.discover()
+        self._plugins_cache[project_name] = (time.time(), plugins)
+        return plugins
+
+    def _process_job(self, job_id):
+        running_path = self._get_job_path(job_id, "running")
+        with open(running_path, "r") as stream:
+            job_data = json.load(stream)
+        os.remove(running_path)
+
+        job_env = job_data["env"]
+        if _get_worker_identity(job_env) != _get_worker_identity(os.environ):
+            self._log.info("Job %s rejected, it's for other bundle.", job_id)
+            _write_json_atomic(
+                self._get_job_path(job_id, "result"), {"status": "rejected"}
+            )
+            return
+
+        self._log.info("Processing job %s", job_id)
+        start = time.time()
+        log_path = os.path.join(self._jobs_dir, f"{job_id}.log")
+        with open(log_path, "w") as log_stream:
+            success = self._publish(job_data, log_stream)
+
+        self._log.info(
+            "Job %s finished in %.2fs (success: %s)",
+            job_id, time.time() - start, success
+        )
+        _write_json_atomic(
+            self._get_job_path(job_id, "result"),
+            {"status": "success" if success else "failed"}
+        )
+
+    def _publish(self, job_data, log_stream):
+        orig_env = dict(os.environ)
+        for output_stream in self._output_streams:
+            output_stream.job_stream = log_stream
+        try:
+            os.environ.clear()
+            os.environ.update(job_data["env"])
+            for key in _CREDENTIALS_KEYS:
+                if key in orig_env:
+                    os.environ[key] = orig_env[key]
+            _prepare_cli_publish_environment()
+            _apply_farm_publish_environment(self._addons_manager)
+            pyblish.api.deregister_all_targets()
+            _register_cli_publish_targets(job_data["targets"])
+
+            os.environ["AYON_PUBLISH_DATA"] = job_data["path"]
+            os.environ["HEADLESS_PUBLISH"] = "true"
+
+            log = Logger.get_logger("CLI-publish")
+            log.info("Running publish in publish worker ...")
+            plugins = self._get_plugins(os.environ.get("AYON_PROJECT_NAME"))
+            success = _run_cli_publish(plugins, log)
+            if success:
+                log.info("Publish finished.")
+            return success
+
+        # Plugins may call 'sys.exit' or raise 'KeyboardInterrupt', that
+        #   must not stop the worker
+        except BaseException:
+            self._log.warning("Publish job crashed.", exc_info=True)
+            return False
+
+        finally:
+            for output_stream in self._output_streams:
+                output_stream.flush()
+                output_stream.job_stream = None
+            os.environ.clear()
+            os.environ.update(orig_env)
+            # User of the job must not be used by following jobs
+            _set_default_service_username(orig_env.get("AYON_USERNAME"))
+
+
+def submit_to_publish_worker(
+    path, targets=None, queue_dir=None, claim_timeout=30
+):
+    """Publish using running publish worker.
+
+    Output of publishing is printed to stdout when job is finished.
+
+    Args:
+        path (str): Path to publish data json.
+        targets (Optional[list[str]]): Pyblish targets.
+        queue_dir (Optional[str]): Queue directory of the worker.
+        claim_timeout (Optional[float]): Seconds to wait for worker to
+            start processing of the job.
+
+    Returns:
+        Union[bool, None]: Publishing finished without errors or 'None'
+            if job was not processed by worker and cold publishing
+            should be used.
+
+    """
+    if queue_dir is None:
+        queue_dir = get_publish_worker_dir()
+    jobs_dir = os.path.join(queue_dir, "jobs")
+    heartbeat_path = os.path.join(queue_dir, "worker.json")
+    try:
+        heartbeat_mtime = os.path.getmtime(heartbeat_path)
+    except OSError:
+        return None
+
+    # Worker is considered dead if heartbeat was not updated for a while
+    if time.time() - heartbeat_mtime > PublishWorker.heartbeat_interval * 3:
+        return None
+
+    job_id = uuid.uuid4().hex
+    job_path = os.path.join(jobs_dir, f"{job_id}.job.json")
+    result_path = os.path.join(jobs_dir, f"{job_id}.result.json")
+    log_path = os.path.join(jobs_dir, f"{job_id}.log")
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in _CREDENTIALS_KEYS
+    }
+    _write_json_atomic(job_path, {
+        "path": path,
+        "targets": list(targets or []),
+        "env": env,
+    })
+
+    claim_deadline = time.time() + claim_timeout
+    while os.path.exists(job_path):
+        if time.time() > claim_deadline:
+            try:
+                os.remove(job_path)
+                return None
+            except OSError:
+                # Job was claimed in the meantime
+                break
+        time.sleep(PublishWorker.poll_interval)
+
+    while not os.path.exists(result_path):
+        try:
+            heartbeat_mtime = os.path.getmtime(heartbeat_path)
+        except OSError:
+            heartbeat_mtime = 0
+        if (
+            time.time() - heartbeat_mtime
+            > PublishWorker.heartbeat_interval * 3
+            # Result could be written right before worker stopped
+            and not os.path.exists(result_path)
+        ):
+            log.warning("Publish worker stopped while processing the job.")
+            return False
+        time.sleep(PublishWorker.poll_interval)
+
+    with open(result_path, "r") as stream:
+        result = json.load(stream)
+    os.remove(result_path)
+
+    if os.path.exists(log_path):
+        with open(log_path, "r") as stream:
+            sys.stdout.write(stream.read())
+        os.remove(log_path)
+
+    status = result["status"]
+    if status == "rejected":
+        return None
+    return status == "success"
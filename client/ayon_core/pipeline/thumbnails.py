@@ -1,6 +1,11 @@
 import os
 import time
+import sqlite3
+import logging
+import threading
+import contextlib
 import collections
+from concurrent.futures import ThreadPoolExecutor, CancelledError
 
 import ayon_api
 
@@ -21,16 +26,22 @@ class ThumbnailsCache:
     thumbnail id validation and file names are thumbnail ids with matching
     extension. Extensions are predefined (.png and .jpeg).
 
-    Cache has cleanup mechanism which is triggered on initialized by default.
+    Cached thumbnails are stored in SQLite index with their size and time
+    of last access, so thumbnail path is received with single lookup and
+    cleanup does not have to walk the thumbnails directory. Thumbnails
+    cached before the index existed are added to the index by first cleanup,
+    then is the index the only source of truth and files of thumbnails that
+    are not in the index are not looked for. Each thread uses own connection
+    to the index.
 
-    The cleanup has 2 levels:
-    1. soft cleanup which remove all files that are older then 'days_alive'
-    2. max size cleanup which remove all files until the thumbnails folder
-        contains less then 'max_filesize'
-        - this is time consuming so it's not triggered automatically
+    Cleanup is running in background thread, it is started on first access
+    to cache (if enabled). It removes least recently used thumbnails:
+    1. thumbnails that were not accessed for more than 'days_alive'
+    2. thumbnails until the thumbnails folder contains less
+        then 'max_filesize'
 
     Args:
-        cleanup (bool): Trigger soft cleanup (Cleanup expired thumbnails).
+        cleanup (bool): Run cleanup in background on first access.
     """
 
     # Lifetime of thumbnails (in seconds)
@@ -39,12 +50,28 @@ class ThumbnailsCache:
     # Max size of thumbnail directory (in bytes)
     # - default 2 Gb
     max_filesize = 2 * 1024 * 1024 * 1024
+    # Filename of index database in thumbnails directory
+    index_filename = "thumbnails_index.db"
+    # Last access time is not updated more often (in seconds)
+    access_update_interval = 60 * 60
 
     def __init__(self, cleanup=True):
         self._thumbnails_dir = None
         self._days_alive_secs = self.days_alive * 24 * 60 * 60
-        if cleanup:
-            self.cleanup()
+        self._cleanup_enabled = cleanup
+        self._cleanup_thread = None
+        self._index_lock = threading.Lock()
+        self._index_initialized = False
+        self._index_available = True
+        self._index_synced = False
+        self._thread_data = threading.local()
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = logging.getLogger(self.__class__.__name__)
+        return self._log
 
     def get_thumbnails_dir(self):
         """Root directory where thumbnails are stored.
@@ -59,6 +86,15 @@ class ThumbnailsCache:
 
     thumbnails_dir = property(get_thumbnails_dir)
 
+    def get_index_path(self):
+        """Path to index database.
+
+        Returns:
+            str: Path to SQLite database file.
+        """
+
+        return os.path.join(self.thumbnails_dir, self.index_filename)
+
     def get_thumbnails_dir_file_info(self):
         """Get information about all files in thumbnails directory.
 
@@ -73,6 +109,11 @@ class ThumbnailsCache:
 
         for root, _, filenames in os.walk(thumbnails_dir):
             for filename in filenames:
+                if (
+                    root == thumbnails_dir
+                    and filename.startswith(self.index_filename)
+                ):
+                    continue
                 path = os.path.join(root, filename)
                 files_info.append(FileInfo(
                     path, os.path.getsize(path), os.path.getmtime(path)
@@ -101,6 +142,22 @@ class ThumbnailsCache:
             for file_info in files_info
         )
 
+    def start_cleanup(self):
+        """Start cleanup in background thread.
+
+        Cleanup is started only once.
+        """
+
+        if self._cleanup_thread is not None:
+            return
+        thread = threading.Thread(
+            target=self._cleanup_in_thread,
+            name="ThumbnailsCleanup",
+            daemon=True,
+        )
+        self._cleanup_thread = thread
+        thread.start()
+
     def cleanup(self, check_max_size=False):
         """Cleanup thumbnails directory.
 
@@ -114,36 +171,13 @@ class ThumbnailsCache:
         if not os.path.exists(thumbnails_dir):
             return
 
-        self._soft_cleanup(thumbnails_dir)
-        if check_max_size:
-            self._max_size_cleanup(thumbnails_dir)
-
-    def _soft_cleanup(self, thumbnails_dir):
-        current_time = time.time()
-        for root, _, filenames in os.walk(thumbnails_dir):
-            for filename in filenames:
-                path = os.path.join(root, filename)
-                modification_time = os.path.getmtime(path)
-                if current_time - modification_time > self._days_alive_secs:
-                    os.remove(path)
-
-    def _max_size_cleanup(self, thumbnails_dir):
-        files_info = self.get_thumbnails_dir_file_info()
-        size = self.get_thumbnails_dir_size(files_info)
-        if size < self.max_filesize:
+        if not self._ensure_index():
+            self._legacy_cleanup(thumbnails_dir, check_max_size)
             return
 
-        sorted_file_info = collections.deque(
-            sorted(files_info, key=lambda item: item.modification_time)
-        )
-        diff = size - self.max_filesize
-        while diff > 0:
-            if not sorted_file_info:
-                break
-
-            file_info = sorted_file_info.popleft()
-            diff -= file_info.size
-            os.remove(file_info.path)
+        self._soft_cleanup()
+        if check_max_size:
+            self._max_size_cleanup()
 
     def get_thumbnail_filepath(self, project_name, thumbnail_id):
         """Get thumbnail by thumbnail id.
@@ -160,16 +194,27 @@ class ThumbnailsCache:
         if not thumbnail_id:
             return None
 
-        for ext in (
-            ".png",
-            ".jpeg",
-        ):
-            filepath = os.path.join(
-                self.thumbnails_dir, project_name, thumbnail_id + ext
-            )
-            if os.path.exists(filepath):
-                return filepath
-        return None
+        if self._cleanup_enabled:
+            self.start_cleanup()
+
+        if not self._ensure_index():
+            return self._find_thumbnail_file(project_name, thumbnail_id)
+
+        try:
+            filepath = self._get_indexed_filepath(project_name, thumbnail_id)
+        except sqlite3.Error:
+            self.log.debug("Failed to read thumbnails index.", exc_info=True)
+            return self._find_thumbnail_file(project_name, thumbnail_id)
+
+        if filepath is not None or self._is_index_synced():
+            return filepath
+
+        # Thumbnail could be cached before index was created or by older
+        #   version of this class
+        filepath = self._find_thumbnail_file(project_name, thumbnail_id)
+        if filepath is not None:
+            self._add_to_index(project_name, filepath)
+        return filepath
 
     def get_project_dir(self, project_name):
         """Path to root directory for specific project.
@@ -219,11 +264,507 @@ class ThumbnailsCache:
         current_time = time.time()
         os.utime(thumbnail_path, (current_time, current_time))
 
+        if self._ensure_index():
+            self._add_to_index(project_name, thumbnail_path)
+
         return thumbnail_path
 
+    @contextlib.contextmanager
+    def _index_connection(self):
+        # SQLite connection can be used only in thread where was created
+        connection = getattr(self._thread_data, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.get_index_path(), timeout=10)
+            self._thread_data.connection = connection
+        with connection:
+            yield connection
+
+    def _is_index_synced(self):
+        """Files cached before index existed were added to index.
+
+        Returns:
+            bool: Index is the only source of truth.
+        """
+
+        if self._index_synced:
+            return True
+        try:
+            with self._index_connection() as connection:
+                row = connection.execute(
+                    "SELECT value FROM info WHERE key = 'synced'"
+                ).fetchone()
+        except sqlite3.Error:
+            return False
+        self._index_synced = row is not None
+        return self._index_synced
+
+    def _ensure_index(self):
+        """Make sure index database exists.
+
+        Returns:
+            bool: Index can be used.
+        """
+
+        if self._index_initialized or not self._index_available:
+            return self._index_available
+
+        with self._index_lock:
+            if self._index_initialized or not self._index_available:
+                return self._index_available
+            try:
+                os.makedirs(self.thumbnails_dir, exist_ok=True)
+                with self._index_connection() as connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS thumbnails ("
+                        " project_name TEXT NOT NULL,"
+                        " thumbnail_id TEXT NOT NULL,"
+                        " filename TEXT NOT NULL,"
+                        " size INTEGER NOT NULL,"
+                        " last_access REAL NOT NULL,"
+                        " PRIMARY KEY (project_name, thumbnail_id))"
+                    )
+                    connection.execute(
+                        "CREATE INDEX IF NOT EXISTS thumbnails_last_access"
+                        " ON thumbnails (last_access)"
+                    )
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS info ("
+                        " key TEXT PRIMARY KEY, value TEXT)"
+                    )
+                self._index_initialized = True
+
+            except (OSError, sqlite3.Error):
+                self.log.warning(
+                    "Failed to initialize thumbnails index.", exc_info=True
+                )
+                self._index_available = False
+        return self._index_available
+
+    def _get_indexed_filepath(self, project_name, thumbnail_id):
+        current_time = time.time()
+        with self._index_connection() as connection:
+            row = connection.execute(
+                "SELECT filename, last_access FROM thumbnails"
+                " WHERE project_name = ? AND thumbnail_id = ?",
+                (project_name, thumbnail_id)
+            ).fetchone()
+            if row is not None:
+                filename, last_access = row
+                filepath = os.path.join(
+                    self.thumbnails_dir, project_name, filename
+                )
+                if not os.path.exists(filepath):
+                    connection.execute(
+                        "DELETE FROM thumbnails"
+                        " WHERE project_name = ? AND thumbnail_id = ?",
+                        (project_name, thumbnail_id)
+                    )
+                    return None
+
+                if current_time - last_access > self.access_update_interval:
+                    connection.execute(
+                        "UPDATE thumbnails SET last_access = ?"
+                        " WHERE project_name = ? AND thumbnail_id = ?",
+                        (current_time, project_name, thumbnail_id)
+                    )
+                return filepath
+        return None
+
+    def _add_to_index(self, project_name, filepath):
+        filename = os.path.basename(filepath)
+        thumbnail_id = os.path.splitext(filename)[0]
+        try:
+            with self._index_connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails"
+                    " (project_name, thumbnail_id, filename, size,"
+                    " last_access) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        project_name,
+                        thumbnail_id,
+                        filename,
+                        os.path.getsize(filepath),
+                        time.time(),
+                    )
+                )
+        except sqlite3.Error:
+            self.log.debug(
+                "Failed to add thumbnail to index.", exc_info=True
+            )
+
+    def _find_thumbnail_file(self, project_name, thumbnail_id):
+        for ext in (
+            ".png",
+            ".jpeg",
+        ):
+            filepath = os.path.join(
+                self.thumbnails_dir, project_name, thumbnail_id + ext
+            )
+            if os.path.exists(filepath):
+                return filepath
+        return None
+
+    def _cleanup_in_thread(self):
+        try:
+            self.cleanup(check_max_size=True)
+        except Exception:
+            self.log.warning("Thumbnails cleanup failed.", exc_info=True)
+
+    def _sync_index(self):
+        """Add files cached before index existed to index.
+
+        Directory is walked only once, then is the index source of truth.
+        """
+
+        with self._index_connection() as connection:
+            row = connection.execute(
+                "SELECT value FROM info WHERE key = 'synced'"
+            ).fetchone()
+            if row is not None:
+                self._index_synced = True
+                return
+
+            thumbnails_dir = self.thumbnails_dir
+            rows = []
+            for file_info in self.get_thumbnails_dir_file_info():
+                project_dir, filename = os.path.split(file_info.path)
+                if os.path.dirname(project_dir) != thumbnails_dir:
+                    continue
+                rows.append((
+                    os.path.basename(project_dir),
+                    os.path.splitext(filename)[0],
+                    filename,
+                    file_info.size,
+                    file_info.modification_time,
+                ))
+            connection.executemany(
+                "INSERT OR IGNORE INTO thumbnails"
+                " (project_name, thumbnail_id, filename, size, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO info (key, value)"
+                " VALUES ('synced', '1')"
+            )
+        self._index_synced = True
+
+    def _remove_indexed_files(self, rows):
+        removed = []
+        for project_name, thumbnail_id, filename in rows:
+            path = os.path.join(self.thumbnails_dir, project_name, filename)
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError:
+                # File may be used by other process
+                continue
+            removed.append((project_name, thumbnail_id))
+
+        if not removed:
+            return
+        with self._index_connection() as connection:
+            connection.executemany(
+                "DELETE FROM thumbnails"
+                " WHERE project_name = ? AND thumbnail_id = ?",
+                removed
+            )
+
+    def _soft_cleanup(self):
+        self._sync_index()
+        expire_time = time.time() - self._days_alive_secs
+        with self._index_connection() as connection:
+            rows = connection.execute(
+                "SELECT project_name, thumbnail_id, filename FROM thumbnails"
+                " WHERE last_access < ?",
+                (expire_time, )
+            ).fetchall()
+        self._remove_indexed_files(rows)
+
+    def _max_size_cleanup(self):
+        self._sync_index()
+        with self._index_connection() as connection:
+            size = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM thumbnails"
+            ).fetchone()[0]
+            if size < self.max_filesize:
+                return
+
+            diff = size - self.max_filesize
+            rows = []
+            indexed_rows = connection.execute(
+                "SELECT project_name, thumbnail_id, filename, size"
+                " FROM thumbnails ORDER BY last_access"
+            ).fetchall()
+            for project_name, thumbnail_id, filename, file_size in (
+                indexed_rows
+            ):
+                if diff <= 0:
+                    break
+                diff -= file_size
+                rows.append((project_name, thumbnail_id, filename))
+        self._remove_indexed_files(rows)
+
+    def _legacy_cleanup(self, thumbnails_dir, check_max_size):
+        """Cleanup based on files in directory if index is not available."""
+
+        current_time = time.time()
+        files_info = []
+        for file_info in self.get_thumbnails_dir_file_info():
+            age = current_time - file_info.modification_time
+            if age > self._days_alive_secs:
+                os.remove(file_info.path)
+            else:
+                files_info.append(file_info)
+
+        if not check_max_size:
+            return
+
+        size = self.get_thumbnails_dir_size(files_info)
+        if size < self.max_filesize:
+            return
+
+        sorted_file_info = collections.deque(
+            sorted(files_info, key=lambda item: item.modification_time)
+        )
+        diff = size - self.max_filesize
+        while diff > 0:
+            if not sorted_file_info:
+                break
+
+            file_info = sorted_file_info.popleft()
+            diff -= file_info.size
+            os.remove(file_info.path)
+
+
+class ThumbnailsFetcher:
+    """Fetch thumbnails from server concurrently.
+
+    Thumbnails are downloaded in a thread pool with limited number of
+    workers, which also limits number of concurrent requests to server.
+    Requests for thumbnail which is already being downloaded share the
+    same future. Prefetch can cancel only futures that were not requested
+    by anything else than prefetch.
+
+    Args:
+        thumbnails_cache (ThumbnailsCache): Cache where thumbnails
+            are stored.
+    """
+
+    max_workers = 4
+
+    def __init__(self, thumbnails_cache):
+        self._thumbnails_cache = thumbnails_cache
+        self._executor = None
+        self._lock = threading.RLock()
+        self._futures = {}
+        # Keys of futures requested by other than prefetch
+        self._required_keys = set()
+        self._prefetch_keys = set()
+
+    def get_thumbnail_path(self, project_name, thumbnail_id):
+        """Get path to thumbnail image.
+
+        Waits for thumbnail if it is already being downloaded.
+
+        Args:
+            project_name (str): Project where thumbnail belongs to.
+            thumbnail_id (str): Thumbnail id.
+
+        Returns:
+            Union[str, None]: Path to thumbnail image.
+        """
+
+        filepath = self._thumbnails_cache.get_thumbnail_filepath(
+            project_name, thumbnail_id
+        )
+        if filepath is not None:
+            return filepath
+
+        with self._lock:
+            future = self._futures.get((project_name, thumbnail_id))
+
+        if future is not None:
+            try:
+                return future.result()
+            except CancelledError:
+                pass
+        return self._download_thumbnail(project_name, thumbnail_id)
+
+    def get_thumbnail_paths(self, project_name, thumbnail_ids):
+        """Get paths to thumbnail images downloaded concurrently.
+
+        Args:
+            project_name (str): Project where thumbnails belong to.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+
+        Returns:
+            dict[str, Union[str, None]]: Path to thumbnail image by
+                thumbnail id.
+        """
+
+        output = {}
+        missing_ids = set()
+        for thumbnail_id in thumbnail_ids:
+            if not thumbnail_id:
+                continue
+            filepath = self._thumbnails_cache.get_thumbnail_filepath(
+                project_name, thumbnail_id
+            )
+            if filepath is None:
+                missing_ids.add(thumbnail_id)
+            else:
+                output[thumbnail_id] = filepath
+
+        futures = self.fetch_thumbnails(project_name, missing_ids)
+        for thumbnail_id, future in futures.items():
+            try:
+                output[thumbnail_id] = future.result()
+            except CancelledError:
+                output[thumbnail_id] = self.get_thumbnail_path(
+                    project_name, thumbnail_id
+                )
+        return output
+
+    def fetch_thumbnails(self, project_name, thumbnail_ids, callback=None):
+        """Fetch thumbnails in background.
+
+        Args:
+            project_name (str): Project where thumbnails belong to.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+            callback (Optional[Callable[[str, str, Union[str, None]], None]]):
+                Called with project name, thumbnail id and thumbnail path
+                when thumbnail is available. Callback is called from
+                worker thread.
+
+        Returns:
+            dict[str, Future]: Futures with thumbnail path by thumbnail id.
+        """
+
+        return self._fetch_thumbnails(
+            project_name, thumbnail_ids, callback, required=True
+        )
+
+    def prefetch_thumbnails(self, project_name, thumbnail_ids, callback=None):
+        """Fetch thumbnails that will be probably needed soon.
+
+        Pending downloads of previous prefetch are cancelled, so only last
+        prefetch request is processed. Downloads that were requested also
+        by 'fetch_thumbnails' are not cancelled.
+
+        Args:
+            project_name (str): Project where thumbnails belong to.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+            callback (Optional[Callable[[str, str, Union[str, None]], None]]):
+                Called with project name, thumbnail id and thumbnail path
+                when thumbnail is available.
+
+        Returns:
+            dict[str, Future]: Futures with thumbnail path by thumbnail id.
+        """
+
+        thumbnail_ids = {
+            thumbnail_id
+            for thumbnail_id in thumbnail_ids
+            if thumbnail_id
+        }
+        prefetch_keys = {
+            (project_name, thumbnail_id)
+            for thumbnail_id in thumbnail_ids
+        }
+        with self._lock:
+            for key in self._prefetch_keys - prefetch_keys:
+                future = self._futures.get(key)
+                if future is not None and key not in self._required_keys:
+                    future.cancel()
+            self._prefetch_keys = prefetch_keys
+
+        return self._fetch_thumbnails(
+            project_name, thumbnail_ids, callback, required=False
+        )
+
+    def _fetch_thumbnails(
+        self, project_name, thumbnail_ids, callback, required
+    ):
+        output = {}
+        for thumbnail_id in thumbnail_ids:
+            if not thumbnail_id or thumbnail_id in output:
+                continue
+            future = self._get_future(project_name, thumbnail_id, required)
+            if callback is not None:
+                future.add_done_callback(
+                    self._make_done_callback(
+                        callback, project_name, thumbnail_id
+                    )
+                )
+            output[thumbnail_id] = future
+        return output
+
+    def _make_done_callback(self, callback, project_name, thumbnail_id):
+        def _done_callback(future):
+            if future.cancelled() or future.exception() is not None:
+                return
+            callback(project_name, thumbnail_id, future.result())
+        return _done_callback
+
+    def _get_future(self, project_name, thumbnail_id, required=True):
+        key = (project_name, thumbnail_id)
+        with self._lock:
+            if required:
+                self._required_keys.add(key)
+            future = self._futures.get(key)
+            if future is not None and not future.cancelled():
+                return future
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="ThumbnailsFetch",
+                )
+            future = self._executor.submit(
+                self._fetch_thumbnail, project_name, thumbnail_id
+            )
+            self._futures[key] = future
+        future.add_done_callback(
+            lambda _future: self._on_future_done(key, _future)
+        )
+        return future
+
+    def _on_future_done(self, key, future):
+        with self._lock:
+            if self._futures.get(key) is future:
+                self._futures.pop(key)
+                self._required_keys.discard(key)
+                self._prefetch_keys.discard(key)
+
+    def _fetch_thumbnail(self, project_name, thumbnail_id):
+        filepath = self._thumbnails_cache.get_thumbnail_filepath(
+            project_name, thumbnail_id
+        )
+        if filepath is not None:
+            return filepath
+        return self._download_thumbnail(project_name, thumbnail_id)
+
+    def _download_thumbnail(self, project_name, thumbnail_id):
+        # 'ayon_api' had a bug, public function
+        #   'get_thumbnail_by_id' did not return output of
+        #   'ServerAPI' method.
+        con = ayon_api.get_server_api_connection()
+        result = con.get_thumbnail_by_id(project_name, thumbnail_id)
+
+        if result is not None and result.is_valid:
+            return self._thumbnails_cache.store_thumbnail(
+                project_name,
+                thumbnail_id,
+                result.content,
+                result.content_type
+            )
+        return None
+
 
 class _CacheItems:
     thumbnails_cache = ThumbnailsCache()
+    thumbnails_fetcher = ThumbnailsFetcher(thumbnails_cache)
 
 
 def get_thumbnail_path(project_name, thumbnail_id):
@@ -241,23 +782,71 @@ def get_thumbnail_path(project_name, thumbnail_id):
     if not thumbnail_id:
         return None
 
-    filepath = _CacheItems.thumbnails_cache.get_thumbnail_filepath(
+    return _CacheItems.thumbnails_fetcher.get_thumbnail_path(
         project_name, thumbnail_id
     )
-    if filepath is not None:
-        return filepath
 
-    # 'ayon_api' had a bug, public function
-    #   'get_thumbnail_by_id' did not return output of
-    #   'ServerAPI' method.
-    con = ayon_api.get_server_api_connection()
-    result = con.get_thumbnail_by_id(project_name, thumbnail_id)
-
-    if result is not None and result.is_valid:
-        return _CacheItems.thumbnails_cache.store_thumbnail(
-            project_name,
-            thumbnail_id,
-            result.content,
-            result.content_type
-        )
-    return None
+
+def get_thumbnail_paths(project_name, thumbnail_ids):
+    """Get paths to thumbnail images.
+
+    Thumbnails that are not cached are downloaded concurrently.
+
+    Args:
+        project_name (str): Project where thumbnails belong to.
+        thumbnail_ids (Iterable[str]): Thumbnail ids.
+
+    Returns:
+        dict[str, Union[str, None]]: Path to thumbnail image by
+            thumbnail id.
+
+    """
+    return _CacheItems.thumbnails_fetcher.get_thumbnail_paths(
+        project_name, thumbnail_ids
+    )
+
+
+def fetch_thumbnails(project_name, thumbnail_ids, callback=None):
+    """Download thumbnails in background.
+
+    Unlike 'prefetch_thumbnails' the downloads are not cancelled by other
+    requests.
+
+    Args:
+        project_name (str): Project where thumbnails belong to.
+        thumbnail_ids (Iterable[str]): Thumbnail ids.
+        callback (Optional[Callable[[str, str, Union[str, None]], None]]):
+            Called with project name, thumbnail id and thumbnail path
+            when thumbnail is available. Callback is called from
+            worker thread.
+
+    Returns:
+        dict[str, Future]: Futures with thumbnail path by thumbnail id.
+
+    """
+    return _CacheItems.thumbnails_fetcher.fetch_thumbnails(
+        project_name, thumbnail_ids, callback
+    )
+
+
+def prefetch_thumbnails(project_name, thumbnail_ids, callback=None):
+    """Download thumbnails in background.
+
+    Use for thumbnails which will be probably needed soon. Pending
+    downloads of previous prefetch are cancelled.
+
+    Args:
+        project_name (str): Project where thumbnails belong to.
+        thumbnail_ids (Iterable[str]): Thumbnail ids.
+        callback (Optional[Callable[[str, str, Union[str, None]], None]]):
+            Called with project name, thumbnail id and thumbnail path
+            when thumbnail is available. Callback is called from
+            worker thread.
+
+    Returns:
+        dict[str, Future]: Futures with thumbnail path by thumbnail id.
+
+    """
+    return _CacheItems.thumbnails_fetcher.prefetch_thumbnails(
+        project_name, thumbnail_ids, callback
+    )
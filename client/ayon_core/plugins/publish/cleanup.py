@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """Cleanup leftover files from publish."""
 import os
-import shutil
 import pyblish.api
 import re
 
 from ayon_core.lib import is_in_tests
+from ayon_core.lib.file_cleanup import FileCleanupService
 
 
 class CleanUp(pyblish.api.InstancePlugin):
@@ -13,6 +13,10 @@ class CleanUp(pyblish.api.InstancePlugin):
 
     This will also clean published renders and delete their parent directories.
 
+    Removal is done by 'FileCleanupService' shared in context data under
+    'cleanupService'. When 'defer_cleanup' is enabled nothing is removed
+    until 'FinalizeCleanUp' confirms that the whole publish succeeded.
+
     """
 
     order = pyblish.api.IntegratorOrder + 10
@@ -42,6 +46,8 @@ class CleanUp(pyblish.api.InstancePlugin):
     # Presets
     patterns = None  # list of regex patterns
     remove_temp_renders = True
+    defer_cleanup = False
+    max_workers = FileCleanupService.default_max_workers
 
     def process(self, instance):
         """Plugin entry point."""
@@ -67,9 +73,12 @@ class CleanUp(pyblish.api.InstancePlugin):
         for path in _skip_cleanup_filepaths:
             skip_cleanup_filepaths.add(os.path.normpath(path))
 
+        cleanup_service = self._get_cleanup_service(instance.context)
         if self.remove_temp_renders:
             self.log.debug("Cleaning renders new...")
-            self.clean_renders(instance, skip_cleanup_filepaths)
+            self.clean_renders(
+                instance, skip_cleanup_filepaths, cleanup_service
+            )
 
         if [ef for ef in self.exclude_families
                 if instance.data["productType"] in ef]:
@@ -100,14 +109,29 @@ class CleanUp(pyblish.api.InstancePlugin):
             return
 
         self.log.debug("Removing staging directory {}".format(staging_dir))
-        shutil.rmtree(staging_dir)
+        cleanup_service.add_dir(staging_dir)
+
+    def _get_cleanup_service(self, context):
+        cleanup_service = context.data.get("cleanupService")
+        if cleanup_service is None:
+            cleanup_service = FileCleanupService(
+                max_workers=self.max_workers,
+                deferred=self.defer_cleanup,
+                log=self.log
+            )
+            context.data["cleanupService"] = cleanup_service
+        return cleanup_service
+
+    def clean_renders(
+        self, instance, skip_cleanup_filepaths, cleanup_service=None
+    ):
+        if cleanup_service is None:
+            cleanup_service = self._get_cleanup_service(instance.context)
 
-    def clean_renders(self, instance, skip_cleanup_filepaths):
         transfers = instance.data.get("transfers", list())
 
         instance_families = instance.data.get("families", list())
         instance_product_type = instance.data.get("productType")
-        dirnames = []
         transfers_dirs = []
 
         for src, dest in transfers:
@@ -135,16 +159,8 @@ class CleanUp(pyblish.api.InstancePlugin):
                 or "render" in instance_families
             ):
                 self.log.info("Removing src: `{}`...".format(src))
-                try:
-                    os.remove(src)
-                except PermissionError:
-                    self.log.warning(
-                        "Insufficient permission to delete {}".format(src)
-                    )
-                    continue
-
-                # add dir for cleanup
-                dirnames.append(os.path.dirname(src))
+                # parent dir is removed too if it ends up empty
+                cleanup_service.add_file(src, remove_empty_parent=True)
 
         # clean by regex patterns
         # make unique set
@@ -152,43 +168,34 @@ class CleanUp(pyblish.api.InstancePlugin):
 
         self.log.debug("__ transfers_dirs: `{}`".format(transfers_dirs))
         self.log.debug("__ self.patterns: `{}`".format(self.patterns))
-        if self.patterns:
-            files = list()
-            # get list of all available content of dirs
-            for _dir in transfers_dirs:
-                if not os.path.exists(_dir):
-                    continue
-                files.extend([
-                    os.path.join(_dir, f)
-                    for f in os.listdir(_dir)])
+        if not self.patterns:
+            return
 
-            self.log.debug("__ files: `{}`".format(files))
+        files = list()
+        # get list of all available content of dirs
+        for _dir in transfers_dirs:
+            if not os.path.isdir(_dir):
+                continue
+            with os.scandir(_dir) as scan:
+                files.extend(
+                    entry.path
+                    for entry in scan
+                    if not entry.is_dir()
+                )
+
+        self.log.debug("__ files: `{}`".format(files))
+
+        patterns = [re.compile(p) for p in self.patterns]
+        # remove all files which match regex pattern
+        for f in files:
+            if os.path.normpath(f) in skip_cleanup_filepaths:
+                continue
 
-            # remove all files which match regex pattern
-            for f in files:
-                if os.path.normpath(f) in skip_cleanup_filepaths:
+            for pattern in patterns:
+                if not pattern.findall(f):
                     continue
 
-                for p in self.patterns:
-                    pattern = re.compile(p)
-                    if not pattern.findall(f):
-                        continue
-                    if not os.path.exists(f):
-                        continue
-
-                    self.log.info("Removing file by regex: `{}`".format(f))
-                    os.remove(f)
-
-                    # add dir for cleanup
-                    dirnames.append(os.path.dirname(f))
-
-        # make unique set
-        cleanup_dirs = set(dirnames)
-
-        # clean dirs which are empty
-        for dir in cleanup_dirs:
-            try:
-                os.rmdir(dir)
-            except OSError:
-                # directory is not empty, skipping
-                continue
+                self.log.info("Removing file by regex: `{}`".format(f))
+                # parent dir is removed too if it ends up empty
+                cleanup_service.add_file(f, remove_empty_parent=True)
+                break
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Finish removal of files queued by 'CleanUp' plugin."""
+import pyblish.api
+
+
+class FinalizeCleanUp(pyblish.api.ContextPlugin):
+    """Wait for background cleanup started by 'CleanUp' plugin.
+
+    Deferred cleanup is started only if no plugin failed during publishing,
+    otherwise it is cancelled and files are kept on disk.
+    """
+
+    order = pyblish.api.IntegratorOrder + 10.5
+    label = "Finalize Clean Up"
+
+    def process(self, context):
+        cleanup_service = context.data.get("cleanupService")
+        if cleanup_service is None:
+            self.log.debug("No cleanup service was created.")
+            return
+
+        publish_failed = any(
+            result["error"] is not None
+            for result in context.data["results"]
+        )
+        if publish_failed and not cleanup_service.started:
+            self.log.info(
+                "Publishing failed. Deferred cleanup is cancelled."
+            )
+            cleanup_service.cancel()
+            return
+
+        cleanup_service.start()
+        cleanup_service.wait()
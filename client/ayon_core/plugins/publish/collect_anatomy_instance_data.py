@@ -34,6 +34,7 @@ import pyblish.api
 import ayon_api
 
 from ayon_core.pipeline.template_data import get_folder_template_data
+from ayon_core.pipeline.hierarchy_index import get_project_hierarchy_index
 from ayon_core.pipeline.version_start import get_versioning_start
 
 
@@ -97,12 +98,25 @@ class CollectAnatomyInstanceData(pyblish.api.ContextPlugin):
             ", ".join(["\"{}\"".format(path) for path in folder_paths])
         ))
 
-        folder_entities_by_path = {
-            folder_entity["path"]: folder_entity
-            for folder_entity in ayon_api.get_folders(
-                project_name, folder_paths=folder_paths
-            )
-        }
+        # Skip query of folders which are known to not exist when hierarchy
+        #   index was already loaded, e.g. by create context
+        hierarchy_index = get_project_hierarchy_index(project_name)
+        if hierarchy_index.is_valid:
+            folder_ids_by_path = hierarchy_index.get_folder_ids(folder_paths)
+            folder_paths = [
+                folder_path
+                for folder_path, folder_id in folder_ids_by_path.items()
+                if folder_id is not None
+            ]
+
+        folder_entities_by_path = {}
+        if folder_paths:
+            folder_entities_by_path = {
+                folder_entity["path"]: folder_entity
+                for folder_entity in ayon_api.get_folders(
+                    project_name, folder_paths=folder_paths
+                )
+            }
 
         not_found_folder_paths = []
         for folder_path, instances in instances_missing_folder.items():
@@ -182,6 +196,21 @@ class CollectAnatomyInstanceData(pyblish.api.ContextPlugin):
             all_task_names |= set(per_task.keys())
         all_task_names.discard(None)
 
+        hierarchy_index = get_project_hierarchy_index(project_name)
+        if all_task_names and hierarchy_index.is_valid:
+            existing_task_names = set()
+            for folder_id, per_task in instances_missing_task.items():
+                folder_path = folder_path_by_id[folder_id]
+                existing_task_names |= {
+                    task_name
+                    for task_name in per_task.keys()
+                    if (
+                        task_name
+                        and hierarchy_index.task_exists(folder_path, task_name)
+                    )
+                }
+            all_task_names = existing_task_names
+
         task_entities = []
         if all_task_names:
             task_entities = ayon_api.get_tasks(
@@ -3,7 +3,7 @@ import collections
 import ayon_api
 import pyblish.api
 
-from ayon_core.pipeline.load import get_representation_path_with_anatomy
+from ayon_core.pipeline.load import get_representation_paths
 
 
 class CollectAudio(pyblish.api.ContextPlugin):
@@ -84,15 +84,30 @@ class CollectAudio(pyblish.api.ContextPlugin):
         repre_entities_by_folder_paths = self.query_representations(
             project_name, folder_paths)
 
+        repre_entity_by_folder_path = {
+            folder_path: repre_entities[0]
+            for folder_path, repre_entities in (
+                repre_entities_by_folder_paths.items()
+            )
+            if repre_entities
+        }
+        repre_paths_by_id = get_representation_paths(
+            repre_entity_by_folder_path.values(), anatomy
+        )
+
         for folder_path, instances in instances_by_folder_path.items():
-            repre_entities = repre_entities_by_folder_paths[folder_path]
-            if not repre_entities:
+            repre_entity = repre_entity_by_folder_path.get(folder_path)
+            if not repre_entity:
+                continue
+
+            repre_path = repre_paths_by_id[repre_entity["id"]]
+            if not repre_path:
+                self.log.warning(
+                    "Couldn't resolve path of audio representation"
+                    " for folder '{}'.".format(folder_path)
+                )
                 continue
 
-            repre_entity = repre_entities[0]
-            repre_path = get_representation_path_with_anatomy(
-                repre_entity, anatomy
-            )
             for instance in instances:
                 instance.data["audio"] = [{
                     "offset": 0,
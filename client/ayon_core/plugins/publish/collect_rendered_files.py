@@ -9,6 +9,8 @@ Provides:
 
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pyblish.api
 
@@ -32,6 +34,9 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
     targets = ["filesequence", "farm"]
     label = "Collect rendered frames"
 
+    # Maximum number of metadata files loaded at the same time
+    max_workers = 4
+
     _context = None
 
     def _load_json(self, path):
@@ -42,14 +47,64 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
                 f"Path to json file doesn't exist. \"{path}\"")
 
         data = None
+        start = time.perf_counter()
         with open(path, "r") as json_file:
             try:
                 data = json.load(json_file)
             except Exception as exc:
                 self.log.error(
                     "Error loading json: %s - Exception: %s", path, exc)
+        self.log.debug(
+            "Loaded json file in %.3fs: %s",
+            time.perf_counter() - start, path
+        )
         return data
 
+    def _iter_loaded_jsons(self, paths):
+        """Load metadata files concurrently and yield them in input order.
+
+        Files are read in a thread pool so I/O of multiple files overlaps,
+        but results are yielded one by one in order of 'paths'. Only a
+        limited number of files is loaded ahead of the one being processed
+        so memory stays bounded.
+
+        Args:
+            paths (list[str]): Paths to metadata json files.
+
+        Yields:
+            tuple[str, Union[dict[str, Any], None]]: Path and loaded data.
+
+        """
+        if not paths:
+            return
+
+        max_workers = max(1, min(self.max_workers, len(paths)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = []
+            paths_iter = iter(paths)
+            for path in paths_iter:
+                pending.append((path, executor.submit(self._load_json, path)))
+                if len(pending) >= max_workers:
+                    break
+
+            while pending:
+                path, future = pending.pop(0)
+                next_path = next(paths_iter, None)
+                if next_path is not None:
+                    next_future = executor.submit(self._load_json, next_path)
+                    pending.append((next_path, next_future))
+                yield path, future.result()
+
+    def _validate_instance_data(self, instance_data):
+        if not isinstance(instance_data, dict):
+            raise ValueError(
+                "invalid json file - instance data must be a dictionary"
+            )
+        if not instance_data.get("productName"):
+            raise ValueError(
+                "invalid json file - instance is missing 'productName'"
+            )
+
     def _fill_staging_dir(self, data_object, anatomy):
         staging_dir = data_object.get("stagingDir")
         if staging_dir:
@@ -94,6 +149,7 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
         # now we can just add instances from json file and we are done
         any_staging_dir_persistent = False
         for instance_data in data.get("instances"):
+            self._validate_instance_data(instance_data)
 
             self.log.debug("  - processing instance for {}".format(
                 instance_data.get("productName")))
@@ -156,10 +212,10 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
         self.log.debug("Anatomy roots: {}".format(anatomy.roots))
         try:
             session_is_set = False
-            for path in paths:
-                path = anatomy.fill_root(path)
-                data = self._load_json(path)
+            paths = [anatomy.fill_root(path) for path in paths]
+            for path, data in self._iter_loaded_jsons(paths):
                 assert data, "failed to load json file"
+                start = time.perf_counter()
                 session_data = data.get("session")
                 if not session_is_set and session_data:
                     session_is_set = True
@@ -167,6 +223,12 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
                     os.environ.update(session_data)
 
                 staging_dir_persistent = self._process_path(data, anatomy)
+                self.log.debug(
+                    "Processed json file in %.3fs: %s",
+                    time.perf_counter() - start, path
+                )
+                # Release loaded data before next file is processed
+                del data
                 if not staging_dir_persistent:
                     context.data["cleanupFullPaths"].append(path)
                     context.data["cleanupEmptyDirs"].append(
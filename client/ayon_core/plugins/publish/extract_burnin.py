@@ -32,6 +32,8 @@ class ExtractBurnin(publish.Extractor):
 
     label = "Extract burnins"
     order = pyblish.api.ExtractorOrder + 0.03
+    # Works only with data of processed instance
+    parallel_safe = True
 
     families = ["review", "burnin"]
     hosts = [
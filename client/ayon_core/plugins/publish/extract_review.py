@@ -14,7 +14,8 @@ from ayon_core.lib import (
     get_ffmpeg_tool_args,
     filter_profiles,
     path_to_subprocess_arg,
-    run_subprocess,
+    run_subprocess_streaming,
+    FFmpegProgressParser,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -73,6 +74,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     label = "Extract Review"
     order = pyblish.api.ExtractorOrder + 0.02
+    # Works only with data of processed instance
+    parallel_safe = True
     families = ["review"]
     hosts = [
         "nuke",
@@ -103,6 +106,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    # Kill ffmpeg if it does not finish in given number of seconds
+    ffmpeg_timeout = None
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -453,12 +458,26 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     return
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+            # Report progress while ffmpeg is running
+            subprcs_cmd = " ".join(
+                ffmpeg_args[:1]
+                + ["-progress", "pipe:1", "-nostats"]
+                + ffmpeg_args[1:]
+            )
 
             # run subprocess
             self.log.debug("Executing: {}".format(subprcs_cmd))
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            progress_parser = FFmpegProgressParser(
+                frame_count=self._get_output_frames_len(temp_data)
+            )
+            run_subprocess_streaming(
+                subprcs_cmd,
+                shell=True,
+                logger=self.log,
+                progress_parser=progress_parser,
+                timeout=self.ffmpeg_timeout,
+            )
 
             # delete files added to fill gaps
             if files_to_clean:
@@ -597,6 +616,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
             "handles_are_set": handles_are_set
         }
 
+    def _get_output_frames_len(self, temp_data):
+        # Set output frames len to 1 when output is single image
+        if (
+            temp_data["output_ext_is_image"]
+            and not temp_data["output_is_sequence"]
+        ):
+            return 1
+
+        return (
+            temp_data["output_frame_end"]
+            - temp_data["output_frame_start"]
+            + 1
+        )
+
     def _ffmpeg_arguments(
         self,
         output_def,
@@ -656,20 +689,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         # Prepare input and output filepaths
         self.input_output_paths(new_repre, output_def, temp_data)
 
-        # Set output frames len to 1 when output is single image
-        if (
-            temp_data["output_ext_is_image"]
-            and not temp_data["output_is_sequence"]
-        ):
-            output_frames_len = 1
-
-        else:
-            output_frames_len = (
-                temp_data["output_frame_end"]
-                - temp_data["output_frame_start"]
-                + 1
-            )
-
+        output_frames_len = self._get_output_frames_len(temp_data)
         duration_seconds = float(output_frames_len / temp_data["fps"])
 
         # Define which layer should be used
@@ -1,5 +1,8 @@
 import os
 import json
+import uuid
+import shutil
+import hashlib
 import logging
 import collections
 import copy
@@ -7,6 +10,8 @@ import time
 
 import ayon_api
 
+from ayon_core.lib import freeze
+
 log = logging.getLogger(__name__)
 
 
@@ -18,23 +23,171 @@ class CacheItem:
         if outdate_time is None:
             outdate_time = time.time() + self.lifetime
         self._outdate_time = outdate_time
+        self._was_filled = outdate_time != 0
 
     @classmethod
     def create_outdated(cls):
         return cls({}, 0)
 
-    def get_value(self):
+    @property
+    def was_filled(self):
+        return self._was_filled
+
+    def get_value(self, frozen=False):
+        """Cached value.
+
+        Args:
+            frozen (Optional[bool]): Return read-only view of the value
+                instead of deep copy. The view is not 'dict' or 'list'
+                instance and is not json serializable.
+
+        Returns:
+            Any: Cached value.
+
+        """
+        if frozen:
+            return freeze(self._value)
         return copy.deepcopy(self._value)
 
     def update_value(self, value):
         self._value = value
         self._outdate_time = time.time() + self.lifetime
+        self._was_filled = True
 
     @property
     def is_outdated(self):
         return time.time() > self._outdate_time
 
 
+class _SettingsSnapshot:
+    """On-disk snapshot of settings shared with child processes.
+
+    Snapshots are used only if 'AYON_SETTINGS_SNAPSHOT_ENABLED' is set.
+    The first process that fetches settings creates snapshot revision and
+    stores it to 'AYON_SETTINGS_SNAPSHOT_REVISION' so all child processes
+    (launched applications, publish jobs, farm jobs using the same
+    environment) can reuse settings fetched by the parent process instead
+    of downloading them from server again.
+
+    Snapshot is identified by server url, bundle name, variant, project name
+    and the revision. Snapshot files older than
+    'AYON_SETTINGS_SNAPSHOT_TTL' seconds are ignored and removed.
+
+    Revision is not changed when settings change on server, snapshots are
+    meant for child processes launched shortly one after another (e.g. farm
+    tasks or publish jobs of one submission), not for long running
+    processes like tray. That's why the default lifetime is only a few
+    minutes, an expired snapshot is fetched from server and saved again.
+    """
+    enabled_env_key = "AYON_SETTINGS_SNAPSHOT_ENABLED"
+    revision_env_key = "AYON_SETTINGS_SNAPSHOT_REVISION"
+    dir_env_key = "AYON_SETTINGS_SNAPSHOT_DIR"
+    ttl_env_key = "AYON_SETTINGS_SNAPSHOT_TTL"
+    default_ttl = 5 * 60
+    studio_filename = "__studio__"
+
+    @classmethod
+    def is_enabled(cls):
+        value = os.getenv(cls.enabled_env_key, "").lower()
+        return value in ("1", "true", "yes", "on")
+
+    @classmethod
+    def _get_ttl(cls):
+        try:
+            return int(os.getenv(cls.ttl_env_key, cls.default_ttl))
+        except ValueError:
+            return cls.default_ttl
+
+    @classmethod
+    def _get_root(cls):
+        root = os.getenv(cls.dir_env_key)
+        if not root:
+            from ayon_core.lib import get_launcher_local_dir
+
+            root = get_launcher_local_dir("settings_snapshots")
+        return root
+
+    @classmethod
+    def _get_revision(cls):
+        revision = os.getenv(cls.revision_env_key)
+        if not revision:
+            revision = uuid.uuid4().hex
+            os.environ[cls.revision_env_key] = revision
+            cls._remove_outdated()
+        return revision
+
+    @classmethod
+    def _get_filepath(cls, bundle_name, variant, project_name):
+        key_data = json.dumps([
+            os.getenv("AYON_SERVER_URL"),
+            bundle_name,
+            variant,
+            cls._get_revision(),
+        ])
+        dirname = hashlib.sha1(key_data.encode("utf-8")).hexdigest()
+        filename = project_name or cls.studio_filename
+        return os.path.join(cls._get_root(), dirname, f"{filename}.json")
+
+    @classmethod
+    def _remove_outdated(cls):
+        root = cls._get_root()
+        if not os.path.isdir(root):
+            return
+        outdate_time = time.time() - cls._get_ttl()
+        with os.scandir(root) as scan:
+            for entry in scan:
+                try:
+                    if entry.stat().st_mtime < outdate_time:
+                        shutil.rmtree(entry.path)
+                except OSError:
+                    continue
+
+    @classmethod
+    def load(cls, bundle_name, variant, project_name):
+        """Load settings from snapshot.
+
+        Returns:
+            Union[dict[str, Any], None]: Settings or None if snapshot
+                is not available.
+
+        """
+        if not cls.is_enabled():
+            return None
+        filepath = cls._get_filepath(bundle_name, variant, project_name)
+        try:
+            if os.path.getmtime(filepath) < time.time() - cls._get_ttl():
+                return None
+            with open(filepath, "r") as stream:
+                return json.load(stream)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            log.debug(
+                "Failed to load settings snapshot %s", filepath, exc_info=True
+            )
+        return None
+
+    @classmethod
+    def save(cls, bundle_name, variant, project_name, value):
+        if not cls.is_enabled():
+            return
+        filepath = cls._get_filepath(bundle_name, variant, project_name)
+        # Write to temp file first so other processes never read
+        #   partially written file
+        tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(value, stream)
+            os.replace(tmp_path, filepath)
+        except Exception:
+            log.debug(
+                "Failed to save settings snapshot %s", filepath, exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
 class _AyonSettingsCache:
     use_bundles = None
     variant = None
@@ -76,19 +229,37 @@ class _AyonSettingsCache:
         return os.environ["AYON_BUNDLE_NAME"]
 
     @classmethod
-    def get_value_by_project(cls, project_name):
+    def get_value_by_project(cls, project_name, frozen=False):
         cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
         if cache_item.is_outdated:
-            if cls._use_bundles():
-                value = ayon_api.get_addons_settings(
-                    bundle_name=cls._get_bundle_name(),
-                    project_name=project_name,
-                    variant=cls._get_variant()
+            value = None
+            use_bundles = cls._use_bundles()
+            bundle_name = variant = None
+            if use_bundles:
+                bundle_name = cls._get_bundle_name()
+                variant = cls._get_variant()
+
+            # Use settings snapshot created by parent process only on first
+            #   access, any later refresh is done from server
+            if not cache_item.was_filled:
+                value = _SettingsSnapshot.load(
+                    bundle_name, variant, project_name
+                )
+
+            if value is None:
+                if use_bundles:
+                    value = ayon_api.get_addons_settings(
+                        bundle_name=bundle_name,
+                        project_name=project_name,
+                        variant=variant
+                    )
+                else:
+                    value = ayon_api.get_addons_settings(project_name)
+                _SettingsSnapshot.save(
+                    bundle_name, variant, project_name, value
                 )
-            else:
-                value = ayon_api.get_addons_settings(project_name)
             cache_item.update_value(value)
-        return cache_item.get_value()
+        return cache_item.get_value(frozen)
 
     @classmethod
     def _get_addon_versions_from_bundle(cls):
@@ -123,27 +294,56 @@ class _AyonSettingsCache:
         return cache_item.get_value()
 
 
-def get_ayon_settings(project_name=None):
+def get_ayon_settings(project_name=None, frozen=False):
     """AYON studio settings.
 
     Raw AYON settings values.
 
     Args:
         project_name (Optional[str]): Project name.
+        frozen (Optional[bool]): Return read-only view of cached settings
+            instead of a copy. The view is not 'dict' instance and is not
+            json serializable. Use 'mutable_copy' on the result if
+            settings should be modified or serialized.
+
+    Returns:
+        Union[dict[str, Any], FrozenDict]: AYON settings.
+    """
+
+    return _AyonSettingsCache.get_value_by_project(project_name, frozen)
+
+
+def get_studio_settings(*args, frozen=False, **kwargs):
+    """Studio settings.
+
+    Args:
+        frozen (Optional[bool]): Return read-only view of cached settings
+            instead of a copy. The view is not 'dict' instance and is not
+            json serializable. Use 'mutable_copy' on the result if
+            settings should be modified or serialized.
 
     Returns:
-        dict[str, Any]: AYON settings.
+        Union[dict[str, Any], FrozenDict]: Studio settings.
+
     """
+    return _AyonSettingsCache.get_value_by_project(None, frozen)
 
-    return _AyonSettingsCache.get_value_by_project(project_name)
 
+def get_project_settings(project_name, *args, frozen=False, **kwargs):
+    """Project settings.
 
-def get_studio_settings(*args, **kwargs):
-    return _AyonSettingsCache.get_value_by_project(None)
+    Args:
+        project_name (str): Project name.
+        frozen (Optional[bool]): Return read-only view of cached settings
+            instead of a copy. The view is not 'dict' instance and is not
+            json serializable. Use 'mutable_copy' on the result if
+            settings should be modified or serialized.
 
+    Returns:
+        Union[dict[str, Any], FrozenDict]: Project settings.
 
-def get_project_settings(project_name, *args, **kwargs):
-    return _AyonSettingsCache.get_value_by_project(project_name)
+    """
+    return _AyonSettingsCache.get_value_by_project(project_name, frozen)
 
 
 def get_general_environments(studio_settings=None):
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 import ayon_api
 
 from ayon_core.lib import NestedCacheItem
+from ayon_core.pipeline.hierarchy_index import get_project_hierarchy_index
+from ayon_core.pipeline.entities_cache import get_entities_cache
 
 HIERARCHY_MODEL_SENDER = "hierarchy.model"
 
@@ -197,19 +199,17 @@ class HierarchyModel(object):
 
     Hierarchy items are folders and tasks. Folders can have as parent another
     folder or project. Tasks can have as parent only folder.
+
+    Folder and task entities are received from process-wide entities cache.
     """
     lifetime = 60  # A minute
 
     def __init__(self, controller):
         self._folders_items = NestedCacheItem(
             levels=1, default_factory=dict, lifetime=self.lifetime)
-        self._folders_by_id = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
 
         self._task_items = NestedCacheItem(
             levels=2, default_factory=dict, lifetime=self.lifetime)
-        self._tasks_by_id = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
 
         self._folders_refreshing = set()
         self._tasks_refreshing = set()
@@ -217,10 +217,8 @@ class HierarchyModel(object):
 
     def reset(self):
         self._folders_items.reset()
-        self._folders_by_id.reset()
 
         self._task_items.reset()
-        self._tasks_by_id.reset()
 
     def refresh_project(self, project_name):
         """Force to refresh folder items for a project.
@@ -229,7 +227,7 @@ class HierarchyModel(object):
             project_name (str): Name of project to refresh.
         """
 
-        self._refresh_folders_cache(project_name)
+        self._refresh_folders_cache(project_name, force=True)
 
     def get_folder_items(self, project_name, sender):
         """Get folder items by project name.
@@ -396,50 +394,34 @@ class HierarchyModel(object):
             dict[str, Any]: Folder entities by id.
         """
 
-        output = {}
         folder_ids = set(folder_ids)
         if not project_name or not folder_ids:
-            return output
+            return {}
 
-        folder_ids_to_query = set()
-        for folder_id in folder_ids:
-            cache = self._folders_by_id[project_name][folder_id]
-            if cache.is_valid:
-                output[folder_id] = cache.get_data()
-            elif folder_id:
-                folder_ids_to_query.add(folder_id)
-            else:
-                output[folder_id] = None
-        self._query_folder_entities(project_name, folder_ids_to_query)
-        for folder_id in folder_ids_to_query:
-            cache = self._folders_by_id[project_name][folder_id]
-            output[folder_id] = cache.get_data()
-        return output
+        folders_by_id = get_entities_cache().get_entities(
+            project_name, "folder", folder_ids
+        )
+        return {
+            folder_id: folders_by_id.get(folder_id)
+            for folder_id in folder_ids
+        }
 
     def get_folder_entity(self, project_name, folder_id):
         output = self.get_folder_entities(project_name, {folder_id})
         return output[folder_id]
 
     def get_task_entities(self, project_name, task_ids):
-        output = {}
         task_ids = set(task_ids)
         if not project_name or not task_ids:
-            return output
+            return {}
 
-        task_ids_to_query = set()
-        for task_id in task_ids:
-            cache = self._tasks_by_id[project_name][task_id]
-            if cache.is_valid:
-                output[task_id] = cache.get_data()
-            elif task_id:
-                task_ids_to_query.add(task_id)
-            else:
-                output[task_id] = None
-        self._query_task_entities(project_name, task_ids_to_query)
-        for task_id in task_ids_to_query:
-            cache = self._tasks_by_id[project_name][task_id]
-            output[task_id] = cache.get_data()
-        return output
+        tasks_by_id = get_entities_cache().get_entities(
+            project_name, "task", task_ids
+        )
+        return {
+            task_id: tasks_by_id.get(task_id)
+            for task_id in task_ids
+        }
 
     def get_task_entity(self, project_name, task_id):
         output = self.get_task_entities(project_name, {task_id})
@@ -493,19 +475,24 @@ class HierarchyModel(object):
             )
             self._tasks_refreshing.discard(folder_id)
 
-    def _refresh_folders_cache(self, project_name, sender=None):
+    def _refresh_folders_cache(self, project_name, sender=None, force=False):
         if project_name in self._folders_refreshing:
             return
 
         with self._folder_refresh_event_manager(project_name, sender):
-            folder_items = self._query_folders(project_name)
+            folder_items = self._query_folders(project_name, force)
             self._folders_items[project_name].update_data(folder_items)
 
-    def _query_folders(self, project_name):
-        hierarchy = ayon_api.get_folders_hierarchy(project_name)
+    def _query_folders(self, project_name, force=False):
+        # Hierarchy is shared with other tools and create context
+        hierarchy_index = get_project_hierarchy_index(project_name)
+        if force:
+            hierarchy_index.refresh()
 
         folder_items = {}
-        hierachy_queue = collections.deque(hierarchy["hierarchy"])
+        hierachy_queue = collections.deque(
+            hierarchy_index.get_hierarchy_items()
+        )
         while hierachy_queue:
             item = hierachy_queue.popleft()
             folder_item = _get_folder_item_from_hierarchy_item(item)
@@ -513,25 +500,6 @@ class HierarchyModel(object):
             hierachy_queue.extend(item["children"] or [])
         return folder_items
 
-    def _query_folder_entities(self, project_name, folder_ids):
-        if not project_name or not folder_ids:
-            return
-        project_cache = self._folders_by_id[project_name]
-        folders = ayon_api.get_folders(project_name, folder_ids=folder_ids)
-        for folder in folders:
-            folder_id = folder["id"]
-            project_cache[folder_id].update_data(folder)
-
-    def _query_task_entities(self, project_name, task_ids):
-        if not project_name or not task_ids:
-            return
-
-        project_cache = self._tasks_by_id[project_name]
-        tasks = ayon_api.get_tasks(project_name, task_ids=task_ids)
-        for task in tasks:
-            task_id = task["id"]
-            project_cache[task_id].update_data(task)
-
     def _refresh_tasks_cache(self, project_name, folder_id, sender=None):
         if folder_id in self._tasks_refreshing:
             while folder_id in self._tasks_refreshing:
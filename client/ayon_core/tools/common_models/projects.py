@@ -6,6 +6,7 @@ import ayon_api
 
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.lib import CacheItem, NestedCacheItem
+from ayon_core.pipeline.entities_cache import get_entities_cache
 
 PROJECTS_MODEL_SENDER = "projects.model"
 
@@ -284,7 +285,7 @@ class ProjectsModel(object):
         if not project_cache.is_valid:
             entity = None
             if project_name:
-                entity = ayon_api.get_project(project_name)
+                entity = get_entities_cache().get_project(project_name)
             project_cache.update_data(entity)
         return project_cache.get_data()
 
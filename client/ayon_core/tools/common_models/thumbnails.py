@@ -3,7 +3,12 @@ import collections
 import ayon_api
 
 from ayon_core.lib import NestedCacheItem
-from ayon_core.pipeline.thumbnails import get_thumbnail_path
+from ayon_core.pipeline.thumbnails import (
+    get_thumbnail_path,
+    get_thumbnail_paths,
+    fetch_thumbnails,
+    prefetch_thumbnails,
+)
 
 
 class ThumbnailsModel:
@@ -24,6 +29,88 @@ class ThumbnailsModel:
     def get_thumbnail_path(self, project_name, thumbnail_id):
         return self._get_thumbnail_path(project_name, thumbnail_id)
 
+    def get_thumbnail_paths(self, project_name, thumbnail_ids):
+        """Thumbnail paths by thumbnail ids.
+
+        Thumbnails that are not cached are downloaded concurrently.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+
+        Returns:
+            dict[str, Union[str, None]]: Thumbnail path by thumbnail id.
+        """
+
+        project_cache = self._paths_cache[project_name]
+        output = {}
+        missing_ids = set()
+        for thumbnail_id in thumbnail_ids:
+            if not thumbnail_id:
+                continue
+            if thumbnail_id in project_cache:
+                output[thumbnail_id] = project_cache[thumbnail_id]
+            else:
+                missing_ids.add(thumbnail_id)
+
+        if missing_ids:
+            filepaths = get_thumbnail_paths(project_name, missing_ids)
+            project_cache.update(filepaths)
+            output.update(filepaths)
+        return output
+
+    def request_thumbnail_paths(self, project_name, thumbnail_ids, callback):
+        """Request thumbnail paths without waiting for downloads.
+
+        Callback is called right away for cached thumbnails, other
+        thumbnails are downloaded concurrently and callback is called
+        from download thread when each of them is available.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+            callback (Callable[[str, Union[str, None]], None]): Called with
+                thumbnail id and thumbnail path.
+        """
+
+        project_cache = self._paths_cache[project_name]
+        missing_ids = set()
+        for thumbnail_id in set(thumbnail_ids):
+            if not thumbnail_id:
+                continue
+            if thumbnail_id in project_cache:
+                callback(thumbnail_id, project_cache[thumbnail_id])
+            else:
+                missing_ids.add(thumbnail_id)
+
+        if not missing_ids:
+            return
+
+        def _on_fetch(_project_name, thumbnail_id, filepath):
+            project_cache[thumbnail_id] = filepath
+            callback(thumbnail_id, filepath)
+
+        fetch_thumbnails(project_name, missing_ids, _on_fetch)
+
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        """Download thumbnails in background.
+
+        Pending downloads of previous prefetch are cancelled.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+        """
+
+        project_cache = self._paths_cache[project_name]
+        thumbnail_ids = [
+            thumbnail_id
+            for thumbnail_id in thumbnail_ids
+            if thumbnail_id and thumbnail_id not in project_cache
+        ]
+        if thumbnail_ids:
+            prefetch_thumbnails(project_name, thumbnail_ids)
+
     def get_folder_thumbnail_ids(self, project_name, folder_ids):
         project_cache = self._folders_cache[project_name]
         output = {}
@@ -45,6 +45,12 @@ class ProductItem:
         folder_id (str): Folder id.
         folder_label (str): Folder label.
         version_items (dict[str, VersionItem]): Version items by id.
+        has_more_versions (Optional[bool]): Product has versions that are
+            not in 'version_items' yet.
+        status_names (Optional[Iterable[str]]): Statuses of all versions
+            of the product, including versions that are not in
+            'version_items'. Statuses of 'version_items' are used if not
+            passed.
     """
 
     def __init__(
@@ -59,6 +65,8 @@ class ProductItem:
         folder_id,
         folder_label,
         version_items,
+        has_more_versions=False,
+        status_names=None,
     ):
         self.product_id = product_id
         self.product_type = product_type
@@ -70,6 +78,13 @@ class ProductItem:
         self.folder_id = folder_id
         self.folder_label = folder_label
         self.version_items = version_items
+        self.has_more_versions = has_more_versions
+        if status_names is None:
+            status_names = {
+                version_item.status
+                for version_item in version_items.values()
+            }
+        self.status_names = set(status_names)
 
     def to_data(self):
         return {
@@ -86,6 +101,8 @@ class ProductItem:
                 version_id: version_item.to_data()
                 for version_id, version_item in self.version_items.items()
             },
+            "has_more_versions": self.has_more_versions,
+            "status_names": list(self.status_names),
         }
 
     @classmethod
@@ -594,6 +611,41 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def get_product_version_items(self, project_name, product_id):
+        """All version items of a product.
+
+        Product items contain only latest versions and hero version, other
+        versions are queried on demand, e.g. when version combobox is
+        opened. Missing versions are also added to the product item.
+
+        Args:
+            project_name (str): Project name.
+            product_id (str): Product id.
+
+        Returns:
+            list[VersionItem]: Version items of the product.
+        """
+
+        pass
+
+    @abstractmethod
+    def get_products_version_items(self, project_name, product_ids):
+        """All version items of multiple products.
+
+        Same as 'get_product_version_items' but missing versions of all
+        products are queried at once.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, list[VersionItem]]: Version items by product id.
+        """
+
+        pass
+
     @abstractmethod
     def get_product_type_items(self, project_name):
         """Product type items for a project.
@@ -696,6 +748,40 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def get_thumbnail_paths(self, project_name, thumbnail_ids):
+        """Get thumbnail paths for thumbnail ids.
+
+        Thumbnails that are not available locally are downloaded
+        concurrently.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+
+        Returns:
+            dict[str, Union[str, None]]: Thumbnail path by thumbnail id.
+        """
+
+        pass
+
+    @abstractmethod
+    def request_thumbnail_paths(self, project_name, thumbnail_ids, callback):
+        """Request thumbnail paths without blocking.
+
+        Thumbnails that are not available locally are downloaded
+        concurrently. Callback is called for each thumbnail when it is
+        available, possibly from other than main thread.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+            callback (Callable[[str, Union[str, None]], None]): Called with
+                thumbnail id and thumbnail path.
+        """
+
+        pass
+
     # Selection model wrapper calls
     @abstractmethod
     def get_selected_project_name(self):
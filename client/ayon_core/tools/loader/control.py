@@ -22,6 +22,7 @@ from .abstract import (
 )
 from .models import (
     SelectionModel,
+    LoadContextsModel,
     ProductsModel,
     LoaderActionsModel,
     SiteSyncModel
@@ -100,6 +101,10 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         host (Optional[AbstractHost]): Host object. Defaults to None.
     """
 
+    # Max number of thumbnails downloaded in background when products
+    #   are shown
+    thumbnails_prefetch_limit = 100
+
     def __init__(self, host=None):
         self._log = None
         self._host = host
@@ -115,8 +120,11 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         self._expected_selection = ExpectedSelection(self)
         self._projects_model = ProjectsModel(self)
         self._hierarchy_model = HierarchyModel(self)
-        self._products_model = ProductsModel(self)
-        self._loader_actions_model = LoaderActionsModel(self)
+        self._contexts_model = LoadContextsModel()
+        self._products_model = ProductsModel(self, self._contexts_model)
+        self._loader_actions_model = LoaderActionsModel(
+            self, self._contexts_model
+        )
         self._thumbnails_model = ThumbnailsModel()
         self._sitesync_model = SiteSyncModel(self)
 
@@ -149,6 +157,7 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         self._project_anatomy_cache.reset()
         self._loaded_products_cache.reset()
 
+        self._contexts_model.reset()
         self._products_model.reset()
         self._hierarchy_model.reset()
         self._loader_actions_model.reset()
@@ -199,14 +208,26 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         return self._hierarchy_model.get_folder_items(project_name, sender)
 
     def get_product_items(self, project_name, folder_ids, sender=None):
-        return self._products_model.get_product_items(
+        product_items = self._products_model.get_product_items(
             project_name, folder_ids, sender)
+        self._prefetch_thumbnails(project_name, product_items)
+        return product_items
 
     def get_product_item(self, project_name, product_id):
         return self._products_model.get_product_item(
             project_name, product_id
         )
 
+    def get_product_version_items(self, project_name, product_id):
+        return self._products_model.get_product_version_items(
+            project_name, product_id
+        )
+
+    def get_products_version_items(self, project_name, product_ids):
+        return self._products_model.get_products_version_items(
+            project_name, product_ids
+        )
+
     def get_product_type_items(self, project_name):
         return self._products_model.get_product_type_items(project_name)
 
@@ -239,6 +260,16 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
             project_name, thumbnail_id
         )
 
+    def get_thumbnail_paths(self, project_name, thumbnail_ids):
+        return self._thumbnails_model.get_thumbnail_paths(
+            project_name, thumbnail_ids
+        )
+
+    def request_thumbnail_paths(self, project_name, thumbnail_ids, callback):
+        self._thumbnails_model.request_thumbnail_paths(
+            project_name, thumbnail_ids, callback
+        )
+
     def change_products_group(self, project_name, product_ids, group_name):
         self._products_model.change_products_group(
             project_name, product_ids, group_name
@@ -426,6 +457,33 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
             cache.update_data(Anatomy(project_name))
         return cache.get_data()
 
+    def _prefetch_thumbnails(self, project_name, product_items):
+        """Download thumbnails of last versions in background.
+
+        Thumbnails are shown when version is selected, downloading them
+        in advance makes them available immediately.
+        """
+
+        thumbnail_ids = []
+        for product_item in product_items:
+            if len(thumbnail_ids) >= self.thumbnails_prefetch_limit:
+                break
+            version_items = [
+                version_item
+                for version_item in product_item.version_items.values()
+                if not version_item.is_hero
+            ]
+            if not version_items:
+                continue
+            last_version = max(
+                version_items, key=lambda item: item.version
+            )
+            if last_version.thumbnail_id:
+                thumbnail_ids.append(last_version.thumbnail_id)
+        self._thumbnails_model.prefetch_thumbnails(
+            project_name, thumbnail_ids
+        )
+
     def _create_event_system(self):
         return QueuedEventSystem()
 
@@ -1,4 +1,5 @@
 from .selection import SelectionModel
+from .contexts import LoadContextsModel
 from .products import ProductsModel
 from .actions import LoaderActionsModel
 from .sitesync import SiteSyncModel
@@ -6,6 +7,7 @@ from .sitesync import SiteSyncModel
 
 __all__ = (
     "SelectionModel",
+    "LoadContextsModel",
     "ProductsModel",
     "LoaderActionsModel",
     "SiteSyncModel",
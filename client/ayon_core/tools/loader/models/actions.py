@@ -10,7 +10,7 @@ from ayon_core.lib import NestedCacheItem
 from ayon_core.pipeline.load import (
     discover_loader_plugins,
     ProductLoaderPlugin,
-    filter_repre_contexts_by_loader,
+    LoaderCompatibilityIndex,
     get_loader_identifier,
     load_with_repre_context,
     load_with_product_context,
@@ -41,8 +41,9 @@ class LoaderActionsModel:
     # NOTE Set to '0' for development
     loaders_cache_lifetime = 30
 
-    def __init__(self, controller):
+    def __init__(self, controller, contexts_model):
         self._controller = controller
+        self._contexts_model = contexts_model
         self._current_context_project = NOT_SET
         self._loaders_by_identifier = NestedCacheItem(
             levels=1, lifetime=self.loaders_cache_lifetime)
@@ -50,6 +51,8 @@ class LoaderActionsModel:
             levels=1, lifetime=self.loaders_cache_lifetime)
         self._repre_loaders = NestedCacheItem(
             levels=1, lifetime=self.loaders_cache_lifetime)
+        self._repre_loaders_index = NestedCacheItem(
+            levels=1, lifetime=self.loaders_cache_lifetime)
 
     def reset(self):
         """Reset the model with all cached items."""
@@ -58,6 +61,7 @@ class LoaderActionsModel:
         self._loaders_by_identifier.reset()
         self._product_loaders.reset()
         self._repre_loaders.reset()
+        self._repre_loaders_index.reset()
 
     def get_versions_action_items(self, project_name, version_ids):
         """Get action items for given version ids.
@@ -314,6 +318,7 @@ class LoaderActionsModel:
         loaders_by_identifier_c = self._loaders_by_identifier[project_name]
         product_loaders_c = self._product_loaders[project_name]
         repre_loaders_c = self._repre_loaders[project_name]
+        repre_loaders_index_c = self._repre_loaders_index[project_name]
         if loaders_by_identifier_c.is_valid:
             return product_loaders_c.get_data(), repre_loaders_c.get_data()
 
@@ -340,8 +345,24 @@ class LoaderActionsModel:
         loaders_by_identifier_c.update_data(loaders_by_identifier)
         product_loaders_c.update_data(product_loaders)
         repre_loaders_c.update_data(repre_loaders)
+        repre_loaders_index_c.update_data(
+            LoaderCompatibilityIndex(repre_loaders)
+        )
         return product_loaders, repre_loaders
 
+    def _get_repre_loaders_index(self, project_name):
+        """Compatibility index of representation loaders.
+
+        Index is created with discovered loaders and cached with them.
+
+        Returns:
+            LoaderCompatibilityIndex: Index of representation loaders.
+        """
+
+        if not self._loaders_by_identifier[project_name].is_valid:
+            self._get_loaders(project_name)
+        return self._repre_loaders_index[project_name].get_data()
+
     def _get_loader_by_identifier(self, project_name, identifier):
         if not self._loaders_by_identifier[project_name].is_valid:
             self._get_loaders(project_name)
@@ -365,8 +386,7 @@ class LoaderActionsModel:
         contexts for 'LoaderPlugin' for all children representations of
         given versions.
 
-        This method is very similar to '_contexts_for_representations' but the
-        queries of entities are called in a different order.
+        Entities are received from contexts model which caches them.
 
         Args:
             project_name (str): Project name.
@@ -378,77 +398,20 @@ class LoaderActionsModel:
         """
 
         # TODO fix hero version
-        version_context_by_id = {}
-        repre_context_by_id = {}
         if not project_name and not version_ids:
-            return version_context_by_id, repre_context_by_id
-
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {}
-        version_entities_by_product_id = collections.defaultdict(list)
-        for version_entity in version_entities:
-            version_id = version_entity["id"]
-            product_id = version_entity["productId"]
-            version_entities_by_id[version_id] = version_entity
-            version_entities_by_product_id[product_id].append(version_entity)
-
-        _product_ids = set(version_entities_by_product_id.keys())
-        _product_entities = ayon_api.get_products(
-            project_name, product_ids=_product_ids
-        )
-        product_entities_by_id = {p["id"]: p for p in _product_entities}
+            return {}, {}
 
-        _folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        _folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=_folder_ids
+        return self._contexts_model.get_version_contexts(
+            project_name, version_ids
         )
-        folder_entities_by_id = {f["id"]: f for f in _folder_entities}
-
-        project_entity = ayon_api.get_project(project_name)
-
-        for version_id, version_entity in version_entities_by_id.items():
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            version_context_by_id[version_id] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-            }
-
-        repre_entities = ayon_api.get_representations(
-            project_name, version_ids=version_ids)
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            repre_context_by_id[repre_entity["id"]] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            }
-
-        return version_context_by_id, repre_context_by_id
 
     def _contexts_for_representations(self, project_name, repre_ids):
         """Get contexts for given representation ids.
 
-        Prepare version contexts for 'ProductLoaderPlugin' and representation
-        contexts for 'LoaderPlugin' for all children representations of
-        given versions.
+        Prepare product contexts for 'ProductLoaderPlugin' and representation
+        contexts for 'LoaderPlugin' for given representations.
 
-        This method is very similar to '_contexts_for_versions' but the
-        queries of entities are called in a different order.
+        Entities are received from contexts model which caches them.
 
         Args:
             project_name (str): Project name.
@@ -459,65 +422,12 @@ class LoaderActionsModel:
                 representation contexts.
         """
 
-        product_context_by_id = {}
-        repre_context_by_id = {}
         if not project_name and not repre_ids:
-            return product_context_by_id, repre_context_by_id
-
-        repre_entities = list(ayon_api.get_representations(
-            project_name, representation_ids=repre_ids
-        ))
-        version_ids = {r["versionId"] for r in repre_entities}
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {
-            v["id"]: v for v in version_entities
-        }
-
-        product_ids = {v["productId"] for v in version_entities_by_id.values()}
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {
-            p["id"]: p for p in product_entities
-        }
+            return {}, {}
 
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        return self._contexts_model.get_representation_contexts(
+            project_name, repre_ids
         )
-        folder_entities_by_id = {
-            f["id"]: f for f in folder_entities
-        }
-
-        project_entity = ayon_api.get_project(project_name)
-
-        for product_id, product_entity in product_entities_by_id.items():
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            product_context_by_id[product_id] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-            }
-
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            repre_context_by_id[repre_entity["id"]] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            }
-        return product_context_by_id, repre_context_by_id
 
     def _get_action_items_for_contexts(
         self,
@@ -541,19 +451,34 @@ class LoaderActionsModel:
         if not version_context_by_id and not repre_context_by_id:
             return action_items
 
-        product_loaders, repre_loaders = self._get_loaders(project_name)
+        product_loaders, _ = self._get_loaders(project_name)
+        repre_loaders_index = self._get_repre_loaders_index(project_name)
 
         repre_contexts_by_name = collections.defaultdict(list)
         for repre_context in repre_context_by_id.values():
             repre_name = repre_context["representation"]["name"]
             repre_contexts_by_name[repre_name].append(repre_context)
 
-        for loader in repre_loaders:
-            for repre_name, repre_contexts in repre_contexts_by_name.items():
-                filtered_repre_contexts = filter_repre_contexts_by_loader(
-                    repre_contexts, loader)
-                if not filtered_repre_contexts:
-                    continue
+        # Resolve compatible loaders for each representation name group
+        #   using index
+        filtered_contexts_by_loader = collections.defaultdict(dict)
+        for repre_name, repre_contexts in repre_contexts_by_name.items():
+            for loader, filtered_repre_contexts in (
+                repre_loaders_index.filter_repre_contexts(
+                    repre_contexts
+                ).items()
+            ):
+                filtered_contexts_by_loader[loader][repre_name] = (
+                    filtered_repre_contexts
+                )
+
+        for loader, filtered_contexts_by_name in (
+            filtered_contexts_by_loader.items()
+        ):
+            for repre_name, filtered_repre_contexts in (
+                filtered_contexts_by_name.items()
+            ):
+                repre_contexts = repre_contexts_by_name[repre_name]
 
                 repre_ids = set()
                 repre_version_ids = set()
@@ -0,0 +1,203 @@
+import collections
+
+import ayon_api
+
+from ayon_core.lib import NestedCacheItem
+from ayon_core.pipeline.entities_cache import get_entities_cache
+
+
+class LoadContextsModel:
+    """Entities used to create load contexts.
+
+    Entities are received from process-wide entities cache, so contexts
+    of selected versions or representations are not queried again on each
+    selection change. Products model adds product entities it queried for
+    product items.
+
+    Cached entities are used only to decide which loaders are available,
+    loaders are triggered with freshly queried contexts.
+    """
+
+    lifetime = 60
+
+    def __init__(self):
+        self._repre_ids_by_version_id = NestedCacheItem(
+            levels=2, lifetime=self.lifetime)
+
+    def reset(self):
+        self._repre_ids_by_version_id.reset()
+
+    def add_entities(self, project_name, entity_type, entities):
+        """Add queried entities to cache.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entities (Iterable[dict[str, Any]]): Entities with default
+                fields.
+
+        """
+        get_entities_cache().add_entities(project_name, entity_type, entities)
+
+    def get_entities(self, project_name, entity_type, entity_ids):
+        """Entities by ids.
+
+        Entities that are not cached are queried.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entity_ids (Iterable[str]): Entity ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Entities by id.
+
+        """
+        return get_entities_cache().get_entities(
+            project_name, entity_type, entity_ids
+        )
+
+    def get_project_entity(self, project_name):
+        return get_entities_cache().get_project(project_name)
+
+    def get_version_contexts(self, project_name, version_ids):
+        """Contexts for given version ids.
+
+        Prepare version contexts for 'ProductLoaderPlugin' and representation
+        contexts for 'LoaderPlugin' for all children representations of
+        given versions.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+                Version and representation contexts by entity id.
+
+        """
+        version_entities_by_id = self.get_entities(
+            project_name, "version", version_ids
+        )
+        product_ids = {
+            version_entity["productId"]
+            for version_entity in version_entities_by_id.values()
+        }
+        product_contexts = self._get_product_contexts(
+            project_name, product_ids
+        )
+
+        version_context_by_id = {}
+        for version_id, version_entity in version_entities_by_id.items():
+            version_context = dict(
+                product_contexts[version_entity["productId"]]
+            )
+            version_context["version"] = version_entity
+            version_context_by_id[version_id] = version_context
+
+        repre_context_by_id = {}
+        for repre_entity in self._get_version_repre_entities(
+            project_name, version_context_by_id.keys()
+        ):
+            repre_context = dict(
+                version_context_by_id[repre_entity["versionId"]]
+            )
+            repre_context["representation"] = repre_entity
+            repre_context_by_id[repre_entity["id"]] = repre_context
+        return version_context_by_id, repre_context_by_id
+
+    def get_representation_contexts(self, project_name, repre_ids):
+        """Contexts for given representation ids.
+
+        Args:
+            project_name (str): Project name.
+            repre_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+                Product and representation contexts by entity id.
+
+        """
+        repre_entities_by_id = self.get_entities(
+            project_name, "representation", repre_ids
+        )
+        version_ids = {
+            repre_entity["versionId"]
+            for repre_entity in repre_entities_by_id.values()
+        }
+        version_entities_by_id = self.get_entities(
+            project_name, "version", version_ids
+        )
+        product_ids = {
+            version_entity["productId"]
+            for version_entity in version_entities_by_id.values()
+        }
+        product_context_by_id = self._get_product_contexts(
+            project_name, product_ids
+        )
+
+        repre_context_by_id = {}
+        for repre_id, repre_entity in repre_entities_by_id.items():
+            version_entity = version_entities_by_id[repre_entity["versionId"]]
+            repre_context = dict(
+                product_context_by_id[version_entity["productId"]]
+            )
+            repre_context["version"] = version_entity
+            repre_context["representation"] = repre_entity
+            repre_context_by_id[repre_id] = repre_context
+        return product_context_by_id, repre_context_by_id
+
+    def _get_product_contexts(self, project_name, product_ids):
+        product_entities_by_id = self.get_entities(
+            project_name, "product", product_ids
+        )
+        folder_ids = {
+            product_entity["folderId"]
+            for product_entity in product_entities_by_id.values()
+        }
+        folder_entities_by_id = self.get_entities(
+            project_name, "folder", folder_ids
+        )
+        project_entity = self.get_project_entity(project_name)
+        return {
+            product_id: {
+                "project": project_entity,
+                "folder": folder_entities_by_id[product_entity["folderId"]],
+                "product": product_entity,
+            }
+            for product_id, product_entity in product_entities_by_id.items()
+        }
+
+    def _get_version_repre_entities(self, project_name, version_ids):
+        project_cache = self._repre_ids_by_version_id[project_name]
+        repre_ids = set()
+        missing_version_ids = set()
+        for version_id in version_ids:
+            cache = project_cache[version_id]
+            if cache.is_valid:
+                repre_ids |= cache.get_data()
+            else:
+                missing_version_ids.add(version_id)
+
+        output = list(
+            self.get_entities(project_name, "representation", repre_ids)
+            .values()
+        )
+        if not missing_version_ids:
+            return output
+
+        repre_entities = list(ayon_api.get_representations(
+            project_name, version_ids=missing_version_ids
+        ))
+        self.add_entities(project_name, "representation", repre_entities)
+        repre_ids_by_version_id = collections.defaultdict(set)
+        for repre_entity in repre_entities:
+            repre_ids_by_version_id[repre_entity["versionId"]].add(
+                repre_entity["id"]
+            )
+        for version_id in missing_version_ids:
+            project_cache[version_id].update_data(
+                repre_ids_by_version_id[version_id]
+            )
+        output.extend(repre_entities)
+        return output
@@ -1,5 +1,6 @@
 import collections
 import contextlib
+import threading
 
 import arrow
 import ayon_api
@@ -15,6 +16,23 @@ from ayon_core.tools.loader.abstract import (
 )
 
 PRODUCTS_MODEL_SENDER = "products.model"
+# Version fields used to create 'VersionItem'
+VERSION_ITEM_FIELDS = {
+    "id",
+    "productId",
+    "version",
+    "thumbnailId",
+    "createdAt",
+    "author",
+    "status",
+    "attrib.frameStart",
+    "attrib.frameEnd",
+    "attrib.handleStart",
+    "attrib.handleEnd",
+    "attrib.step",
+    "attrib.comment",
+    "attrib.source",
+}
 
 
 def version_item_from_entity(version):
@@ -141,40 +159,69 @@ class ProductsModel:
     All of the entities are product based. This model prepares data for UI
     and caches it for faster access.
 
+    Product items contain only 'versions_preload_count' latest versions
+    and hero version. Remaining versions are queried when are requested
+    using 'get_product_version_items'.
+
     Note:
         Data are not used for actions model because that would require to
-            break OpenPype compatibility of 'LoaderPlugin's.
+            break OpenPype compatibility of 'LoaderPlugin's. Queried product
+            entities are shared with actions model through
+            'LoadContextsModel'.
     """
 
     lifetime = 60  # In seconds (minute by default)
+    versions_preload_count = 5
+    # Limits of cached product items and representation items
+    max_cached_folders = 1000
+    max_cached_versions = 10000
 
-    def __init__(self, controller):
+    def __init__(self, controller, contexts_model):
         self._controller = controller
+        self._contexts_model = contexts_model
+        # Items are refreshed in background thread of loader UI while
+        #   main thread is reading them
+        self._lock = threading.RLock()
 
         # Mapping helpers
         # NOTE - mapping must be cleaned up with cache cleanup
         self._product_item_by_id = collections.defaultdict(dict)
         self._version_item_by_id = collections.defaultdict(dict)
         self._product_folder_ids_mapping = collections.defaultdict(dict)
+        self._unloaded_version_ids_by_product_id = (
+            collections.defaultdict(dict)
+        )
 
         # Cache helpers
         self._product_type_items_cache = NestedCacheItem(
             levels=1, default_factory=list, lifetime=self.lifetime)
         self._product_items_cache = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_entries=self.max_cached_folders,
+            name="loader.product_items",
+        )
         self._repre_items_cache = NestedCacheItem(
-            levels=2, default_factory=dict, lifetime=self.lifetime)
+            levels=2,
+            default_factory=dict,
+            lifetime=self.lifetime,
+            max_entries=self.max_cached_versions,
+            name="loader.repre_items",
+        )
 
     def reset(self):
         """Reset model with all cached data."""
 
-        self._product_item_by_id.clear()
-        self._version_item_by_id.clear()
-        self._product_folder_ids_mapping.clear()
+        with self._lock:
+            self._product_item_by_id.clear()
+            self._version_item_by_id.clear()
+            self._product_folder_ids_mapping.clear()
+            self._unloaded_version_ids_by_product_id.clear()
 
-        self._product_type_items_cache.reset()
-        self._product_items_cache.reset()
-        self._repre_items_cache.reset()
+            self._product_type_items_cache.reset()
+            self._product_items_cache.reset()
+            self._repre_items_cache.reset()
 
     def get_product_type_items(self, project_name):
         """Product type items for project.
@@ -189,14 +236,17 @@ class ProductsModel:
         if not project_name:
             return []
 
-        cache = self._product_type_items_cache[project_name]
-        if not cache.is_valid:
-            product_types = ayon_api.get_project_product_types(project_name)
-            cache.update_data([
-                product_type_item_from_data(product_type)
-                for product_type in product_types
-            ])
-        return cache.get_data()
+        with self._lock:
+            cache = self._product_type_items_cache[project_name]
+            if not cache.is_valid:
+                product_types = ayon_api.get_project_product_types(
+                    project_name
+                )
+                cache.update_data([
+                    product_type_item_from_data(product_type)
+                    for product_type in product_types
+                ])
+            return cache.get_data()
 
     def get_product_items(self, project_name, folder_ids, sender):
         """Product items with versions for project and folder ids.
@@ -216,23 +266,24 @@ class ProductsModel:
         if not project_name or not folder_ids:
             return []
 
-        project_cache = self._product_items_cache[project_name]
-        output = []
-        folder_ids_to_update = set()
-        for folder_id in folder_ids:
-            cache = project_cache[folder_id]
-            if cache.is_valid:
+        with self._lock:
+            project_cache = self._product_items_cache[project_name]
+            output = []
+            folder_ids_to_update = set()
+            for folder_id in folder_ids:
+                cache = project_cache[folder_id]
+                if cache.is_valid:
+                    output.extend(cache.get_data().values())
+                else:
+                    folder_ids_to_update.add(folder_id)
+
+            self._refresh_product_items(
+                project_name, folder_ids_to_update, sender)
+
+            for folder_id in folder_ids_to_update:
+                cache = project_cache[folder_id]
                 output.extend(cache.get_data().values())
-            else:
-                folder_ids_to_update.add(folder_id)
-
-        self._refresh_product_items(
-            project_name, folder_ids_to_update, sender)
-
-        for folder_id in folder_ids_to_update:
-            cache = project_cache[folder_id]
-            output.extend(cache.get_data().values())
-        return output
+            return output
 
     def get_product_item(self, project_name, product_id):
         """Get product item based on passed product id.
@@ -251,14 +302,89 @@ class ProductsModel:
         if not any((project_name, product_id)):
             return None
 
-        product_items_by_id = self._product_item_by_id[project_name]
-        product_item = product_items_by_id.get(product_id)
-        if product_item is not None:
-            return product_item
-        for product_item in self._query_product_items_by_ids(
-            project_name, product_ids=[product_id]
-        ).values():
-            return product_item
+        with self._lock:
+            product_items_by_id = self._product_item_by_id[project_name]
+            product_item = product_items_by_id.get(product_id)
+            if product_item is not None:
+                return product_item
+            for product_item in self._query_product_items_by_ids(
+                project_name, product_ids=[product_id]
+            ).values():
+                return product_item
+
+    def get_product_version_items(self, project_name, product_id):
+        """All version items of a product.
+
+        Versions that were not preloaded are queried and added to the
+        product item.
+
+        Args:
+            project_name (str): Project name.
+            product_id (str): Product id.
+
+        Returns:
+            list[VersionItem]: Version items of the product.
+        """
+
+        if not project_name or not product_id:
+            return []
+
+        return self.get_products_version_items(
+            project_name, [product_id]
+        ).get(product_id, [])
+
+    def get_products_version_items(self, project_name, product_ids):
+        """All version items of multiple products.
+
+        Versions that were not preloaded are queried in single server call
+        and added to the product items.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, list[VersionItem]]: Version items by product id.
+        """
+
+        if not project_name or not product_ids:
+            return {}
+
+        with self._lock:
+            product_items_by_id = self._get_product_items_by_id(
+                project_name, product_ids
+            )
+            unloaded_version_ids_by_product_id = (
+                self._unloaded_version_ids_by_product_id[project_name]
+            )
+            version_ids = set()
+            for product_id in product_items_by_id:
+                unloaded_version_ids = (
+                    unloaded_version_ids_by_product_id.pop(product_id, None)
+                )
+                if unloaded_version_ids:
+                    version_ids |= unloaded_version_ids
+
+            if version_ids:
+                version_item_by_id = self._version_item_by_id[project_name]
+                for version in ayon_api.get_versions(
+                    project_name,
+                    version_ids=version_ids,
+                    fields=VERSION_ITEM_FIELDS,
+                ):
+                    version_item = version_item_from_entity(version)
+                    version_id = version_item.version_id
+                    product_item = product_items_by_id[
+                        version_item.product_id
+                    ]
+                    product_item.version_items[version_id] = version_item
+                    version_item_by_id[version_id] = version_item
+
+            output = {}
+            for product_id, product_item in product_items_by_id.items():
+                product_item.has_more_versions = False
+                output[product_id] = list(product_item.version_items.values())
+            return output
 
     def get_product_ids_by_repre_ids(self, project_name, repre_ids):
         """Get product ids based on passed representation ids.
@@ -297,29 +423,30 @@ class ProductsModel:
             list[RepreItem]: Representation items.
         """
 
-        output = []
-        if not any((project_name, version_ids)):
-            return output
+        with self._lock:
+            output = []
+            if not any((project_name, version_ids)):
+                return output
+
+            invalid_version_ids = set()
+            project_cache = self._repre_items_cache[project_name]
+            for version_id in version_ids:
+                version_cache = project_cache[version_id]
+                if version_cache.is_valid:
+                    output.extend(version_cache.get_data().values())
+                else:
+                    invalid_version_ids.add(version_id)
+
+            if invalid_version_ids:
+                self.refresh_representation_items(
+                    project_name, invalid_version_ids, sender
+                )
 
-        invalid_version_ids = set()
-        project_cache = self._repre_items_cache[project_name]
-        for version_id in version_ids:
-            version_cache = project_cache[version_id]
-            if version_cache.is_valid:
+            for version_id in invalid_version_ids:
+                version_cache = project_cache[version_id]
                 output.extend(version_cache.get_data().values())
-            else:
-                invalid_version_ids.add(version_id)
-
-        if invalid_version_ids:
-            self.refresh_representation_items(
-                project_name, invalid_version_ids, sender
-            )
-
-        for version_id in invalid_version_ids:
-            version_cache = project_cache[version_id]
-            output.extend(version_cache.get_data().values())
 
-        return output
+            return output
 
     def get_versions_repre_count(self, project_name, version_ids, sender):
         """Get representation count for passed version ids.
@@ -333,29 +460,30 @@ class ProductsModel:
             dict[str, int]: Number of representations by version id.
         """
 
-        output = {}
-        if not any((project_name, version_ids)):
-            return output
+        with self._lock:
+            output = {}
+            if not any((project_name, version_ids)):
+                return output
+
+            invalid_version_ids = set()
+            project_cache = self._repre_items_cache[project_name]
+            for version_id in version_ids:
+                version_cache = project_cache[version_id]
+                if version_cache.is_valid:
+                    output[version_id] = len(version_cache.get_data())
+                else:
+                    invalid_version_ids.add(version_id)
+
+            if invalid_version_ids:
+                self.refresh_representation_items(
+                    project_name, invalid_version_ids, sender
+                )
 
-        invalid_version_ids = set()
-        project_cache = self._repre_items_cache[project_name]
-        for version_id in version_ids:
-            version_cache = project_cache[version_id]
-            if version_cache.is_valid:
+            for version_id in invalid_version_ids:
+                version_cache = project_cache[version_id]
                 output[version_id] = len(version_cache.get_data())
-            else:
-                invalid_version_ids.add(version_id)
-
-        if invalid_version_ids:
-            self.refresh_representation_items(
-                project_name, invalid_version_ids, sender
-            )
-
-        for version_id in invalid_version_ids:
-            version_cache = project_cache[version_id]
-            output[version_id] = len(version_cache.get_data())
 
-        return output
+            return output
 
     def change_products_group(self, project_name, product_ids, group_name):
         """Change group name for passed product ids.
@@ -380,35 +508,36 @@ class ProductsModel:
         if not product_ids:
             return
 
-        product_items = self._get_product_items_by_id(
-            project_name, product_ids
-        )
-        if not product_items:
-            return
-
-        session = OperationsSession()
-        folder_ids = set()
-        for product_item in product_items.values():
-            session.update_entity(
-                project_name,
-                "product",
-                product_item.product_id,
-                {"attrib": {"productGroup": group_name}}
+        with self._lock:
+            product_items = self._get_product_items_by_id(
+                project_name, product_ids
             )
-            folder_ids.add(product_item.folder_id)
-            product_item.group_name = group_name
+            if not product_items:
+                return
+
+            session = OperationsSession()
+            folder_ids = set()
+            for product_item in product_items.values():
+                session.update_entity(
+                    project_name,
+                    "product",
+                    product_item.product_id,
+                    {"attrib": {"productGroup": group_name}}
+                )
+                folder_ids.add(product_item.folder_id)
+                product_item.group_name = group_name
 
-        session.commit()
-        self._controller.emit_event(
-            "products.group.changed",
-            {
-                "project_name": project_name,
-                "folder_ids": folder_ids,
-                "product_ids": product_ids,
-                "group_name": group_name,
-            },
-            PRODUCTS_MODEL_SENDER
-        )
+            session.commit()
+            self._controller.emit_event(
+                "products.group.changed",
+                {
+                    "project_name": project_name,
+                    "folder_ids": folder_ids,
+                    "product_ids": product_ids,
+                    "group_name": group_name,
+                },
+                PRODUCTS_MODEL_SENDER
+            )
 
     def _get_product_items_by_id(self, project_name, product_ids):
         product_item_by_id = self._product_item_by_id[project_name]
@@ -526,21 +655,78 @@ class ProductsModel:
 
         products = list(ayon_api.get_products(project_name, **kwargs))
         product_ids = {product["id"] for product in products}
+        # Share queried entities with actions model
+        self._contexts_model.add_entities(project_name, "product", products)
+
+        # Find out which versions should be preloaded, only minimum of
+        #   fields is queried for all versions
+        version_ids_by_product_id = collections.defaultdict(list)
+        status_names_by_product_id = collections.defaultdict(set)
+        preload_version_ids = set()
+        for version in ayon_api.get_versions(
+            project_name,
+            product_ids=product_ids,
+            fields={"id", "productId", "version", "status"},
+        ):
+            # Statuses filter must know statuses of all versions
+            status_names_by_product_id[version["productId"]].add(
+                version["status"]
+            )
+            # Hero version is always preloaded
+            if version["version"] < 0:
+                preload_version_ids.add(version["id"])
+                continue
+            version_ids_by_product_id[version["productId"]].append(
+                (version["version"], version["id"])
+            )
 
-        # Add 'status' to fields -> fixed in ayon-python-api 1.0.4
-        fields = ayon_api.get_default_fields_for_type("version")
-        fields.add("status")
-        versions = ayon_api.get_versions(
-            project_name, product_ids=product_ids, fields=fields
+        unloaded_version_ids_by_product_id = (
+            self._unloaded_version_ids_by_product_id[project_name]
         )
+        for product_id, version_ids in version_ids_by_product_id.items():
+            version_ids.sort(reverse=True)
+            preload_version_ids.update(
+                version_id
+                for _, version_id in (
+                    version_ids[:self.versions_preload_count]
+                )
+            )
+            unloaded_version_ids = {
+                version_id
+                for _, version_id in (
+                    version_ids[self.versions_preload_count:]
+                )
+            }
+            if unloaded_version_ids:
+                unloaded_version_ids_by_product_id[product_id] = (
+                    unloaded_version_ids
+                )
+            else:
+                unloaded_version_ids_by_product_id.pop(product_id, None)
+
+        versions = []
+        if preload_version_ids:
+            versions = list(ayon_api.get_versions(
+                project_name,
+                version_ids=preload_version_ids,
+                fields=VERSION_ITEM_FIELDS,
+            ))
 
-        return self._create_product_items(
+        product_items = self._create_product_items(
             project_name, products, versions, folder_items=folder_items
         )
+        for product_id, product_item in product_items.items():
+            product_item.has_more_versions = (
+                product_id in unloaded_version_ids_by_product_id
+            )
+            product_item.status_names = (
+                status_names_by_product_id[product_id]
+            )
+        return product_items
 
     def _query_version_items_by_ids(self, project_name, version_ids):
         versions = list(ayon_api.get_versions(
-            project_name, version_ids=version_ids
+            project_name, version_ids=version_ids, fields=VERSION_ITEM_FIELDS
         ))
         product_ids = {version["productId"] for version in versions}
         products = list(ayon_api.get_products(
@@ -573,12 +759,16 @@ class ProductsModel:
 
         product_item_by_id = self._product_item_by_id[project_name]
         version_item_by_id = self._version_item_by_id[project_name]
+        unloaded_version_ids_by_product_id = (
+            self._unloaded_version_ids_by_product_id[project_name]
+        )
         for folder_id in folder_ids:
             product_ids = project_mapping.pop(folder_id, None)
             if not product_ids:
                 continue
 
             for product_id in product_ids:
+                unloaded_version_ids_by_product_id.pop(product_id, None)
                 product_item = product_item_by_id.pop(product_id, None)
                 if product_item is None:
                     continue
@@ -666,34 +856,35 @@ class ProductsModel:
     def refresh_representation_items(
         self, project_name, version_ids, sender
     ):
-        if not any((project_name, version_ids)):
-            return
-        self._controller.emit_event(
-            "model.representations.refresh.started",
-            {
-                "project_name": project_name,
-                "version_ids": version_ids,
-                "sender": sender,
-            },
-            PRODUCTS_MODEL_SENDER
-        )
-        failed = False
-        try:
-            self._refresh_representation_items(project_name, version_ids)
-        except Exception:
-            # TODO add more information about failed refresh
-            failed = True
+        with self._lock:
+            if not any((project_name, version_ids)):
+                return
+            self._controller.emit_event(
+                "model.representations.refresh.started",
+                {
+                    "project_name": project_name,
+                    "version_ids": version_ids,
+                    "sender": sender,
+                },
+                PRODUCTS_MODEL_SENDER
+            )
+            failed = False
+            try:
+                self._refresh_representation_items(project_name, version_ids)
+            except Exception:
+                # TODO add more information about failed refresh
+                failed = True
 
-        self._controller.emit_event(
-            "model.representations.refresh.finished",
-            {
-                "project_name": project_name,
-                "version_ids": version_ids,
-                "sender": sender,
-                "failed": failed,
-            },
-            PRODUCTS_MODEL_SENDER
-        )
+            self._controller.emit_event(
+                "model.representations.refresh.finished",
+                {
+                    "project_name": project_name,
+                    "version_ids": version_ids,
+                    "sender": sender,
+                    "failed": failed,
+                },
+                PRODUCTS_MODEL_SENDER
+            )
 
     def _refresh_representation_items(self, project_name, version_ids):
         representations = list(ayon_api.get_representations(
@@ -78,6 +78,7 @@ class VersionsFilterModel(QtCore.QSortFilterProxyModel):
 
 class VersionComboBox(QtWidgets.QComboBox):
     value_changed = QtCore.Signal(str, str)
+    versions_requested = QtCore.Signal(str)
 
     def __init__(self, product_id, parent):
         super().__init__(parent)
@@ -101,12 +102,24 @@ class VersionComboBox(QtWidgets.QComboBox):
     def get_product_id(self):
         return self._product_id
 
+    def get_current_version_id(self):
+        return self._current_id
+
+    def showPopup(self):
+        # Give chance to load all versions before popup is shown
+        self.versions_requested.emit(self._product_id)
+        super().showPopup()
+
     def set_statuses_filter(self, status_names):
         self._proxy_model.set_statuses_filter(status_names)
+        self.select_first_version()
+
+    def select_first_version(self):
         if self.count() == 0:
             return
         if self.currentIndex() != 0:
             self.setCurrentIndex(0)
+        self._on_index_change()
 
     def all_versions_filtered_out(self):
         if self._items_by_id:
@@ -144,6 +157,8 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
     """A delegate that display version integer formatted as version string."""
 
     version_changed = QtCore.Signal(str, str)
+    # Set of product ids
+    versions_requested = QtCore.Signal(object)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -158,8 +173,35 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
 
     def set_statuses_filter(self, status_names):
         self._statuses_filter = set(status_names)
+        product_ids = set()
         for widget in self._editor_by_id.values():
             widget.set_statuses_filter(status_names)
+            # Versions matching the filter may not be loaded yet
+            if widget.count() == 0:
+                product_ids.add(widget.get_product_id())
+
+        # Request versions of all products at once
+        if product_ids:
+            self.versions_requested.emit(product_ids)
+
+    def update_product_versions(self, product_id, version_items):
+        """Update versions in editors of a product.
+
+        Args:
+            product_id (str): Product id.
+            version_items (list[VersionItem]): Sorted version items.
+
+        """
+        for editor in self._editor_by_id.values():
+            if editor.get_product_id() != product_id:
+                continue
+            filtered_out = editor.count() == 0
+            editor.update_versions(
+                version_items, editor.get_current_version_id()
+            )
+            # Use first version matching statuses filter
+            if filtered_out:
+                editor.select_first_version()
 
     def paint(self, painter, option, index):
         fg_color = index.data(QtCore.Qt.ForegroundRole)
@@ -224,6 +266,7 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
         editor.setProperty("itemId", item_id)
 
         editor.value_changed.connect(self._on_editor_change)
+        editor.versions_requested.connect(self._on_editor_versions_request)
         editor.destroyed.connect(self._on_destroy)
 
         self._editor_by_id[item_id] = editor
@@ -249,6 +292,9 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
     def _on_editor_change(self, product_id, version_id):
         self.version_changed.emit(product_id, version_id)
 
+    def _on_editor_versions_request(self, product_id):
+        self.versions_requested.emit({product_id})
+
     def _on_destroy(self, obj):
         item_id = obj.property("itemId")
         self._editor_by_id.pop(item_id, None)
@@ -4,7 +4,7 @@ import qtawesome
 from qtpy import QtGui, QtCore
 
 from ayon_core.style import get_default_entity_icon_color
-from ayon_core.tools.utils import get_qt_icon
+from ayon_core.tools.utils import get_qt_icon, RefreshWorker
 
 PRODUCTS_MODEL_SENDER_NAME = "qt_products_model"
 
@@ -130,6 +130,8 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._last_project_statuses = {}
         self._last_status_icons_by_name = {}
 
+        self._refresh_worker = RefreshWorker(self)
+
     def get_product_item_indexes(self):
         return [
             self.indexFromItem(item)
@@ -223,9 +225,9 @@ class ProductsModel(QtGui.QStandardItemModel):
             product_item = self._product_items_by_id.get(product_id)
             if product_item is None:
                 return None
-            product_items = list(product_item.version_items.values())
-            product_items.sort(reverse=True)
-            return product_items
+            version_items = list(product_item.version_items.values())
+            version_items.sort(reverse=True)
+            return version_items
 
         if role == QtCore.Qt.EditRole:
             return None
@@ -241,6 +243,50 @@ class ProductsModel(QtGui.QStandardItemModel):
 
         return super().data(index, role)
 
+    def load_products_versions(self, product_ids):
+        """Load all versions of products.
+
+        Product items contain only latest versions, older versions are
+        loaded when version combobox is opened or when statuses filter
+        hides all loaded versions. Versions of all passed products are
+        queried at once.
+
+        Args:
+            product_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, list[VersionItem]]: Sorted version items by product
+                id. Products with all versions already loaded are skipped.
+
+        """
+        product_items_by_id = {}
+        for product_id in product_ids:
+            product_item = self._product_items_by_id.get(product_id)
+            if product_item is not None and product_item.has_more_versions:
+                product_items_by_id[product_id] = product_item
+
+        if not product_items_by_id:
+            return {}
+
+        version_items_by_product_id = (
+            self._controller.get_products_version_items(
+                self._last_project_name, set(product_items_by_id)
+            )
+        )
+        output = {}
+        for product_id, product_item in product_items_by_id.items():
+            product_item.version_items.update({
+                version_item.version_id: version_item
+                for version_item in version_items_by_product_id.get(
+                    product_id, []
+                )
+            })
+            product_item.has_more_versions = False
+            version_items = list(product_item.version_items.values())
+            version_items.sort(reverse=True)
+            output[product_id] = version_items
+        return output
+
     def setData(self, index, value, role=None):
         if not index.isValid():
             return False
@@ -416,10 +462,7 @@ class ProductsModel(QtGui.QStandardItemModel):
         model_item = self._items_by_id.get(product_item.product_id)
         last_version = last_version_by_product_id[product_item.product_id]
 
-        statuses = {
-            version_item.status
-            for version_item in product_item.version_items.values()
-        }
+        statuses = product_item.status_names
         if model_item is None:
             product_id = product_item.product_id
             model_item = QtGui.QStandardItem(product_item.product_name)
@@ -457,35 +500,51 @@ class ProductsModel(QtGui.QStandardItemModel):
         return self._last_project_name
 
     def refresh(self, project_name, folder_ids):
-        self._clear()
+        """Refresh products of folders.
+
+        Data are queried in background thread and model is filled when
+            they are ready, then 'refreshed' signal is emitted. Previous
+            items are kept until then unless project did change.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+
+        """
+        if project_name != self._last_project_name:
+            self._clear()
 
         self._last_project_name = project_name
         self._last_folder_ids = folder_ids
-        status_items = self._controller.get_project_status_items(project_name)
-        self._last_project_statuses = {
-            status_item.name: status_item
-            for status_item in status_items
-        }
-        self._last_status_icons_by_name = {}
+        self._refresh_worker.request(
+            "refresh",
+            self._on_refresh_finished,
+            self._get_refresh_data,
+            project_name,
+            folder_ids,
+        )
 
+    def _get_refresh_data(self, project_name, folder_ids):
+        """Query data for refresh.
+
+        Called in background thread, must not touch Qt objects.
+
+        Returns:
+            dict[str, Any]: Data used to fill the model.
+
+        """
+        status_items = self._controller.get_project_status_items(project_name)
         active_site_icon_def = self._controller.get_active_site_icon_def(
             project_name
         )
         remote_site_icon_def = self._controller.get_remote_site_icon_def(
             project_name
         )
-        active_site_icon = get_qt_icon(active_site_icon_def)
-        remote_site_icon = get_qt_icon(remote_site_icon_def)
-
         product_items = self._controller.get_product_items(
             project_name,
             folder_ids,
             sender=PRODUCTS_MODEL_SENDER_NAME
         )
-        product_items_by_id = {
-            product_item.product_id: product_item
-            for product_item in product_items
-        }
         last_version_by_product_id = {}
         for product_item in product_items:
             versions = list(product_item.version_items.values())
@@ -499,14 +558,59 @@ class ProductsModel(QtGui.QStandardItemModel):
             version_item.version_id
             for version_item in last_version_by_product_id.values()
         }
-        repre_count_by_version_id = self._controller.get_versions_representation_count(
-            project_name, version_ids
+        repre_count_by_version_id = (
+            self._controller.get_versions_representation_count(
+                project_name, version_ids
+            )
         )
         sync_availability_by_version_id = (
             self._controller.get_version_sync_availability(
                 project_name, version_ids
             )
         )
+        return {
+            "status_items": status_items,
+            "active_site_icon_def": active_site_icon_def,
+            "remote_site_icon_def": remote_site_icon_def,
+            "product_items": product_items,
+            "last_version_by_product_id": last_version_by_product_id,
+            "repre_count_by_version_id": repre_count_by_version_id,
+            "sync_availability_by_version_id": (
+                sync_availability_by_version_id
+            ),
+        }
+
+    def _on_refresh_finished(self, thread):
+        self._clear()
+        if thread.failed:
+            self._last_project_statuses = {}
+            self._last_status_icons_by_name = {}
+            self.refreshed.emit()
+            return
+
+        self._fill_items(thread.get_result())
+
+    def _fill_items(self, refresh_data):
+        self._last_project_statuses = {
+            status_item.name: status_item
+            for status_item in refresh_data["status_items"]
+        }
+        self._last_status_icons_by_name = {}
+
+        active_site_icon = get_qt_icon(refresh_data["active_site_icon_def"])
+        remote_site_icon = get_qt_icon(refresh_data["remote_site_icon_def"])
+        product_items = refresh_data["product_items"]
+        last_version_by_product_id = (
+            refresh_data["last_version_by_product_id"]
+        )
+        repre_count_by_version_id = refresh_data["repre_count_by_version_id"]
+        sync_availability_by_version_id = (
+            refresh_data["sync_availability_by_version_id"]
+        )
+        product_items_by_id = {
+            product_item.product_id: product_item
+            for product_item in product_items
+        }
 
         # Prepare product groups
         product_name_matches_by_group = collections.defaultdict(dict)
@@ -537,10 +641,7 @@ class ProductsModel(QtGui.QStandardItemModel):
             for product_name, product_items in groups.items():
                 group_product_types |= {p.product_type for p in product_items}
                 for product_item in product_items:
-                    group_status_names |= {
-                        version_item.status
-                        for version_item in product_item.version_items.values()
-                    }
+                    group_status_names |= product_item.status_names
                     group_product_types.add(product_item.product_type)
 
                 if len(product_items) == 1:
@@ -605,12 +706,7 @@ class ProductsModel(QtGui.QStandardItemModel):
                     )
                     new_merged_items.append(item)
                     merged_product_types.add(product_item.product_type)
-                    merged_status_names |= {
-                        version_item.status
-                        for version_item in (
-                            product_item.version_items.values()
-                        )
-                    }
+                    merged_status_names |= product_item.status_names
 
                 merged_item.setData(
                     "|".join(merged_product_types),
@@ -195,6 +195,9 @@ class ProductsWidget(QtWidgets.QWidget):
         version_delegate.version_changed.connect(
             self._on_version_delegate_change
         )
+        version_delegate.versions_requested.connect(
+            self._on_versions_requested
+        )
 
         controller.register_event_callback(
             "selection.folders.changed",
@@ -447,6 +450,17 @@ class ProductsWidget(QtWidgets.QWidget):
     def _on_version_delegate_change(self, product_id, version_id):
         self._products_model.set_product_version(product_id, version_id)
 
+    def _on_versions_requested(self, product_ids):
+        version_items_by_product_id = (
+            self._products_model.load_products_versions(product_ids)
+        )
+        for product_id, version_items in (
+            version_items_by_product_id.items()
+        ):
+            self._version_delegate.update_product_versions(
+                product_id, version_items
+            )
+
     def _on_folders_selection_change(self, event):
         project_name = event["project_name"]
         sitesync_enabled = self._controller.is_sitesync_enabled(
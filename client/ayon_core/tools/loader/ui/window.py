@@ -117,6 +117,9 @@ class RefreshHandler:
 
 
 class LoaderWindow(QtWidgets.QWidget):
+    # Thumbnail paths are received from download threads
+    _thumbnail_received = QtCore.Signal(int, str, object)
+
     def __init__(self, controller=None, parent=None):
         super(LoaderWindow, self).__init__(parent)
 
@@ -326,6 +329,10 @@ class LoaderWindow(QtWidgets.QWidget):
         self._selected_folder_ids = set()
         self._selected_version_ids = set()
 
+        self._thumbnails_request_id = 0
+        self._thumbnail_path_by_id = {}
+        self._thumbnail_received.connect(self._on_thumbnail_received)
+
         self._products_widget.set_enable_grouping(
             self._product_group_checkbox.isChecked()
         )
@@ -505,17 +512,29 @@ class LoaderWindow(QtWidgets.QWidget):
 
         thumbnail_ids.discard(None)
 
+        # Results of previous request are ignored
+        self._thumbnails_request_id += 1
+        self._thumbnail_path_by_id = {}
+        self._thumbnails_widget.set_current_thumbnails(None)
         if not thumbnail_ids:
-            self._thumbnails_widget.set_current_thumbnails(None)
             return
 
-        thumbnail_paths = set()
-        for thumbnail_id in thumbnail_ids:
-            thumbnail_path = self._controller.get_thumbnail_path(
-                project_name, thumbnail_id)
-            thumbnail_paths.add(thumbnail_path)
-        thumbnail_paths.discard(None)
-        self._thumbnails_widget.set_current_thumbnail_paths(thumbnail_paths)
+        request_id = self._thumbnails_request_id
+        self._controller.request_thumbnail_paths(
+            project_name,
+            thumbnail_ids,
+            lambda thumbnail_id, path: self._thumbnail_received.emit(
+                request_id, thumbnail_id, path
+            )
+        )
+
+    def _on_thumbnail_received(self, request_id, thumbnail_id, path):
+        if request_id != self._thumbnails_request_id or not path:
+            return
+        self._thumbnail_path_by_id[thumbnail_id] = path
+        self._thumbnails_widget.set_current_thumbnail_paths(
+            set(self._thumbnail_path_by_id.values())
+        )
 
     def _on_projects_refresh(self):
         self._refresh_handler.set_project_refreshed()
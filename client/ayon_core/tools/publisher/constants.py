@@ -28,6 +28,8 @@ PRODUCT_TYPE_ROLE = QtCore.Qt.UserRole + 6
 GROUP_ROLE = QtCore.Qt.UserRole + 7
 CONVERTER_IDENTIFIER_ROLE = QtCore.Qt.UserRole + 8
 CREATOR_SORT_ROLE = QtCore.Qt.UserRole + 9
+IS_ACTIVE_ROLE = QtCore.Qt.UserRole + 10
+IS_VALID_ROLE = QtCore.Qt.UserRole + 11
 
 ResetKeySequence = QtGui.QKeySequence(
     QtCore.Qt.ControlModifier | QtCore.Qt.Key_R
@@ -54,6 +56,8 @@ __all__ = (
     "PRODUCT_TYPE_ROLE",
     "GROUP_ROLE",
     "CONVERTER_IDENTIFIER_ROLE",
+    "IS_ACTIVE_ROLE",
+    "IS_VALID_ROLE",
 
     "ResetKeySequence",
 )
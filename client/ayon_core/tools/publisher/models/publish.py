@@ -1,5 +1,4 @@
 import uuid
-import copy
 import inspect
 import logging
 import traceback
@@ -12,6 +11,7 @@ import arrow
 import pyblish.plugin
 
 from ayon_core.lib import env_value_to_bool
+from ayon_core.lib.profiling import profile_resources
 from ayon_core.pipeline import (
     PublishValidationError,
     KnownPublishError,
@@ -20,8 +20,15 @@ from ayon_core.pipeline import (
 from ayon_core.pipeline.plugin_discover import DiscoverResult
 from ayon_core.pipeline.publish import (
     get_publish_instance_label,
+    extract_result_log_items,
     PublishError,
 )
+from ayon_core.pipeline.publish.parallel import (
+    ThreadRecordsHandler,
+    is_parallel_publish_enabled,
+    is_plugin_parallel_safe,
+    process_plugin_instances_parallel,
+)
 from ayon_core.tools.publisher.abstract import AbstractPublisherBackend
 
 PUBLISH_EVENT_SOURCE = "publisher.publish.model"
@@ -169,11 +176,16 @@ class PublishReportMaker:
         if instance is not None:
             instance_id = instance.id
         plugin_data = self._plugin_data_by_id[plugin_id]
-        plugin_data["instances_data"].append({
+        instance_data = {
             "id": instance_id,
             "logs": self._extract_instance_log_items(result),
             "process_time": result["duration"]
-        })
+        }
+        # Resources usage is available only in profiling mode
+        profile = result.get("profile")
+        if profile is not None:
+            instance_data["profile"] = profile
+        plugin_data["instances_data"].append(instance_data)
 
     def add_action_result(
         self, action: pyblish.api.Action, result: Dict[str, Any]
@@ -206,9 +218,18 @@ class PublishReportMaker:
             for instance in self._all_instances_by_id.values()
         }
 
-        plugins_data_by_id = copy.deepcopy(
-            self._plugin_data_by_id
-        )
+        # Log items are not changed after they're created so they can be
+        #   shared, deep copy of them is slow with a lot of log records
+        plugins_data_by_id = {}
+        for plugin_id, plugin_data in self._plugin_data_by_id.items():
+            plugin_data = dict(plugin_data)
+            for key in ("instances_data", "actions_data"):
+                plugin_data[key] = [
+                    dict(item) for item in plugin_data[key]
+                ]
+            plugin_data["families"] = list(plugin_data["families"])
+            plugin_data["targets"] = list(plugin_data["targets"])
+            plugins_data_by_id[plugin_id] = plugin_data
 
         # Ensure the current plug-in is marked as `passed` in the result
         # so that it shows on reports for paused publishes
@@ -237,14 +258,21 @@ class PublishReportMaker:
                     traceback.format_exception(*exc_info)
                 )
 
+        creators_process_times = {}
+        if self._create_discover_result is not None:
+            creators_process_times = dict(
+                self._create_discover_result.process_times
+            )
+
         return {
             "plugins_data": list(plugins_data_by_id.values()),
             "instances": instances_details,
             "context": self._extract_context_data(publish_context),
             "crashed_file_paths": crashed_file_paths,
+            "creators_process_times": creators_process_times,
             "id": uuid.uuid4().hex,
             "created_at": now.isoformat(),
-            "report_version": "1.1.0",
+            "report_version": "1.2.0",
         }
 
     def _add_plugin_data_item(self, plugin: pyblish.api.Plugin):
@@ -328,60 +356,7 @@ class PublishReportMaker:
         return log_items
 
     def _extract_log_items(self, result):
-        output = []
-        records = result.get("records") or []
-        for record in records:
-            record_exc_info = record.exc_info
-            if record_exc_info is not None:
-                record_exc_info = "".join(
-                    traceback.format_exception(*record_exc_info)
-                )
-
-            try:
-                msg = record.getMessage()
-            except Exception:
-                msg = str(record.msg)
-
-            output.append({
-                "type": "record",
-                "msg": msg,
-                "name": record.name,
-                "lineno": record.lineno,
-                "levelno": record.levelno,
-                "levelname": record.levelname,
-                "threadName": record.threadName,
-                "filename": record.filename,
-                "pathname": record.pathname,
-                "msecs": record.msecs,
-                "exc_info": record_exc_info
-            })
-
-        exception = result.get("error")
-        if exception:
-            fname, line_no, func, exc = exception.traceback
-
-            # Conversion of exception into string may crash
-            try:
-                msg = str(exception)
-            except BaseException:
-                msg = (
-                    "Publisher Controller: ERROR"
-                    " - Failed to get exception message"
-                )
-
-            # Action result does not have 'is_validation_error'
-            is_validation_error = result.get("is_validation_error", False)
-            output.append({
-                "type": "error",
-                "is_validation_error": is_validation_error,
-                "msg": msg,
-                "filename": str(fname),
-                "lineno": str(line_no),
-                "func": str(func),
-                "traceback": exception.formatted_traceback
-            })
-
-        return output
+        return extract_result_log_items(result)
 
 
 class PublishPluginActionItem:
@@ -875,6 +850,12 @@ class PublishModel:
         self._log_to_console: bool = env_value_to_bool(
             "AYON_PUBLISHER_PRINT_LOGS", default=False
         )
+        # Process parallel safe instance plugins concurrently
+        self._parallel_publish: bool = is_parallel_publish_enabled()
+        # Store resources used by plugins to publish report
+        self._profile_publish: bool = env_value_to_bool(
+            "AYON_PUBLISH_PROFILE", default=False
+        )
 
         # Publishing should stop at validation stage
         self._publish_up_validation: bool = False
@@ -930,6 +911,10 @@ class PublishModel:
         self._log_to_console = env_value_to_bool(
             "AYON_PUBLISHER_PRINT_LOGS", default=False
         )
+        self._parallel_publish = is_parallel_publish_enabled()
+        self._profile_publish = env_value_to_bool(
+            "AYON_PUBLISH_PROFILE", default=False
+        )
 
         create_context = self._controller.get_create_context()
 
@@ -1253,6 +1238,27 @@ class PublishModel:
                     self._publish_report.set_plugin_skipped(plugin.id)
                     continue
 
+                if self._parallel_publish and is_plugin_parallel_safe(plugin):
+                    instances = [
+                        instance
+                        for instance in instances
+                        if instance.data.get("publish") is not False
+                    ]
+                    if len(instances) > 1:
+                        self._emit_event(
+                            "publish.process.instance.changed",
+                            {"instance_label": "{} instances".format(
+                                len(instances)
+                            )}
+                        )
+                        yield partial(
+                            self._process_parallel_and_continue,
+                            plugin,
+                            instances
+                        )
+                        self._publish_report.set_plugin_passed(plugin.id)
+                        continue
+
                 for instance in instances:
                     if instance.data.get("publish") is False:
                         continue
@@ -1327,23 +1333,76 @@ class PublishModel:
         instance: pyblish.api.Instance
     ):
         with self._log_manager(plugin) as log_handler:
-            result = pyblish.plugin.process(
-                plugin, self._publish_context, instance
-            )
+            if self._profile_publish:
+                with profile_resources() as profile_data:
+                    result = pyblish.plugin.process(
+                        plugin, self._publish_context, instance
+                    )
+                result["profile"] = profile_data
+            else:
+                result = pyblish.plugin.process(
+                    plugin, self._publish_context, instance
+                )
             if log_handler is not None:
                 records = log_handler.get_records()
-                exception = result.get("error")
-                if exception is not None and records:
-                    last_record = records[-1]
-                    if (
-                        last_record.name == "pyblish.plugin"
-                        and last_record.levelno == logging.ERROR
-                    ):
-                        # Remove last record made by pyblish
-                        # - `log.exception(formatted_traceback)`
-                        records.pop(-1)
+                self._remove_pyblish_error_record(result, records)
                 result["records"] = records
 
+        self._handle_process_result(plugin, result)
+
+    def _process_parallel_and_continue(
+        self,
+        plugin: pyblish.api.Plugin,
+        instances: List[pyblish.api.Instance]
+    ):
+        """Process parallel safe plugin on multiple instances concurrently.
+
+        Results are handled in order of instances, so report is the same
+            as if instances were processed one by one.
+        """
+        records_handler = None
+        root = logging.getLogger()
+        if not self._log_to_console:
+            records_handler = ThreadRecordsHandler()
+            plugin.log.propagate = False
+            plugin.log.addHandler(records_handler)
+            root.addHandler(records_handler)
+
+        try:
+            results = process_plugin_instances_parallel(
+                plugin,
+                self._publish_context,
+                instances,
+                records_handler=records_handler,
+                profile=self._profile_publish,
+            )
+        finally:
+            if records_handler is not None:
+                plugin.log.propagate = True
+                plugin.log.removeHandler(records_handler)
+                root.removeHandler(records_handler)
+                records_handler.clear_records()
+
+        for result in results:
+            self._handle_process_result(plugin, result)
+
+    def _remove_pyblish_error_record(
+        self, result: Dict[str, Any], records: List[logging.LogRecord]
+    ):
+        exception = result.get("error")
+        if exception is not None and records:
+            last_record = records[-1]
+            if (
+                last_record.name == "pyblish.plugin"
+                and last_record.levelno == logging.ERROR
+            ):
+                # Remove last record made by pyblish
+                # - `log.exception(formatted_traceback)`
+                records.pop(-1)
+
+    def _handle_process_result(
+        self, plugin: pyblish.api.Plugin, result: Dict[str, Any]
+    ):
         exception = result.get("error")
         if exception:
             if (
@@ -1,6 +1,37 @@
 import uuid
-import collections
-import copy
+
+from ayon_core.pipeline.publish.report_file import PublishReportLogsReader
+
+
+# Profile keys where maximum is used when profiles are merged
+_PROFILE_MAX_KEYS = {"peak_rss_delta", "subprocess_max_rss"}
+
+
+def merge_profiles(profile, other):
+    """Merge resources usage profiles of multiple instances.
+
+    Args:
+        profile (Union[dict[str, Any], None]): Profile to merge into.
+        other (dict[str, Any]): Profile to merge.
+
+    Returns:
+        dict[str, Any]: Merged profile.
+
+    """
+    if profile is None:
+        return dict(other)
+
+    for key, value in other.items():
+        current = profile.get(key)
+        if value is None:
+            continue
+        if current is None:
+            profile[key] = value
+        elif key in _PROFILE_MAX_KEYS:
+            profile[key] = max(current, value)
+        else:
+            profile[key] = current + value
+    return profile
 
 
 class PluginItem:
@@ -21,17 +52,31 @@ class PluginItem:
 
         errored = False
         process_time = 0.0
+        profile = None
+        instances_count = 0
         for instance_data in plugin_data["instances_data"]:
+            instances_count += 1
             process_time += instance_data["process_time"]
-            for log_item in instance_data["logs"]:
-                errored = log_item["type"] == "error"
-                if errored:
-                    break
+            # Introduced in report '1.2.0' (only in profiling mode)
+            instance_profile = instance_data.get("profile")
+            if instance_profile:
+                profile = merge_profiles(profile, instance_profile)
+            # Introduced in report '1.3.0' (logs stored in separated file)
+            logs_index = instance_data.get("logs_index")
+            if logs_index is not None:
+                errored = logs_index["errored"]
+            else:
+                for log_item in instance_data["logs"]:
+                    errored = log_item["type"] == "error"
+                    if errored:
+                        break
             if errored:
                 break
 
         self.process_time = process_time
+        self.instances_count = instances_count
         self.errored = errored
+        self.profile = profile
 
     @property
     def id(self):
@@ -39,20 +84,12 @@ class PluginItem:
 
 
 class InstanceItem:
-    def __init__(self, instance_id, instance_data, logs_by_instance_id):
+    def __init__(self, instance_id, instance_data, errored_instance_ids):
         self._id = instance_id
         self.label = instance_data.get("label") or instance_data.get("name")
         self.family = instance_data.get("family")
         self.removed = not instance_data.get("exists", True)
-
-        logs = logs_by_instance_id.get(instance_id) or []
-        errored = False
-        for log_item in logs:
-            if log_item.errored:
-                errored = True
-                break
-
-        self.errored = errored
+        self.errored = instance_id in errored_instance_ids
 
     @property
     def id(self):
@@ -82,26 +119,113 @@ class LogItem:
         return self._plugin_id
 
 
+class LogsChunk:
+    """Log items of one plugin processed on one instance.
+
+    Log items are kept in memory only if they're part of report data,
+    otherwise they're read from report logs file when needed.
+
+    Args:
+        plugin_id (str): Plugin item id.
+        instance_id (Union[str, None]): Instance id.
+        count (int): Number of log items.
+        errored (bool): Log items contain error.
+        logs_data (Optional[list[dict[str, Any]]]): Log items data.
+        logs_reader (Optional[PublishReportLogsReader]): Reader of logs file.
+        offset (Optional[int]): Offset of log items in logs file.
+
+    """
+    def __init__(
+        self,
+        plugin_id,
+        instance_id,
+        count,
+        errored,
+        logs_data=None,
+        logs_reader=None,
+        offset=None,
+    ):
+        self.plugin_id = plugin_id
+        self.instance_id = instance_id
+        self.count = count
+        self.errored = errored
+        self._logs_data = logs_data
+        self._logs_reader = logs_reader
+        self._offset = offset
+
+    def get_logs(self):
+        """Log items of the chunk.
+
+        Returns:
+            list[LogItem]: Log items.
+
+        """
+        logs_data = self._logs_data
+        if logs_data is None:
+            logs_data = []
+            if self._logs_reader is not None:
+                logs_data = self._logs_reader.read_logs(self._offset)
+
+        return [
+            LogItem(log_item_data, self.plugin_id, self.instance_id)
+            for log_item_data in logs_data
+        ]
+
+
 class PublishReport:
-    def __init__(self, report_data):
-        data = copy.deepcopy(report_data)
+    """Publish report data prepared for UI.
 
-        context_data = data["context"]
+    Args:
+        report_data (dict[str, Any]): Report data.
+        logs_filepath (Optional[str]): Path to JSON Lines report file with
+            log items. Used for reports with 'logs_index' in instances data.
+
+    """
+    def __init__(self, report_data, logs_filepath=None):
+        logs_reader = None
+        if logs_filepath:
+            logs_reader = PublishReportLogsReader(logs_filepath)
+
+        context_data = dict(report_data["context"])
         context_data["name"] = "context"
         context_data["label"] = context_data.get("label") or "Context"
 
-        logs = []
+        logs_chunks = []
+        errored_instance_ids = set()
         plugins_items_by_id = {}
-        for plugin_data in data["plugins_data"]:
+        for plugin_data in report_data["plugins_data"]:
             item = PluginItem(plugin_data)
             plugins_items_by_id[item.id] = item
             for instance_data_item in plugin_data["instances_data"]:
                 instance_id = instance_data_item["id"]
-                for log_item_data in instance_data_item["logs"]:
-                    log_item = LogItem(
-                        copy.deepcopy(log_item_data), item.id, instance_id
+                logs_index = instance_data_item.get("logs_index")
+                if logs_index is not None:
+                    chunk = LogsChunk(
+                        item.id,
+                        instance_id,
+                        logs_index["count"],
+                        logs_index["errored"],
+                        logs_reader=logs_reader,
+                        offset=logs_index["offset"],
                     )
-                    logs.append(log_item)
+                else:
+                    logs_data = instance_data_item["logs"]
+                    chunk = LogsChunk(
+                        item.id,
+                        instance_id,
+                        len(logs_data),
+                        any(
+                            log_item["type"] == "error"
+                            for log_item in logs_data
+                        ),
+                        logs_data=logs_data,
+                    )
+                if not chunk.count:
+                    continue
+                if chunk.errored:
+                    errored_instance_ids.add(instance_id)
+                logs_chunks.append(chunk)
+
         sorted_plugins = sorted(
             plugins_items_by_id.values(),
             key=lambda item: item.order
@@ -111,19 +235,15 @@ class PublishReport:
             for plugin_item in sorted_plugins
         ]
 
-        logs_by_instance_id = collections.defaultdict(list)
-        for log_item in logs:
-            logs_by_instance_id[log_item.instance_id].append(log_item)
-
         instance_items_by_id = {}
         instance_items_by_family = {}
-        context_item = InstanceItem(None, context_data, logs_by_instance_id)
+        context_item = InstanceItem(None, context_data, errored_instance_ids)
         instance_items_by_id[context_item.id] = context_item
         instance_items_by_family[context_item.family] = [context_item]
 
-        for instance_id, instance_data in data["instances"].items():
+        for instance_id, instance_data in report_data["instances"].items():
             item = InstanceItem(
-                instance_id, instance_data, logs_by_instance_id
+                instance_id, instance_data, errored_instance_ids
             )
             instance_items_by_id[item.id] = item
             if item.family not in instance_items_by_family:
@@ -136,6 +256,61 @@ class PublishReport:
         self.plugins_id_order = plugins_id_order
         self.plugins_items_by_id = plugins_items_by_id
 
-        self.logs = logs
+        self.logs_chunks = logs_chunks
 
         self.crashed_plugin_paths = report_data["crashed_file_paths"]
+
+    @property
+    def logs(self):
+        """All log items of report.
+
+        Log items are loaded on each access, use 'get_logs' to get only
+        part of them.
+
+        Returns:
+            list[LogItem]: Log items.
+
+        """
+        logs, _ = self.get_logs()
+        return logs
+
+    def get_logs(
+        self, instance_filter=None, plugin_filter=None, start=0, limit=None
+    ):
+        """Log items filtered by instance and plugin ids.
+
+        Only log chunks that are part of requested range are loaded.
+
+        Args:
+            instance_filter (Optional[set[str]]): Instance ids.
+            plugin_filter (Optional[set[str]]): Plugin item ids.
+            start (Optional[int]): Index of first log item.
+            limit (Optional[int]): Maximum number of log items.
+
+        Returns:
+            tuple[list[LogItem], int]: Log items in range and number of
+                all log items matching filters.
+
+        """
+        end = None
+        if limit is not None:
+            end = start + limit
+        logs = []
+        total = 0
+        for chunk in self.logs_chunks:
+            if instance_filter and chunk.instance_id not in instance_filter:
+                continue
+            if plugin_filter and chunk.plugin_id not in plugin_filter:
+                continue
+
+            chunk_start = total
+            total += chunk.count
+            if total <= start or (end is not None and chunk_start >= end):
+                continue
+
+            chunk_logs = chunk.get_logs()
+            logs.extend(chunk_logs[
+                max(0, start - chunk_start):
+                None if end is None else end - chunk_start
+            ])
+        return logs, total
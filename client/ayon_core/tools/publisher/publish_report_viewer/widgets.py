@@ -28,6 +28,7 @@ from .report_items import PublishReport
 FILEPATH_ROLE = QtCore.Qt.UserRole + 1
 TRACEBACK_ROLE = QtCore.Qt.UserRole + 2
 IS_DETAIL_ITEM_ROLE = QtCore.Qt.UserRole + 3
+SORT_VALUE_ROLE = QtCore.Qt.UserRole + 4
 
 
 def get_pretty_milliseconds(value):
@@ -45,6 +46,187 @@ def get_pretty_milliseconds(value):
     return f"{value:.2f}h {minutes:.2f}m"
 
 
+def get_pretty_bytes(value):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(value) < 1024:
+            return f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}TB"
+
+
+def _get_plugin_wall_time(plugin_item):
+    """Wall time of plugin in seconds."""
+    if plugin_item.profile:
+        return plugin_item.profile["wall_time"]
+    return plugin_item.process_time / 1000
+
+
+class PluginsPerformanceModel(QtGui.QStandardItemModel):
+    """Resources used by plugins with optional comparison to other report.
+
+    Resources other than time are available only in reports created
+        in profiling mode.
+    """
+    # Column label, profile key, value type
+    columns = (
+        ("Plugin", None, None),
+        ("Instances", None, None),
+        ("Wall time", None, "time"),
+        ("Wall diff", None, "time"),
+        ("CPU time", "cpu_time", "time"),
+        ("Children CPU", "children_cpu_time", "time"),
+        ("Peak RSS delta", "peak_rss_delta", "bytes"),
+        ("Read", "bytes_read", "bytes"),
+        ("Written", "bytes_written", "bytes"),
+        ("Subprocesses", "subprocess_count", "count"),
+        ("Subprocess time", "subprocess_time", "time"),
+        ("API calls", "api_calls", "count"),
+        ("API time", "api_time", "time"),
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.setHorizontalHeaderLabels([
+            column[0] for column in self.columns
+        ])
+        self._report = None
+        self._compare_report = None
+        self._is_active = True
+        self._need_refresh = False
+
+    def set_active(self, is_active):
+        if self._is_active is is_active:
+            return
+        self._is_active = is_active
+        self._update_items()
+
+    def set_report(self, report):
+        self._report = report
+        self._need_refresh = True
+        self._update_items()
+
+    def set_compare_report(self, report):
+        self._compare_report = report
+        self._need_refresh = True
+        self._update_items()
+
+    def _format_value(self, value, value_type):
+        if value is None:
+            return "N/A"
+        if value_type == "time":
+            return get_pretty_milliseconds(value * 1000)
+        if value_type == "bytes":
+            return get_pretty_bytes(value)
+        return str(value)
+
+    def _create_item(self, value, value_type):
+        item = QtGui.QStandardItem(self._format_value(value, value_type))
+        sort_value = value
+        if sort_value is None:
+            sort_value = -1
+        item.setData(sort_value, SORT_VALUE_ROLE)
+        return item
+
+    def _update_items(self):
+        if not self._is_active or not self._need_refresh:
+            return
+        self._need_refresh = False
+
+        root_item = self.invisibleRootItem()
+        root_item.removeRows(0, root_item.rowCount())
+        if self._report is None:
+            return
+
+        compare_time_by_name = {}
+        if self._compare_report is not None:
+            for plugin_item in (
+                self._compare_report.plugins_items_by_id.values()
+            ):
+                if plugin_item.passed:
+                    compare_time_by_name[plugin_item.name] = (
+                        _get_plugin_wall_time(plugin_item)
+                    )
+
+        rows = []
+        for plugin_id in self._report.plugins_id_order:
+            plugin_item = self._report.plugins_items_by_id[plugin_id]
+            if not plugin_item.passed:
+                continue
+
+            label = plugin_item.label or plugin_item.name
+            label_item = QtGui.QStandardItem(label)
+            label_item.setData(label, SORT_VALUE_ROLE)
+            label_item.setToolTip(plugin_item.name)
+            row = [
+                label_item,
+                self._create_item(plugin_item.instances_count, "count"),
+            ]
+
+            wall_time = _get_plugin_wall_time(plugin_item)
+            row.append(self._create_item(wall_time, "time"))
+
+            compare_time = compare_time_by_name.get(plugin_item.name)
+            wall_diff = None
+            if compare_time is not None:
+                wall_diff = wall_time - compare_time
+            diff_item = self._create_item(wall_diff, "time")
+            if wall_diff is not None and wall_diff > 0:
+                diff_item.setText("+" + diff_item.text())
+            row.append(diff_item)
+
+            profile = plugin_item.profile or {}
+            for _, key, value_type in self.columns[4:]:
+                row.append(self._create_item(profile.get(key), value_type))
+
+            for item in row:
+                item.setEditable(False)
+            rows.append(row)
+
+        for row in rows:
+            root_item.appendRow(row)
+
+
+class PluginsPerformanceWidget(QtWidgets.QWidget):
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        model = PluginsPerformanceModel()
+        proxy_model = QtCore.QSortFilterProxyModel()
+        proxy_model.setSortRole(SORT_VALUE_ROLE)
+        proxy_model.setSourceModel(model)
+
+        view = QtWidgets.QTreeView(self)
+        view.setModel(proxy_model)
+        view.setIndentation(0)
+        view.setAlternatingRowColors(True)
+        view.setSortingEnabled(True)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        view.sortByColumn(2, QtCore.Qt.DescendingOrder)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(view, 1)
+
+        model.rowsInserted.connect(self._on_rows_inserted)
+
+        self._view = view
+        self._model = model
+        self._proxy_model = proxy_model
+
+    def set_active(self, is_active):
+        self._model.set_active(is_active)
+
+    def set_report(self, report):
+        self._model.set_report(report)
+
+    def set_compare_report(self, report):
+        self._model.set_compare_report(report)
+
+    def _on_rows_inserted(self):
+        header = self._view.header()
+        header.resizeSections(QtWidgets.QHeaderView.ResizeToContents)
+
+
 class PluginLoadReportModel(QtGui.QStandardItemModel):
     def __init__(self):
         super().__init__()
@@ -285,6 +467,9 @@ class ZoomPlainText(QtWidgets.QPlainTextEdit):
 
 
 class DetailsWidget(QtWidgets.QWidget):
+    # Number of log items shown at once
+    page_size = 2000
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -292,19 +477,45 @@ class DetailsWidget(QtWidgets.QWidget):
         output_widget.setObjectName("PublishLogConsole")
         output_widget.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
 
+        pages_widget = QtWidgets.QWidget(self)
+        prev_page_btn = QtWidgets.QPushButton("<", pages_widget)
+        prev_page_btn.setToolTip("Previous logs")
+        pages_label = QtWidgets.QLabel(pages_widget)
+        next_page_btn = QtWidgets.QPushButton(">", pages_widget)
+        next_page_btn.setToolTip("Next logs")
+
+        pages_layout = QtWidgets.QHBoxLayout(pages_widget)
+        pages_layout.setContentsMargins(0, 0, 0, 0)
+        pages_layout.addStretch(1)
+        pages_layout.addWidget(prev_page_btn, 0)
+        pages_layout.addWidget(pages_label, 0)
+        pages_layout.addWidget(next_page_btn, 0)
+
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(output_widget)
+        layout.addWidget(output_widget, 1)
+        layout.addWidget(pages_widget, 0)
+
+        prev_page_btn.clicked.connect(self._on_prev_page)
+        next_page_btn.clicked.connect(self._on_next_page)
+
+        pages_widget.setVisible(False)
 
         self._is_active = True
         self._need_refresh = False
         self._output_widget = output_widget
+        self._pages_widget = pages_widget
+        self._prev_page_btn = prev_page_btn
+        self._pages_label = pages_label
+        self._next_page_btn = next_page_btn
         self._report_item = None
         self._instance_filter = set()
         self._plugin_filter = set()
+        self._page_start = 0
 
     def clear(self):
         self._output_widget.setPlainText("")
+        self._pages_widget.setVisible(False)
 
     def set_active(self, is_active):
         if self._is_active is is_active:
@@ -316,16 +527,19 @@ class DetailsWidget(QtWidgets.QWidget):
         self._report_item = report
         self._plugin_filter = set()
         self._instance_filter = set()
+        self._page_start = 0
         self._need_refresh = True
         self._update_logs()
 
     def set_plugin_filter(self, plugin_filter):
         self._plugin_filter = plugin_filter
+        self._page_start = 0
         self._need_refresh = True
         self._update_logs()
 
     def set_instance_filter(self, instance_filter):
         self._instance_filter = instance_filter
+        self._page_start = 0
         self._need_refresh = True
         self._update_logs()
 
@@ -333,26 +547,38 @@ class DetailsWidget(QtWidgets.QWidget):
         if not self._is_active or not self._need_refresh:
             return
 
+        self._need_refresh = False
         if not self._report_item:
-            self._output_widget.setPlainText("")
+            self.clear()
             return
 
-        filtered_logs = []
-        for log in self._report_item.logs:
-            if (
-                self._instance_filter
-                and log.instance_id not in self._instance_filter
-            ):
-                continue
-
-            if (
-                self._plugin_filter
-                and log.plugin_id not in self._plugin_filter
-            ):
-                continue
-            filtered_logs.append(log)
+        # Load only log items on current page
+        logs, total = self._report_item.get_logs(
+            self._instance_filter,
+            self._plugin_filter,
+            self._page_start,
+            self.page_size,
+        )
+        self._update_pages(len(logs), total)
+        self._set_logs(logs)
+
+    def _update_pages(self, count, total):
+        self._pages_widget.setVisible(total > self.page_size)
+        self._pages_label.setText("Logs {}-{} of {}".format(
+            self._page_start + 1, self._page_start + count, total
+        ))
+        self._prev_page_btn.setEnabled(self._page_start > 0)
+        self._next_page_btn.setEnabled(self._page_start + count < total)
+
+    def _on_prev_page(self):
+        self._page_start = max(0, self._page_start - self.page_size)
+        self._need_refresh = True
+        self._update_logs()
 
-        self._set_logs(filtered_logs)
+    def _on_next_page(self):
+        self._page_start += self.page_size
+        self._need_refresh = True
+        self._update_logs()
 
     def _set_logs(self, logs):
         lines = []
@@ -758,15 +984,18 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         logs_text_widget = DetailsWidget(details_tab_widget)
         plugin_load_report_widget = PluginLoadReportWidget(details_tab_widget)
         plugins_details_widget = PluginsDetailsWidget(details_tab_widget)
+        performance_widget = PluginsPerformanceWidget(details_tab_widget)
 
         plugin_load_report_widget.set_active(False)
         plugins_details_widget.set_active(False)
+        performance_widget.set_active(False)
 
         details_tab_widget.addTab(logs_text_widget, "Logs")
         details_tab_widget.addTab(plugins_details_widget, "Plugins Details")
         details_tab_widget.addTab(
             plugin_load_report_widget, "Crashed plugins"
         )
+        details_tab_widget.addTab(performance_widget, "Performance")
 
         middle_widget = QtWidgets.QWidget(self)
         middle_layout = QtWidgets.QGridLayout(middle_widget)
@@ -808,6 +1037,7 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._logs_text_widget = logs_text_widget
         self._plugin_load_report_widget = plugin_load_report_widget
         self._plugins_details_widget = plugins_details_widget
+        self._performance_widget = performance_widget
 
         self._removed_instances_check = removed_instances_check
         self._instances_view = instances_view
@@ -866,12 +1096,22 @@ class PublishReportViewerWidget(QtWidgets.QFrame):
         self._logs_text_widget.set_report(report)
         self._plugin_load_report_widget.set_report(report)
         self._plugins_details_widget.set_report(report)
+        self._performance_widget.set_report(report)
 
         self._ignore_selection_changes = False
 
         self._instances_view.expandAll()
         self._plugins_view.expandAll()
 
+    def set_compare_report(self, report):
+        """Set report used for comparison of plugins performance.
+
+        Args:
+            report (Union[PublishReport, None]): Report to compare with.
+
+        """
+        self._performance_widget.set_compare_report(report)
+
     def _on_tab_change(self, new_idx):
         if self._current_tab_idx == new_idx:
             return
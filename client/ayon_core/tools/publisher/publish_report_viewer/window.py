@@ -1,6 +1,7 @@
 import os
 import json
 import uuid
+import shutil
 
 import arrow
 from qtpy import QtWidgets, QtCore, QtGui
@@ -8,6 +9,11 @@ from qtpy import QtWidgets, QtCore, QtGui
 from ayon_core import style
 from ayon_core.lib import get_launcher_local_dir
 from ayon_core.resources import get_ayon_icon_filepath
+from ayon_core.pipeline.publish.report_file import (
+    PUBLISH_REPORT_FILE_EXT,
+    is_publish_report_file,
+    read_publish_report_file,
+)
 from ayon_core.tools import resources
 from ayon_core.tools.utils import (
     IconButton,
@@ -41,12 +47,23 @@ def get_reports_dir():
 
 
 class PublishReportItem:
-    """Report item representing one file in report directory."""
+    """Report item representing one file in report directory.
+
+    Args:
+        content (dict[str, Any]): Report data.
+        logs_filepath (Optional[str]): Path to JSON Lines report file from
+            which are log items read lazily.
+
+    """
 
-    def __init__(self, content):
+    def __init__(self, content, logs_filepath=None):
         changed = self._fix_content(content)
 
-        report_path = os.path.join(get_reports_dir(), content["id"])
+        reports_dir = get_reports_dir()
+        report_path = os.path.join(reports_dir, content["id"])
+        logs_filename = content.get("logs_filename")
+        if logs_filepath is None and logs_filename:
+            logs_filepath = os.path.join(reports_dir, logs_filename)
         file_modified = None
         if os.path.exists(report_path):
             file_modified = os.path.getmtime(report_path)
@@ -60,7 +77,24 @@ class PublishReportItem:
         self.created_at = float(created_at)
         self._loaded_label = content.get("label")
         self._changed = changed
-        self.publish_report = PublishReport(content)
+        self.logs_filepath = logs_filepath
+        self._publish_report = None
+
+    @property
+    def publish_report(self):
+        """Publish report prepared for UI.
+
+        Report is created on first access.
+
+        Returns:
+            PublishReport: Publish report.
+        """
+
+        if self._publish_report is None:
+            self._publish_report = PublishReport(
+                self.content, self.logs_filepath
+            )
+        return self._publish_report
 
     @property
     def version(self):
@@ -127,6 +161,16 @@ class PublishReportItem:
         if not save:
             return
 
+        # Copy logs file next to report so the logs are available even if
+        #   source file is removed
+        if self.logs_filepath:
+            logs_filename = self.id + PUBLISH_REPORT_FILE_EXT
+            logs_filepath = os.path.join(get_reports_dir(), logs_filename)
+            if os.path.normpath(self.logs_filepath) != logs_filepath:
+                shutil.copyfile(self.logs_filepath, logs_filepath)
+                self.logs_filepath = logs_filepath
+            self.content["logs_filename"] = logs_filename
+
         with open(self.report_path, "w") as stream:
             json.dump(self.content, stream)
 
@@ -139,7 +183,8 @@ class PublishReportItem:
         """Create report item from file.
 
         Args:
-            filepath (str): Path to report file. Content must be json.
+            filepath (str): Path to report file. Content must be json or
+                JSON Lines publish report.
 
         Returns:
             PublishReportItem: Report item.
@@ -149,12 +194,17 @@ class PublishReportItem:
             return None
 
         try:
-            with open(filepath, "r") as stream:
-                content = json.load(stream)
+            logs_filepath = None
+            if is_publish_report_file(filepath):
+                content = read_publish_report_file(filepath)
+                logs_filepath = filepath
+            else:
+                with open(filepath, "r") as stream:
+                    content = json.load(stream)
 
             file_modified = os.path.getmtime(filepath)
             changed = cls._fix_content(content, file_modified=file_modified)
-            obj = cls(content)
+            obj = cls(content, logs_filepath)
             if changed:
                 obj.mark_as_changed()
             return obj
@@ -168,6 +218,12 @@ class PublishReportItem:
         if os.path.exists(self.report_path):
             os.remove(self.report_path)
 
+        logs_filename = self.content.get("logs_filename")
+        if logs_filename:
+            logs_filepath = os.path.join(get_reports_dir(), logs_filename)
+            if os.path.exists(logs_filepath):
+                os.remove(logs_filepath)
+
     def update_file_content(self):
         """Update report content in file."""
 
@@ -263,7 +319,7 @@ class PublisherReportHandler:
         report_dir = get_reports_dir()
         for filename in os.listdir(report_dir):
             ext = os.path.splitext(filename)[-1]
-            if ext == ".json":
+            if ext in (".json", PUBLISH_REPORT_FILE_EXT):
                 continue
             filepath = os.path.join(report_dir, filename)
             item = PublishReportItem.from_filepath(filepath)
@@ -441,9 +497,22 @@ class LoadedFilesModel(QtGui.QStandardItemModel):
             return report_item.publish_report
         return None
 
+    def set_baseline_item_id(self, item_id):
+        """Mark report used as baseline for performance comparison.
+
+        Args:
+            item_id (Union[str, None]): Report item id.
+
+        """
+        for _item_id, item in self._items_by_id.items():
+            font = item.font()
+            font.setItalic(_item_id == item_id)
+            item.setFont(font)
+
 
 class LoadedFilesView(QtWidgets.QTreeView):
     selection_changed = QtCore.Signal()
+    baseline_changed = QtCore.Signal()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -465,6 +534,7 @@ class LoadedFilesView(QtWidgets.QTreeView):
         self.setItemDelegateForColumn(1, time_delegate)
 
         self.sortByColumn(1, QtCore.Qt.AscendingOrder)
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
 
         remove_btn = IconButton(self)
         remove_icon_path = resources.get_icon_path("delete")
@@ -475,6 +545,7 @@ class LoadedFilesView(QtWidgets.QTreeView):
 
         model.rowsInserted.connect(self._on_rows_inserted)
         remove_btn.clicked.connect(self._on_remove_clicked)
+        self.customContextMenuRequested.connect(self._on_context_menu)
         self.selectionModel().selectionChanged.connect(
             self._on_selection_change
         )
@@ -483,6 +554,7 @@ class LoadedFilesView(QtWidgets.QTreeView):
         self._proxy_model = proxy_model
         self._time_delegate = time_delegate
         self._remove_btn = remove_btn
+        self._baseline_item_id = None
 
     def _update_remove_btn(self):
         viewport = self.viewport()
@@ -517,6 +589,32 @@ class LoadedFilesView(QtWidgets.QTreeView):
     def remove_item_by_id(self, item_id):
         self._model.remove_item_by_id(item_id)
         self._fill_selection()
+        if item_id == self._baseline_item_id:
+            self._set_baseline_item_id(None)
+
+    def _set_baseline_item_id(self, item_id):
+        self._baseline_item_id = item_id
+        self._model.set_baseline_item_id(item_id)
+        self.baseline_changed.emit()
+
+    def _on_context_menu(self, point):
+        index = self.indexAt(point)
+        item_id = index.data(ITEM_ID_ROLE)
+
+        menu = QtWidgets.QMenu(self)
+        if item_id and item_id != self._baseline_item_id:
+            set_action = menu.addAction("Set as performance baseline")
+            set_action.triggered.connect(
+                lambda: self._set_baseline_item_id(item_id)
+            )
+        if self._baseline_item_id is not None:
+            clear_action = menu.addAction("Clear performance baseline")
+            clear_action.triggered.connect(
+                lambda: self._set_baseline_item_id(None)
+            )
+
+        if menu.actions():
+            menu.exec_(self.viewport().mapToGlobal(point))
 
     def _on_remove_clicked(self):
         index = self.currentIndex()
@@ -538,9 +636,15 @@ class LoadedFilesView(QtWidgets.QTreeView):
         item_id = index.data(ITEM_ID_ROLE)
         return self._model.get_report_by_id(item_id)
 
+    def get_baseline_report(self):
+        if self._baseline_item_id is None:
+            return None
+        return self._model.get_report_by_id(self._baseline_item_id)
+
 
 class LoadedFilesWidget(QtWidgets.QWidget):
     report_changed = QtCore.Signal()
+    baseline_changed = QtCore.Signal()
 
     def __init__(self, parent):
         super().__init__(parent)
@@ -554,6 +658,7 @@ class LoadedFilesWidget(QtWidgets.QWidget):
         layout.addWidget(view, 1)
 
         view.selection_changed.connect(self._on_report_change)
+        view.baseline_changed.connect(self._on_baseline_change)
 
         self._view = view
 
@@ -580,12 +685,18 @@ class LoadedFilesWidget(QtWidgets.QWidget):
     def _on_report_change(self):
         self.report_changed.emit()
 
+    def _on_baseline_change(self):
+        self.baseline_changed.emit()
+
     def _add_filepaths(self, filepaths):
         self._view.add_filepaths(filepaths)
 
     def get_current_report(self):
         return self._view.get_current_report()
 
+    def get_baseline_report(self):
+        return self._view.get_baseline_report()
+
 
 class PublishReportViewerWindow(QtWidgets.QWidget):
     default_width = 1200
@@ -617,6 +728,9 @@ class PublishReportViewerWindow(QtWidgets.QWidget):
         layout.addWidget(body, 1)
 
         loaded_files_widget.report_changed.connect(self._on_report_change)
+        loaded_files_widget.baseline_changed.connect(
+            self._on_baseline_change
+        )
 
         self._loaded_files_widget = loaded_files_widget
         self._main_widget = main_widget
@@ -628,5 +742,9 @@ class PublishReportViewerWindow(QtWidgets.QWidget):
         report = self._loaded_files_widget.get_current_report()
         self.set_report(report)
 
+    def _on_baseline_change(self):
+        report = self._loaded_files_widget.get_baseline_report()
+        self._main_widget.set_compare_report(report)
+
     def set_report(self, report_data):
         self._main_widget.set_report(report_data)
@@ -28,13 +28,15 @@ from qtpy import QtWidgets, QtCore, QtGui
 
 from ayon_core.style import get_objected_colors
 from ayon_core.tools.utils import NiceCheckbox
-from ayon_core.tools.utils.lib import html_escape, checkstate_int_to_enum
+from ayon_core.tools.utils.lib import checkstate_int_to_enum
 
 from ayon_core.tools.publisher.abstract import AbstractPublisherFrontend
 from ayon_core.tools.publisher.constants import (
     INSTANCE_ID_ROLE,
     SORT_VALUE_ROLE,
     IS_GROUP_ROLE,
+    IS_ACTIVE_ROLE,
+    IS_VALID_ROLE,
     CONTEXT_ID,
     CONTEXT_LABEL,
     GROUP_ROLE,
@@ -46,16 +48,20 @@ from .widgets import AbstractInstanceView
 
 
 class ListItemDelegate(QtWidgets.QStyledItemDelegate):
-    """Generic delegate for instance group.
+    """Generic delegate for instance group and instance items.
 
     All indexes having `IS_GROUP_ROLE` data set to True will use
-    `group_item_paint` method to draw it's content otherwise default styled
-    item delegate paint method is used.
+    `group_item_paint` method to draw it's content. Instance items are
+    painted by `instance_item_paint` without using widgets, so view can
+    show thousands of instances as only visible rows are painted.
 
     Goal is to draw group items with different colors for normal, hover and
     pressed state.
     """
     radius_ratio = 0.3
+    # Ratio of checkbox width to height
+    checkbox_ratio = 90.0 / 50.0
+    item_margin = 4
 
     def __init__(self, parent):
         super().__init__(parent)
@@ -66,10 +72,52 @@ class ListItemDelegate(QtWidgets.QStyledItemDelegate):
             key: value.get_qcolor()
             for key, value in group_color_info.items()
         }
+        checkbox_colors = get_objected_colors("nice-checkbox")
+        self._checkbox_colors = {
+            key: value.get_qcolor()
+            for key, value in checkbox_colors.items()
+        }
+        self._invalid_color = get_objected_colors(
+            "publisher", "error"
+        ).get_qcolor()
+        self._active_toggle_enabled = True
+
+    def set_active_toggle_enabled(self, enabled):
+        self._active_toggle_enabled = enabled
+
+    def get_checkbox_rect(self, rect, font_metrics):
+        """Rect of active checkbox in item rect.
+
+        Args:
+            rect (QtCore.QRect): Rect of item.
+            font_metrics (QtGui.QFontMetrics): Font metrics of view.
+
+        Returns:
+            QtCore.QRect: Rect of checkbox.
+
+        """
+        height = font_metrics.height()
+        width = int(height * self.checkbox_ratio)
+        return QtCore.QRect(
+            rect.right() - self.item_margin - width,
+            rect.top() + int((rect.height() - height) * 0.5),
+            width,
+            height
+        )
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        size.setHeight(max(
+            size.height(),
+            option.fontMetrics.height() + (self.item_margin * 2)
+        ))
+        return size
 
     def paint(self, painter, option, index):
         if index.data(IS_GROUP_ROLE):
             self.group_item_paint(painter, option, index)
+        elif index.data(IS_ACTIVE_ROLE) is not None:
+            self.instance_item_paint(painter, option, index)
         else:
             super().paint(painter, option, index)
 
@@ -106,115 +154,85 @@ class ListItemDelegate(QtWidgets.QStyledItemDelegate):
 
         painter.restore()
 
+    def instance_item_paint(self, painter, option, index):
+        """Paint instance item with label and active checkbox."""
+        option = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        label = option.text or "No label"
+        option.text = ""
 
-class InstanceListItemWidget(QtWidgets.QWidget):
-    """Widget with instance info drawn over delegate paint.
-
-    This is required to be able use custom checkbox on custom place.
-    """
-    active_changed = QtCore.Signal(str, bool)
-    double_clicked = QtCore.Signal()
-
-    def __init__(self, instance, context_info, parent):
-        super().__init__(parent)
-
-        self.instance = instance
-
-        instance_label = instance.label
-        if instance_label is None:
-            # Do not cause UI crash if label is 'None'
-            instance_label = "No label"
-
-        instance_label = html_escape(instance_label)
-
-        product_name_label = QtWidgets.QLabel(instance_label, self)
-        product_name_label.setObjectName("ListViewProductName")
-
-        active_checkbox = NiceCheckbox(parent=self)
-        active_checkbox.setChecked(instance["active"])
-
-        layout = QtWidgets.QHBoxLayout(self)
-        content_margins = layout.contentsMargins()
-        layout.setContentsMargins(content_margins.left() + 2, 0, 2, 0)
-        layout.addWidget(product_name_label)
-        layout.addStretch(1)
-        layout.addWidget(active_checkbox)
-
-        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        product_name_label.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        active_checkbox.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-
-        active_checkbox.stateChanged.connect(self._on_active_change)
-
-        self._instance_label_widget = product_name_label
-        self._active_checkbox = active_checkbox
-
-        self._has_valid_context = None
+        widget = option.widget
+        if widget is None:
+            style = QtWidgets.QApplication.style()
+        else:
+            style = widget.style()
+        # Draw background of item (selection, hover)
+        style.drawControl(
+            QtWidgets.QStyle.CE_ItemViewItem, option, painter, widget
+        )
 
-        self._set_valid_property(context_info.is_valid)
+        checkbox_rect = self.get_checkbox_rect(
+            option.rect, option.fontMetrics
+        )
+        text_rect = QtCore.QRect(
+            option.rect.left() + self.item_margin + 5,
+            option.rect.top(),
+            checkbox_rect.left() - option.rect.left() - (
+                (self.item_margin * 2) + 5
+            ),
+            option.rect.height()
+        )
 
-    def mouseDoubleClickEvent(self, event):
-        widget = self.childAt(event.pos())
-        super().mouseDoubleClickEvent(event)
-        if widget is not self._active_checkbox:
-            self.double_clicked.emit()
+        painter.save()
+        painter.setRenderHints(
+            QtGui.QPainter.Antialiasing
+            | QtGui.QPainter.TextAntialiasing
+        )
+        if index.data(IS_VALID_ROLE) is False:
+            painter.setPen(self._invalid_color)
+        else:
+            painter.setPen(
+                option.palette.color(QtGui.QPalette.Text)
+            )
+        painter.setFont(option.font)
+        painter.drawText(
+            text_rect,
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            option.fontMetrics.elidedText(
+                label, QtCore.Qt.ElideRight, text_rect.width()
+            )
+        )
 
-    def _set_valid_property(self, valid):
-        if self._has_valid_context == valid:
-            return
-        self._has_valid_context = valid
-        state = ""
-        if not valid:
-            state = "invalid"
-        self._instance_label_widget.setProperty("state", state)
-        self._instance_label_widget.style().polish(self._instance_label_widget)
-
-    def is_active(self):
-        """Instance is activated."""
-        return self.instance["active"]
-
-    def set_active(self, new_value):
-        """Change active state of instance and checkbox."""
-        checkbox_value = self._active_checkbox.isChecked()
-        instance_value = self.instance["active"]
-        if new_value is None:
-            new_value = not instance_value
-
-        # First change instance value and them change checkbox
-        # - prevent to trigger `active_changed` signal
-        if instance_value != new_value:
-            self.instance["active"] = new_value
-
-        if checkbox_value != new_value:
-            self._active_checkbox.setChecked(new_value)
-
-    def update_instance(self, instance, context_info):
-        """Update instance object."""
-        self.instance = instance
-        self.update_instance_values(context_info)
-
-    def update_instance_values(self, context_info):
-        """Update instance data propagated to widgets."""
-        # Check product name
-        label = self.instance.label
-        if label != self._instance_label_widget.text():
-            self._instance_label_widget.setText(html_escape(label))
-        # Check active state
-        self.set_active(self.instance["active"])
-        # Check valid states
-        self._set_valid_property(context_info.is_valid)
-
-    def _on_active_change(self):
-        new_value = self._active_checkbox.isChecked()
-        old_value = self.instance["active"]
-        if new_value == old_value:
-            return
+        self._paint_checkbox(
+            painter, checkbox_rect, bool(index.data(IS_ACTIVE_ROLE))
+        )
+        painter.restore()
 
-        self.instance["active"] = new_value
-        self.active_changed.emit(self.instance.id, new_value)
+    def _paint_checkbox(self, painter, rect, checked):
+        # Static variant of 'NiceCheckbox' painting
+        if checked:
+            bg_color = self._checkbox_colors["bg-checked"]
+        else:
+            bg_color = self._checkbox_colors["bg-unchecked"]
+
+        radius = int(rect.height() * 0.5)
+        painter.setPen(QtCore.Qt.transparent)
+        painter.setBrush(bg_color)
+        painter.drawRoundedRect(rect, radius, radius)
+
+        checker_size = rect.height()
+        pos_x = rect.left()
+        if checked:
+            pos_x = rect.right() + 1 - checker_size
+        painter.setBrush(self._checkbox_colors["bg-checker"])
+        painter.drawEllipse(
+            QtCore.QRect(pos_x, rect.top(), checker_size, checker_size)
+        )
 
-    def set_active_toggle_enabled(self, enabled):
-        self._active_checkbox.setEnabled(enabled)
+        if not self._active_toggle_enabled:
+            level = 33
+            painter.setBrush(QtGui.QColor(level, level, level, 127))
+            painter.drawRoundedRect(rect, radius, radius)
 
 
 class ListContextWidget(QtWidgets.QFrame):
@@ -333,6 +351,7 @@ class InstanceListGroupWidget(QtWidgets.QFrame):
 class InstanceTreeView(QtWidgets.QTreeView):
     """View showing instances and their groups."""
     toggle_requested = QtCore.Signal(int)
+    active_toggle_requested = QtCore.Signal(str)
     double_clicked = QtCore.Signal()
 
     def __init__(self, *args, **kwargs):
@@ -342,11 +361,13 @@ class InstanceTreeView(QtWidgets.QTreeView):
         self.setHeaderHidden(True)
         self.setIndentation(0)
         self.setExpandsOnDoubleClick(False)
+        self.setUniformRowHeights(True)
         self.setSelectionMode(
             QtWidgets.QAbstractItemView.ExtendedSelection
         )
         self.viewport().setMouseTracking(True)
         self._pressed_group_index = None
+        self._pressed_checkbox_index = None
 
     def _expand_item(self, index, expand=None):
         is_expanded = self.isExpanded(index)
@@ -389,6 +410,18 @@ class InstanceTreeView(QtWidgets.QTreeView):
 
         return super().event(event)
 
+    def _get_checkbox_index(self, pos):
+        """Instance index if position is on its active checkbox."""
+        index = self.indexAt(pos)
+        if index.data(IS_ACTIVE_ROLE) is None:
+            return None
+        checkbox_rect = self.itemDelegate().get_checkbox_rect(
+            self.visualRect(index), self.fontMetrics()
+        )
+        if checkbox_rect.contains(pos):
+            return index
+        return None
+
     def _mouse_press(self, event):
         """Store index of pressed group.
 
@@ -406,12 +439,30 @@ class InstanceTreeView(QtWidgets.QTreeView):
         self._pressed_group_index = pressed_group_index
 
     def mousePressEvent(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            checkbox_index = self._get_checkbox_index(event.pos())
+            if checkbox_index is not None:
+                self._pressed_checkbox_index = checkbox_index
+                event.accept()
+                return
         self._mouse_press(event)
         super().mousePressEvent(event)
 
     def mouseDoubleClickEvent(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            checkbox_index = self._get_checkbox_index(event.pos())
+            if checkbox_index is not None:
+                self._pressed_checkbox_index = checkbox_index
+                event.accept()
+                return
+
         self._mouse_press(event)
         super().mouseDoubleClickEvent(event)
+        if (
+            event.button() == QtCore.Qt.LeftButton
+            and self.indexAt(event.pos()).data(IS_ACTIVE_ROLE) is not None
+        ):
+            self.double_clicked.emit()
 
     def _mouse_release(self, event, pressed_index):
         if event.button() != QtCore.Qt.LeftButton:
@@ -430,6 +481,20 @@ class InstanceTreeView(QtWidgets.QTreeView):
         return True
 
     def mouseReleaseEvent(self, event):
+        pressed_checkbox_index = self._pressed_checkbox_index
+        self._pressed_checkbox_index = None
+        if pressed_checkbox_index is not None:
+            if (
+                event.button() == QtCore.Qt.LeftButton
+                and self._get_checkbox_index(event.pos())
+                == pressed_checkbox_index
+            ):
+                self.active_toggle_requested.emit(
+                    pressed_checkbox_index.data(INSTANCE_ID_ROLE)
+                )
+            event.accept()
+            return
+
         pressed_index = self._pressed_group_index
         self._pressed_group_index = None
         result = self._mouse_release(event, pressed_index)
@@ -476,11 +541,16 @@ class InstanceListView(AbstractInstanceView):
         instance_view.collapsed.connect(self._on_collapse)
         instance_view.expanded.connect(self._on_expand)
         instance_view.toggle_requested.connect(self._on_toggle_request)
+        instance_view.active_toggle_requested.connect(
+            self._on_active_toggle_request
+        )
         instance_view.double_clicked.connect(self.double_clicked)
 
         self._group_items = {}
         self._group_widgets = {}
-        self._widgets_by_id = {}
+        # Instance items are painted by delegate, no widgets are created
+        self._instance_items_by_id = {}
+        self._instances_by_id = {}
         # Group by instance id for handling of active state
         self._group_by_instance_id = {}
         self._context_item = None
@@ -526,12 +596,17 @@ class InstanceListView(AbstractInstanceView):
             active = False
 
         group_names = set()
+        changed = False
         for instance_id in selected_instance_ids:
-            widget = self._widgets_by_id.get(instance_id)
-            if widget is None:
+            instance = self._instances_by_id.get(instance_id)
+            if instance is None:
                 continue
 
-            widget.set_active(active)
+            new_value = active
+            if new_value is None:
+                new_value = not instance["active"]
+            if self._set_instance_active(instance_id, new_value):
+                changed = True
             group_name = self._group_by_instance_id.get(instance_id)
             if group_name is not None:
                 group_names.add(group_name)
@@ -539,25 +614,52 @@ class InstanceListView(AbstractInstanceView):
         for group_name in group_names:
             self._update_group_checkstate(group_name)
 
+        if changed:
+            self.active_changed.emit()
+
+    def _on_active_toggle_request(self, instance_id):
+        if not self._active_toggle_enabled:
+            return
+        instance = self._instances_by_id.get(instance_id)
+        if instance is not None:
+            self._on_active_changed(instance_id, not instance["active"])
+
+    def _set_instance_active(self, instance_id, active):
+        """Change active state of instance and its item.
+
+        Returns:
+            bool: Active state of instance changed.
+
+        """
+        instance = self._instances_by_id[instance_id]
+        changed = instance["active"] != active
+        if changed:
+            instance["active"] = active
+        item = self._instance_items_by_id[instance_id]
+        if item.data(IS_ACTIVE_ROLE) != active:
+            item.setData(active, IS_ACTIVE_ROLE)
+        return changed
+
     def _update_group_checkstate(self, group_name):
         """Update checkstate of one group."""
         widget = self._group_widgets.get(group_name)
         if widget is None:
             return
 
-        activity = None
-        for instance_id, _group_name in self._group_by_instance_id.items():
-            if _group_name != group_name:
-                continue
+        group_item = self._group_items.get(group_name)
+        if group_item is None:
+            return
 
-            instance_widget = self._widgets_by_id.get(instance_id)
-            if not instance_widget:
+        activity = None
+        for row in range(group_item.rowCount()):
+            active = group_item.child(row).data(IS_ACTIVE_ROLE)
+            if active is None:
                 continue
 
             if activity is None:
-                activity = int(instance_widget.is_active())
+                activity = int(active)
 
-            elif activity != instance_widget.is_active():
+            elif activity != active:
                 activity = -1
                 break
 
@@ -648,19 +750,27 @@ class InstanceListView(AbstractInstanceView):
                 context_info = context_info_by_id[instance_id]
 
                 self._group_by_instance_id[instance_id] = group_name
+                self._instances_by_id[instance_id] = instance
                 # Remove instance id from `to_remove` if already exists and
-                #   trigger update of widget
+                #   trigger update of item
                 if instance_id in to_remove:
                     to_remove.remove(instance_id)
-                    widget = self._widgets_by_id[instance_id]
-                    widget.update_instance(instance, context_info)
+                    self._update_instance_item(
+                        self._instance_items_by_id[instance_id],
+                        instance,
+                        context_info
+                    )
                     continue
 
                 # Create new item and store it as new
                 item = QtGui.QStandardItem()
+                item.setFlags(
+                    QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+                )
                 item.setData(instance["productName"], SORT_VALUE_ROLE)
                 item.setData(instance["productName"], GROUP_ROLE)
                 item.setData(instance_id, INSTANCE_ID_ROLE)
+                self._update_instance_item(item, instance, context_info)
                 new_items.append(item)
                 new_items_with_instance.append((item, instance))
 
@@ -683,14 +793,15 @@ class InstanceListView(AbstractInstanceView):
             for idx in reversed(sorted(idx_to_remove)):
                 group_item.removeRows(idx, 1)
 
-            # Cleanup instance related widgets
+            # Cleanup instance related data
+            # - instance could be moved to other group
             for instance_id in to_remove:
-                self._group_by_instance_id.pop(instance_id)
-                widget = self._widgets_by_id.pop(instance_id)
-                widget.deleteLater()
+                if self._group_by_instance_id.get(instance_id) == group_name:
+                    self._group_by_instance_id.pop(instance_id)
+                    self._instances_by_id.pop(instance_id, None)
+                    self._instance_items_by_id.pop(instance_id, None)
 
-            # Process new instance items and add them to model and create
-            #   their widgets
+            # Process new instance items and add them to model
             if new_items:
                 # Trigger sort at the end when new instances are available
                 sort_at_the_end = True
@@ -702,26 +813,11 @@ class InstanceListView(AbstractInstanceView):
                     context_info = context_info_by_id[instance.id]
                     if not context_info.is_valid:
                         expand_groups.add(group_name)
-                    item_index = self._instance_model.index(
-                        item.row(),
-                        item.column(),
-                        group_index
-                    )
-                    proxy_index = self._proxy_model.mapFromSource(item_index)
-                    widget = InstanceListItemWidget(
-                        instance, context_info, self._instance_view
-                    )
-                    widget.set_active_toggle_enabled(
-                        self._active_toggle_enabled
-                    )
-                    widget.active_changed.connect(self._on_active_changed)
-                    widget.double_clicked.connect(self.double_clicked)
-                    self._instance_view.setIndexWidget(proxy_index, widget)
-                    self._widgets_by_id[instance.id] = widget
+                    self._instance_items_by_id[instance.id] = item
 
-            # Trigger sort at the end of refresh
-            if sort_at_the_end:
-                self._proxy_model.sort(0)
+        # Trigger sort at the end of refresh
+        if sort_at_the_end:
+            self._proxy_model.sort(0)
 
         # Expand groups marked for expanding
         for group_name in expand_groups:
@@ -730,6 +826,23 @@ class InstanceListView(AbstractInstanceView):
 
             self._instance_view.expand(proxy_index)
 
+    def _update_instance_item(self, item, instance, context_info):
+        """Update data of instance item used by delegate."""
+        label = instance.label
+        if label is None:
+            # Do not cause UI crash if label is 'None'
+            label = "No label"
+
+        values = (
+            (label, QtCore.Qt.DisplayRole),
+            (label, QtCore.Qt.ToolTipRole),
+            (instance["active"], IS_ACTIVE_ROLE),
+            (context_info.is_valid, IS_VALID_ROLE),
+        )
+        for value, role in values:
+            if item.data(role) != value:
+                item.setData(value, role)
+
     def _make_sure_context_item_exists(self):
         if self._context_item is not None:
             return False
@@ -869,6 +982,12 @@ class InstanceListView(AbstractInstanceView):
                 continue
 
             group_item = self._group_items.pop(group_name)
+            for row in range(group_item.rowCount()):
+                instance_id = group_item.child(row).data(INSTANCE_ID_ROLE)
+                if self._group_by_instance_id.get(instance_id) == group_name:
+                    self._group_by_instance_id.pop(instance_id)
+                    self._instances_by_id.pop(instance_id, None)
+                    self._instance_items_by_id.pop(instance_id, None)
             root_item.removeRow(group_item.row())
             widget = self._group_widgets.pop(group_name)
             widget.deleteLater()
@@ -876,9 +995,12 @@ class InstanceListView(AbstractInstanceView):
     def refresh_instance_states(self):
         """Trigger update of all instances."""
         context_info_by_id = self._controller.get_instances_context_info()
-        for instance_id, widget in self._widgets_by_id.items():
-            context_info = context_info_by_id[instance_id]
-            widget.update_instance_values(context_info)
+        for instance_id, item in self._instance_items_by_id.items():
+            self._update_instance_item(
+                item,
+                self._instances_by_id[instance_id],
+                context_info_by_id[instance_id]
+            )
 
     def _on_active_changed(self, changed_instance_id, new_value):
         selected_instance_ids, _, _ = self.get_selected_items()
@@ -910,10 +1032,9 @@ class InstanceListView(AbstractInstanceView):
 
         changed_ids = set()
         for instance_id in instance_ids:
-            widget = self._widgets_by_id.get(instance_id)
-            if widget:
+            if instance_id in self._instances_by_id:
                 changed_ids.add(instance_id)
-                widget.set_active(new_value)
+                self._set_instance_active(instance_id, new_value)
 
         if changed_ids:
             self.active_changed.emit()
@@ -1075,35 +1196,19 @@ class InstanceListView(AbstractInstanceView):
             selection_model.clear()
             return
 
-        if len(select_indexes) == 1:
-            proxy_index = proxy_model.mapFromSource(select_indexes[0])
-            selection_model.setCurrentIndex(
-                proxy_index,
-                QtCore.QItemSelectionModel.ClearAndSelect
-                | QtCore.QItemSelectionModel.Rows
-            )
-            return
-
-        first_index = proxy_model.mapFromSource(select_indexes.pop(0))
-        last_index = proxy_model.mapFromSource(select_indexes.pop(-1))
-
-        selection_model.setCurrentIndex(
-            first_index,
-            QtCore.QItemSelectionModel.ClearAndSelect
-            | QtCore.QItemSelectionModel.Rows
-        )
-
+        # Select all indexes at once to trigger selection change only once
+        selection = QtCore.QItemSelection()
+        proxy_index = None
         for index in select_indexes:
             proxy_index = proxy_model.mapFromSource(index)
-            selection_model.select(
-                proxy_index,
-                QtCore.QItemSelectionModel.Select
-                | QtCore.QItemSelectionModel.Rows
-            )
+            selection.select(proxy_index, proxy_index)
 
         selection_model.setCurrentIndex(
-            last_index,
-            QtCore.QItemSelectionModel.Select
+            proxy_index, QtCore.QItemSelectionModel.NoUpdate
+        )
+        selection_model.select(
+            selection,
+            QtCore.QItemSelectionModel.ClearAndSelect
             | QtCore.QItemSelectionModel.Rows
         )
 
@@ -1112,9 +1217,8 @@ class InstanceListView(AbstractInstanceView):
             return
 
         self._active_toggle_enabled = enabled
-        for widget in self._widgets_by_id.values():
-            if isinstance(widget, InstanceListItemWidget):
-                widget.set_active_toggle_enabled(enabled)
+        self._instance_delegate.set_active_toggle_enabled(enabled)
+        self._instance_view.viewport().update()
 
         for widget in self._group_widgets.values():
             if isinstance(widget, InstanceListGroupWidget):
@@ -23,6 +23,9 @@ class OverviewWidget(QtWidgets.QFrame):
 
     anim_end_value = 200
     anim_duration = 200
+    # Card view creates widget for each instance, list view is used
+    #   when there are more instances
+    card_view_instances_limit = 300
 
     def __init__(
         self, controller: AbstractPublisherFrontend, parent: QtWidgets.QWidget
@@ -396,10 +399,16 @@ class OverviewWidget(QtWidgets.QFrame):
     def _change_view_type(self):
         idx = self._product_views_layout.currentIndex()
         new_idx = (idx + 1) % self._product_views_layout.count()
+        self._set_current_view(self._product_views_layout.widget(new_idx))
 
-        old_view = self._product_views_layout.currentWidget()
-        new_view = self._product_views_layout.widget(new_idx)
+    def _set_current_view(self, new_view):
+        """Show other view with selection of current view.
+
+        Args:
+            new_view (QtWidgets.QWidget): View to show.
 
+        """
+        old_view = self._product_views_layout.currentWidget()
         if not new_view.refreshed:
             new_view.refresh()
             new_view.set_refreshed(True)
@@ -413,7 +422,7 @@ class OverviewWidget(QtWidgets.QFrame):
             instance_ids, context_selected, convertor_identifiers
         )
 
-        self._product_views_layout.setCurrentIndex(new_idx)
+        self._product_views_layout.setCurrentWidget(new_view)
 
         self._on_product_change()
 
@@ -428,8 +437,19 @@ class OverviewWidget(QtWidgets.QFrame):
             widget.set_refreshed(False)
 
         view = self._product_views_layout.currentWidget()
-        view.refresh()
-        view.set_refreshed(True)
+        if (
+            view is self._product_view_cards
+            and (
+                len(self._controller.get_instances())
+                > self.card_view_instances_limit
+            )
+        ):
+            # Switch view the same way as user would so selection
+            #   is kept, the list view is refreshed by the switch
+            self._set_current_view(self._product_list_view)
+        else:
+            view.refresh()
+            view.set_refreshed(True)
 
         self._refreshing_instances = False
 
@@ -110,6 +110,11 @@ class SceneInventoryController:
             representation_ids
         )
 
+    def get_container_version_items(self, product_ids, version_ids):
+        return self._containers_model.get_container_version_items(
+            product_ids, version_ids
+        )
+
     def get_version_items(self, product_ids):
         return self._containers_model.get_version_items(product_ids)
 
@@ -7,7 +7,7 @@ from qtpy import QtCore, QtGui
 import qtawesome
 
 from ayon_core.style import get_default_entity_icon_color
-from ayon_core.tools.utils import get_qt_icon
+from ayon_core.tools.utils import get_qt_icon, RefreshWorker
 from ayon_core.tools.utils.lib import format_version
 
 ITEM_ID_ROLE = QtCore.Qt.UserRole + 1
@@ -41,6 +41,8 @@ ITEM_UNIQUE_NAME_ROLE = QtCore.Qt.UserRole + 24
 class InventoryModel(QtGui.QStandardItemModel):
     """The model for the inventory"""
 
+    about_to_fill = QtCore.Signal()
+    refreshed = QtCore.Signal()
     column_labels = [
         "Name",
         "Version",
@@ -119,16 +121,23 @@ class InventoryModel(QtGui.QStandardItemModel):
         self._last_project_statuses = {}
         self._last_status_icons_by_name = {}
 
+        self._refresh_worker = RefreshWorker(self)
+
     def outdated(self, item):
         return item.get("isOutdated", True)
 
     def refresh(self, selected=None):
-        """Refresh the model"""
+        """Refresh the model.
+
+        Containers are collected from host right away, information about
+            their entities is queried in background thread. Signal
+            'about_to_fill' is emitted right before items are replaced and
+            'refreshed' when model is filled.
+
+        """
         # for debugging or testing, injecting items from outside
         container_items = self._controller.get_container_items()
 
-        self._clear_items()
-
         items_by_repre_id = {}
         for container_item in container_items:
             # if (
@@ -140,32 +149,72 @@ class InventoryModel(QtGui.QStandardItemModel):
             items = items_by_repre_id.setdefault(repre_id, [])
             items.append(container_item)
 
+        self._refresh_worker.request(
+            "refresh",
+            self._on_refresh_finished,
+            self._get_refresh_data,
+            items_by_repre_id,
+        )
+
+    def _get_refresh_data(self, items_by_repre_id):
+        """Query entities information of containers.
+
+        Called in background thread, must not touch Qt objects.
+
+        """
         repre_id = set(items_by_repre_id.keys())
         repre_info_by_id = self._controller.get_representation_info_items(
             repre_id
         )
-        product_ids = {
-            repre_info.product_id
-            for repre_info in repre_info_by_id.values()
-            if repre_info.is_valid
-        }
-        version_items_by_product_id = self._controller.get_version_items(
-            product_ids
+        product_ids = set()
+        version_ids = set()
+        for repre_info in repre_info_by_id.values():
+            if repre_info.is_valid:
+                product_ids.add(repre_info.product_id)
+                version_ids.add(repre_info.version_id)
+        version_items_by_product_id = (
+            self._controller.get_container_version_items(
+                product_ids, version_ids
+            )
         )
         # SiteSync addon information
         progress_by_id = self._controller.get_representations_site_progress(
             repre_id
         )
-        sites_info = self._controller.get_sites_information()
+        return {
+            "items_by_repre_id": items_by_repre_id,
+            "repre_info_by_id": repre_info_by_id,
+            "version_items_by_product_id": version_items_by_product_id,
+            "progress_by_id": progress_by_id,
+            "sites_info": self._controller.get_sites_information(),
+            "site_icon_defs": self._controller.get_site_provider_icons(),
+            "status_items": self._controller.get_project_status_items(),
+        }
+
+    def _on_refresh_finished(self, thread):
+        self.about_to_fill.emit()
+        try:
+            self._clear_items()
+            if not thread.failed:
+                self._fill_items(thread.get_result())
+        finally:
+            self.refreshed.emit()
+
+    def _fill_items(self, refresh_data):
+        items_by_repre_id = refresh_data["items_by_repre_id"]
+        repre_info_by_id = refresh_data["repre_info_by_id"]
+        version_items_by_product_id = (
+            refresh_data["version_items_by_product_id"]
+        )
+        progress_by_id = refresh_data["progress_by_id"]
+        sites_info = refresh_data["sites_info"]
         site_icons = {
             provider: get_qt_icon(icon_def)
-            for provider, icon_def in (
-                self._controller.get_site_provider_icons().items()
-            )
+            for provider, icon_def in refresh_data["site_icon_defs"].items()
         }
         self._last_project_statuses = {
             status_item.name: status_item
-            for status_item in self._controller.get_project_status_items()
+            for status_item in refresh_data["status_items"]
         }
         self._last_status_icons_by_name = {}
 
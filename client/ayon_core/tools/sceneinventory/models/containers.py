@@ -1,4 +1,5 @@
 import uuid
+import threading
 import collections
 
 import ayon_api
@@ -184,164 +185,353 @@ class VersionItem:
 
 
 class ContainersModel:
+    version_fields = {"id", "version", "productId", "status"}
+
     def __init__(self, controller):
         self._controller = controller
+        # Entities information is queried in background thread of scene
+        #   inventory UI while main thread is reading it
+        self._lock = threading.RLock()
         self._items_cache = None
         self._containers_by_id = {}
         self._container_items_by_id = {}
         self._version_items_by_product_id = {}
+        self._version_states_by_product_id = {}
+        self._version_entities_by_id = {}
         self._repre_info_by_id = {}
 
     def reset(self):
-        self._items_cache = None
-        self._containers_by_id = {}
-        self._container_items_by_id = {}
-        self._version_items_by_product_id = {}
-        self._repre_info_by_id = {}
+        with self._lock:
+            self._items_cache = None
+            self._containers_by_id = {}
+            self._container_items_by_id = {}
+            self._version_items_by_product_id = {}
+            self._version_states_by_product_id = {}
+            self._version_entities_by_id = {}
+            self._repre_info_by_id = {}
 
     def get_containers(self):
-        self._update_cache()
-        return list(self._containers_by_id.values())
+        with self._lock:
+            self._update_cache()
+            return list(self._containers_by_id.values())
 
     def get_containers_by_item_ids(self, item_ids):
-        return {
-            item_id: self._containers_by_id.get(item_id)
-            for item_id in item_ids
-        }
+        with self._lock:
+            return {
+                item_id: self._containers_by_id.get(item_id)
+                for item_id in item_ids
+            }
 
     def get_container_items(self):
-        self._update_cache()
-        return list(self._items_cache)
+        with self._lock:
+            self._update_cache()
+            return list(self._items_cache)
 
     def get_container_items_by_id(self, item_ids):
-        return {
-            item_id: self._container_items_by_id.get(item_id)
-            for item_id in item_ids
-        }
+        with self._lock:
+            return {
+                item_id: self._container_items_by_id.get(item_id)
+                for item_id in item_ids
+            }
 
     def get_representation_info_items(self, representation_ids):
-        output = {}
-        missing_repre_ids = set()
-        for repre_id in representation_ids:
-            try:
-                uuid.UUID(repre_id)
-            except ValueError:
-                output[repre_id] = RepresentationInfo.new_invalid()
-                continue
+        with self._lock:
+            output = {}
+            missing_repre_ids = set()
+            for repre_id in representation_ids:
+                try:
+                    uuid.UUID(repre_id)
+                except ValueError:
+                    output[repre_id] = RepresentationInfo.new_invalid()
+                    continue
 
-            repre_info = self._repre_info_by_id.get(repre_id)
-            if repre_info is None:
-                missing_repre_ids.add(repre_id)
-            else:
-                output[repre_id] = repre_info
+                repre_info = self._repre_info_by_id.get(repre_id)
+                if repre_info is None:
+                    missing_repre_ids.add(repre_id)
+                else:
+                    output[repre_id] = repre_info
 
-        if not missing_repre_ids:
+            if not missing_repre_ids:
+                return output
+
+            project_name = self._controller.get_current_project_name()
+            repre_hierarchy_by_id = get_representations_hierarchy(
+                project_name, missing_repre_ids
+            )
+            for repre_id, repre_hierarchy in repre_hierarchy_by_id.items():
+                kwargs = {
+                    "folder_id": None,
+                    "folder_path": None,
+                    "product_id": None,
+                    "product_name": None,
+                    "product_type": None,
+                    "product_group": None,
+                    "version_id": None,
+                    "representation_name": None,
+                }
+                folder = repre_hierarchy.folder
+                product = repre_hierarchy.product
+                version = repre_hierarchy.version
+                repre = repre_hierarchy.representation
+                if folder:
+                    kwargs["folder_id"] = folder["id"]
+                    kwargs["folder_path"] = folder["path"]
+                if product:
+                    group = product["attrib"]["productGroup"]
+                    kwargs["product_id"] = product["id"]
+                    kwargs["product_name"] = product["name"]
+                    kwargs["product_type"] = product["productType"]
+                    kwargs["product_group"] = group
+                if version:
+                    kwargs["version_id"] = version["id"]
+                if repre:
+                    kwargs["representation_name"] = repre["name"]
+
+                repre_info = RepresentationInfo(**kwargs)
+                self._repre_info_by_id[repre_id] = repre_info
+                output[repre_id] = repre_info
             return output
 
-        project_name = self._controller.get_current_project_name()
-        repre_hierarchy_by_id = get_representations_hierarchy(
-            project_name, missing_repre_ids
-        )
-        for repre_id, repre_hierarchy in repre_hierarchy_by_id.items():
-            kwargs = {
-                "folder_id": None,
-                "folder_path": None,
-                "product_id": None,
-                "product_name": None,
-                "product_type": None,
-                "product_group": None,
-                "version_id": None,
-                "representation_name": None,
-            }
-            folder = repre_hierarchy.folder
-            product = repre_hierarchy.product
-            version = repre_hierarchy.version
-            repre = repre_hierarchy.representation
-            if folder:
-                kwargs["folder_id"] = folder["id"]
-                kwargs["folder_path"] = folder["path"]
-            if product:
-                group = product["attrib"]["productGroup"]
-                kwargs["product_id"] = product["id"]
-                kwargs["product_name"] = product["name"]
-                kwargs["product_type"] = product["productType"]
-                kwargs["product_group"] = group
-            if version:
-                kwargs["version_id"] = version["id"]
-            if repre:
-                kwargs["representation_name"] = repre["name"]
-
-            repre_info = RepresentationInfo(**kwargs)
-            self._repre_info_by_id[repre_id] = repre_info
-            output[repre_id] = repre_info
-        return output
+    def get_container_version_items(self, product_ids, version_ids):
+        """Version items needed to show state of loaded versions.
 
-    def get_version_items(self, product_ids):
+        Only loaded versions, last version, last approved version and hero
+        version of each product are returned. All versions of products
+        are available with 'get_version_items'.
+
+        Args:
+            product_ids (Iterable[str]): Product ids.
+            version_ids (Iterable[str]): Loaded version ids.
+
+        Returns:
+            dict[str, dict[str, VersionItem]]: Version items by version id
+                by product id.
+
+        """
         if not product_ids:
             return {}
 
-        missing_ids = {
-            product_id
-            for product_id in product_ids
-            if product_id not in self._version_items_by_product_id
-        }
-        if missing_ids:
-            status_items_by_name = {
-                status_item.name: status_item
-                for status_item in self._controller.get_project_status_items()
+        with self._lock:
+            product_ids = set(product_ids)
+            version_ids = set(version_ids)
+            missing_product_ids = {
+                product_id
+                for product_id in product_ids
+                if (
+                    product_id not in self._version_items_by_product_id
+                    and product_id not in self._version_states_by_product_id
+                )
             }
+            project_name = self._controller.get_current_project_name()
+            if missing_product_ids:
+                self._query_version_states(project_name, missing_product_ids)
 
-            def version_sorted(entity):
-                return entity["version"]
+            known_version_ids = set(self._version_entities_by_id)
+            for product_id in product_ids:
+                known_version_ids.update(
+                    self._version_items_by_product_id.get(product_id, ())
+                )
+            missing_version_ids = version_ids - known_version_ids
+            if missing_version_ids:
+                for version_id in missing_version_ids:
+                    self._version_entities_by_id[version_id] = None
+                for version_entity in ayon_api.get_versions(
+                    project_name,
+                    version_ids=missing_version_ids,
+                    hero=True,
+                    fields=self.version_fields,
+                ):
+                    self._version_entities_by_id[version_entity["id"]] = (
+                        version_entity
+                    )
 
-            project_name = self._controller.get_current_project_name()
-            version_entities_by_product_id = {
-                product_id: []
-                for product_id in missing_ids
-            }
+            loaded_entities_by_product_id = collections.defaultdict(dict)
+            for version_id in version_ids:
+                version_entity = self._version_entities_by_id.get(version_id)
+                if version_entity is not None:
+                    product_id = version_entity["productId"]
+                    loaded_entities_by_product_id[product_id][version_id] = (
+                        version_entity
+                    )
 
-            version_entities = list(ayon_api.get_versions(
-                project_name,
-                product_ids=missing_ids,
-                fields={"id", "version", "productId", "status"}
-            ))
-            version_entities.sort(key=version_sorted)
-            for version_entity in version_entities:
-                product_id = version_entity["productId"]
-                version_entities_by_product_id[product_id].append(
-                    version_entity
+            output = {}
+            for product_id in product_ids:
+                # Use all versions if were already queried
+                version_items = self._version_items_by_product_id.get(
+                    product_id
                 )
+                if version_items is not None:
+                    output[product_id] = {
+                        version_id: version_item
+                        for version_id, version_item in version_items.items()
+                        if (
+                            version_id in version_ids
+                            or version_item.is_latest
+                            or version_item.is_last_approved
+                            or version_item.is_hero
+                        )
+                    }
+                    continue
+
+                state = self._version_states_by_product_id[product_id]
+                version_entities = dict(state["version_entities"])
+                version_entities.update(
+                    loaded_entities_by_product_id[product_id]
+                )
+                last_version = state["last_version"]
+                output[product_id] = {
+                    version_id: VersionItem.from_entity(
+                        version_entity,
+                        abs(version_entity["version"]) == last_version,
+                        version_id == state["last_approved_id"],
+                    )
+                    for version_id, version_entity in version_entities.items()
+                }
+            return output
 
-            for product_id, version_entities in (
-                version_entities_by_product_id.items()
-            ):
-                last_version = abs(version_entities[-1]["version"])
-                last_approved_id = None
+    def get_version_items(self, product_ids):
+        if not product_ids:
+            return {}
+
+        with self._lock:
+            missing_ids = {
+                product_id
+                for product_id in product_ids
+                if product_id not in self._version_items_by_product_id
+            }
+            if missing_ids:
+                status_items = self._controller.get_project_status_items()
+                status_items_by_name = {
+                    status_item.name: status_item
+                    for status_item in status_items
+                }
+
+                def version_sorted(entity):
+                    return entity["version"]
+
+                project_name = self._controller.get_current_project_name()
+                version_entities_by_product_id = {
+                    product_id: []
+                    for product_id in missing_ids
+                }
+
+                version_entities = list(ayon_api.get_versions(
+                    project_name,
+                    product_ids=missing_ids,
+                    fields=self.version_fields
+                ))
+                version_entities.sort(key=version_sorted)
                 for version_entity in version_entities:
-                    status_item = status_items_by_name.get(
-                        version_entity["status"]
+                    product_id = version_entity["productId"]
+                    version_entities_by_product_id[product_id].append(
+                        version_entity
                     )
-                    if status_item is None:
-                        continue
-                    if status_item.state == StatusStates.done:
-                        last_approved_id = version_entity["id"]
-
-                version_items_by_id = {
-                    entity["id"]: VersionItem.from_entity(
-                        entity,
-                        abs(entity["version"]) == last_version,
-                        entity["id"] == last_approved_id
+
+                for product_id, version_entities in (
+                    version_entities_by_product_id.items()
+                ):
+                    last_version = abs(version_entities[-1]["version"])
+                    last_approved_id = None
+                    for version_entity in version_entities:
+                        status_item = status_items_by_name.get(
+                            version_entity["status"]
+                        )
+                        if status_item is None:
+                            continue
+                        if status_item.state == StatusStates.done:
+                            last_approved_id = version_entity["id"]
+
+                    version_items_by_id = {
+                        entity["id"]: VersionItem.from_entity(
+                            entity,
+                            abs(entity["version"]) == last_version,
+                            entity["id"] == last_approved_id
+                        )
+                        for entity in version_entities
+                    }
+                    self._version_items_by_product_id[product_id] = (
+                        version_items_by_id
                     )
-                    for entity in version_entities
-                }
-                self._version_items_by_product_id[product_id] = (
-                    version_items_by_id
-                )
 
-        return {
-            product_id: dict(self._version_items_by_product_id[product_id])
+            return {
+                product_id: dict(self._version_items_by_product_id[product_id])
+                for product_id in product_ids
+            }
+
+    def _query_version_states(self, project_name, product_ids):
+        """Query last, last approved and hero versions of products.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (set[str]): Product ids.
+
+        """
+        version_entities_by_product_id = {
+            product_id: {}
             for product_id in product_ids
         }
+        last_version_by_product_id = {}
+        last_versions = ayon_api.get_last_versions(
+            project_name, product_ids, fields=self.version_fields
+        )
+        for product_id, version_entity in last_versions.items():
+            if not version_entity:
+                continue
+            version_entities_by_product_id[product_id][
+                version_entity["id"]
+            ] = version_entity
+            last_version_by_product_id[product_id] = version_entity["version"]
+
+        for version_entity in ayon_api.get_hero_versions(
+            project_name, product_ids=product_ids, fields=self.version_fields
+        ):
+            product_id = version_entity["productId"]
+            version_entities_by_product_id[product_id][
+                version_entity["id"]
+            ] = version_entity
+            # Product has only hero version
+            last_version_by_product_id.setdefault(
+                product_id, abs(version_entity["version"])
+            )
+
+        done_status_names = {
+            status_item.name
+            for status_item in self._controller.get_project_status_items()
+            if status_item.state == StatusStates.done
+        }
+        last_approved_by_product_id = {}
+        if done_status_names:
+            for version_entity in ayon_api.get_versions(
+                project_name,
+                product_ids=product_ids,
+                statuses=done_status_names,
+                fields=self.version_fields,
+            ):
+                product_id = version_entity["productId"]
+                last_approved = last_approved_by_product_id.get(product_id)
+                # Hero version is used only if there is no other approved
+                #   version (hero has negative version)
+                if (
+                    last_approved is None
+                    or last_approved["version"] < version_entity["version"]
+                ):
+                    last_approved_by_product_id[product_id] = version_entity
+
+        for product_id, version_entities in (
+            version_entities_by_product_id.items()
+        ):
+            last_approved = last_approved_by_product_id.get(product_id)
+            last_approved_id = None
+            if last_approved is not None:
+                last_approved_id = last_approved["id"]
+                version_entities[last_approved_id] = last_approved
+
+            self._version_entities_by_id.update(version_entities)
+            self._version_states_by_product_id[product_id] = {
+                "last_version": last_version_by_product_id.get(product_id),
+                "last_approved_id": last_approved_id,
+                "version_entities": version_entities,
+            }
 
     def _update_cache(self):
         if self._items_cache is not None:
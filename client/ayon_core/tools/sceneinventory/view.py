@@ -1,4 +1,5 @@
 import collections
+import contextlib
 import logging
 from functools import partial
 
@@ -84,6 +85,8 @@ class SceneInventoryView(QtWidgets.QTreeView):
         self.setColumnHidden(model.remote_site_col, not sync_enabled)
 
         self.customContextMenuRequested.connect(self._show_right_mouse_menu)
+        model.about_to_fill.connect(self._on_model_about_to_fill)
+        model.refreshed.connect(self._on_model_refresh)
 
         self._model = model
         self._proxy_model = proxy_model
@@ -94,22 +97,35 @@ class SceneInventoryView(QtWidgets.QTreeView):
         self._selected = None
 
         self._controller = controller
+        self._preserve_stack = None
 
     def refresh(self):
-        with preserve_expanded_rows(
+        kwargs = {}
+        # TODO do not touch view's inner attribute
+        if self._hierarchy_view:
+            kwargs["selected"] = self._selected
+        self._model.refresh(**kwargs)
+
+    def _on_model_about_to_fill(self):
+        # Model is filled asynchronously, expanded rows and selection are
+        #   stored right before items are replaced
+        preserve_stack = contextlib.ExitStack()
+        preserve_stack.enter_context(preserve_expanded_rows(
             tree_view=self,
             role=ITEM_UNIQUE_NAME_ROLE
-        ):
-            with preserve_selection(
-                tree_view=self,
-                role=ITEM_UNIQUE_NAME_ROLE,
-                current_index=False
-            ):
-                kwargs = {}
-                # TODO do not touch view's inner attribute
-                if self._hierarchy_view:
-                    kwargs["selected"] = self._selected
-                self._model.refresh(**kwargs)
+        ))
+        preserve_stack.enter_context(preserve_selection(
+            tree_view=self,
+            role=ITEM_UNIQUE_NAME_ROLE,
+            current_index=False
+        ))
+        self._preserve_stack = preserve_stack
+
+    def _on_model_refresh(self):
+        preserve_stack = self._preserve_stack
+        self._preserve_stack = None
+        if preserve_stack is not None:
+            preserve_stack.close()
 
     def set_hierarchy_view(self, enabled):
         self._proxy_model.set_hierarchy_view(enabled)
@@ -227,8 +243,10 @@ class SceneInventoryView(QtWidgets.QTreeView):
             menu.addAction(remove_action)
             return
 
-        version_items_by_product_id = self._controller.get_version_items(
-            product_ids
+        version_items_by_product_id = (
+            self._controller.get_container_version_items(
+                product_ids, version_ids
+            )
         )
         has_outdated = False
         has_loaded_hero_versions = False
@@ -35,6 +35,8 @@ from .lib import (
     get_warning_pixmap,
     set_style_property,
     DynamicQThread,
+    RefreshThread,
+    RefreshWorker,
     qt_app_context,
     get_qt_app,
     get_ayon_qt_app,
@@ -118,6 +120,8 @@ __all__ = (
     "get_warning_pixmap",
     "set_style_property",
     "DynamicQThread",
+    "RefreshThread",
+    "RefreshWorker",
     "qt_app_context",
     "get_qt_app",
     "get_ayon_qt_app",
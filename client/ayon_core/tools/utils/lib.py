@@ -1,5 +1,6 @@
 import os
 import sys
+import uuid
 import contextlib
 import collections
 import traceback
@@ -466,6 +467,96 @@ class RefreshThread(QtCore.QThread):
         self.refresh_finished.emit(self.id)
 
 
+class RefreshWorker(QtCore.QObject):
+    """Run refresh functions in background threads.
+
+    Requests are identified by a key, e.g. name of refreshed model. Only one
+    thread is running for a key at a time. When a request is made while
+    previous request of the same key is still running, the new request
+    waits until the thread finishes and replaces any other waiting request,
+    and result of the superseded thread is dropped. That way rapid changes
+    of selection do not trigger a query for each of them.
+
+    Callback is called in main thread with finished 'RefreshThread'.
+
+    Args:
+        parent (Optional[QtCore.QObject]): Parent object.
+
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._threads_by_key = {}
+        self._pending_by_key = {}
+        self._request_by_thread_id = {}
+        self._canceled_thread_ids = set()
+
+    def request(self, key, callback, func, *args, **kwargs):
+        """Request to run function in background thread.
+
+        Args:
+            key (str): Request key.
+            callback (Callable[[RefreshThread], None]): Called in main
+                thread when the function finished.
+            func (Callable): Function to run in thread.
+            *args: Arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        """
+        thread = self._threads_by_key.get(key)
+        if thread is not None:
+            self._canceled_thread_ids.add(thread.id)
+            self._pending_by_key[key] = (callback, func, args, kwargs)
+            return
+        self._start_thread(key, callback, func, args, kwargs)
+
+    def cancel(self, key):
+        """Cancel running and waiting request of a key.
+
+        The running thread is not stopped, only its result is ignored.
+
+        Args:
+            key (str): Request key.
+
+        """
+        self._pending_by_key.pop(key, None)
+        thread = self._threads_by_key.get(key)
+        if thread is not None:
+            self._canceled_thread_ids.add(thread.id)
+
+    def is_running(self, key):
+        """Request of a key is being processed.
+
+        Args:
+            key (str): Request key.
+
+        Returns:
+            bool: Thread of the key is running or request is waiting.
+
+        """
+        return key in self._threads_by_key
+
+    def _start_thread(self, key, callback, func, args, kwargs):
+        thread_id = uuid.uuid4().hex
+        thread = RefreshThread(thread_id, func, *args, **kwargs)
+        self._threads_by_key[key] = thread
+        self._request_by_thread_id[thread_id] = (key, callback)
+        thread.refresh_finished.connect(self._on_thread_finish)
+        thread.start()
+
+    def _on_thread_finish(self, thread_id):
+        key, callback = self._request_by_thread_id.pop(thread_id)
+        thread = self._threads_by_key.pop(key)
+        canceled = thread_id in self._canceled_thread_ids
+        self._canceled_thread_ids.discard(thread_id)
+
+        pending = self._pending_by_key.pop(key, None)
+        if pending is not None:
+            self._start_thread(key, *pending)
+
+        if not canceled:
+            callback(thread)
+
+
 class _IconsCache:
     """Cache for icons."""
 
@@ -5,7 +5,7 @@ from ayon_core.style import (
     get_default_entity_icon_color,
     get_disabled_entity_icon_color,
 )
-from ayon_core.tools.utils import TreeView
+from ayon_core.tools.utils import TreeView, RefreshWorker
 from ayon_core.tools.utils.delegates import PrettyTimeDelegate
 
 from .utils import BaseOverlayFrame
@@ -23,6 +23,7 @@ class PublishedFilesModel(QtGui.QStandardItemModel):
         controller (AbstractWorkfilesFrontend): The control object.
     """
 
+    refreshed = QtCore.Signal()
     columns = [
         "Name",
         "Author",
@@ -63,6 +64,8 @@ class PublishedFilesModel(QtGui.QStandardItemModel):
         self._last_folder_id = None
         self._last_task_id = None
 
+        self._refresh_worker = RefreshWorker(self)
+
         self._add_empty_item()
 
     def set_published_mode(self, published_mode):
@@ -91,6 +94,16 @@ class PublishedFilesModel(QtGui.QStandardItemModel):
         if self._published_mode:
             self._fill_items()
 
+    def is_refreshing(self):
+        """Published files are being queried.
+
+        Returns:
+            bool: Refresh is in progress, 'refreshed' signal will be emitted
+                when it is done.
+
+        """
+        return self._refresh_worker.is_running("refresh")
+
     def _clear_items(self):
         self._remove_missing_context_item()
         self._remove_empty_item()
@@ -178,12 +191,39 @@ class PublishedFilesModel(QtGui.QStandardItemModel):
         folder_id = self._last_folder_id
         task_id = self._last_task_id
         if not folder_id:
+            self._refresh_worker.cancel("refresh")
             self._add_missing_context_item()
+            self.refreshed.emit()
             return
 
+        self._refresh_worker.request(
+            "refresh",
+            self._on_refresh_finished,
+            self._get_refresh_data,
+            folder_id,
+            task_id,
+        )
+
+    def _get_refresh_data(self, folder_id, task_id):
         file_items = self._controller.get_published_file_items(
             folder_id, task_id
         )
+        user_items_by_name = {}
+        if file_items:
+            user_items_by_name = self._controller.get_user_items_by_name()
+        return file_items, user_items_by_name
+
+    def _on_refresh_finished(self, thread):
+        file_items = []
+        user_items_by_name = {}
+        if not thread.failed:
+            file_items, user_items_by_name = thread.get_result()
+        try:
+            self._fill_items_impl(file_items, user_items_by_name)
+        finally:
+            self.refreshed.emit()
+
+    def _fill_items_impl(self, file_items, user_items_by_name):
         root_item = self.invisibleRootItem()
         if not file_items:
             self._add_empty_item()
@@ -191,8 +231,6 @@ class PublishedFilesModel(QtGui.QStandardItemModel):
         self._remove_empty_item()
         self._remove_missing_context_item()
 
-        user_items_by_name = self._controller.get_user_items_by_name()
-
         items_to_remove = set(self._items_by_id.keys())
         new_items = []
         for file_item in file_items:
@@ -334,6 +372,7 @@ class PublishedFilesWidget(QtWidgets.QWidget):
         selection_model = view.selectionModel()
         selection_model.selectionChanged.connect(self._on_selection_change)
         view.double_clicked.connect(self._on_mouse_double_click)
+        model.refreshed.connect(self._on_model_refresh)
 
         controller.register_event_callback(
             "expected_selection_changed",
@@ -347,6 +386,8 @@ class PublishedFilesWidget(QtWidgets.QWidget):
         self._time_delegate = time_delegate
         self._controller = controller
 
+        self._expected_selection_event = None
+
     def set_published_mode(self, published_mode):
         self._model.set_published_mode(published_mode)
 
@@ -386,9 +427,22 @@ class PublishedFilesWidget(QtWidgets.QWidget):
         if not repre_info["current"]:
             return
 
+        # Selection is changed when published files are refreshed
+        self._expected_selection_event = event
         self._model.refresh()
+        if not self._model.is_refreshing():
+            self._apply_expected_selection()
+
+    def _on_model_refresh(self):
+        self._apply_expected_selection()
+
+    def _apply_expected_selection(self):
+        event = self._expected_selection_event
+        if event is None:
+            return
+        self._expected_selection_event = None
 
-        representation_id = repre_info["id"]
+        representation_id = event["representation"]["id"]
         selected_repre_id = self.get_selected_repre_id()
         if (
             representation_id is not None
@@ -862,6 +862,19 @@ class CleanUpModel(BaseSettingsModel):
     remove_temp_renders: bool = SettingsField(
         False, title="Remove Temp renders"
     )
+    defer_cleanup: bool = SettingsField(
+        False,
+        title="Defer cleanup",
+        description=(
+            "Remove files only after whole publishing finished successfully."
+        )
+    )
+    max_workers: int = SettingsField(
+        8,
+        title="Max workers",
+        ge=1,
+        description="Number of threads used to remove files."
+    )
 
 
 class CleanUpFarmModel(BaseSettingsModel):
@@ -1290,7 +1303,9 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "CleanUp": {
         "paterns": [],  # codespell:ignore paterns
-        "remove_temp_renders": False
+        "remove_temp_renders": False,
+        "defer_cleanup": False,
+        "max_workers": 8
     },
     "CleanUpFarm": {
         "enabled": False
@@ -0,0 +1,148 @@
+import pytest
+
+from ayon_core.lib import cache as cache_module
+from ayon_core.lib.cache import NestedCacheItem, get_caches_usage
+
+
+class FakeTime:
+    def __init__(self):
+        self.value = 1000.0
+
+    def __call__(self):
+        return self.value
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(cache_module.time, "time", fake)
+    return fake
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = NestedCacheItem(levels=1, max_entries=3)
+    for key in ("a", "b", "c"):
+        cache[key] = key
+
+    # Use "a" so "b" becomes the least recently used item
+    assert cache["a"].get_data() == "a"
+    cache["d"] = "d"
+
+    assert cache.cached_count() == 3
+    assert set(cache._data_by_key) == {"a", "c", "d"}
+
+    cache["e"] = "e"
+    assert set(cache._data_by_key) == {"a", "d", "e"}
+    assert cache.get_usage()["evictions"] == 2
+
+
+def test_max_entries_across_nested_levels():
+    cache = NestedCacheItem(levels=2, max_entries=2)
+    cache["x"]["a"] = 1
+    cache["y"]["b"] = 2
+    cache["x"]["c"] = 3
+
+    assert set(cache._data_by_key) == {"x", "y"}
+    assert set(cache._data_by_key["x"]._data_by_key) == {"c"}
+
+    cache["z"]["d"] = 4
+    # Evicted item was the only child of "y" so the nested item is removed
+    assert set(cache._data_by_key) == {"x", "z"}
+    assert cache.get_usage()["entries"] == 2
+
+
+def test_expired_items_evicted_on_access(fake_time):
+    cache = NestedCacheItem(levels=1, lifetime=10)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    fake_time.value += 5
+    cache["c"] = 3
+
+    fake_time.value += 6
+    # "a" and "b" are expired, "c" is still valid
+    assert cache["c"].is_valid
+
+    assert set(cache._data_by_key) == {"c"}
+    assert cache.get_usage()["evictions"] == 2
+
+
+def test_items_without_data_are_not_evicted_as_expired(fake_time):
+    cache = NestedCacheItem(levels=1, lifetime=10)
+    # Item is created but data were not set yet
+    assert not cache["a"].is_valid
+
+    fake_time.value += 20
+    cache["b"] = 2
+
+    assert set(cache._data_by_key) == {"a", "b"}
+    assert cache.get_usage()["evictions"] == 0
+
+
+def test_reset_and_clear_key_accounting():
+    cache = NestedCacheItem(levels=2, max_entries=3)
+    cache["x"]["a"] = 1
+    cache["x"]["b"] = 2
+    cache["y"]["c"] = 3
+
+    cache["x"].clear_key("a")
+    assert cache.get_usage()["entries"] == 2
+
+    # Missing key does not change anything
+    cache["x"].clear_key("missing")
+    assert cache.get_usage()["entries"] == 2
+
+    cache["y"].reset()
+    assert cache.get_usage()["entries"] == 1
+
+    # Removed items are not counted so there is space for new items
+    cache["z"]["d"] = 4
+    cache["z"]["e"] = 5
+    usage = cache.get_usage()
+    assert usage["entries"] == 3
+    assert usage["evictions"] == 0
+
+    cache.reset()
+    usage = cache.get_usage()
+    assert usage["entries"] == 0
+    assert usage["evictions"] == 0
+    assert cache.cached_count() == 0
+
+
+def test_get_usage_counters(fake_time):
+    cache = NestedCacheItem(
+        levels=1, lifetime=10, max_entries=5, name="test_usage"
+    )
+    assert not cache["a"].is_valid
+    cache["a"] = 1
+    assert cache["a"].is_valid
+    assert cache["a"].is_valid
+
+    fake_time.value += 10
+    assert not cache["a"].is_valid
+    # 'is_expired' is not counted to statistics
+    assert cache["a"].is_expired
+
+    usage = cache.get_usage()
+    assert usage["name"] == "test_usage"
+    assert usage["entries"] == 1
+    assert usage["hits"] == 2
+    assert usage["misses"] == 2
+    assert usage["evictions"] == 0
+    assert usage["max_entries"] == 5
+    assert usage["max_bytes"] is None
+    assert usage["bytes"] > 0
+
+    assert usage in get_caches_usage()
+
+
+def test_max_bytes_evicts_oldest():
+    cache = NestedCacheItem(levels=1, max_bytes=10000)
+    cache["a"] = "a" * 4000
+    cache["b"] = "b" * 4000
+    cache["c"] = "c" * 4000
+
+    assert set(cache._data_by_key) == {"b", "c"}
+    usage = cache.get_usage()
+    assert usage["bytes"] <= 10000
+    assert usage["evictions"] == 1
@@ -0,0 +1,118 @@
+import copy
+import json
+
+import pytest
+
+from ayon_core.lib.frozen import FrozenDict, FrozenList, freeze, unfreeze
+
+
+def _create_data():
+    return {
+        "core": {
+            "tools": ["a", "b"],
+            "profiles": [{"name": "profile", "hosts": ["maya"]}],
+        },
+        "enabled": True,
+    }
+
+
+def test_nested_values_are_frozen_lazily():
+    data = _create_data()
+    frozen = freeze(data)
+    assert isinstance(frozen, FrozenDict)
+    # Data are wrapped, not copied
+    assert frozen._data is data
+
+    core = frozen["core"]
+    assert isinstance(core, FrozenDict)
+    assert core._data is data["core"]
+    assert isinstance(core["tools"], FrozenList)
+    assert isinstance(core["profiles"][0], FrozenDict)
+    assert isinstance(core["tools"][0:1], FrozenList)
+    assert frozen["enabled"] is True
+
+    # Frozen value is not wrapped again
+    assert freeze(frozen) is frozen
+    assert freeze("value") == "value"
+
+
+def test_mutation_raises_errors():
+    frozen = freeze(_create_data())
+    with pytest.raises(TypeError):
+        frozen["enabled"] = False
+    with pytest.raises(TypeError):
+        del frozen["core"]
+    with pytest.raises(TypeError):
+        frozen["core"]["tools"][0] = "c"
+    with pytest.raises(AttributeError):
+        frozen["core"]["tools"].append("c")
+    with pytest.raises(AttributeError):
+        frozen["core"].update({"tools": []})
+    with pytest.raises(AttributeError):
+        frozen["core"]["profiles"][0].pop("name")
+    assert frozen == _create_data()
+
+
+def test_read_access_matches_data():
+    data = _create_data()
+    frozen = freeze(data)
+    assert frozen == data
+    assert frozen["core"]["tools"] == ["a", "b"]
+    assert list(frozen) == list(data)
+    assert len(frozen) == len(data)
+    assert "core" in frozen
+    assert "b" in frozen["core"]["tools"]
+    assert frozen.get("missing") is None
+    assert dict(frozen["core"]["profiles"][0]) == {
+        "name": "profile", "hosts": ["maya"]
+    }
+
+
+def test_mutable_copy():
+    data = _create_data()
+    frozen = freeze(data)
+
+    mutable = frozen.mutable_copy()
+    assert type(mutable) is dict
+    assert mutable == data
+    mutable["core"]["tools"].append("c")
+    assert data["core"]["tools"] == ["a", "b"]
+
+    tools = frozen["core"]["tools"].mutable_copy()
+    assert type(tools) is list
+    tools.append("c")
+    assert data["core"]["tools"] == ["a", "b"]
+
+    unfrozen = unfreeze(frozen["core"])
+    assert type(unfrozen) is dict
+    unfrozen["tools"].append("c")
+    assert data["core"]["tools"] == ["a", "b"]
+
+
+def test_copy_and_deepcopy():
+    data = _create_data()
+    frozen = freeze(data)
+    # Shallow copy of read-only view can be the view itself
+    assert copy.copy(frozen) is frozen
+
+    # Deep copy is mutable
+    copied = copy.deepcopy(frozen)
+    assert type(copied) is dict
+    copied["core"]["tools"].append("c")
+    assert data["core"]["tools"] == ["a", "b"]
+
+    copied_list = copy.deepcopy(frozen["core"]["tools"])
+    assert type(copied_list) is list
+
+    # Frozen values inside of other data are copied too
+    copied = copy.deepcopy({"settings": frozen})
+    assert type(copied["settings"]) is dict
+
+
+def test_frozen_is_not_json_serializable():
+    frozen = freeze(_create_data())
+    assert not isinstance(frozen, dict)
+    assert not isinstance(frozen["core"]["tools"], list)
+    with pytest.raises(TypeError):
+        json.dumps(frozen)
+    assert json.loads(json.dumps(frozen.mutable_copy())) == _create_data()
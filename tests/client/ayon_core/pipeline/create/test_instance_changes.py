@@ -0,0 +1,168 @@
+from ayon_core.lib.attribute_definitions import BoolDef, NumberDef
+from ayon_core.pipeline.create import CreatedInstance
+from ayon_core.pipeline.create.changes import TrackChangesItem
+
+
+class ValidateSomething:
+    """Publish plugin with attribute definitions."""
+    @classmethod
+    def convert_attribute_values(cls, data):
+        return None
+
+    @classmethod
+    def get_attribute_defs(cls):
+        return [BoolDef("optional", default=True)]
+
+
+def _create_instance():
+    instance = CreatedInstance(
+        "model",
+        "modelMain",
+        {
+            "folderPath": "/assets/hero",
+            "task": "modeling",
+            "variant": "Main",
+            "custom": {"nested": {"items": [1, 2]}},
+            "creator_attributes": {"frames": 10},
+            "publish_attributes": {
+                "ValidateSomething": {"optional": True},
+            },
+        },
+        creator_identifier="test.model",
+        creator_attr_defs=[NumberDef("frames", default=1)],
+    )
+    instance.set_publish_plugins([ValidateSomething])
+    return instance
+
+
+def test_new_instance_has_no_changes():
+    instance = _create_instance()
+    instance.mark_as_stored()
+    changes = instance.changes()
+    assert not changes.changed
+    assert changes.changed_keys == set()
+
+
+def test_nested_value_changed_in_place():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    instance["custom"]["nested"]["items"].append(3)
+    changes = instance.changes()
+    assert changes.changed_keys == {"custom"}
+    assert changes["custom"]["nested"]["items"].old_value == [1, 2]
+    assert changes["custom"]["nested"]["items"].new_value == [1, 2, 3]
+
+    # Snapshot of stored data is not affected by further changes
+    instance.mark_as_stored()
+    instance["custom"]["nested"]["items"].append(4)
+    assert instance.changes()["custom"].old_value == {
+        "nested": {"items": [1, 2, 3]}
+    }
+    assert instance.origin_data["custom"] == {
+        "nested": {"items": [1, 2, 3]}
+    }
+
+
+def test_changed_values_are_copies():
+    instance = _create_instance()
+    instance.mark_as_stored()
+    instance["custom"]["nested"]["items"].append(3)
+
+    old_value, new_value = instance.changes().changes["custom"]
+    new_value["nested"]["items"].append(5)
+    old_value["nested"]["items"].append(5)
+    assert instance["custom"] == {"nested": {"items": [1, 2, 3]}}
+    assert instance.origin_data["custom"] == {"nested": {"items": [1, 2]}}
+
+
+def test_pop_key():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    instance.pop("custom")
+    changes = instance.changes()
+    assert changes.changed_keys == {"custom"}
+    assert changes.removed_keys == {"custom"}
+
+    instance.mark_as_stored()
+    assert "custom" not in instance.origin_data
+    assert not instance.changes().changed
+
+
+def test_set_unchanged_value():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    instance["task"] = "modeling"
+    instance["custom"] = {"nested": {"items": [1, 2]}}
+    assert not instance.changes().changed
+
+    instance["task"] = "rigging"
+    instance["task"] = "modeling"
+    assert not instance.changes().changed
+
+
+def test_set_value_after_store():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    instance["task"] = "rigging"
+    changes = instance.changes()
+    assert changes.changed_keys == {"task"}
+    assert changes.changes["task"] == ("modeling", "rigging")
+
+    instance.mark_as_stored()
+    assert not instance.changes().changed
+    assert instance.origin_data["task"] == "rigging"
+
+
+def test_creator_attributes_changes():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    instance.creator_attributes["frames"] = 20
+    changes = instance.changes()
+    assert changes.changed_keys == {"creator_attributes"}
+    assert changes["creator_attributes"].changes == {"frames": (10, 20)}
+
+    instance.mark_as_stored()
+    assert not instance.changes().changed
+    assert instance.origin_data["creator_attributes"] == {"frames": 20}
+
+    # Set same value
+    instance.creator_attributes["frames"] = 20
+    assert not instance.changes().changed
+
+
+def test_publish_attributes_changes():
+    instance = _create_instance()
+    instance.mark_as_stored()
+
+    instance.publish_attributes["ValidateSomething"]["optional"] = False
+    changes = instance.changes()
+    assert changes.changed_keys == {"publish_attributes"}
+    plugin_changes = changes["publish_attributes"]["ValidateSomething"]
+    assert plugin_changes.changes == {"optional": (True, False)}
+
+    instance.mark_as_stored()
+    assert not instance.changes().changed
+    assert instance.origin_data["publish_attributes"] == {
+        "ValidateSomething": {"optional": False}
+    }
+
+
+def test_track_changes_item_copy_values():
+    old_value = {"key": [1]}
+    new_value = {"key": [1, 2]}
+
+    item = TrackChangesItem(old_value, new_value)
+    old_value["key"].append(3)
+    assert item.old_value == {"key": [1]}
+
+    item = TrackChangesItem(old_value, new_value, copy_values=False)
+    assert item.changed
+    # Returned values are still copies
+    item.new_value["key"].append(4)
+    assert new_value == {"key": [1, 2]}
+    assert item["key"].changed
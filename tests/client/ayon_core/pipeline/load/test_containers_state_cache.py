@@ -0,0 +1,162 @@
+import pytest
+
+from ayon_core.pipeline import entities_cache
+from ayon_core.pipeline.load import utils
+from ayon_core.pipeline.entities_cache import ProjectEventsPoller
+
+
+class FakeServer:
+    """Entities and events returned instead of server queries."""
+    def __init__(self):
+        self.version_id_by_repre_id = {"repre_1": "version_1"}
+        self.version_by_id = {
+            "version_1": {"id": "version_1", "productId": "product_1",
+                          "version": 1},
+        }
+        self.last_version_id_by_product_id = {"product_1": "version_1"}
+        self.events = []
+        self.events_error = False
+        self.queries = []
+
+    def get_representations(self, project_name, representation_ids, fields):
+        self.queries.append("representations")
+        for repre_id in representation_ids:
+            version_id = self.version_id_by_repre_id.get(repre_id)
+            if version_id is not None:
+                yield {"id": repre_id, "versionId": version_id}
+
+    def get_versions(self, project_name, version_ids, hero, fields):
+        self.queries.append("versions")
+        for version_id in version_ids:
+            version = self.version_by_id.get(version_id)
+            if version is not None:
+                yield version
+
+    def get_last_versions(self, project_name, product_ids, fields):
+        self.queries.append("last_versions")
+        output = {}
+        for product_id in product_ids:
+            version_id = self.last_version_id_by_product_id.get(product_id)
+            if version_id is not None:
+                output[product_id] = {"id": version_id}
+        return output
+
+    def get_events(self, **kwargs):
+        if self.events_error:
+            raise RuntimeError("Server is not available")
+        return list(self.events)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+    poller = ProjectEventsPoller()
+    # Check events on each access
+    poller.check_interval = 0
+    monkeypatch.setattr(utils, "get_project_events_poller", lambda: poller)
+    for name in (
+        "get_representations",
+        "get_versions",
+        "get_last_versions",
+    ):
+        monkeypatch.setattr(utils.ayon_api, name, getattr(server, name))
+    monkeypatch.setattr(
+        entities_cache.ayon_api, "get_events", server.get_events
+    )
+    return server
+
+
+def _last_version_id(cache):
+    _, _, last_version_id_by_product_id = cache.get_info({"repre_1"})
+    return last_version_id_by_product_id["product_1"]
+
+
+def _add_event(server, topic):
+    server.events.append({
+        "id": "event_{}".format(len(server.events)),
+        "topic": topic,
+        "summary": {},
+    })
+
+
+def test_version_created_after_first_fill(server):
+    cache = utils._ContainersStateCache("project")
+    assert _last_version_id(cache) == "version_1"
+
+    # New version is published before next access
+    server.version_by_id["version_2"] = {
+        "id": "version_2", "productId": "product_1", "version": 2
+    }
+    server.last_version_id_by_product_id["product_1"] = "version_2"
+    _add_event(server, "entity.version.created")
+
+    assert _last_version_id(cache) == "version_2"
+
+
+def test_cached_data_are_used_without_events(server):
+    cache = utils._ContainersStateCache("project")
+    cache.get_info({"repre_1"})
+    cache.get_info({"repre_1"})
+    assert server.queries == [
+        "representations", "versions", "last_versions"
+    ]
+
+
+def test_last_version_topics_requery_only_last_versions(server):
+    cache = utils._ContainersStateCache("project")
+    cache.get_info({"repre_1"})
+    server.queries.clear()
+
+    _add_event(server, "entity.version.active_changed")
+    cache.get_info({"repre_1"})
+    assert server.queries == ["last_versions"]
+
+    # Same event is not processed twice
+    server.queries.clear()
+    cache.get_info({"repre_1"})
+    assert server.queries == []
+
+
+def test_removed_topics_reset_cache(server):
+    cache = utils._ContainersStateCache("project")
+    cache.get_info({"repre_1"})
+    server.queries.clear()
+
+    server.version_id_by_repre_id.pop("repre_1")
+    _add_event(server, "entity.representation.deleted")
+    version_id_by_repre_id, _, _ = cache.get_info({"repre_1"})
+
+    assert version_id_by_repre_id == {"repre_1": None}
+    assert server.queries == ["representations"]
+
+
+def test_unrelated_topics_keep_cache(server):
+    cache = utils._ContainersStateCache("project")
+    cache.get_info({"repre_1"})
+    server.queries.clear()
+
+    _add_event(server, "entity.folder.name_changed")
+    cache.get_info({"repre_1"})
+    assert server.queries == []
+
+
+def test_failed_events_reset_cache(server):
+    cache = utils._ContainersStateCache("project")
+    cache.get_info({"repre_1"})
+    server.queries.clear()
+
+    server.events_error = True
+    cache.get_info({"repre_1"})
+    assert server.queries == [
+        "representations", "versions", "last_versions"
+    ]
+
+
+def test_events_of_other_project_are_ignored(server):
+    cache = utils._ContainersStateCache("project")
+    cache.get_info({"repre_1"})
+    server.queries.clear()
+
+    cache._on_project_events("other_project", None)
+    cache.get_info({"repre_1"})
+    assert server.queries == []
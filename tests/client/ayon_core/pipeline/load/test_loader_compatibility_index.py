@@ -0,0 +1,134 @@
+import itertools
+
+from ayon_core.pipeline.load import (
+    LoaderPlugin,
+    LoaderCompatibilityIndex,
+)
+
+
+class DefaultLoader(LoaderPlugin):
+    product_types = {"model", "pointcache"}
+    representations = {"abc"}
+    extensions = {"abc"}
+
+
+class WildcardLoader(LoaderPlugin):
+    product_types = {"*"}
+    representations = {"*"}
+    extensions = {"*"}
+
+
+class NoProductTypesLoader(LoaderPlugin):
+    product_types = set()
+    representations = {"*"}
+    extensions = {"*"}
+
+
+class ClassMethodLoader(LoaderPlugin):
+    product_types = {"*"}
+    representations = {"*"}
+    extensions = {"*"}
+
+    @classmethod
+    def is_compatible_loader(cls, context):
+        return context["representation"]["name"] == "ma"
+
+
+class StaticMethodLoader(LoaderPlugin):
+    product_types = {"*"}
+    representations = {"*"}
+    extensions = {"*"}
+
+    @staticmethod
+    def is_compatible_loader(context):
+        return context["product"]["productType"] == "render"
+
+
+class StaticExtensionLoader(LoaderPlugin):
+    product_types = {"render"}
+    representations = {"exr", "ma"}
+    extensions = {"exr"}
+
+    @staticmethod
+    def has_valid_extension(repre_entity):
+        return repre_entity["name"] == "exr"
+
+
+class InheritedLoader(StaticMethodLoader):
+    pass
+
+
+LOADERS = [
+    DefaultLoader,
+    WildcardLoader,
+    NoProductTypesLoader,
+    ClassMethodLoader,
+    StaticMethodLoader,
+    StaticExtensionLoader,
+    InheritedLoader,
+]
+
+
+def _create_context(repre_name, product_type, ext):
+    return {
+        "product": {"productType": product_type},
+        "representation": {
+            "name": repre_name,
+            "context": {"ext": ext},
+        },
+    }
+
+
+def _get_contexts():
+    return [
+        _create_context(repre_name, product_type, ext)
+        for repre_name, product_type, ext in itertools.product(
+            ("abc", "ma", "exr"),
+            ("model", "pointcache", "render"),
+            ("abc", "ABC", "ma", "exr"),
+        )
+    ]
+
+
+def test_custom_loaders_are_detected():
+    index = LoaderCompatibilityIndex(LOADERS)
+    assert index._custom_loaders == [
+        ClassMethodLoader,
+        StaticMethodLoader,
+        StaticExtensionLoader,
+        InheritedLoader,
+    ]
+
+
+def test_compatible_loaders_match_is_compatible_loader():
+    index = LoaderCompatibilityIndex(LOADERS)
+    for context in _get_contexts():
+        expected = [
+            loader
+            for loader in LOADERS
+            if loader.is_compatible_loader(context)
+        ]
+        assert index.get_compatible_loaders(context) == expected
+
+
+def test_filter_repre_contexts():
+    index = LoaderCompatibilityIndex(LOADERS)
+    contexts = _get_contexts()
+    expected = {}
+    for loader in LOADERS:
+        loader_contexts = [
+            context
+            for context in contexts
+            if loader.is_compatible_loader(context)
+        ]
+        if loader_contexts:
+            expected[loader] = loader_contexts
+
+    result = index.filter_repre_contexts(contexts)
+    assert list(result) == list(expected)
+    assert result == expected
+
+
+def test_context_without_representation():
+    index = LoaderCompatibilityIndex(LOADERS)
+    assert index.get_compatible_loaders({"product": {}}) == []
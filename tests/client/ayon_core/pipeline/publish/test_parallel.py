@@ -0,0 +1,107 @@
+import threading
+
+import pyblish.api
+
+from ayon_core.lib.profiling import resource
+from ayon_core.pipeline.publish.parallel import publish_iter_parallel
+
+
+def _create_context(names):
+    context = pyblish.api.Context()
+    for name in names:
+        context.create_instance(name, family="test")
+    return context
+
+
+def _messages(result):
+    return [record.getMessage() for record in result["records"]]
+
+
+def test_parallel_records_are_separated():
+    # Both instances are processed at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    class ProcessInstances(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+        families = ["test"]
+        parallel_safe = True
+
+        def process(self, instance):
+            self.log.info("start {}".format(instance.name))
+            barrier.wait()
+            self.log.info("end {}".format(instance.name))
+
+    context = _create_context(["a", "b"])
+    results = list(publish_iter_parallel(
+        context, plugins=[ProcessInstances], max_workers=2
+    ))
+
+    assert [result["instance"].name for result in results] == ["a", "b"]
+    for result in results:
+        name = result["instance"].name
+        assert result["error"] is None
+        assert _messages(result) == [
+            "start {}".format(name),
+            "end {}".format(name),
+        ]
+
+
+def test_parallel_error_record_is_removed():
+    class FailInstance(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+        families = ["test"]
+        parallel_safe = True
+
+        def process(self, instance):
+            self.log.info("validate {}".format(instance.name))
+            if instance.name == "b":
+                raise ValueError("Invalid instance")
+
+    context = _create_context(["a", "b"])
+    results = list(publish_iter_parallel(
+        context, plugins=[FailInstance], max_workers=2
+    ))
+
+    result_a, result_b = results
+    assert result_a["error"] is None
+    assert isinstance(result_b["error"], ValueError)
+    assert _messages(result_a) == ["validate a"]
+    assert _messages(result_b) == ["validate b"]
+
+
+class ProfiledPlugin(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    families = ["test"]
+    parallel_safe = True
+
+    def process(self, instance):
+        self.log.info("process {}".format(instance.name))
+
+
+def test_parallel_profile_skips_process_counters():
+    context = _create_context(["a", "b"])
+    results = list(publish_iter_parallel(
+        context, plugins=[ProfiledPlugin], max_workers=2, profile=True
+    ))
+
+    for result in results:
+        profile = result["profile"]
+        assert profile["wall_time"] >= 0
+        assert profile["cpu_time"] >= 0
+        # Process-wide values would contain work of other instances
+        assert profile["peak_rss_delta"] is None
+        assert profile["bytes_read"] is None
+        assert profile["children_cpu_time"] is None
+
+
+def test_single_worker_profile_has_process_counters():
+    context = _create_context(["a", "b"])
+    results = list(publish_iter_parallel(
+        context, plugins=[ProfiledPlugin], max_workers=1, profile=True
+    ))
+
+    for result in results:
+        profile = result["profile"]
+        assert profile["wall_time"] >= 0
+        if resource is not None:
+            assert profile["peak_rss_delta"] is not None
@@ -0,0 +1,142 @@
+import json
+import logging
+
+import pytest
+import pyblish.api
+
+from ayon_core.pipeline.publish.report_file import (
+    PublishReportFileWriter,
+    PublishReportLogsReader,
+    PublishReportFileMaker,
+    read_publish_report_file,
+)
+
+
+def _log_items(prefix, count, error=False):
+    output = [
+        {"type": "record", "msg": "{} {}".format(prefix, idx)}
+        for idx in range(count)
+    ]
+    if error:
+        output.append({"type": "error", "msg": "{} error".format(prefix)})
+    return output
+
+
+def test_writer_offsets_are_readable(tmp_path):
+    filepath = str(tmp_path / "report.jsonl")
+    with PublishReportFileWriter(filepath) as writer:
+        first = writer.add_logs("plugin_a", "instance_a", _log_items("a", 2))
+        empty = writer.add_logs("plugin_a", "instance_b", [])
+        second = writer.add_logs(
+            "plugin_b", None, _log_items("b", 1, error=True)
+        )
+        writer.write_report({"plugins_data": []})
+
+    assert first == {"offset": 0, "count": 2, "errored": False}
+    assert empty == {"offset": None, "count": 0, "errored": False}
+    assert second["offset"] > first["offset"]
+    assert second["count"] == 2
+    assert second["errored"]
+
+    reader = PublishReportLogsReader(filepath)
+    assert reader.read_logs(first["offset"]) == _log_items("a", 2)
+    assert reader.read_logs(empty["offset"]) == []
+    assert reader.read_logs(second["offset"]) == _log_items(
+        "b", 1, error=True
+    )
+
+
+def test_read_report_from_last_line(tmp_path):
+    filepath = str(tmp_path / "report.jsonl")
+    report_data = {"plugins_data": [], "label": "Report"}
+    with PublishReportFileWriter(filepath) as writer:
+        # Log line bigger than read block size
+        writer.add_logs("plugin", None, _log_items("x" * 1000, 100))
+        writer.write_report(report_data)
+
+    assert read_publish_report_file(filepath) == report_data
+
+
+def test_read_report_of_killed_publish(tmp_path):
+    filepath = str(tmp_path / "killed.jsonl")
+    writer = PublishReportFileWriter(filepath)
+    first = writer.add_logs("plugin_a", "instance_a", _log_items("a", 2))
+    second = writer.add_logs("plugin_a", "instance_b", _log_items("b", 1))
+    third = writer.add_logs(
+        "plugin_b", None, _log_items("c", 0, error=True)
+    )
+    writer.close()
+    # Last line was written only partially
+    with open(filepath, "ab") as stream:
+        stream.write(b'{"type": "logs", "plugin_id": "plu')
+
+    report_data = read_publish_report_file(filepath)
+
+    plugins_data = report_data["plugins_data"]
+    assert [plugin_data["id"] for plugin_data in plugins_data] == [
+        "plugin_a", "plugin_b"
+    ]
+    assert plugins_data[0]["passed"]
+    assert not plugins_data[1]["passed"]
+    assert [
+        instance_data["logs_index"]
+        for instance_data in plugins_data[0]["instances_data"]
+    ] == [first, second]
+    assert plugins_data[1]["instances_data"][0]["logs_index"] == third
+    assert set(report_data["instances"]) == {"instance_a", "instance_b"}
+    assert report_data["crashed_file_paths"] == {}
+    assert report_data["created_at"]
+
+
+def test_read_file_without_report(tmp_path):
+    filepath = tmp_path / "empty.jsonl"
+    filepath.write_bytes(b"")
+    with pytest.raises(ValueError):
+        read_publish_report_file(str(filepath))
+
+    filepath.write_bytes(json.dumps({"type": "other"}).encode("utf-8"))
+    with pytest.raises(ValueError):
+        read_publish_report_file(str(filepath))
+
+
+def test_report_file_maker(tmp_path):
+    class CollectSomething(pyblish.api.InstancePlugin):
+        """Collect something."""
+        order = pyblish.api.CollectorOrder
+        label = "Collect Something"
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("instance", productType="model")
+    record = logging.LogRecord(
+        "collector", logging.INFO, "collect.py", 10, "Found %s", ("x", ),
+        None
+    )
+    filepath = str(tmp_path / "maker.jsonl")
+    maker = PublishReportFileMaker(filepath)
+    maker.add_result({
+        "plugin": CollectSomething,
+        "instance": instance,
+        "error": None,
+        "records": [record],
+        "duration": 0.5,
+    })
+    maker.finish(context, label="Farm publish")
+
+    report_data = read_publish_report_file(filepath)
+    assert report_data["label"] == "Farm publish"
+    assert report_data["instances"][instance.id]["product_type"] == "model"
+
+    plugin_data, = report_data["plugins_data"]
+    assert plugin_data["label"] == "Collect Something"
+    assert plugin_data["docstring"] == "Collect something."
+    instance_data, = plugin_data["instances_data"]
+    assert instance_data["id"] == instance.id
+    assert instance_data["process_time"] == 0.5
+
+    logs_index = instance_data["logs_index"]
+    assert logs_index["count"] == 1
+    log_item, = PublishReportLogsReader(filepath).read_logs(
+        logs_index["offset"]
+    )
+    assert log_item["msg"] == "Found x"
+    assert log_item["levelname"] == "INFO"
@@ -0,0 +1,150 @@
+import pytest
+
+from ayon_core.pipeline import entities_cache
+from ayon_core.pipeline import hierarchy_index
+from ayon_core.pipeline.entities_cache import ProjectEventsPoller
+
+
+class FakeServer:
+    """Hierarchy and events returned instead of server queries."""
+    def __init__(self):
+        self.folders = {
+            "folder_1": {"name": "hero", "parents": ["assets"]},
+            "folder_2": {"name": "assets", "parents": []},
+        }
+        self.task_names_by_folder_id = {
+            "folder_1": {"modeling"},
+            "folder_2": set(),
+        }
+        self.events = []
+        self.hierarchy_queries = 0
+
+    def _get_path(self, folder):
+        return "/" + "/".join(folder["parents"] + [folder["name"]])
+
+    def get_folders_hierarchy(self, project_name):
+        self.hierarchy_queries += 1
+        items = [
+            {
+                "id": folder_id,
+                "name": folder["name"],
+                "parents": folder["parents"],
+                "taskNames": sorted(self.task_names_by_folder_id[folder_id]),
+                "children": [],
+            }
+            for folder_id, folder in self.folders.items()
+        ]
+        return {"hierarchy": items}
+
+    def get_folders(self, project_name, folder_paths, fields):
+        for folder_id, folder in self.folders.items():
+            path = self._get_path(folder)
+            if path in folder_paths:
+                yield {"id": folder_id, "name": folder["name"], "path": path}
+
+    def get_tasks(self, project_name, folder_ids=None, fields=None):
+        for folder_id, task_names in self.task_names_by_folder_id.items():
+            if folder_ids is not None and folder_id not in folder_ids:
+                continue
+            for task_name in task_names:
+                yield {"name": task_name, "folderId": folder_id}
+
+    def get_events(self, **kwargs):
+        return list(self.events)
+
+    def add_event(self, topic):
+        self.events.append({
+            "id": "event_{}".format(len(self.events)),
+            "topic": topic,
+            "summary": {},
+        })
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+    poller = ProjectEventsPoller()
+    # Check events on each access
+    poller.check_interval = 0
+    monkeypatch.setattr(
+        hierarchy_index, "get_project_events_poller", lambda: poller
+    )
+    for name in (
+        "get_folders_hierarchy",
+        "get_folders",
+        "get_tasks",
+    ):
+        monkeypatch.setattr(
+            hierarchy_index.ayon_api, name, getattr(server, name)
+        )
+    monkeypatch.setattr(
+        entities_cache.ayon_api, "get_events", server.get_events
+    )
+    return server
+
+
+def test_index_is_loaded_once(server):
+    index = hierarchy_index.ProjectHierarchyIndex("project")
+    assert index.get_folder_id("/assets/hero") == "folder_1"
+    assert index.task_exists("/assets/hero", "modeling")
+    assert index.get_folder_paths_by_name("hero") == {"/assets/hero"}
+    assert server.hierarchy_queries == 1
+
+
+def test_renamed_folder_invalidates_index(server):
+    index = hierarchy_index.ProjectHierarchyIndex("project")
+    assert index.get_folder_id("/assets/hero") == "folder_1"
+
+    server.folders["folder_1"]["name"] = "villain"
+    server.add_event("entity.folder.name_changed")
+
+    assert index.get_folder_id("/assets/hero") is None
+    assert index.get_folder_id("/assets/villain") == "folder_1"
+    assert server.hierarchy_queries == 2
+
+
+def test_deleted_task_invalidates_index(server):
+    index = hierarchy_index.ProjectHierarchyIndex("project")
+    assert index.task_exists("/assets/hero", "modeling")
+
+    server.task_names_by_folder_id["folder_1"].discard("modeling")
+    server.add_event("entity.task.deleted")
+
+    assert not index.task_exists("/assets/hero", "modeling")
+
+
+def test_created_folder_clears_missing(server):
+    index = hierarchy_index.ProjectHierarchyIndex("project")
+    assert index.get_folder_id("/assets/new") is None
+
+    server.folders["folder_3"] = {"name": "new", "parents": ["assets"]}
+    server.task_names_by_folder_id["folder_3"] = {"layout"}
+    server.add_event("entity.folder.created")
+
+    assert index.get_folder_id("/assets/new") == "folder_3"
+    assert index.task_exists("/assets/new", "layout")
+    # Created folder is queried incrementally
+    assert server.hierarchy_queries == 1
+
+
+def test_unrelated_events_keep_index(server):
+    index = hierarchy_index.ProjectHierarchyIndex("project")
+    index.get_folder_id("/assets/hero")
+
+    server.add_event("entity.folder.attrib_changed")
+    server.add_event("entity.version.created")
+    index.get_folder_id("/assets/hero")
+    assert server.hierarchy_queries == 1
+
+
+def test_failed_events_invalidate_index(server):
+    index = hierarchy_index.ProjectHierarchyIndex("project")
+    index.get_folder_id("/assets/hero")
+
+    index._on_project_events("other_project", None)
+    index.get_folder_id("/assets/hero")
+    assert server.hierarchy_queries == 1
+
+    index._on_project_events("project", None)
+    index.get_folder_id("/assets/hero")
+    assert server.hierarchy_queries == 2
@@ -0,0 +1,223 @@
+import os
+import time
+import threading
+
+import pytest
+
+from ayon_core.pipeline.thumbnails import ThumbnailsCache, ThumbnailsFetcher
+
+
+class BlockingFetcher(ThumbnailsFetcher):
+    """Fetcher with one worker where downloads wait for release."""
+    max_workers = 1
+
+    def __init__(self):
+        super().__init__(None)
+        self.release_event = threading.Event()
+        self.fetched_ids = []
+
+    def _fetch_thumbnail(self, project_name, thumbnail_id):
+        self.release_event.wait(5)
+        self.fetched_ids.append(thumbnail_id)
+        return "{}/{}.png".format(project_name, thumbnail_id)
+
+
+def _collect_callback(received):
+    def _callback(project_name, thumbnail_id, path):
+        received[thumbnail_id] = path
+    return _callback
+
+
+def test_prefetch_cancels_previous_prefetch():
+    fetcher = BlockingFetcher()
+    # First thumbnail blocks the only worker so others are pending
+    fetcher.fetch_thumbnails("project", ["x"])
+    first = fetcher.prefetch_thumbnails("project", ["a", "b"])
+    second = fetcher.prefetch_thumbnails("project", ["a", "c"])
+    fetcher.release_event.set()
+
+    assert first["b"].cancelled()
+    # Thumbnail requested again by prefetch is not cancelled
+    assert first["a"] is second["a"]
+    assert second["a"].result(5) == "project/a.png"
+    assert second["c"].result(5) == "project/c.png"
+    assert "b" not in fetcher.fetched_ids
+
+
+def test_prefetch_does_not_cancel_fetch_request():
+    fetcher = BlockingFetcher()
+    received = {}
+    fetcher.fetch_thumbnails("project", ["x"])
+    fetcher.prefetch_thumbnails("project", ["a", "b"])
+    # UI request receives future created by prefetch
+    futures = fetcher.fetch_thumbnails(
+        "project", ["b"], _collect_callback(received)
+    )
+    fetcher.prefetch_thumbnails("project", ["c"])
+    fetcher.release_event.set()
+
+    assert futures["b"].result(5) == "project/b.png"
+    assert received == {"b": "project/b.png"}
+
+
+def test_fetch_request_future_is_not_cancelled_by_prefetch():
+    fetcher = BlockingFetcher()
+    received = {}
+    fetcher.fetch_thumbnails("project", ["x"])
+    futures = fetcher.fetch_thumbnails(
+        "project", ["b"], _collect_callback(received)
+    )
+    # Prefetch shares future created by UI request
+    fetcher.prefetch_thumbnails("project", ["b"])
+    fetcher.prefetch_thumbnails("project", ["c"])
+    fetcher.release_event.set()
+
+    assert futures["b"].result(5) == "project/b.png"
+    assert received == {"b": "project/b.png"}
+
+
+@pytest.fixture
+def thumbnails_cache(tmp_path):
+    cache = ThumbnailsCache(cleanup=False)
+    cache._thumbnails_dir = str(tmp_path)
+    return cache
+
+
+def _write_legacy_thumbnail(cache, project_name, thumbnail_id, size=10):
+    project_dir = cache.make_sure_project_dir_exists(project_name)
+    filepath = os.path.join(project_dir, thumbnail_id + ".jpeg")
+    with open(filepath, "wb") as stream:
+        stream.write(b"x" * size)
+    return filepath
+
+
+def _indexed_ids(cache):
+    with cache._index_connection() as connection:
+        return {
+            row[0]
+            for row in connection.execute(
+                "SELECT thumbnail_id FROM thumbnails"
+            )
+        }
+
+
+def _set_last_access(cache, thumbnail_id, last_access):
+    with cache._index_connection() as connection:
+        connection.execute(
+            "UPDATE thumbnails SET last_access = ? WHERE thumbnail_id = ?",
+            (last_access, thumbnail_id)
+        )
+
+
+def test_stored_thumbnail_is_indexed(thumbnails_cache):
+    filepath = thumbnails_cache.store_thumbnail(
+        "project", "thumb_1", b"content", "image/png"
+    )
+    assert filepath.endswith("thumb_1.png")
+    assert _indexed_ids(thumbnails_cache) == {"thumb_1"}
+    assert thumbnails_cache.get_thumbnail_filepath(
+        "project", "thumb_1"
+    ) == filepath
+
+
+def test_removed_file_is_removed_from_index(thumbnails_cache):
+    filepath = thumbnails_cache.store_thumbnail(
+        "project", "thumb_1", b"content", "image/png"
+    )
+    os.remove(filepath)
+    assert thumbnails_cache.get_thumbnail_filepath(
+        "project", "thumb_1"
+    ) is None
+    assert _indexed_ids(thumbnails_cache) == set()
+
+
+def test_legacy_thumbnail_before_sync(thumbnails_cache):
+    filepath = _write_legacy_thumbnail(thumbnails_cache, "project", "old")
+    assert thumbnails_cache.get_thumbnail_filepath(
+        "project", "old"
+    ) == filepath
+    assert _indexed_ids(thumbnails_cache) == {"old"}
+
+
+def test_index_is_source_of_truth_after_sync(thumbnails_cache, monkeypatch):
+    filepath = _write_legacy_thumbnail(thumbnails_cache, "project", "old")
+    thumbnails_cache.cleanup()
+    assert _indexed_ids(thumbnails_cache) == {"old"}
+    assert thumbnails_cache.get_thumbnail_filepath(
+        "project", "old"
+    ) == filepath
+
+    def _find_thumbnail_file(*args, **kwargs):
+        raise AssertionError("Files should not be looked for")
+
+    monkeypatch.setattr(
+        thumbnails_cache, "_find_thumbnail_file", _find_thumbnail_file
+    )
+    # File that is not in index is not found
+    _write_legacy_thumbnail(thumbnails_cache, "project", "unknown")
+    assert thumbnails_cache.get_thumbnail_filepath(
+        "project", "unknown"
+    ) is None
+
+    # Synced state is stored in index
+    other_cache = ThumbnailsCache(cleanup=False)
+    other_cache._thumbnails_dir = thumbnails_cache.thumbnails_dir
+    assert other_cache._is_index_synced()
+
+
+def test_max_size_cleanup_removes_least_recently_used(thumbnails_cache):
+    current_time = time.time()
+    for idx, thumbnail_id in enumerate(("oldest", "older", "newest")):
+        thumbnails_cache.store_thumbnail(
+            "project", thumbnail_id, b"x" * 100, "image/png"
+        )
+        _set_last_access(thumbnails_cache, thumbnail_id, current_time + idx)
+
+    thumbnails_cache.max_filesize = 250
+    thumbnails_cache.cleanup(check_max_size=True)
+
+    assert _indexed_ids(thumbnails_cache) == {"older", "newest"}
+    project_dir = thumbnails_cache.get_project_dir("project")
+    assert sorted(os.listdir(project_dir)) == ["newest.png", "older.png"]
+
+
+def test_cleanup_removes_expired(thumbnails_cache):
+    thumbnails_cache.store_thumbnail(
+        "project", "expired", b"x", "image/png"
+    )
+    thumbnails_cache.store_thumbnail(
+        "project", "valid", b"x", "image/png"
+    )
+    _set_last_access(
+        thumbnails_cache,
+        "expired",
+        time.time() - thumbnails_cache._days_alive_secs - 10
+    )
+    thumbnails_cache.cleanup()
+
+    assert _indexed_ids(thumbnails_cache) == {"valid"}
+    assert thumbnails_cache.get_thumbnail_filepath(
+        "project", "expired"
+    ) is None
+
+
+def test_index_connection_per_thread(thumbnails_cache):
+    thumbnails_cache.store_thumbnail("project", "thumb", b"x", "image/png")
+    with thumbnails_cache._index_connection() as connection:
+        pass
+    with thumbnails_cache._index_connection() as other_connection:
+        pass
+    assert connection is other_connection
+
+    thread_connections = []
+
+    def _get_connection():
+        assert thumbnails_cache.get_thumbnail_filepath("project", "thumb")
+        with thumbnails_cache._index_connection() as thread_connection:
+            thread_connections.append(thread_connection)
+
+    thread = threading.Thread(target=_get_connection)
+    thread.start()
+    thread.join()
+    assert thread_connections
+    assert thread_connections[0] is not connection
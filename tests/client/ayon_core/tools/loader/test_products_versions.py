@@ -0,0 +1,141 @@
+import os
+import types
+
+import pytest
+
+pytest.importorskip("qtpy.QtWidgets")
+
+from qtpy import QtWidgets, QtGui  # noqa: E402
+
+from ayon_core.tools.loader.abstract import VersionItem  # noqa: E402
+from ayon_core.tools.loader.models import products  # noqa: E402
+from ayon_core.tools.loader.ui.products_delegates import (  # noqa: E402
+    VersionDelegate,
+)
+from ayon_core.tools.loader.ui.products_model import (  # noqa: E402
+    PRODUCT_ID_ROLE,
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+def _version_item(product_id, version, status):
+    return VersionItem(
+        version_id="{}_v{}".format(product_id, version),
+        version=version,
+        is_hero=False,
+        product_id=product_id,
+        thumbnail_id=None,
+        published_time=None,
+        author=None,
+        status=status,
+        frame_range=None,
+        duration=None,
+        handles=None,
+        step=None,
+        comment=None,
+        source=None,
+    )
+
+
+def _version_entity(product_id, version, status):
+    return {
+        "id": "{}_v{}".format(product_id, version),
+        "productId": product_id,
+        "version": version,
+        "thumbnailId": None,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "author": None,
+        "status": status,
+        "attrib": {},
+    }
+
+
+def test_filtered_out_editors_request_versions_at_once(app):
+    product_ids = ["product_1", "product_2", "product_3"]
+    model = QtGui.QStandardItemModel()
+    for product_id in product_ids:
+        item = QtGui.QStandardItem(product_id)
+        item.setData(product_id, PRODUCT_ID_ROLE)
+        model.appendRow(item)
+
+    delegate = VersionDelegate()
+    requests = []
+    delegate.versions_requested.connect(requests.append)
+    parent = QtWidgets.QWidget()
+    editors = []
+    for row, product_id in enumerate(product_ids):
+        editor = delegate.createEditor(
+            parent, QtWidgets.QStyleOptionViewItem(), model.index(row, 0)
+        )
+        # Only 'product_1' has loaded version with approved status
+        status = "Approved" if product_id == "product_1" else "WIP"
+        version_item = _version_item(product_id, 2, status)
+        editor.update_versions([version_item], version_item.version_id)
+        editors.append(editor)
+
+    delegate.set_statuses_filter(["Approved"])
+    assert requests == [{"product_2", "product_3"}]
+
+    # Older approved version is loaded for 'product_2'
+    delegate.update_product_versions(
+        "product_2",
+        [
+            _version_item("product_2", 2, "WIP"),
+            _version_item("product_2", 1, "Approved"),
+        ]
+    )
+    assert editors[1].get_current_version_id() == "product_2_v1"
+    assert editors[2].count() == 0
+
+
+def test_products_versions_are_queried_at_once(monkeypatch):
+    version_queries = []
+
+    def _get_versions(project_name, version_ids, fields):
+        version_queries.append(set(version_ids))
+        for version_id in version_ids:
+            product_id, version = version_id.split("_v")
+            yield _version_entity(product_id, int(version), "WIP")
+
+    monkeypatch.setattr(products.ayon_api, "get_versions", _get_versions)
+
+    model = products.ProductsModel(None, None)
+    for product_id in ("product_1", "product_2", "product_3"):
+        version_item = _version_item(product_id, 3, "WIP")
+        model._product_item_by_id["project"][product_id] = (
+            types.SimpleNamespace(
+                version_items={version_item.version_id: version_item},
+                has_more_versions=True,
+            )
+        )
+    model._unloaded_version_ids_by_product_id["project"].update({
+        "product_1": {"product_1_v1", "product_1_v2"},
+        "product_2": {"product_2_v1"},
+    })
+
+    version_items_by_product_id = model.get_products_version_items(
+        "project", ["product_1", "product_2", "product_3"]
+    )
+    assert version_queries == [
+        {"product_1_v1", "product_1_v2", "product_2_v1"}
+    ]
+    assert {
+        product_id: sorted(item.version for item in version_items)
+        for product_id, version_items in version_items_by_product_id.items()
+    } == {
+        "product_1": [1, 2, 3],
+        "product_2": [1, 3],
+        "product_3": [3],
+    }
+
+    # All versions are loaded
+    model.get_products_version_items("project", ["product_1", "product_2"])
+    assert len(version_queries) == 1
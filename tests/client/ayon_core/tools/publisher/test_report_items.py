@@ -0,0 +1,116 @@
+import pytest
+
+pytest.importorskip("qtpy.QtWidgets")
+
+from ayon_core.pipeline.publish.report_file import (  # noqa: E402
+    PublishReportFileWriter,
+    read_publish_report_file,
+)
+from ayon_core.tools.publisher.publish_report_viewer.report_items import (  # noqa: E402, E501
+    PublishReport,
+)
+
+
+def _log_items(prefix, count):
+    return [
+        {"type": "record", "msg": "{} {}".format(prefix, idx)}
+        for idx in range(count)
+    ]
+
+
+def _plugin_data(plugin_id, order, instances_data):
+    return {
+        "id": plugin_id,
+        "name": plugin_id,
+        "label": None,
+        "order": order,
+        "skipped": False,
+        "passed": True,
+        "instances_data": instances_data,
+    }
+
+
+@pytest.fixture
+def report(tmp_path):
+    filepath = str(tmp_path / "report.jsonl")
+    writer = PublishReportFileWriter(filepath)
+    # Chunks with 3, 2 and 4 log items
+    chunks = [
+        ("collect", "instance_a", _log_items("collect a", 3)),
+        ("collect", "instance_b", _log_items("collect b", 2)),
+        ("validate", "instance_a", _log_items("validate a", 4)),
+    ]
+    instances_data_by_plugin = {}
+    for plugin_id, instance_id, log_items in chunks:
+        instances_data_by_plugin.setdefault(plugin_id, []).append({
+            "id": instance_id,
+            "logs": [],
+            "logs_index": writer.add_logs(plugin_id, instance_id, log_items),
+            "process_time": 0.1,
+        })
+    writer.write_report({
+        "plugins_data": [
+            _plugin_data(plugin_id, order, instances_data)
+            for order, (plugin_id, instances_data) in enumerate(
+                instances_data_by_plugin.items()
+            )
+        ],
+        "instances": {
+            "instance_a": {"label": "A"},
+            "instance_b": {"label": "B"},
+        },
+        "context": {"label": None},
+        "crashed_file_paths": {},
+    })
+    return PublishReport(read_publish_report_file(filepath), filepath)
+
+
+def _messages(log_items):
+    return [log_item["msg"] for log_item in log_items]
+
+
+def test_get_logs_all(report):
+    logs, total = report.get_logs()
+    assert total == 9
+    assert len(logs) == 9
+    assert _messages(report.logs) == _messages(logs)
+
+
+def test_get_logs_pages_across_chunks(report):
+    pages = []
+    for start in range(0, 9, 2):
+        logs, total = report.get_logs(start=start, limit=2)
+        assert total == 9
+        pages.append(_messages(logs))
+
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 1]
+    assert pages[1] == ["collect a 2", "collect b 0"]
+    assert pages[2] == ["collect b 1", "validate a 0"]
+    all_logs, _ = report.get_logs()
+    assert sum(pages, []) == _messages(all_logs)
+
+
+def test_get_logs_out_of_range(report):
+    logs, total = report.get_logs(start=20, limit=5)
+    assert logs == []
+    assert total == 9
+
+
+def test_get_logs_filtered(report):
+    logs, total = report.get_logs(
+        instance_filter={"instance_a"}, start=2, limit=3
+    )
+    assert total == 7
+    assert _messages(logs) == [
+        "collect a 2", "validate a 0", "validate a 1"
+    ]
+    assert {log_item.instance_id for log_item in logs} == {"instance_a"}
+
+    plugin_ids = {
+        plugin_id
+        for plugin_id, plugin_item in report.plugins_items_by_id.items()
+        if plugin_item.name == "validate"
+    }
+    logs, total = report.get_logs(plugin_filter=plugin_ids, limit=2)
+    assert total == 4
+    assert _messages(logs) == ["validate a 0", "validate a 1"]
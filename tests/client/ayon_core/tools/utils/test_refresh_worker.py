@@ -0,0 +1,118 @@
+import os
+import time
+import threading
+
+import pytest
+
+pytest.importorskip("qtpy.QtWidgets")
+
+from qtpy import QtWidgets  # noqa: E402
+
+from ayon_core.tools.utils import RefreshWorker  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+def _wait_for(app, condition, timeout=5):
+    end_time = time.time() + timeout
+    while not condition():
+        if time.time() > end_time:
+            raise AssertionError("Condition was not met in time")
+        app.processEvents()
+        time.sleep(0.01)
+
+
+class BlockingFunc:
+    """Function which blocks in thread until it is released."""
+    def __init__(self):
+        self.called_with = []
+        self.release_event = threading.Event()
+
+    def __call__(self, value):
+        self.called_with.append(value)
+        self.release_event.wait(5)
+        return value
+
+
+def test_waiting_requests_are_coalesced(app):
+    worker = RefreshWorker()
+    func = BlockingFunc()
+    results = []
+
+    def _callback(thread):
+        results.append(thread.get_result())
+
+    worker.request("key", _callback, func, 1)
+    _wait_for(app, lambda: func.called_with == [1])
+    # Both requests wait for the running one, only the last is used
+    worker.request("key", _callback, func, 2)
+    worker.request("key", _callback, func, 3)
+    assert worker.is_running("key")
+    func.release_event.set()
+
+    _wait_for(app, lambda: not worker.is_running("key"))
+    # Result of superseded request is dropped
+    assert results == [3]
+    assert func.called_with == [1, 3]
+
+
+def test_keys_are_independent(app):
+    worker = RefreshWorker()
+    func = BlockingFunc()
+    results = []
+
+    def _callback(thread):
+        results.append(thread.get_result())
+
+    worker.request("a", _callback, func, "a")
+    worker.request("b", _callback, func, "b")
+    func.release_event.set()
+
+    _wait_for(
+        app, lambda: not worker.is_running("a") and not worker.is_running("b")
+    )
+    assert sorted(results) == ["a", "b"]
+
+
+def test_cancel_drops_running_and_waiting_request(app):
+    worker = RefreshWorker()
+    func = BlockingFunc()
+    results = []
+
+    def _callback(thread):
+        results.append(thread.get_result())
+
+    worker.request("key", _callback, func, 1)
+    _wait_for(app, lambda: func.called_with == [1])
+    worker.request("key", _callback, func, 2)
+    worker.cancel("key")
+    func.release_event.set()
+
+    _wait_for(app, lambda: not worker.is_running("key"))
+    assert results == []
+    assert func.called_with == [1]
+
+    # Worker can be used after cancel
+    worker.request("key", _callback, func, 3)
+    _wait_for(app, lambda: results == [3])
+
+
+def test_failed_function(app):
+    worker = RefreshWorker()
+    threads = []
+
+    def _func():
+        raise ValueError("Failed")
+
+    worker.request("key", threads.append, _func)
+    _wait_for(app, lambda: bool(threads))
+    thread = threads[0]
+    assert thread.failed
+    assert isinstance(thread.get_exception(), ValueError)
@@ -7,3 +7,7 @@ client_path = Path(__file__).resolve().parent.parent / "client"
 sys.path.append(str(client_path))
 
 print(f"Added {client_path} to sys.path")
+
+# add common AYON vendor, same as it is added on AYON launch
+vendor_path = client_path / "ayon_core" / "vendor" / "python"
+sys.path.append(str(vendor_path))